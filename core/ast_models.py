@@ -309,6 +309,37 @@ class TranslationConfig:
     fields: list[str] = field(default_factory=list)  # Fields to translate
 
 
+class PartitionStrategy(Enum):
+    """Declarative partitioning strategy for tb_ tables."""
+
+    RANGE = "range"  # Time buckets on a date/timestamp column
+    LIST = "list"  # Explicit value lists per partition
+    HASH = "hash"  # Fixed number of hash buckets (e.g. tenant_id)
+
+
+# Implicit tb_ columns that can be used as partition keys (name → PostgreSQL type)
+IMPLICIT_PARTITION_KEY_COLUMNS = {"created_at": "TIMESTAMPTZ", "tenant_id": "UUID"}
+
+
+@dataclass
+class PartitioningConfig:
+    """Configuration for declarative table partitioning"""
+
+    strategy: PartitionStrategy
+    key: str  # Partition key column (business field, created_at or tenant_id)
+
+    # RANGE: bucket size, partitions created ahead of now(), and retention window
+    interval: str = "month"  # day | week | month | year
+    premake: int = 3
+    retention: str | None = None  # e.g. "12 months"; None keeps all partitions
+
+    # LIST: partition suffix → values stored in that partition
+    values: dict[str, list[str]] = field(default_factory=dict)
+
+    # HASH: number of partitions (modulus)
+    partitions: int = 8
+
+
 @dataclass
 class EntityDefinition:
     """Represents an entity in SpecQL"""
@@ -349,6 +380,9 @@ class EntityDefinition:
     # NEW: Table views configuration
     table_views: TableViewConfig | None = None
 
+    # Declarative partitioning
+    partitioning: PartitioningConfig | None = None
+
     # Identifier configuration (NEW)
     identifier: IdentifierConfig | None = None
 
@@ -553,6 +587,7 @@ class Entity:
     trinity_helpers: Optional["TrinityHelpers"] = None
     graphql: Optional["GraphQLSchema"] = None
     translations: Optional["TranslationConfig"] = None
+    partitioning: Optional["PartitioningConfig"] = None
 
     # Organization (numbering system)
     organization: Optional["Organization"] = None
@@ -618,6 +653,8 @@ class Index:
     columns: list[str]
     type: str = "btree"
     name: str | None = None
+    unique: bool = False
+    where: str | None = None  # Partial index predicate
 
 
 @dataclass
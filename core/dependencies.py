@@ -41,6 +41,13 @@ FAKER = OptionalDependency(
     purpose="Test data generation",
 )
 
+# Only speeds up column-wise seed generation; a stdlib fallback is always used without it
+NUMPY = OptionalDependency(
+    package_name="numpy",
+    pip_extra="testing",
+    purpose="Vectorized test data generation",
+)
+
 TREE_SITTER = OptionalDependency(
     package_name="tree_sitter",
     pip_extra="reverse",
@@ -11,6 +11,7 @@ from typing import Any
 import yaml
 
 from core.ast_models import (
+    IMPLICIT_PARTITION_KEY_COLUMNS,
     ActionDefinition,
     ActionStep,
     Agent,
@@ -22,6 +23,8 @@ from core.ast_models import (
     IdentifierConfig,
     IncludeRelation,
     Organization,
+    PartitioningConfig,
+    PartitionStrategy,
     Pattern,
     RefreshScope,
     TableViewConfig,
@@ -50,6 +53,8 @@ class ParseError(Exception):
 class SpecQLParser:
     """Parser for SpecQL YAML to AST"""
 
+    RANGE_PARTITION_INTERVALS = ("day", "week", "month", "year")
+
     def __init__(self, logger=None, enable_performance_monitoring: bool = False):
         # Will be extended in Phase 2 with composite types
         self.current_entity_fields = {}  # Track fields for expression validation
@@ -199,6 +204,13 @@ class SpecQLParser:
                 self.logger.debug("Parsing translations configuration")
                 entity.translations = self._parse_translations(data["translations"], entity_name)
 
+            # Parse partitioning configuration
+            if "partitioning" in data:
+                self.logger.debug("Parsing partitioning configuration")
+                entity.partitioning = self._parse_partitioning(
+                    data["partitioning"], entity_name, entity.fields
+                )
+
             self.logger.info(
                 f"Successfully parsed entity '{entity_name}' with {len(entity.fields)} fields, {len(entity.actions)} actions"
             )
@@ -967,3 +979,102 @@ class SpecQLParser:
             table_name=table_name,
             fields=fields,
         )
+
+    def _parse_partitioning(
+        self, config: dict, entity_name: str, fields: dict[str, FieldDefinition]
+    ) -> PartitioningConfig:
+        """Parse partitioning configuration block."""
+
+        if not isinstance(config, dict):
+            raise SpecQLValidationError(
+                entity=entity_name,
+                message=f"partitioning must be a dictionary, got {type(config).__name__}",
+            )
+
+        # Parse strategy
+        strategy_str = config.get("strategy")
+        try:
+            strategy = PartitionStrategy(strategy_str)
+        except ValueError:
+            raise SpecQLValidationError(
+                entity=entity_name,
+                message=f"Invalid partitioning.strategy: '{strategy_str}'. Must be: range, list, or hash",
+            )
+
+        # Parse key (business field or implicit column)
+        key = config.get("key")
+        if key in IMPLICIT_PARTITION_KEY_COLUMNS:
+            key_type = IMPLICIT_PARTITION_KEY_COLUMNS[key]
+        elif key in fields:
+            key_type = fields[key].get_postgres_type()
+        else:
+            raise SpecQLValidationError(
+                entity=entity_name,
+                message=f"partitioning.key '{key}' must be a field or one of: {', '.join(IMPLICIT_PARTITION_KEY_COLUMNS)}",
+            )
+
+        partitioning = PartitioningConfig(strategy=strategy, key=key)
+
+        if strategy == PartitionStrategy.RANGE:
+            if key_type not in ("DATE", "TIMESTAMP", "TIMESTAMPTZ"):
+                raise SpecQLValidationError(
+                    entity=entity_name,
+                    message=f"Range partitioning requires a date or timestamp key, '{key}' is {key_type}",
+                )
+
+            interval = config.get("interval", "month")
+            if interval not in self.RANGE_PARTITION_INTERVALS:
+                raise SpecQLValidationError(
+                    entity=entity_name,
+                    message=f"Invalid partitioning.interval: '{interval}'. Must be: {', '.join(self.RANGE_PARTITION_INTERVALS)}",
+                )
+
+            premake = config.get("premake", 3)
+            if not isinstance(premake, int) or premake < 1:
+                raise SpecQLValidationError(
+                    entity=entity_name,
+                    message=f"partitioning.premake must be a positive integer, got {premake!r}",
+                )
+
+            retention = config.get("retention")
+            if retention is not None and not isinstance(retention, str):
+                raise SpecQLValidationError(
+                    entity=entity_name,
+                    message=f"partitioning.retention must be an interval string such as '12 months', got {retention!r}",
+                )
+
+            partitioning.interval = interval
+            partitioning.premake = premake
+            partitioning.retention = retention
+
+        elif strategy == PartitionStrategy.LIST:
+            values = config.get("values")
+            if not isinstance(values, dict) or not values:
+                raise SpecQLValidationError(
+                    entity=entity_name,
+                    message="List partitioning requires partitioning.values mapping partition names to value lists",
+                )
+
+            for name, partition_values in values.items():
+                if not isinstance(partition_values, list) or not partition_values:
+                    raise SpecQLValidationError(
+                        entity=entity_name,
+                        message=f"partitioning.values.{name} must be a non-empty list",
+                    )
+
+            partitioning.values = {
+                str(name): [str(v) for v in partition_values]
+                for name, partition_values in values.items()
+            }
+
+        else:  # HASH
+            partitions = config.get("partitions", 8)
+            if not isinstance(partitions, int) or partitions < 2:
+                raise SpecQLValidationError(
+                    entity=entity_name,
+                    message=f"partitioning.partitions must be an integer >= 2, got {partitions!r}",
+                )
+
+            partitioning.partitions = partitions
+
+        return partitioning
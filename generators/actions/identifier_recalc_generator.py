@@ -5,7 +5,7 @@ Generates PostgreSQL functions for recalculating entity identifiers based on Spe
 Supports hierarchical and composite identifier strategies.
 """
 
-from core.ast_models import EntityDefinition
+from core.ast_models import EntityDefinition, IdentifierComponent
 from core.separators import Separators
 
 
@@ -28,7 +28,16 @@ class IdentifierRecalcGenerator:
         return "-- Simple strategy not implemented yet"
 
     def _generate_hierarchical_strategy(self, entity: EntityDefinition) -> str:
-        """Generate hierarchical identifier recalculation with DOT separator."""
+        """
+        Generate hierarchical identifier recalculation with DOT separator.
+
+        Recalculation is scoped to the affected subtrees: the roots come from p_pks (a
+        batch of changed nodes) or ctx.pk, and each subtree is seeded with its parent's
+        stored identifier. Roots nested inside another root's subtree are dropped (via
+        the ltree path if the entity has one, else by walking up the parents), so a bulk
+        edit recomputes every affected subtree once. Without
+        a scope, ctx.pk_tenant limits the rebuild to one tenant's trees, else all trees.
+        """
 
         entity_lower = entity.name.lower()
         schema = entity.schema
@@ -45,36 +54,84 @@ class IdentifierRecalcGenerator:
             tenant_lookup = self._get_tenant_identifier_expression(entity)
             tenant_expr = f"{tenant_lookup} || '{Separators.TENANT}' || "
 
-        # Build component expression
-        component_expr = self._build_component_expression(
+        # Build component expressions (anchor rows use alias t, recursive rows child)
+        components = (
             entity.identifier.components
             if entity.identifier
             else [{"field": "name", "transform": "slugify"}]
         )
+        component_expr = self._build_component_expression(components)
+        child_component_expr = self._build_component_expression(components, alias="child")
+        nested_root_check = self._build_nested_root_check(entity)
 
         return f"""
+-- Replaces the (ctx) version: both overloads would make (ctx) and () calls ambiguous
+DROP FUNCTION IF EXISTS {schema}.recalculate_{entity_lower}_identifier(
+    core.recalculation_context
+);
+
 -- Recalculate hierarchical identifiers (separator: '{separator}')
 CREATE OR REPLACE FUNCTION {schema}.recalculate_{entity_lower}_identifier(
-    ctx core.recalculation_context DEFAULT ROW(NULL, NULL, NULL)::core.recalculation_context
+    ctx core.recalculation_context DEFAULT ROW(NULL, NULL, NULL)::core.recalculation_context,
+    p_pks INTEGER[] DEFAULT NULL
 ) RETURNS INTEGER AS $$
 DECLARE
+    v_root_pks INTEGER[];
     v_updated_count INTEGER := 0;
 BEGIN
+    -- Resolve the affected subtree roots
+    IF p_pks IS NOT NULL THEN
+        v_root_pks := p_pks;
+    ELSIF ctx.pk IS NOT NULL THEN
+        SELECT array_agg(pk_{entity_lower}) INTO v_root_pks
+        FROM {schema}.tb_{entity_lower}
+        WHERE id = ctx.pk;
+
+        IF v_root_pks IS NULL THEN
+            RETURN 0;
+        END IF;
+    END IF;
+
+    -- Drop roots nested inside another root's subtree (recomputed with it)
+    IF v_root_pks IS NOT NULL THEN
+        SELECT array_agg(r.pk_{entity_lower}) INTO v_root_pks
+        FROM {schema}.tb_{entity_lower} r
+        WHERE r.pk_{entity_lower} = ANY(v_root_pks)
+          AND NOT EXISTS (
+{nested_root_check}
+          );
+
+        IF v_root_pks IS NULL THEN
+            RETURN 0;
+        END IF;
+    END IF;
+
     -- Build hierarchical identifiers using recursive CTE
     WITH RECURSIVE hierarchy AS (
-        -- Root nodes
+        -- Subtree roots (seeded with the parent's stored identifier)
         SELECT
             t.pk_{entity_lower},
-            {tenant_expr}{component_expr} AS base_identifier
+            CASE
+                WHEN t.fk_parent_{entity_lower} IS NULL
+                THEN {tenant_expr}{component_expr}
+                ELSE p.base_identifier || '{separator}' || {component_expr}
+            END AS base_identifier
         FROM {schema}.tb_{entity_lower} t
-        WHERE t.fk_parent_{entity_lower} IS NULL
+        LEFT JOIN {schema}.tb_{entity_lower} p
+            ON p.pk_{entity_lower} = t.fk_parent_{entity_lower}
+        WHERE CASE
+            WHEN v_root_pks IS NOT NULL THEN t.pk_{entity_lower} = ANY(v_root_pks)
+            WHEN ctx.pk_tenant IS NOT NULL
+                THEN t.fk_parent_{entity_lower} IS NULL AND t.tenant_id = ctx.pk_tenant
+            ELSE t.fk_parent_{entity_lower} IS NULL
+        END
 
         UNION ALL
 
         -- Child nodes (use configured separator: '{separator}')
         SELECT
             child.pk_{entity_lower},
-            parent.base_identifier || '{separator}' || {component_expr}
+            parent.base_identifier || '{separator}' || {child_component_expr}
         FROM {schema}.tb_{entity_lower} child
         JOIN hierarchy parent ON child.fk_parent_{entity_lower} = parent.pk_{entity_lower}
     )
@@ -99,9 +156,37 @@ $$ LANGUAGE plpgsql;
 COMMENT ON FUNCTION {schema}.recalculate_{entity_lower}_identifier IS
 'Recalculate hierarchical identifiers for {entity.name}.
 Separator: {separator} (default: dot for hierarchy)
-Pattern: {{tenant}}|{{parent}}{separator}{{child}}';
+Pattern: {{tenant}}|{{parent}}{separator}{{child}}
+Scope: subtrees of p_pks or ctx.pk; else ctx.pk_tenant; else all trees';
 """.strip()
 
+    def _build_nested_root_check(self, entity: EntityDefinition) -> str:
+        """Subquery finding another root among the ancestors of root r"""
+        entity_lower = entity.name.lower()
+        table = f"{entity.schema}.tb_{entity_lower}"
+
+        if "path" in entity.fields:
+            return f"""              SELECT 1
+              FROM {table} a
+              WHERE a.pk_{entity_lower} = ANY(v_root_pks)
+                AND a.pk_{entity_lower} <> r.pk_{entity_lower}
+                AND r.path <@ a.path"""
+
+        return f"""              WITH RECURSIVE ancestors AS (
+                  SELECT a.pk_{entity_lower}, a.fk_parent_{entity_lower}
+                  FROM {table} a
+                  WHERE a.pk_{entity_lower} = r.fk_parent_{entity_lower}
+
+                  UNION ALL
+
+                  SELECT a.pk_{entity_lower}, a.fk_parent_{entity_lower}
+                  FROM {table} a
+                  JOIN ancestors anc ON a.pk_{entity_lower} = anc.fk_parent_{entity_lower}
+              )
+              SELECT 1
+              FROM ancestors
+              WHERE ancestors.pk_{entity_lower} = ANY(v_root_pks)"""
+
     def _generate_composite_hierarchical_strategy(self, entity: EntityDefinition) -> str:
         """Generate composite hierarchical identifier (allocation pattern)."""
 
@@ -236,22 +321,25 @@ Components have tenant prefix stripped to avoid duplication.';
             return f"(SELECT identifier FROM management.tb_tenant WHERE id = t.{tenant_field})"
         return "'unknown-tenant'"
 
-    def _build_component_expression(self, components: list) -> str:
+    def _build_component_expression(self, components: list, alias: str = "t") -> str:
         """Build SQL expression for identifier components."""
         if not components:
-            return "public.safe_slug(t.name)"  # Default fallback
+            return f"public.safe_slug({alias}.name)"  # Default fallback
 
         expressions = []
         for comp in components:
             if isinstance(comp, dict):
                 field = comp["field"]
                 transform = comp.get("transform", "slugify")
+            elif isinstance(comp, IdentifierComponent):
+                field = comp.field
+                transform = comp.transform
             else:
                 # Simple string component
                 field = comp
                 transform = "slugify"
 
-            expr = f"t.{field}"
+            expr = f"{alias}.{field}"
             if transform == "slugify":
                 expr = f"public.safe_slug({expr})"
             elif transform == "uppercase":
@@ -104,10 +104,10 @@ class RefreshTableViewStepCompiler:
             return "\n    ".join(lines)
 
         elif step.refresh_scope == RefreshScope.BATCH:
-            # Deferred refresh (collect PKs, refresh at end)
+            # Deferred refresh (deduplicated queue, drained at commit in dependency order)
             return f"""
-    -- Queue for batch refresh (deferred)
-    INSERT INTO pg_temp.tv_refresh_queue VALUES ('{entity.name}', {pk_var});
+    -- Queue for batch refresh (deferred, drained once at commit)
+    PERFORM app.enqueue_tv_refresh('{entity.name}', {pk_var});
 """.strip()
 
         else:
@@ -4,16 +4,35 @@ Generates the app.* schema foundation including shared utility functions
 """
 
 import importlib.resources as resources
+from dataclasses import dataclass, field
 
 from jinja2 import Environment, FileSystemLoader, TemplateNotFound
 
+from core.ast_models import Entity, PartitioningConfig, PartitionStrategy
+from generators.schema.partition_generator import PartitionGenerator
+
+
+@dataclass
+class AuditLogConfig:
+    """Foundation options for app.tb_mutation_audit_log"""
+
+    # Range-partition the log by month (BRIN on created_at, partition maintenance functions)
+    partitioned: bool = False
+    retention: str | None = None  # e.g. "12 months"; partitions older than this are dropped
+
+    # Lean audit: entities whose audit rows skip the full object_data JSON
+    lean_entities: list[str] = field(default_factory=list)
+
 
 class AppSchemaGenerator:
     """Generates app.* schema foundation with shared utilities"""
 
-    def __init__(self, templates_dir: str = "templates/sql"):
+    def __init__(
+        self, templates_dir: str = "templates/sql", audit_log: AuditLogConfig | None = None
+    ):
         self.templates_dir = templates_dir
         self.env = Environment(loader=FileSystemLoader(templates_dir))
+        self.audit_log = audit_log or AuditLogConfig()
         self._generated = False  # Ensure foundation is generated only once
 
     def _load_template(self, template_name: str):
@@ -75,6 +94,9 @@ class AppSchemaGenerator:
 
     def _generate_audit_log_table(self) -> str:
         """Generate the mutation audit log table"""
+        if self.audit_log.partitioned:
+            return self._generate_partitioned_audit_log_table()
+
         return """-- ============================================================================
 -- AUDIT LOG TABLE: app.tb_mutation_audit_log
 -- Comprehensive audit trail for all mutations across the application
@@ -115,6 +137,81 @@ CREATE INDEX idx_mutation_audit_tenant ON app.tb_mutation_audit_log(tenant_id);
 CREATE INDEX idx_mutation_audit_entity ON app.tb_mutation_audit_log(entity_type, entity_id);
 CREATE INDEX idx_mutation_audit_created ON app.tb_mutation_audit_log(created_at);
 
+-- Comments
+COMMENT ON TABLE app.tb_mutation_audit_log IS 'Comprehensive audit trail for all mutations across the application';
+COMMENT ON COLUMN app.tb_mutation_audit_log.id IS 'Unique identifier for this audit log entry';
+COMMENT ON COLUMN app.tb_mutation_audit_log.tenant_id IS 'Tenant that performed the operation';
+COMMENT ON COLUMN app.tb_mutation_audit_log.user_id IS 'User who performed the operation';
+COMMENT ON COLUMN app.tb_mutation_audit_log.entity_type IS 'Type of entity being mutated (e.g., contact, company)';
+COMMENT ON COLUMN app.tb_mutation_audit_log.entity_id IS 'ID of the entity being mutated';
+COMMENT ON COLUMN app.tb_mutation_audit_log.operation IS 'Type of operation: INSERT, UPDATE, DELETE, NOOP';
+COMMENT ON COLUMN app.tb_mutation_audit_log.status IS 'Operation status: success or failed:*';
+COMMENT ON COLUMN app.tb_mutation_audit_log.updated_fields IS 'Array of field names that were modified';
+COMMENT ON COLUMN app.tb_mutation_audit_log.message IS 'Human-readable success or error message';
+COMMENT ON COLUMN app.tb_mutation_audit_log.object_data IS 'Complete entity data after the mutation';
+COMMENT ON COLUMN app.tb_mutation_audit_log.extra_metadata IS 'Additional metadata including side effects';
+COMMENT ON COLUMN app.tb_mutation_audit_log.error_context IS 'Error context information for debugging';
+COMMENT ON COLUMN app.tb_mutation_audit_log.created_at IS 'Timestamp when the audit log entry was created';"""
+
+    def _generate_partitioned_audit_log_table(self) -> str:
+        """Generate the mutation audit log range-partitioned by month on created_at"""
+        audit_entity = Entity(
+            name="mutation_audit_log",
+            schema="app",
+            partitioning=PartitioningConfig(
+                strategy=PartitionStrategy.RANGE,
+                key="created_at",
+                interval="month",
+                retention=self.audit_log.retention,
+            ),
+        )
+        partitions = PartitionGenerator(audit_entity).generate()
+
+        return f"""-- ============================================================================
+-- AUDIT LOG TABLE: app.tb_mutation_audit_log (partitioned by month)
+-- Comprehensive audit trail for all mutations across the application
+-- ============================================================================
+CREATE TABLE app.tb_mutation_audit_log (
+    -- Primary key (must include the partition key)
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+
+    -- Multi-tenancy
+    tenant_id UUID NOT NULL,
+
+    -- User context
+    user_id UUID,
+
+    -- Entity context
+    entity_type TEXT NOT NULL,
+    entity_id UUID NOT NULL,
+
+    -- Operation details
+    operation TEXT NOT NULL,  -- 'INSERT', 'UPDATE', 'DELETE', 'NOOP'
+    status TEXT NOT NULL,     -- 'success', 'failed:*'
+
+    -- Data changes
+    updated_fields TEXT[],
+    message TEXT,
+    object_data JSONB,
+
+    -- Additional context
+    extra_metadata JSONB,
+    error_context JSONB,
+
+    -- Timestamps
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- Indexes for performance
+-- created_at follows insertion order, so a BRIN index replaces the B-tree
+CREATE INDEX idx_mutation_audit_tenant ON app.tb_mutation_audit_log(tenant_id);
+CREATE INDEX idx_mutation_audit_entity ON app.tb_mutation_audit_log(entity_type, entity_id);
+CREATE INDEX idx_mutation_audit_created ON app.tb_mutation_audit_log USING brin (created_at);
+
+{partitions}
+
 -- Comments
 COMMENT ON TABLE app.tb_mutation_audit_log IS 'Comprehensive audit trail for all mutations across the application';
 COMMENT ON COLUMN app.tb_mutation_audit_log.id IS 'Unique identifier for this audit log entry';
@@ -144,7 +241,17 @@ COMMENT ON COLUMN app.tb_mutation_audit_log.created_at IS 'Timestamp when the au
 
     def _generate_log_and_return_mutation(self) -> str:
         """Generate the shared log_and_return_mutation utility function with audit logging"""
-        return """-- ============================================================================
+        audited_object_data = "p_object_data"
+        if self.audit_log.lean_entities:
+            # Lean audit: keep the audit row, drop the full entity JSON for high-volume entities
+            lean_entities = ", ".join(
+                f"'{name.lower()}'" for name in sorted(set(self.audit_log.lean_entities))
+            )
+            audited_object_data = (
+                f"CASE WHEN p_entity IN ({lean_entities}) THEN NULL ELSE p_object_data END"
+            )
+
+        return f"""-- ============================================================================
 -- SHARED UTILITY: app.log_and_return_mutation
 -- Used by ALL business schemas for standardized mutation responses with audit logging
 -- ============================================================================
@@ -191,7 +298,7 @@ BEGIN
         p_status,
         p_updated_fields,
         p_message,
-        p_object_data,
+        {audited_object_data},
         p_extra_metadata,
         p_error_context,
         now()
@@ -10,6 +10,7 @@ from typing import Any
 from jinja2 import Environment, FileSystemLoader, TemplateNotFound
 
 from core.ast_models import Action, Entity, FieldTier
+from generators.schema.partition_generator import PartitionGenerator
 from generators.schema.schema_registry import SchemaRegistry
 from utils.logger import get_team_logger
 from utils.safe_slug import safe_slug, safe_table_name
@@ -99,6 +100,7 @@ class CoreLogicGenerator:
             "update_fields": update_fields,
             "validations": validations,
             "fk_resolutions": fk_resolutions,
+            "partition_key": PartitionGenerator(entity).pruning_key(tenant_filtered=True),
         }
 
         template = self._load_template("core_update_function.sql.j2")
@@ -117,6 +119,7 @@ class CoreLogicGenerator:
                 "table_name": safe_table_name(entity.name),
                 "pk_column": f"pk_{safe_slug(entity.name)}",
             },
+            "partition_key": PartitionGenerator(entity).pruning_key(tenant_filtered=True),
         }
 
         template = self._load_template("core_delete_function.sql.j2")
@@ -157,8 +160,10 @@ class CoreLogicGenerator:
         }
 
     def _prepare_update_fields(self, entity: Entity) -> dict[str, list[str]]:
-        """Prepare field list for UPDATE statement"""
+        """Prepare field list for UPDATE statement and its no-op comparison"""
         update_assignments = []
+        current_values = []  # Before-image columns (locked row)
+        new_values = []  # Values the UPDATE would write, cast to the column type
 
         # Business fields
         for field_name, field_def in entity.fields.items():
@@ -166,15 +171,21 @@ class CoreLogicGenerator:
                 # Foreign key (INTEGER)
                 fk_name = f"fk_{field_name}"
                 update_assignments.append(f"{fk_name} = v_{fk_name}")
+                current_values.append(f"v_current.{fk_name}")
+                new_values.append(f"v_{fk_name}")
             else:
                 # Regular field
                 update_assignments.append(f"{field_name} = input_data.{field_name}")
+                current_values.append(f"v_current.{field_name}")
+                new_values.append(f"input_data.{field_name}::{field_def.get_postgres_type()}")
 
         # Audit fields
         update_assignments.extend(["updated_at = now()", "updated_by = auth_user_id"])
 
         return {
             "assignments": update_assignments,
+            "current_values": current_values,
+            "new_values": new_values,
         }
 
     def _generate_validations(self, entity: Entity) -> list[dict[str, str]]:
@@ -423,11 +434,9 @@ class CoreLogicGenerator:
             # TODO: Implement finding dependent entities
 
         elif hasattr(step, "refresh_scope") and step.refresh_scope.value == "batch":
-            # Deferred refresh (collect PKs, refresh at end)
-            compiled.append("-- Queue for batch refresh (deferred)")
-            compiled.append(
-                f"INSERT INTO pg_temp.tv_refresh_queue VALUES ('{entity.name}', {pk_var});"
-            )
+            # Deferred refresh (deduplicated queue, drained at commit in dependency order)
+            compiled.append("-- Queue for batch refresh (deferred, drained once at commit)")
+            compiled.append(f"PERFORM app.enqueue_tv_refresh('{entity.name}', {pk_var});")
 
         return compiled
 
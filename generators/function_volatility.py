@@ -0,0 +1,834 @@
+"""
+Function Volatility Analyzer
+
+Post-generation pass over emitted CREATE FUNCTION statements. Infers the tightest
+correct volatility, strictness and parallel safety from each function body and
+rewrites plain PL/pgSQL lookups (`BEGIN RETURN ...; END;`) as `LANGUAGE sql` so
+the planner can inline them.
+
+Bodies are analyzed with pglast when it is installed (PL/pgSQL statements and the
+SQL embedded in them), with a keyword scan as fallback. Calls to functions that
+are neither known builtins nor seen earlier by the analyzer make the inference
+inexact: the declared attributes are then only ever loosened, never tightened.
+
+Text output of timestamps, dates and intervals depends on TimeZone, DateStyle and
+IntervalStyle, so casts to text and `||` operands are typed from the parameters
+and PL/pgSQL variables; anything the analyzer cannot type counts as STABLE.
+Columns need no typing: reading a table already makes a function STABLE.
+
+Note: PostgreSQL validates `LANGUAGE sql` bodies at CREATE time (unless
+check_function_bodies is off), so objects referenced by converted functions must
+be created before them.
+"""
+
+import re
+from dataclasses import dataclass, field, replace
+from enum import IntEnum
+
+from core.dependencies import PGLAST
+
+
+class Volatility(IntEnum):
+    """Function volatility, ordered from tightest to loosest."""
+
+    IMMUTABLE = 0
+    STABLE = 1
+    VOLATILE = 2
+
+
+class ParallelSafety(IntEnum):
+    """Function parallel safety, ordered from tightest to loosest."""
+
+    SAFE = 0
+    RESTRICTED = 1
+    UNSAFE = 2
+
+
+@dataclass(frozen=True)
+class FunctionAttributes:
+    """Language and planner-relevant attributes of a function."""
+
+    language: str
+    volatility: Volatility = Volatility.VOLATILE
+    strict: bool = False
+    parallel: ParallelSafety = ParallelSafety.UNSAFE
+
+    def options(self) -> list[str]:
+        """Attribute clauses that differ from PostgreSQL's defaults."""
+        options = []
+        if self.volatility != Volatility.VOLATILE:
+            options.append(self.volatility.name)
+        if self.strict:
+            options.append("STRICT")
+        if self.parallel != ParallelSafety.UNSAFE:
+            options.append(f"PARALLEL {self.parallel.name}")
+        return options
+
+    def __str__(self) -> str:
+        return " ".join([self.language, *(self.options() or ["VOLATILE"])])
+
+
+@dataclass
+class FunctionAttributeChange:
+    """One function whose attributes were rewritten."""
+
+    name: str
+    before: FunctionAttributes
+    after: FunctionAttributes
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.before} -> {self.after}"
+
+
+@dataclass
+class BodyFacts:
+    """What a function body does, as far as volatility and parallelism go."""
+
+    writes: bool = False  # DML, DDL or other utility statements
+    reads: bool = False  # Table (or set-returning function) access
+    locks: bool = False  # Row locks (FOR UPDATE / FOR SHARE)
+    dynamic: bool = False  # EXECUTE of dynamic SQL
+    subtransactions: bool = False  # EXCEPTION blocks
+    cursors: bool = False
+    stable_values: bool = False  # CURRENT_TIMESTAMP, casts to timestamptz, p_ts::text, ...
+    temp_tables: bool = False  # pg_temp access (session-local, parallel restricted)
+    calls: set[str] = field(default_factory=set)
+
+
+# Builtins by (volatility, parallel safety). Anything else is an unknown call.
+_IMMUTABLE_SAFE = (Volatility.IMMUTABLE, ParallelSafety.SAFE)
+_STABLE_SAFE = (Volatility.STABLE, ParallelSafety.SAFE)
+_VOLATILE_SAFE = (Volatility.VOLATILE, ParallelSafety.SAFE)
+_VOLATILE_RESTRICTED = (Volatility.VOLATILE, ParallelSafety.RESTRICTED)
+_VOLATILE_UNSAFE = (Volatility.VOLATILE, ParallelSafety.UNSAFE)
+
+BUILTIN_FUNCTIONS: dict[str, tuple[Volatility, ParallelSafety]] = {
+    **dict.fromkeys(
+        [
+            "abs", "ceil", "floor", "round", "trunc", "mod", "power", "sqrt",
+            "greatest", "least", "coalesce", "nullif",
+            "lower", "upper", "length", "char_length", "octet_length", "substring",
+            "substr", "position", "strpos", "trim", "btrim", "ltrim", "rtrim",
+            "replace", "translate", "regexp_replace", "regexp_match", "regexp_matches",
+            "split_part", "left", "right", "lpad", "rpad", "repeat", "reverse",
+            "initcap", "md5", "sha256", "encode", "decode",
+            "nlevel", "subpath", "subltree", "text2ltree", "ltree2text", "lca",
+            "array_length", "array_upper", "array_lower", "array_append", "array_prepend",
+            "array_cat", "array_remove", "array_position", "cardinality", "unnest",
+            "generate_series", "generate_subscripts",
+            "count", "sum", "min", "max", "avg", "bool_and", "bool_or", "every",
+            "array_agg", "string_agg",
+            "row_number", "rank", "dense_rank", "percent_rank", "ntile", "lag", "lead",
+            "first_value", "last_value",
+            "jsonb_array_elements", "jsonb_array_elements_text", "jsonb_each",
+            "jsonb_each_text", "jsonb_object_keys", "jsonb_typeof", "jsonb_array_length",
+            "jsonb_set", "jsonb_insert", "jsonb_strip_nulls", "jsonb_extract_path",
+            "jsonb_extract_path_text", "jsonb_path_query", "jsonb_path_exists",
+        ],
+        _IMMUTABLE_SAFE,
+    ),
+    **dict.fromkeys(
+        [
+            "now", "statement_timestamp", "transaction_timestamp", "current_setting",
+            "to_char", "to_timestamp", "to_date", "date_trunc", "age", "format",
+            "concat", "concat_ws", "array_to_string", "to_json", "to_jsonb",
+            "row_to_json", "json_build_object", "json_build_array", "jsonb_build_object",
+            "jsonb_build_array", "json_agg", "jsonb_agg", "json_object_agg",
+            "jsonb_object_agg", "to_tsvector", "to_tsquery", "plainto_tsquery",
+            "websearch_to_tsquery", "ts_rank", "pg_typeof", "has_table_privilege",
+            "current_schemas",
+        ],
+        _STABLE_SAFE,
+    ),
+    **dict.fromkeys(
+        ["gen_random_uuid", "uuid_generate_v4", "clock_timestamp", "timeofday"],
+        _VOLATILE_SAFE,
+    ),
+    **dict.fromkeys(["random", "setseed"], _VOLATILE_RESTRICTED),
+    **dict.fromkeys(
+        [
+            "nextval", "setval", "currval", "lastval", "set_config", "pg_notify",
+            "pg_sleep", "txid_current", "pg_advisory_lock", "pg_advisory_xact_lock",
+            "pg_try_advisory_lock", "pg_try_advisory_xact_lock",
+        ],
+        _VOLATILE_UNSAFE,
+    ),
+}  # fmt: skip
+
+# Cast targets whose input functions depend on settings (DateStyle, TimeZone) or the
+# catalogs (search_path): text -> timestamptz, date, regclass, ... casts are STABLE
+STABLE_CAST_TYPES = {
+    "timestamptz", "timestamp", "date", "time", "timetz", "interval",
+    "regclass", "regproc", "regprocedure", "regoper", "regoperator", "regtype",
+    "regconfig", "regdictionary", "regnamespace", "regrole", "regcollation",
+}  # fmt: skip
+
+# Text-like cast targets: the source's output function decides the volatility
+TEXT_TYPES = {"text", "varchar", "character", "char", "bpchar", "name", "citext"}
+
+# Types (by first word) whose text output does not depend on any setting. Not here:
+# timestamps, dates, times and intervals (TimeZone, DateStyle, IntervalStyle), money
+# (lc_monetary) and bytea (bytea_output)
+PLAIN_OUTPUT_TYPES = TEXT_TYPES | {
+    "int", "integer", "int2", "int4", "int8", "smallint", "bigint", "numeric",
+    "decimal", "real", "float4", "float8", "double", "boolean", "bool", "uuid",
+    "json", "jsonb", "ltree", "lquery", "inet", "cidr", "macaddr",
+}  # fmt: skip
+
+# Immutable builtins returning text or numbers (plain output as `||` operands)
+PLAIN_OUTPUT_FUNCTIONS = {
+    "lower", "upper", "length", "char_length", "octet_length", "substring", "substr",
+    "position", "strpos", "trim", "btrim", "ltrim", "rtrim", "replace", "translate",
+    "regexp_replace", "split_part", "left", "right", "lpad", "rpad", "repeat",
+    "reverse", "initcap", "md5", "sha256", "encode", "nlevel", "ltree2text",
+    "array_length", "cardinality", "abs", "ceil", "floor", "round", "trunc", "mod",
+    "power", "sqrt",
+}  # fmt: skip
+
+# Words followed by "(" that are syntax, not function calls
+_NOT_CALLS = {
+    "all", "and", "any", "array", "as", "between", "by", "case", "cast", "check",
+    "conflict", "cube", "decimal", "default", "distinct", "do", "else", "elsif",
+    "end", "except", "exists", "extract", "filter", "for", "foreach", "from", "group",
+    "grouping", "having", "if", "ilike", "in", "intersect", "interval", "into", "is",
+    "join", "key", "lateral", "like", "limit", "loop", "not", "numeric", "offset",
+    "on", "or", "order", "over", "overlay", "perform", "primary", "query", "raise",
+    "recursive", "references", "return", "returning", "rollup", "row", "select",
+    "set", "sets", "some", "table", "then", "time", "timestamp", "to", "union",
+    "unique", "using", "values", "varchar", "char", "character", "varying", "when",
+    "where", "while", "window", "with", "within",
+}  # fmt: skip
+
+_CREATE_FUNCTION = re.compile(r"\bCREATE\s+(?:OR\s+REPLACE\s+)?FUNCTION\s+([\w.\"]+)\s*\(", re.I)
+_DOLLAR_QUOTE = re.compile(r"\$(?:[A-Za-z_]\w*)?\$")
+_BODY_START = re.compile(r"\bAS\s+(\$(?:[A-Za-z_]\w*)?\$)", re.I)
+_LANGUAGE = re.compile(r"\bLANGUAGE\s+'?(\w+)'?(\s*)", re.I)
+_OPTION_TOKENS = re.compile(
+    r"\s*\b(?:IMMUTABLE|STABLE|VOLATILE|STRICT|RETURNS\s+NULL\s+ON\s+NULL\s+INPUT"
+    r"|CALLED\s+ON\s+NULL\s+INPUT|PARALLEL\s+(?:SAFE|RESTRICTED|UNSAFE))\b",
+    re.I,
+)
+_SETOF_OR_TABLE = re.compile(r"\bRETURNS\s+(?:SETOF|TABLE)\b", re.I)
+_TRIGGER_RETURN = re.compile(r"\bRETURNS\s+(?:EVENT_)?TRIGGER\b", re.I)
+_NOT_INLINABLE = re.compile(r"\bSECURITY\s+DEFINER\b|\bSET\s+\w+\s*(?:=|TO\b|FROM\b)", re.I)
+
+# Keyword scan (fallback when pglast is unavailable or cannot parse the body)
+_WRITES = re.compile(
+    r"\b(?:INSERT\s+INTO|UPDATE\s+[\w.\"]+(?:\s+(?:AS\s+)?\w+)?\s+SET|DELETE\s+FROM"
+    r"|MERGE\s+INTO|TRUNCATE|CREATE|ALTER|DROP|COPY|NOTIFY|LISTEN|LOCK\s+TABLE|COMMIT"
+    r"|ROLLBACK|CALL|REFRESH\s+MATERIALIZED|GRANT|REVOKE|SET\s+(?:LOCAL|SESSION))\b",
+    re.I,
+)
+_DYNAMIC = re.compile(r"\bEXECUTE\b", re.I)
+_LOCKS = re.compile(r"\bFOR (?:NO KEY )?UPDATE\b|\bFOR (?:KEY )?SHARE\b", re.I)
+_READS = re.compile(r"(?<!DISTINCT )\bFROM\b|\bJOIN\b", re.I)
+_SUBTRANSACTIONS = re.compile(r"\bEXCEPTION WHEN\b", re.I)
+_CURSORS = re.compile(r"\bCURSOR\b|\b(?:OPEN|FETCH|MOVE) \w+", re.I)
+_STABLE_VALUES = re.compile(
+    r"\b(?:CURRENT_TIMESTAMP|CURRENT_DATE|CURRENT_TIME|LOCALTIMESTAMP|LOCALTIME"
+    r"|CURRENT_USER|SESSION_USER|CURRENT_ROLE|CURRENT_SCHEMA|CURRENT_CATALOG)\b",
+    re.I,
+)
+_STABLE_CASTS = re.compile(
+    rf"(?:::\s*|\bAS\s+)(?:pg_catalog\.)?(?:{'|'.join(sorted(STABLE_CAST_TYPES))})\b", re.I
+)
+_TEXT_CASTS = re.compile(
+    rf"::\s*(?:pg_catalog\.)?(?:{'|'.join(sorted(TEXT_TYPES))})\b"
+    rf"|\bCAST\s*\((?P<source>[^()]*?)\s+AS\s+(?:pg_catalog\.)?(?:{'|'.join(sorted(TEXT_TYPES))})\b",
+    re.I,
+)
+_CONCAT = re.compile(r"\|\|")
+_LEFT_OPERAND = re.compile(r"(?P<cast>::\s*)?(?P<token>''|[\w.$]+|\S)\s*$")
+_RIGHT_OPERAND = re.compile(r"\s*(?P<token>''|[\w.$]+(?:\s*\()?|\S)")
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+_TEMP_TABLES = re.compile(r"\bpg_temp\.", re.I)
+_CALL = re.compile(r"(?<![\w.$])([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)?)\s*\(")
+_ALIAS_OR_TARGET = re.compile(r"\b(?:AS|INTO|UPDATE|TABLE)\s*$", re.I)
+
+# Plain lookups: no DECLARE, a single RETURN [QUERY] statement
+_PLAIN_RETURN = re.compile(
+    r"\s*BEGIN\s+RETURN\s+(?P<query>QUERY\s+)?(?P<expr>[^;]+?)\s*;\s*END\s*;?\s*", re.I | re.S
+)
+_NULL_GUARD = re.compile(
+    r"^\s*(?:DECLARE\b.*?)?\bBEGIN\s+IF\s+(?P<cond>[^;]+?)\s+THEN\s+RETURN\s+NULL\s*;"
+    r"\s*END\s+IF\s*;",
+    re.I | re.S,
+)
+
+# PL/pgSQL statement kinds (pglast parse_plpgsql output)
+_PLPGSQL_DYNAMIC = {"PLpgSQL_stmt_dynexecute", "PLpgSQL_stmt_dynfors"}
+_PLPGSQL_CURSORS = {"PLpgSQL_stmt_open", "PLpgSQL_stmt_fetch", "PLpgSQL_stmt_forc"}
+_PLPGSQL_WRITES = {"PLpgSQL_stmt_commit", "PLpgSQL_stmt_rollback", "PLpgSQL_stmt_call"}
+
+
+@dataclass
+class _FunctionStatement:
+    """A CREATE FUNCTION statement located in the generated SQL."""
+
+    name: str
+    start: int  # Statement start
+    end: int  # Offset of the terminating ';'
+    arguments: str
+    options: str  # Header after the RETURNS clause
+    options_start: int
+    tag: str
+    body: str
+    body_start: int
+    trailer: str  # Between the closing dollar quote and ';'
+    declared: FunctionAttributes
+    set_returning: bool
+    facts: BodyFacts | None = None
+
+
+def _plain_type(type_name: str) -> bool:
+    """Whether values of a declared type have setting-independent text output."""
+    first_word = re.split(r"[\s(\[]", type_name.strip().lower(), maxsplit=1)[0]
+    return first_word.removeprefix("pg_catalog.") in PLAIN_OUTPUT_TYPES
+
+
+class FunctionVolatilityAnalyzer:
+    """
+    Infer and rewrite volatility, strictness and parallel safety of generated functions.
+
+    The analyzer remembers every function it has seen, so calls into functions
+    generated earlier (e.g. the app foundation) resolve to their inferred attributes.
+    """
+
+    def __init__(self) -> None:
+        self.known: dict[str, FunctionAttributes] = {}
+        self.changes: list[FunctionAttributeChange] = []
+
+    def analyze(self, sql: str) -> str:
+        """Rewrite the attributes of every CREATE FUNCTION in sql; record the changes."""
+        functions = self._find_functions(sql)
+        if not functions:
+            return sql
+
+        for function in functions:
+            function.facts = self._body_facts(sql, function)
+
+        # Resolve calls between functions of this chunk to a fixed point
+        inferred: dict[int, FunctionAttributes] = {}
+        for _ in range(len(functions) + 1):
+            previous = dict(inferred)
+            for index, function in enumerate(functions):
+                inferred[index] = self._infer(function)
+                self._remember(function.name, inferred[index])
+            if inferred == previous:
+                break
+
+        # Rewrite back to front so earlier offsets stay valid
+        changes = []
+        for index in reversed(range(len(functions))):
+            function = functions[index]
+            attributes = inferred[index]
+            new_body = self._inlinable_body(function, attributes)
+            if new_body is not None:
+                attributes = replace(attributes, language="sql")
+                self._remember(function.name, attributes)
+            if attributes == function.declared:
+                continue
+            sql = self._rewrite(sql, function, attributes, new_body)
+            changes.append(FunctionAttributeChange(function.name, function.declared, attributes))
+
+        self.changes.extend(reversed(changes))
+        return sql
+
+    # ------------------------------------------------------------------
+    # Locating functions
+    # ------------------------------------------------------------------
+
+    def _find_functions(self, sql: str) -> list[_FunctionStatement]:
+        functions = []
+        position = 0
+        while match := _CREATE_FUNCTION.search(sql, position):
+            position = match.end()
+            if self._inside_dollar_quote(sql, match.start()):
+                continue
+            function = self._parse_function(sql, match)
+            if function is not None:
+                functions.append(function)
+                position = function.end + 1
+        return functions
+
+    @staticmethod
+    def _inside_dollar_quote(sql: str, offset: int) -> bool:
+        open_tag = None
+        for quote in _DOLLAR_QUOTE.finditer(sql, 0, offset):
+            if open_tag is None:
+                open_tag = quote.group(0)
+            elif quote.group(0) == open_tag:
+                open_tag = None
+        return open_tag is not None
+
+    def _parse_function(self, sql: str, match: re.Match) -> _FunctionStatement | None:
+        arguments_end = self._closing_paren(sql, match.end() - 1)
+        body_match = _BODY_START.search(sql, arguments_end) if arguments_end else None
+        if body_match is None:
+            return None
+
+        tag = body_match.group(1)
+        body_start = body_match.end()
+        body_end = sql.find(tag, body_start)
+        end = sql.find(";", body_end + len(tag)) if body_end >= 0 else -1
+        if end < 0:
+            return None
+
+        header = sql[arguments_end + 1 : body_match.start()]
+        options_offset = self._options_offset(header)
+        options = header[options_offset:]
+        trailer = sql[body_end + len(tag) : end]
+        declared = self._declared_attributes(options + " " + trailer)
+        if declared is None or _TRIGGER_RETURN.search(header):
+            return None
+
+        return _FunctionStatement(
+            name=match.group(1).replace('"', "").lower(),
+            start=match.start(),
+            end=end,
+            arguments=sql[match.end() : arguments_end],
+            options=options,
+            options_start=arguments_end + 1 + options_offset,
+            tag=tag,
+            body=sql[body_start:body_end],
+            body_start=body_start,
+            trailer=trailer,
+            declared=declared,
+            set_returning=bool(_SETOF_OR_TABLE.search(header)),
+        )
+
+    @staticmethod
+    def _closing_paren(sql: str, open_index: int) -> int | None:
+        depth = 0
+        in_string = False
+        for index in range(open_index, len(sql)):
+            char = sql[index]
+            if char == "'":
+                in_string = not in_string
+            elif in_string:
+                continue
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+                if depth == 0:
+                    return index
+        return None
+
+    def _options_offset(self, header: str) -> int:
+        """Offset of the attribute clauses, past `RETURNS TABLE (...)` columns."""
+        returns_table = re.search(r"\bRETURNS\s+TABLE\s*\(", header, re.I)
+        if returns_table is None:
+            return 0
+        closing = self._closing_paren(header, returns_table.end() - 1)
+        return closing + 1 if closing is not None else 0
+
+    @staticmethod
+    def _declared_attributes(options: str) -> FunctionAttributes | None:
+        language = _LANGUAGE.search(options)
+        if language is None or language.group(1).lower() not in ("sql", "plpgsql"):
+            return None
+
+        upper = options.upper()
+        volatility = Volatility.VOLATILE
+        for level in (Volatility.IMMUTABLE, Volatility.STABLE):
+            if re.search(rf"\b{level.name}\b", upper):
+                volatility = level
+        parallel = re.search(r"\bPARALLEL\s+(SAFE|RESTRICTED|UNSAFE)\b", upper)
+
+        return FunctionAttributes(
+            language=language.group(1).lower(),
+            volatility=volatility,
+            strict=bool(re.search(r"\bSTRICT\b|\bRETURNS\s+NULL\s+ON\s+NULL\s+INPUT\b", upper)),
+            parallel=ParallelSafety[parallel.group(1)] if parallel else ParallelSafety.UNSAFE,
+        )
+
+    # ------------------------------------------------------------------
+    # Body analysis
+    # ------------------------------------------------------------------
+
+    def _body_facts(self, sql: str, function: _FunctionStatement) -> BodyFacts:
+        if PGLAST.available:
+            try:
+                return self._ast_facts(sql[function.start : function.end + 1], function)
+            except Exception:
+                pass  # Unparseable here (e.g. PL/pgSQL with custom types): scan keywords
+        return self._scanned_facts(function.body, self._scanned_types(function))
+
+    def _ast_facts(self, statement: str, function: _FunctionStatement) -> BodyFacts:
+        import pglast
+
+        facts = BodyFacts()
+        types = self._parameter_types(function)
+        if function.declared.language == "sql":
+            queries = [function.body]
+        else:
+            queries = []
+            tree = pglast.parse_plpgsql(statement)
+            self._collect_plpgsql(tree, facts, queries)
+            for datum in tree[0]["PLpgSQL_function"]["datums"]:
+                variable = datum.get("PLpgSQL_var")
+                if variable is not None:
+                    types[variable["refname"].lower()] = variable["datatype"]["PLpgSQL_type"][
+                        "typname"
+                    ]
+
+        for query in queries:
+            for node in self._walk(pglast.parse_sql(query)):
+                kind = type(node).__name__
+                if kind.endswith("Stmt") and kind not in ("SelectStmt", "RawStmt"):
+                    facts.writes = True
+                elif kind == "IntoClause":
+                    facts.writes = True
+                elif kind == "LockingClause":
+                    facts.locks = True
+                elif kind in ("RangeVar", "RangeFunction"):
+                    facts.reads = True
+                    if kind == "RangeVar" and (node.schemaname or "").lower() == "pg_temp":
+                        facts.temp_tables = True
+                elif kind == "TypeCast":
+                    target = node.typeName.names[-1].sval.lower()
+                    if target in STABLE_CAST_TYPES:
+                        facts.stable_values = True
+                    elif target in TEXT_TYPES and not self._plain_output(node.arg, types):
+                        facts.stable_values = True
+                elif kind == "A_Expr" and self._is_concat(node):
+                    if not all(self._plain_output(arg, types) for arg in (node.lexpr, node.rexpr)):
+                        facts.stable_values = True
+                elif kind == "SQLValueFunction":
+                    facts.stable_values = True
+                elif kind == "FuncCall":
+                    facts.calls.add(".".join(part.sval for part in node.funcname).lower())
+        return facts
+
+    @staticmethod
+    def _is_concat(node) -> bool:
+        return bool(node.name) and [part.sval for part in node.name] == ["||"]
+
+    def _plain_output(self, node, types: dict[str, str]) -> bool:
+        """Whether the text form of an expression is independent of settings."""
+        kind = type(node).__name__
+        if kind == "A_Const":
+            return True
+        if kind == "ColumnRef":
+            name = ".".join(getattr(part, "sval", "*") for part in node.fields).lower()
+            return name in types and _plain_type(types[name])
+        if kind == "TypeCast":
+            return _plain_type(node.typeName.names[-1].sval)
+        if kind == "A_Expr" and self._is_concat(node):
+            return True  # Text; its own operands are checked where the walk meets it
+        if kind == "FuncCall":
+            name = ".".join(part.sval for part in node.funcname).lower()
+            return name.removeprefix("pg_catalog.") in PLAIN_OUTPUT_FUNCTIONS
+        return False
+
+    def _collect_plpgsql(self, node, facts: BodyFacts, queries: list[str]) -> None:
+        """Collect embedded SQL and statement kinds from a parse_plpgsql tree."""
+        if isinstance(node, list):
+            for item in node:
+                self._collect_plpgsql(item, facts, queries)
+            return
+        if not isinstance(node, dict):
+            return
+
+        for kind, value in node.items():
+            if kind in _PLPGSQL_DYNAMIC:
+                facts.dynamic = True
+            elif kind in _PLPGSQL_CURSORS:
+                facts.cursors = True
+            elif kind in _PLPGSQL_WRITES:
+                facts.writes = True
+            elif kind == "PLpgSQL_exception_block":
+                facts.subtransactions = True
+            elif kind == "PLpgSQL_expr":
+                queries.append(self._expression_query(value))
+                continue
+            self._collect_plpgsql(value, facts, queries)
+
+    @staticmethod
+    def _expression_query(expr: dict) -> str:
+        query = expr["query"]
+        mode = expr.get("parseMode", 0)
+        if mode == 0:  # Full SQL statement
+            return query
+        if mode >= 3:  # Assignment: target := expression
+            query = re.split(r":=|=", query, maxsplit=1)[-1]
+        return f"SELECT {query}"
+
+    @staticmethod
+    def _walk(node):
+        """Yield every pglast AST node under node."""
+        from pglast import ast
+
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, (list, tuple)):
+                stack.extend(current)
+            elif isinstance(current, ast.Node):
+                yield current
+                stack.extend(getattr(current, name) for name in current)
+
+    @staticmethod
+    def _scanned_facts(body: str, types: dict[str, str]) -> BodyFacts:
+        text = re.sub(r"--[^\n]*|/\*.*?\*/", " ", body, flags=re.S)
+        text = re.sub(r"'(?:[^']|'')*'", "''", text)
+        text = re.sub(r"\s+", " ", text)
+
+        def plain(token: str, cast: bool = False) -> bool:
+            token = token.strip().lower()
+            if cast:
+                return _plain_type(token)
+            if token.endswith("("):
+                return token[:-1].strip().removeprefix("pg_catalog.") in PLAIN_OUTPUT_FUNCTIONS
+            if token == "''" or _NUMBER.fullmatch(token):
+                return True
+            return token in types and _plain_type(types[token])
+
+        setting_dependent_text = False
+        for cast in _TEXT_CASTS.finditer(text):
+            if cast.group("source") is not None:
+                plain_source = plain(cast.group("source"))
+            else:
+                source = _LEFT_OPERAND.search(text[: cast.start()])
+                plain_source = bool(source) and plain(
+                    source.group("token"), cast=bool(source.group("cast"))
+                )
+            setting_dependent_text = setting_dependent_text or not plain_source
+        for concat in _CONCAT.finditer(text):
+            left = _LEFT_OPERAND.search(text[: concat.start()])
+            right = _RIGHT_OPERAND.match(text, concat.end())
+            if not (
+                left
+                and right
+                and plain(left.group("token"), cast=bool(left.group("cast")))
+                and plain(right.group("token"))
+            ):
+                setting_dependent_text = True
+
+        calls = set()
+        for call in _CALL.finditer(text):
+            name = call.group(1).lower()
+            if name in _NOT_CALLS or _ALIAS_OR_TARGET.search(text[: call.start()]):
+                continue
+            calls.add(name)
+
+        return BodyFacts(
+            writes=bool(_WRITES.search(text)),
+            reads=bool(_READS.search(text)),
+            locks=bool(_LOCKS.search(text)),
+            dynamic=bool(_DYNAMIC.search(text)),
+            subtransactions=bool(_SUBTRANSACTIONS.search(text)),
+            cursors=bool(_CURSORS.search(text)),
+            stable_values=bool(
+                _STABLE_VALUES.search(text) or _STABLE_CASTS.search(text) or setting_dependent_text
+            ),
+            temp_tables=bool(_TEMP_TABLES.search(text)),
+            calls=calls,
+        )
+
+    # ------------------------------------------------------------------
+    # Inference
+    # ------------------------------------------------------------------
+
+    def _infer(self, function: _FunctionStatement) -> FunctionAttributes:
+        facts = function.facts
+        declared = function.declared
+        volatility = Volatility.IMMUTABLE
+        parallel = ParallelSafety.SAFE
+
+        if facts.writes or facts.dynamic or facts.locks:
+            volatility, parallel = Volatility.VOLATILE, ParallelSafety.UNSAFE
+        if facts.reads or facts.stable_values:
+            volatility = max(volatility, Volatility.STABLE)
+        if facts.subtransactions or facts.cursors or facts.temp_tables:
+            parallel = max(parallel, ParallelSafety.RESTRICTED)
+
+        exact = True
+        for call in facts.calls:
+            callee = self._lookup(call)
+            if callee is None:
+                exact = False
+                continue
+            volatility = max(volatility, callee[0])
+            parallel = max(parallel, callee[1])
+
+        if not exact:
+            volatility = max(volatility, declared.volatility)
+            parallel = max(parallel, declared.parallel)
+
+        return FunctionAttributes(
+            language=declared.language,
+            volatility=volatility,
+            strict=declared.strict or self._has_null_guard(function),
+            parallel=parallel,
+        )
+
+    def _lookup(self, name: str) -> tuple[Volatility, ParallelSafety] | None:
+        schema, _, bare = name.rpartition(".")
+        known = self.known.get(name)
+        if known is None and not schema:
+            known = self.known.get(f"public.{name}")
+        if known is not None:
+            return known.volatility, known.parallel
+        if schema in ("", "pg_catalog"):
+            return BUILTIN_FUNCTIONS.get(bare)
+        return None
+
+    def _remember(self, name: str, attributes: FunctionAttributes) -> None:
+        self.known[name] = attributes
+
+    @staticmethod
+    def _parameter_declarations(arguments: str) -> list[tuple[list[str], str]]:
+        """(words without the IN/INOUT/VARIADIC mode, declaration) of the input parameters."""
+        declarations = []
+        depth, current = 0, ""
+        for char in arguments + ",":
+            depth += (char == "(") - (char == ")")
+            if char == "," and depth == 0:
+                words = current.split()
+                if words and words[0].upper() in ("IN", "INOUT", "VARIADIC"):
+                    words = words[1:]
+                if words and words[0].upper() != "OUT":
+                    declarations.append((words, current))
+                current = ""
+            else:
+                current += char
+        return declarations
+
+    def _parameters(self, arguments: str) -> list[tuple[str, bool]]:
+        """(name, has_default) of the input parameters."""
+        return [
+            (words[0].lower(), bool(re.search(r"\bDEFAULT\b|=", declaration, re.I)))
+            for words, declaration in self._parameter_declarations(arguments)
+        ]
+
+    def _parameter_types(self, function: _FunctionStatement) -> dict[str, str]:
+        """Declared type of each named input parameter, also under `function.parameter`."""
+        qualifier = function.name.rpartition(".")[2]
+        types = {}
+        for words, _ in self._parameter_declarations(function.arguments):
+            if len(words) > 1:
+                types[words[0].lower()] = words[1]
+                types[f"{qualifier}.{words[0].lower()}"] = words[1]
+        return types
+
+    def _scanned_types(self, function: _FunctionStatement) -> dict[str, str]:
+        """Parameter and DECLARE variable types, for the keyword scan."""
+        types = self._parameter_types(function)
+        declare = re.search(r"^\s*DECLARE\b(.*?)\bBEGIN\b", function.body, re.I | re.S)
+        if declare is not None:
+            for declaration in declare.group(1).split(";"):
+                words = [word for word in declaration.split() if word.upper() != "CONSTANT"]
+                if len(words) > 1:
+                    types[words[0].lower()] = words[1]
+        return types
+
+    def _has_null_guard(self, function: _FunctionStatement) -> bool:
+        """PL/pgSQL starting with `IF p IS NULL OR ... THEN RETURN NULL` over every input."""
+        if function.declared.language != "plpgsql" or function.set_returning:
+            return False
+        parameters = self._parameters(function.arguments)
+        if not parameters or any(has_default for _, has_default in parameters):
+            return False
+        guard = _NULL_GUARD.match(function.body)
+        if guard is None:
+            return False
+        checked = set()
+        for condition in re.split(r"\s+OR\s+", guard.group("cond"), flags=re.I):
+            null_check = re.fullmatch(r"\(?\s*(\w+)\s+IS\s+NULL\s*\)?", condition.strip(), re.I)
+            if null_check is None:
+                return False
+            checked.add(null_check.group(1).lower())
+        return {name for name, _ in parameters} <= checked
+
+    def _inlinable_body(
+        self, function: _FunctionStatement, attributes: FunctionAttributes
+    ) -> str | None:
+        """SQL body replacing a plain PL/pgSQL lookup, or None if it must stay PL/pgSQL."""
+        if (
+            function.declared.language != "plpgsql"
+            or attributes.volatility == Volatility.VOLATILE
+            or _NOT_INLINABLE.search(function.options + function.trailer)
+        ):
+            return None
+
+        body = re.sub(r"--[^\n]*", "", function.body)
+        plain = _PLAIN_RETURN.fullmatch(body)
+        if plain is None or bool(plain.group("query")) != function.set_returning:
+            return None
+
+        expression = plain.group("expr").strip()
+        if function.facts is not None and function.facts.reads:
+            expression = self._qualify_parameters(function, expression)
+        statement = expression if plain.group("query") else f"SELECT {expression}"
+        return f"\n    {statement}\n"
+
+    def _qualify_parameters(self, function: _FunctionStatement, expression: str) -> str:
+        """
+        Qualify parameter references with the function name (`get_x.p_pk`).
+
+        PL/pgSQL resolves a name matching both a parameter and a column to the
+        parameter (or raises), while a SQL function resolves it to the column.
+        """
+        qualifier = function.name.rpartition(".")[2]
+        names = [name for name, _ in self._parameters(function.arguments)]
+        if not names:
+            return expression
+
+        reference = re.compile(
+            rf"(?<![\w.$\"])(?<!::)({'|'.join(map(re.escape, names))})(?![\w$\"(.])", re.I
+        )
+
+        def qualify(match: re.Match) -> str:
+            if re.search(r"(?:::|\bAS)\s*$", match.string[: match.start()], re.I):
+                return match.group(0)  # Cast target or alias
+            return f"{qualifier}.{match.group(0)}"
+
+        # Leave string literals untouched
+        parts = re.split(r"('(?:[^']|'')*')", expression)
+        return "".join(
+            part if index % 2 else reference.sub(qualify, part) for index, part in enumerate(parts)
+        )
+
+    # ------------------------------------------------------------------
+    # Rewriting
+    # ------------------------------------------------------------------
+
+    def _rewrite(
+        self,
+        sql: str,
+        function: _FunctionStatement,
+        attributes: FunctionAttributes,
+        new_body: str | None,
+    ) -> str:
+        options, trailer = function.options, function.trailer
+        in_trailer = _LANGUAGE.search(options) is None
+
+        def clauses(segment: str) -> str:
+            segment = _OPTION_TOKENS.sub("", segment)
+            language = _LANGUAGE.search(segment)
+            if language is None:
+                return segment
+            separator = "\n" if "\n" in language.group(2) else " "
+            rendered = separator.join([f"LANGUAGE {attributes.language}", *attributes.options()])
+            return segment[: language.start()] + rendered + separator + segment[language.end() :]
+
+        if in_trailer:
+            trailer = clauses(trailer).rstrip()
+            options = _OPTION_TOKENS.sub("", options)
+        else:
+            options = clauses(options)
+            trailer = _OPTION_TOKENS.sub("", trailer)
+
+        body = new_body if new_body is not None else function.body
+        body_end = function.body_start + len(function.body)
+        return (
+            sql[: function.options_start]
+            + options
+            + sql[function.options_start + len(function.options) : function.body_start]
+            + body
+            + sql[body_end : body_end + len(function.tag)]
+            + trailer
+            + sql[function.end :]
+        )
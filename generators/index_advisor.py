@@ -0,0 +1,630 @@
+"""
+Index Advisor
+
+Workload-driven index recommendations for generated schemas. The per-field rules in
+IndexGenerator, index_strategy and tenant_indexes only see column types; this pass
+reads what the generated SQL actually runs:
+
+- WHERE clauses of the statements in compiled actions and helper functions
+- join conditions in tv_ refresh functions (FK columns looked up per parent)
+- soft-delete predicates (`deleted_at IS NULL`), which become partial indexes
+- tv_ filter columns declared by `extra_filter_columns` (`@fraiseql:filter`
+  comments), which FraiseQL always queries together with tenant_id
+
+Every table access that no existing index serves becomes a composite B-tree
+proposal: equality columns first (tenant_id leading), then at most one range
+column, with the remaining selected columns as INCLUDE when the query could then
+be answered from the index alone. Proposals that are a prefix of another proposal
+are folded into it, and existing indexes made prefix-redundant are reported.
+
+Usage: feed every generated SQL file to observe(), then call advise() (requires
+pglast). Used by `specql generate --advise-indexes`.
+"""
+
+from dataclasses import dataclass, field
+
+from core.dependencies import PGLAST
+from generators.schema.online_ddl import CONCURRENT_FILE_HEADER, concurrently
+
+SOFT_DELETE_PREDICATE = "deleted_at IS NULL"
+MAX_INCLUDE_COLUMNS = 3
+MAX_IDENTIFIER_LENGTH = 63  # PostgreSQL NAMEDATALEN - 1
+
+# Range operators and their mirror image (for `value < column`)
+_RANGE_OPERATORS = {"<": ">", ">": "<", "<=": ">=", ">=": "<="}
+
+
+@dataclass(frozen=True)
+class ExistingIndex:
+    """An index (or PRIMARY KEY / UNIQUE constraint) found in the generated DDL."""
+
+    name: str
+    table: str
+    columns: tuple[str | None, ...]  # None for expression columns
+    include: tuple[str, ...] = ()
+    where: str | None = None
+    unique: bool = False
+    method: str = "btree"
+
+    @property
+    def plain(self) -> bool:
+        """Full (non-partial) B-tree over plain columns."""
+        return self.method == "btree" and self.where is None and None not in self.columns
+
+
+@dataclass
+class IndexRecommendation:
+    """One proposed index and the workload it serves."""
+
+    table: str
+    columns: tuple[str, ...]
+    include: tuple[str, ...] = ()
+    where: str | None = None
+    reasons: list[str] = field(default_factory=list)
+    name: str = ""
+
+    def sql(self, online: bool = False) -> str:
+        statement = f"CREATE INDEX {self.name} ON {self.table} ({', '.join(self.columns)})"
+        if self.include:
+            statement += f" INCLUDE ({', '.join(self.include)})"
+        if self.where:
+            statement += f" WHERE {self.where}"
+        statement += ";"
+        return concurrently(statement) if online else statement
+
+    def __str__(self) -> str:
+        return f"{self.name}: {'; '.join(self.reasons)}"
+
+
+@dataclass
+class RedundantIndex:
+    """An existing index whose columns are a prefix of another (existing or proposed) one."""
+
+    index: ExistingIndex
+    covered_by: str
+
+    def __str__(self) -> str:
+        return f"{self.index.name} is a prefix of {self.covered_by}"
+
+
+@dataclass
+class IndexAdvice:
+    """Result of IndexAdvisor.advise()."""
+
+    recommendations: list[IndexRecommendation] = field(default_factory=list)
+    redundant: list[RedundantIndex] = field(default_factory=list)
+
+    def report(self) -> list[str]:
+        """One line per recommendation and per redundant index."""
+        lines = [str(recommendation) for recommendation in self.recommendations]
+        lines.extend(f"redundant: {redundant}" for redundant in self.redundant)
+        return lines
+
+    def render(self, online: bool = False) -> str:
+        """advised_indexes.sql: each index preceded by the workload that motivates it."""
+        parts = [CONCURRENT_FILE_HEADER.rstrip()] if online else []
+        parts.append(
+            "-- ============================================================================\n"
+            "-- Advised indexes (specql generate --advise-indexes)\n"
+            "-- Derived from the WHERE/JOIN clauses of the generated functions and the\n"
+            "-- declared tv_ filter columns. Review before applying.\n"
+            "-- ============================================================================"
+        )
+        for recommendation in self.recommendations:
+            reasons = "\n".join(f"-- {reason}" for reason in recommendation.reasons)
+            parts.append(f"{reasons}\n{recommendation.sql(online)}")
+
+        if self.redundant:
+            drops = "\n".join(
+                f"-- DROP INDEX IF EXISTS {redundant.index.table.rpartition('.')[0]}."
+                f"{redundant.index.name};  -- prefix of {redundant.covered_by}"
+                for redundant in self.redundant
+            )
+            parts.append(
+                "-- Prefix-redundant indexes (a longer index with the same leading columns\n"
+                "-- serves the same lookups). Generated DDL re-creates them, so drop them\n"
+                "-- only after reviewing RLS and constraint needs:\n" + drops
+            )
+        return "\n\n".join(parts) + "\n"
+
+
+@dataclass
+class _Access:
+    """How one statement reaches one table reference."""
+
+    table: str
+    equality: list[str] = field(default_factory=list)
+    range_column: str | None = None
+    partial: bool = False
+    selected: tuple[str, ...] | None = None  # Plain selected columns (covering candidates)
+    predicates: list[str] = field(default_factory=list)
+    source: str = ""
+
+    @property
+    def where(self) -> str | None:
+        return SOFT_DELETE_PREDICATE if self.partial else None
+
+    def reason(self) -> str:
+        return f"{self.source}: {' AND '.join(self.predicates)}"
+
+
+class IndexAdvisor:
+    """
+    Propose composite, covering and partial indexes for the generated workload.
+
+    observe() may be called once per generated file, in any order: statements are
+    only analyzed in advise(), when every table and index is known.
+    """
+
+    def __init__(self) -> None:
+        self.tables: dict[str, list[str]] = {}
+        self.indexes: list[ExistingIndex] = []
+        self.filters: list[tuple[str, str]] = []  # (tv table, column)
+        self._queries: list[tuple[str, str]] = []  # (source, SQL statement)
+
+    # ------------------------------------------------------------------
+    # Collecting DDL and workload
+    # ------------------------------------------------------------------
+
+    def observe(self, sql: str) -> None:
+        """Record tables, indexes, filter annotations and queries of generated SQL."""
+        PGLAST.require()
+        import pglast
+
+        for statement in pglast.split(sql, with_parser=False):
+            try:
+                (raw,) = pglast.parse_sql(statement)
+            except Exception:
+                continue  # Not parseable on its own (e.g. psql meta-commands)
+            node = raw.stmt
+            kind = type(node).__name__
+            if kind == "CreateStmt":
+                self._add_table(node)
+            elif kind == "IndexStmt":
+                self._add_index(node)
+            elif kind == "AlterTableStmt":
+                self._add_constraints(node)
+            elif kind == "CommentStmt":
+                self._add_filter(node)
+            elif kind == "CreateFunctionStmt":
+                self._add_function(node, statement[raw.stmt_location :])
+            elif kind in ("SelectStmt", "InsertStmt", "UpdateStmt", "DeleteStmt"):
+                self._queries.append(("statement", statement))
+
+    def _add_table(self, node) -> None:
+        from pglast.enums import ConstrType
+
+        table = _qualified(node.relation)
+        columns = []
+        for element in node.tableElts or ():
+            if type(element).__name__ == "ColumnDef":
+                columns.append(element.colname)
+                for constraint in element.constraints or ():
+                    if constraint.contype in (ConstrType.CONSTR_PRIMARY, ConstrType.CONSTR_UNIQUE):
+                        self._add_key(table, constraint, (element.colname,))
+            elif type(element).__name__ == "Constraint":
+                self._add_key(table, element)
+        self.tables[table] = columns
+
+    def _add_constraints(self, node) -> None:
+        from pglast.enums import AlterTableType
+
+        for command in node.cmds or ():
+            if command.subtype == AlterTableType.AT_AddConstraint:
+                self._add_key(_qualified(node.relation), command.def_)
+
+    def _add_key(self, table: str, constraint, columns: tuple[str, ...] | None = None) -> None:
+        """PRIMARY KEY and UNIQUE constraints are unique B-tree indexes."""
+        from pglast.enums import ConstrType
+
+        if constraint.contype not in (ConstrType.CONSTR_PRIMARY, ConstrType.CONSTR_UNIQUE):
+            return
+        columns = columns or tuple(key.sval for key in constraint.keys or ())
+        suffix = "pkey" if constraint.contype == ConstrType.CONSTR_PRIMARY else "key"
+        name = constraint.conname or f"{table.rpartition('.')[2]}_{'_'.join(columns)}_{suffix}"
+        self.indexes.append(ExistingIndex(name, table, columns, unique=True))
+
+    def _add_index(self, node) -> None:
+        from pglast.stream import RawStream
+
+        self.indexes.append(
+            ExistingIndex(
+                name=node.idxname or "",
+                table=_qualified(node.relation),
+                columns=tuple(element.name for element in node.indexParams or ()),
+                include=tuple(element.name for element in node.indexIncludingParams or ()),
+                where=RawStream()(node.whereClause) if node.whereClause else None,
+                unique=bool(node.unique),
+                method=(node.accessMethod or "btree").lower(),
+            )
+        )
+
+    def _add_filter(self, node) -> None:
+        """`@fraiseql:filter ... index=btree` column comments declare tv_ filters."""
+        from pglast.enums import ObjectType
+
+        comment = node.comment or ""
+        if node.objtype != ObjectType.OBJECT_COLUMN or "@fraiseql:filter" not in comment:
+            return
+        if "index=btree" not in comment.replace(" ", "").lower():
+            return
+        parts = [part.sval for part in node.object]
+        if len(parts) == 2:
+            parts.insert(0, "public")
+        if len(parts) == 3:
+            self.filters.append((f"{parts[0]}.{parts[1]}", parts[2]))
+
+    def _add_function(self, node, statement: str) -> None:
+        import pglast
+
+        name = ".".join(part.sval for part in node.funcname)
+        options = {option.defname: option.arg for option in node.options or ()}
+        language = options["language"].sval.lower() if "language" in options else "sql"
+        body = options.get("as")
+
+        if language == "sql" and body:
+            for query in pglast.split(body[0].sval, with_parser=False):
+                self._queries.append((name, query))
+        elif language == "plpgsql":
+            try:
+                tree = pglast.parse_plpgsql(statement)
+            except Exception:
+                return
+            for query in _plpgsql_queries(tree):
+                self._queries.append((name, query))
+
+    # ------------------------------------------------------------------
+    # Advice
+    # ------------------------------------------------------------------
+
+    def advise(self) -> IndexAdvice:
+        """Recommendations for every access no existing index serves."""
+        accesses = [*self._filter_accesses()]
+        for source, query in self._queries:
+            accesses.extend(self._statement_accesses(source, query))
+
+        frequency: dict[tuple[str, str], int] = {}
+        for access in accesses:
+            for column in access.equality:
+                frequency[(access.table, column)] = frequency.get((access.table, column), 0) + 1
+
+        proposals: dict[tuple, IndexRecommendation] = {}
+        for access in accesses:
+            if not (access.equality or access.range_column) or self._served(access):
+                continue
+            equality = sorted(
+                dict.fromkeys(access.equality),
+                key=lambda c: (c != "tenant_id", -frequency[(access.table, c)], c),
+            )
+            columns = tuple(equality + ([access.range_column] if access.range_column else []))
+            include = tuple(c for c in access.selected or () if c not in columns)
+            key = (access.table, columns, access.where)
+            proposal = proposals.setdefault(
+                key, IndexRecommendation(access.table, columns, where=access.where)
+            )
+            proposal.include = tuple(dict.fromkeys(proposal.include + include))
+            if access.reason() not in proposal.reasons:
+                proposal.reasons.append(access.reason())
+
+        recommendations = self._fold_prefixes(list(proposals.values()))
+        taken = {index.name for index in self.indexes}
+        for recommendation in recommendations:
+            if len(recommendation.include) > MAX_INCLUDE_COLUMNS:
+                recommendation.include = ()  # Too wide to be worth an index-only scan
+            recommendation.name = self._index_name(recommendation, taken)
+            taken.add(recommendation.name)  # Truncation can collide within one run too
+
+        return IndexAdvice(recommendations, self._redundant(recommendations))
+
+    def _filter_accesses(self) -> list[_Access]:
+        accesses = []
+        for table, column in self.filters:
+            columns = self.tables.get(table, [])
+            if column == "tenant_id" or "tenant_id" not in columns:
+                continue
+            accesses.append(
+                _Access(
+                    table=table,
+                    equality=["tenant_id", column],
+                    predicates=["tenant_id = ?", f"{column} = ?"],
+                    source=f"FraiseQL filter {table}.{column}",
+                )
+            )
+        return accesses
+
+    def _served(self, access: _Access) -> bool:
+        """An existing index already serves the access (or it hits a unique key)."""
+        equality = set(access.equality)
+        for index in self.indexes:
+            if index.table != access.table or index.method != "btree":
+                continue
+            if index.where is not None and index.where != access.where:
+                continue
+            if index.unique and index.where is None and set(index.columns) <= equality:
+                return True  # Single-row lookup
+            leading = index.columns[: len(equality)]
+            if len(leading) < len(equality) or set(leading) != equality:
+                continue
+            if access.range_column is None:
+                return True
+            if len(index.columns) > len(equality):
+                if index.columns[len(equality)] == access.range_column:
+                    return True
+        return False
+
+    @staticmethod
+    def _fold_prefixes(proposals: list[IndexRecommendation]) -> list[IndexRecommendation]:
+        """Drop proposals whose columns are a prefix of a longer proposal on the same table."""
+        kept = []
+        for proposal in sorted(proposals, key=lambda p: -len(p.columns)):
+            for longer in kept:
+                if (
+                    longer.table == proposal.table
+                    and longer.columns[: len(proposal.columns)] == proposal.columns
+                    and longer.where in (None, proposal.where)
+                    and set(proposal.include) <= set(longer.columns + longer.include)
+                ):
+                    longer.reasons.extend(r for r in proposal.reasons if r not in longer.reasons)
+                    break
+            else:
+                kept.append(proposal)
+        return sorted(kept, key=lambda p: (p.table, p.columns, p.where or ""))
+
+    def _redundant(self, recommendations: list[IndexRecommendation]) -> list[RedundantIndex]:
+        """Existing plain non-unique indexes that are a strict prefix of a longer index."""
+        longer: list[tuple[str, tuple, str]] = [
+            (r.table, r.columns, r.name) for r in recommendations if r.where is None
+        ]
+        longer.extend(
+            (index.table, index.columns, index.name) for index in self.indexes if index.plain
+        )
+
+        redundant = []
+        for index in self.indexes:
+            if index.unique or not index.plain or index.include:
+                continue
+            for table, columns, name in longer:
+                if (
+                    table == index.table
+                    and len(columns) > len(index.columns)
+                    and columns[: len(index.columns)] == index.columns
+                ):
+                    redundant.append(RedundantIndex(index, name))
+                    break
+        return redundant
+
+    def _index_name(self, recommendation: IndexRecommendation, taken: set[str]) -> str:
+        """idx_<table>_<columns>, truncated to 63 characters and suffixed unless unused."""
+        table = recommendation.table.rpartition(".")[2]
+        name = f"idx_{table}_{'_'.join(recommendation.columns)}"
+        if recommendation.where:
+            name += "_active"
+        name = name[:MAX_IDENTIFIER_LENGTH]
+        candidate, counter = name, 2
+        while candidate in taken:
+            suffix = f"_{counter}"
+            candidate = name[: MAX_IDENTIFIER_LENGTH - len(suffix)] + suffix
+            counter += 1
+        return candidate
+
+    # ------------------------------------------------------------------
+    # Statement analysis
+    # ------------------------------------------------------------------
+
+    def _statement_accesses(self, source: str, query: str) -> list[_Access]:
+        import pglast
+
+        try:
+            statements = pglast.parse_sql(query)
+        except Exception:
+            return []
+        accesses: list[_Access] = []
+        for raw in statements:
+            self._visit(raw.stmt, [], source, accesses)
+        return accesses
+
+    def _visit(self, node, outer: list[dict], source: str, accesses: list[_Access]) -> None:
+        """Analyze one (sub)statement, then the statements nested in it."""
+        from pglast import ast
+
+        scope = outer
+        if isinstance(node, (ast.SelectStmt, ast.UpdateStmt, ast.DeleteStmt)):
+            local: dict[str, str] = {}
+            conjuncts: list = []
+            for item in self._from_items(node):
+                self._collect_relations(item, local, conjuncts)
+            conjuncts.extend(_conjuncts(node.whereClause))
+            scope = [local, *outer]
+            accesses.extend(self._accesses(node, local, scope, conjuncts, source))
+
+        for name in node:
+            self._visit_children(getattr(node, name), scope, source, accesses)
+
+    def _visit_children(self, value, scope, source, accesses) -> None:
+        from pglast import ast
+
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                self._visit_children(item, scope, source, accesses)
+        elif isinstance(value, ast.Node):
+            self._visit(value, scope, source, accesses)
+
+    @staticmethod
+    def _from_items(node) -> list:
+        items = list(getattr(node, "fromClause", None) or ())
+        if getattr(node, "relation", None) is not None:
+            items.insert(0, node.relation)
+        items.extend(getattr(node, "usingClause", None) or ())
+        return items
+
+    def _collect_relations(self, item, local: dict[str, str], conjuncts: list) -> None:
+        from pglast import ast
+
+        if isinstance(item, ast.RangeVar):
+            table = self._resolve_table(item)
+            if table is not None:
+                local[item.alias.aliasname if item.alias else item.relname] = table
+        elif isinstance(item, ast.JoinExpr):
+            self._collect_relations(item.larg, local, conjuncts)
+            self._collect_relations(item.rarg, local, conjuncts)
+            conjuncts.extend(_conjuncts(item.quals))
+
+    def _resolve_table(self, relation) -> str | None:
+        if relation.schemaname == "pg_temp":
+            return None
+        if relation.schemaname:
+            table = _qualified(relation)
+            return table if table in self.tables else None
+        matches = [t for t in self.tables if t.rpartition(".")[2] == relation.relname]
+        return matches[0] if len(matches) == 1 else None
+
+    def _column(self, node, scope: list[dict]) -> tuple[str, str, str] | None:
+        """(alias, table, column) of a ColumnRef, or None for variables/expressions."""
+        from pglast import ast
+
+        if not isinstance(node, ast.ColumnRef):
+            return None
+        fields = node.fields
+        if any(isinstance(part, ast.A_Star) for part in fields):
+            return None
+        names = [part.sval for part in fields]
+        if len(names) == 2:
+            for local in scope:
+                table = local.get(names[0])
+                if table is not None:
+                    if names[1] in self.tables[table]:
+                        return names[0], table, names[1]
+                    return None
+            return None
+        if len(names) == 1:
+            for local in scope:
+                owners = [(a, t) for a, t in local.items() if names[0] in self.tables[t]]
+                if len(owners) == 1:
+                    return owners[0][0], owners[0][1], names[0]
+                if owners:
+                    return None  # Ambiguous
+        return None
+
+    def _accesses(self, node, local, scope, conjuncts, source) -> list[_Access]:
+        from pglast import ast
+        from pglast.enums import A_Expr_Kind, NullTestType
+
+        by_alias: dict[str, _Access] = {}
+
+        def access(alias: str, table: str) -> _Access:
+            return by_alias.setdefault(alias, _Access(table=table, source=source))
+
+        for conjunct in conjuncts:
+            if isinstance(conjunct, ast.NullTest):
+                column = self._column(conjunct.arg, scope)
+                if (
+                    column
+                    and column[2] == "deleted_at"
+                    and conjunct.nulltesttype == NullTestType.IS_NULL
+                ):
+                    entry = access(column[0], column[1])
+                    entry.partial = True
+                    entry.predicates.append(SOFT_DELETE_PREDICATE)
+                continue
+            if not isinstance(conjunct, ast.A_Expr):
+                continue
+
+            operator = conjunct.name[-1].sval if conjunct.name else ""
+            left = self._column(conjunct.lexpr, scope)
+            right = (
+                self._column(conjunct.rexpr, scope)
+                if not isinstance(conjunct.rexpr, (list, tuple))
+                else None
+            )
+            if conjunct.kind == A_Expr_Kind.AEXPR_OP and operator == "=":
+                if left and right:
+                    if left[0] == right[0]:
+                        continue  # Compares two columns of the same row
+                    for this, other in ((left, right), (right, left)):
+                        entry = access(this[0], this[1])
+                        entry.equality.append(this[2])
+                        entry.predicates.append(f"{this[2]} = {other[1]}.{other[2]}")
+                    continue
+                column = left or right
+                if column:
+                    entry = access(column[0], column[1])
+                    entry.equality.append(column[2])
+                    entry.predicates.append(f"{column[2]} = ?")
+            elif conjunct.kind in (A_Expr_Kind.AEXPR_OP_ANY, A_Expr_Kind.AEXPR_IN) and left:
+                if operator == "=":
+                    entry = access(left[0], left[1])
+                    entry.equality.append(left[2])
+                    entry.predicates.append(f"{left[2]} IN (?)")
+            elif conjunct.kind == A_Expr_Kind.AEXPR_BETWEEN and left:
+                self._add_range(access(left[0], left[1]), left[2], "BETWEEN ? AND ?")
+            elif conjunct.kind == A_Expr_Kind.AEXPR_OP and operator in _RANGE_OPERATORS:
+                if left and not right:
+                    self._add_range(access(left[0], left[1]), left[2], f"{operator} ?")
+                elif right and not left:
+                    mirrored = _RANGE_OPERATORS[operator]
+                    self._add_range(access(right[0], right[1]), right[2], f"{mirrored} ?")
+
+        selected = self._selected_columns(node, local, scope)
+        for alias, entry in by_alias.items():
+            if entry.range_column in entry.equality:
+                entry.range_column = None
+            if selected is not None and list(local) == [alias]:
+                entry.selected = selected
+        return list(by_alias.values())
+
+    @staticmethod
+    def _add_range(entry: _Access, column: str, comparison: str) -> None:
+        """Only the first range column can follow the equality columns in a B-tree."""
+        if entry.range_column is None:
+            entry.range_column = column
+            entry.predicates.append(f"{column} {comparison}")
+
+    def _selected_columns(self, node, local, scope) -> tuple[str, ...] | None:
+        """Plain columns of a single-table SELECT (candidates for INCLUDE)."""
+        from pglast import ast
+
+        if not isinstance(node, ast.SelectStmt) or len(local) != 1 or not node.targetList:
+            return None
+        columns = []
+        for target in node.targetList:
+            column = self._column(target.val, scope)
+            if column is None or column[0] not in local:
+                return None
+            columns.append(column[2])
+        return tuple(dict.fromkeys(columns))
+
+
+def _qualified(relation) -> str:
+    return f"{relation.schemaname or 'public'}.{relation.relname}"
+
+
+def _conjuncts(node) -> list:
+    """AND-ed terms of a boolean expression (OR and NOT terms are not index-usable)."""
+    from pglast import ast
+    from pglast.enums import BoolExprType
+
+    if node is None:
+        return []
+    if isinstance(node, ast.BoolExpr) and node.boolop == BoolExprType.AND_EXPR:
+        return [term for arg in node.args for term in _conjuncts(arg)]
+    return [node]
+
+
+def _plpgsql_queries(node) -> list[str]:
+    """SQL statements (and expressions, as SELECTs) embedded in a parse_plpgsql tree."""
+    queries = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, list):
+            stack.extend(reversed(current))
+        elif isinstance(current, dict):
+            for kind, value in current.items():
+                if kind == "PLpgSQL_expr":
+                    query, mode = value["query"], value.get("parseMode", 0)
+                    if mode >= 3:  # Assignment: target := expression
+                        query = query.split(":=", 1)[-1]
+                    queries.append(query if mode == 0 else f"SELECT {query}")
+                else:
+                    stack.append(value)
+    return queries
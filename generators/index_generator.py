@@ -4,12 +4,17 @@ Generates appropriate database indexes for FraiseQL rich types
 """
 
 from core.ast_models import Entity, FieldDefinition
+from generators.schema.online_ddl import concurrently
+from generators.schema.partition_generator import PartitionGenerator
 from utils.safe_slug import safe_slug, safe_table_name
 
 
 class IndexGenerator:
     """Generates database indexes appropriate for rich types"""
 
+    def __init__(self, online: bool = False):
+        self.online = online  # Build indexes CONCURRENTLY (not supported on partitioned tables)
+
     def generate_indexes_for_rich_types(self, entity: Entity) -> list[str]:
         """Generate indexes for all rich type fields in an entity"""
         indexes = []
@@ -19,6 +24,8 @@ class IndexGenerator:
                 field_indexes = self._generate_index_for_field(field_def, entity)
                 indexes.extend(field_indexes)
 
+        if self.online and not PartitionGenerator(entity).is_partitioned():
+            return [concurrently(index) for index in indexes]
         return indexes
 
     def _generate_index_for_field(self, field: FieldDefinition, entity: Entity) -> list[str]:
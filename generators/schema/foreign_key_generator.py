@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from core.ast_models import FieldDefinition
 
 from .index_strategy import generate_btree_index
+from .online_ddl import add_constraint
 
 
 @dataclass
@@ -33,6 +34,14 @@ class ForeignKeyDDL:
 class ForeignKeyGenerator:
     """Generates foreign key DDL from reference fields"""
 
+    def __init__(self, online: bool = False):
+        """
+        Args:
+            online: Emit lock-light DDL (constraints added NOT VALID then validated,
+                indexes built CONCURRENTLY) instead of inline REFERENCES
+        """
+        self.online = online
+
     def map_field(self, field: FieldDefinition) -> ForeignKeyDDL:
         """
         Map reference field to foreign key DDL
@@ -74,12 +83,18 @@ class ForeignKeyGenerator:
             fk_company INTEGER NOT NULL
             REFERENCES crm.tb_company(pk_company)
             ON DELETE RESTRICT ON UPDATE CASCADE
+
+        In online mode the column is emitted without REFERENCES; add the constraint
+        with generate_constraint_ddl() after the table.
         """
         parts = [fk_ddl.column_name, fk_ddl.postgres_type]
 
         if not fk_ddl.nullable:
             parts.append("NOT NULL")
 
+        if self.online:
+            return " ".join(parts)
+
         # REFERENCES constraint
         ref_target = (
             f"{fk_ddl.references_schema}.{fk_ddl.references_table}({fk_ddl.references_column})"
@@ -92,6 +107,28 @@ class ForeignKeyGenerator:
 
         return " ".join(parts)
 
+    def generate_constraint_ddl(self, schema: str, table: str, fk_ddl: ForeignKeyDDL) -> str:
+        """
+        Generate FK constraint as a separate ALTER TABLE
+
+        Example output (online):
+            ALTER TABLE crm.tb_contact
+                ADD CONSTRAINT tb_contact_fk_company_fkey
+                FOREIGN KEY (fk_company) REFERENCES crm.tb_company(pk_company)
+                ON DELETE RESTRICT ON UPDATE CASCADE NOT VALID;
+            ALTER TABLE crm.tb_contact VALIDATE CONSTRAINT tb_contact_fk_company_fkey;
+        """
+        ref_target = (
+            f"{fk_ddl.references_schema}.{fk_ddl.references_table}({fk_ddl.references_column})"
+        )
+        return add_constraint(
+            f"{schema}.{table}",
+            f"{table}_{fk_ddl.column_name}_fkey",
+            f"FOREIGN KEY ({fk_ddl.column_name}) REFERENCES {ref_target} "
+            f"ON DELETE {fk_ddl.on_delete} ON UPDATE {fk_ddl.on_update}",
+            online=self.online,
+        )
+
     def generate_index(self, schema: str, table: str, fk_ddl: ForeignKeyDDL) -> str:
         """
         Generate B-tree index on FK column with partial index support
@@ -106,4 +143,6 @@ class ForeignKeyGenerator:
         index_name = f"idx_{entity_name}_{field_name}"
         table_name = f"{schema}.{table}"
 
-        return generate_btree_index(table_name, index_name, [fk_ddl.column_name])
+        return generate_btree_index(
+            table_name, index_name, [fk_ddl.column_name], concurrently=self.online
+        )
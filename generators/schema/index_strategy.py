@@ -8,6 +8,7 @@ def generate_index(
     index_type: str = "btree",
     unique: bool = False,
     partial: bool = True,  # NEW: Default to partial indexes
+    concurrently: bool = False,
 ) -> str:
     """Generate index with optional partial index clause.
 
@@ -18,6 +19,7 @@ def generate_index(
         index_type: Index type ('btree', 'gin', 'gist', etc.)
         unique: Whether this is a unique index
         partial: Whether to add WHERE deleted_at IS NULL (default True)
+        concurrently: Build with CREATE INDEX CONCURRENTLY (online mode)
 
     Returns:
         SQL CREATE INDEX statement
@@ -31,6 +33,7 @@ def generate_index(
         )
     """
     unique_clause = "UNIQUE " if unique else ""
+    concurrently_clause = "CONCURRENTLY " if concurrently else ""
     using_clause = f"USING {index_type}" if index_type != "btree" else ""
     column_list = ", ".join(columns)
 
@@ -39,15 +42,19 @@ def generate_index(
     if partial and not unique:  # Don't apply to unique constraints
         where_clause = "\n    WHERE deleted_at IS NULL"
 
-    return f"""CREATE {unique_clause}INDEX {index_name}
+    return f"""CREATE {unique_clause}INDEX {concurrently_clause}{index_name}
     ON {table_name} {using_clause}({column_list}){where_clause};""".strip()
 
 
 def generate_btree_index(
-    table_name: str, index_name: str, columns: list[str], partial: bool = True
+    table_name: str,
+    index_name: str,
+    columns: list[str],
+    partial: bool = True,
+    concurrently: bool = False,
 ) -> str:
     """Generate B-tree index (most common type)."""
-    return generate_index(table_name, index_name, columns, "btree", False, partial)
+    return generate_index(table_name, index_name, columns, "btree", False, partial, concurrently)
 
 
 def generate_gin_index(
@@ -0,0 +1,127 @@
+"""
+Online-safe DDL helpers.
+
+Plain `CREATE INDEX`, `ADD CONSTRAINT ... FOREIGN KEY` and `SET NOT NULL` hold SHARE or
+ACCESS EXCLUSIVE locks while they scan the whole table, blocking writes (or all
+traffic) for the duration. Online mode trades those for lock-light equivalents:
+
+- `CREATE INDEX CONCURRENTLY`, which cannot run inside a transaction block and is
+  therefore split into its own file (see split_concurrent)
+- `ADD CONSTRAINT ... NOT VALID` followed by `VALIDATE CONSTRAINT`, which only takes a
+  SHARE UPDATE EXCLUSIVE lock for the scan. The validation runs after the migration
+  has committed (see split_validation): inside it, the scan would run while the
+  migration still holds the ACCESS EXCLUSIVE lock taken by ADD CONSTRAINT
+- `SET NOT NULL` proven by a validated `CHECK (col IS NOT NULL)`, so PostgreSQL 12+
+  skips the full-table scan under ACCESS EXCLUSIVE (also run after the migration)
+- a `SET lock_timeout` preamble so a DDL statement queued behind a long transaction
+  fails fast instead of blocking every query queued behind it
+"""
+
+import re
+
+DEFAULT_LOCK_TIMEOUT = "5s"
+
+_CREATE_INDEX = re.compile(
+    r"^([ \t]*CREATE[ \t]+(?:UNIQUE[ \t]+)?INDEX)[ \t]+(?!CONCURRENTLY\b)",
+    re.IGNORECASE | re.MULTILINE,
+)
+_CONCURRENT_STATEMENT = re.compile(
+    r"^[ \t]*(?:CREATE[ \t]+(?:UNIQUE[ \t]+)?|DROP[ \t]+)INDEX[ \t]+CONCURRENTLY\b[^;]*;[ \t]*\n?",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+_VALIDATION_STATEMENT = re.compile(
+    r"^[ \t]*ALTER[ \t]+TABLE[ \t]+(?:ONLY[ \t]+)?\S+[ \t]+(?:VALIDATE[ \t]+CONSTRAINT\b"
+    r"|ALTER[ \t]+COLUMN[ \t]+\S+[ \t]+SET[ \t]+NOT[ \t]+NULL\b"
+    r"|DROP[ \t]+CONSTRAINT[ \t]+\S+_not_null\b)[^;]*;[ \t]*\n?",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+CONCURRENT_FILE_HEADER = """-- ============================================================================
+-- Concurrent index builds
+-- Run OUTSIDE a transaction block (e.g. psql -f, without --single-transaction)
+-- after the migration they belong to. A failed build leaves an INVALID index:
+-- drop it and re-run this file.
+-- ============================================================================
+"""
+
+
+VALIDATION_FILE_HEADER = """-- ============================================================================
+-- Constraint validation
+-- Run after the migration it belongs to has committed, outside its transaction.
+-- VALIDATE CONSTRAINT scans under a SHARE UPDATE EXCLUSIVE lock, so writes
+-- continue meanwhile; SET NOT NULL then relies on the validated CHECK.
+-- ============================================================================
+"""
+
+
+def lock_timeout_preamble(lock_timeout: str = DEFAULT_LOCK_TIMEOUT) -> str:
+    """Fail fast instead of queueing behind long transactions while holding a lock."""
+    return f"SET lock_timeout = '{lock_timeout}';"
+
+
+def concurrently(sql: str) -> str:
+    """Rewrite every CREATE [UNIQUE] INDEX in `sql` as CREATE ... INDEX CONCURRENTLY."""
+    return _CREATE_INDEX.sub(r"\1 CONCURRENTLY ", sql)
+
+
+def split_concurrent(sql: str) -> tuple[str, str]:
+    """
+    Separate CREATE/DROP INDEX CONCURRENTLY statements from the rest of `sql`.
+
+    Returns:
+        (transactional SQL, concurrent index SQL)
+    """
+    concurrent = [match.group(0).strip() for match in _CONCURRENT_STATEMENT.finditer(sql)]
+    return _CONCURRENT_STATEMENT.sub("", sql), "\n\n".join(concurrent)
+
+
+def split_validation(sql: str) -> tuple[str, str]:
+    """
+    Separate the post-migration steps of add_constraint/set_not_null from `sql`.
+
+    Returns:
+        (migration SQL, validation SQL: VALIDATE CONSTRAINT, SET NOT NULL and
+        dropping the proving CHECK)
+    """
+    validation = [match.group(0).strip() for match in _VALIDATION_STATEMENT.finditer(sql)]
+    return _VALIDATION_STATEMENT.sub("", sql), "\n".join(validation)
+
+
+def add_constraint(
+    table: str, name: str, definition: str, online: bool = False, only: bool = False
+) -> str:
+    """
+    ALTER TABLE ... ADD CONSTRAINT, split into NOT VALID + VALIDATE when online.
+
+    The VALIDATE statement belongs after the migration (see split_validation). Only
+    FOREIGN KEY and CHECK constraints accept NOT VALID; other definitions are
+    added as-is.
+    """
+    alter = f"ALTER TABLE{' ONLY' if only else ''} {table}"
+    statement = f"{alter}\n    ADD CONSTRAINT {name}\n    {definition}"
+    if not online or not re.match(r"(FOREIGN\s+KEY|CHECK)\b", definition, re.IGNORECASE):
+        return f"{statement};"
+    return f"{statement} NOT VALID;\n{alter} VALIDATE CONSTRAINT {name};"
+
+
+def set_not_null(table: str, column: str, online: bool = False) -> str:
+    """
+    ALTER COLUMN ... SET NOT NULL, proven by a validated CHECK when online.
+
+    Online, everything after adding the NOT VALID CHECK belongs after the migration
+    (see split_validation).
+    """
+    statement = f"ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL;"
+    if not online:
+        return statement
+
+    check = f"{table.rpartition('.')[2]}_{column}_not_null"
+    return "\n".join(
+        [
+            f"ALTER TABLE {table} ADD CONSTRAINT {check} CHECK ({column} IS NOT NULL) NOT VALID;",
+            f"ALTER TABLE {table} VALIDATE CONSTRAINT {check};",
+            statement,
+            f"ALTER TABLE {table} DROP CONSTRAINT {check};",
+        ]
+    )
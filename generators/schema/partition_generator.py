@@ -0,0 +1,244 @@
+"""
+Partition Generator
+
+Generates declarative partitioning DDL for tb_ tables with a `partitioning:` block.
+
+- RANGE: time buckets on a date/timestamp key, a DEFAULT partition, and
+  create/drop/maintain functions for rolling partition creation and retention
+- LIST: one partition per configured value list, plus a DEFAULT partition
+- HASH: a fixed set of MODULUS/REMAINDER partitions (e.g. on tenant_id)
+
+PostgreSQL requires every unique constraint on a partitioned table to include the
+partition key, so the table template widens the primary key and unique constraints
+with `key_column` when partitioning is configured.
+"""
+
+from core.ast_models import IMPLICIT_PARTITION_KEY_COLUMNS, Entity, PartitionStrategy
+from core.exceptions import SpecQLValidationError
+
+# Partition name suffix format per range interval
+RANGE_SUFFIX_FORMATS = {"day": "YYYYMMDD", "week": "YYYYMMDD", "month": "YYYYMM", "year": "YYYY"}
+
+
+def validate_partition_references(entities: list) -> None:
+    """
+    Reject references to partitioned entities.
+
+    pk_<entity> alone is not unique on a partitioned table (its primary key
+    includes the partition key), so no foreign key can target it.
+
+    Raises:
+        SpecQLValidationError: If an entity has a ref() to a partitioned entity
+    """
+    partitioned = {e.name for e in entities if getattr(e, "partitioning", None) is not None}
+    for entity in entities:
+        for field_name, field_def in entity.fields.items():
+            target = field_def.reference_entity
+            if field_def.type_name == "ref" and target in partitioned:
+                raise SpecQLValidationError(
+                    entity=entity.name,
+                    message=(
+                        f"Field '{field_name}' references partitioned entity '{target}': "
+                        "foreign keys to partitioned entities are not supported"
+                    ),
+                )
+
+
+class PartitionGenerator:
+    """Generate PARTITION BY clauses, partitions and maintenance functions for an entity"""
+
+    def __init__(self, entity: Entity):
+        self.entity = entity
+        self.config = getattr(entity, "partitioning", None)
+        self.table_name = f"tb_{entity.name.lower()}"
+        self.qualified_table = f"{entity.schema}.{self.table_name}"
+
+    def is_partitioned(self) -> bool:
+        """Check if the entity declares a partitioning block."""
+        return self.config is not None
+
+    @property
+    def key_column(self) -> str:
+        """Physical partition key column (ref fields map to their fk_ column)."""
+        key = self.config.key
+        field_def = self.entity.fields.get(key)
+        if field_def and field_def.type_name == "ref":
+            return f"fk_{key}"
+        return key
+
+    @property
+    def key_type(self) -> str:
+        """PostgreSQL type of the partition key column."""
+        key = self.config.key
+        if key in IMPLICIT_PARTITION_KEY_COLUMNS:
+            return IMPLICIT_PARTITION_KEY_COLUMNS[key]
+        return self.entity.fields[key].get_postgres_type()
+
+    def pruning_key(self, tenant_filtered: bool = False) -> dict[str, str] | None:
+        """
+        Partition key that lookups must filter on to prune to a single partition.
+
+        Returns None when the entity is not partitioned, or when the key is tenant_id and
+        the caller already filters on tenant_id (pruning then happens without extra input).
+        """
+        if not self.is_partitioned():
+            return None
+        if tenant_filtered and self.key_column == "tenant_id":
+            return None
+        return {"column": self.key_column, "type": self.key_type}
+
+    def partition_clause(self) -> str:
+        """PARTITION BY clause body, e.g. RANGE (created_at)."""
+        return f"{self.config.strategy.value.upper()} ({self.key_column})"
+
+    def generate(self) -> str:
+        """Generate partitions and maintenance functions (empty if not partitioned)."""
+        if not self.is_partitioned():
+            return ""
+
+        header = f"""
+-- ============================================================================
+-- Partitions: {self.qualified_table} ({self.config.strategy.value} on {self.key_column})
+-- ============================================================================""".strip()
+
+        if self.config.strategy == PartitionStrategy.RANGE:
+            body = self._generate_range_partitions()
+        elif self.config.strategy == PartitionStrategy.LIST:
+            body = self._generate_list_partitions()
+        else:
+            body = self._generate_hash_partitions()
+
+        return f"{header}\n{body}"
+
+    def _generate_default_partition(self) -> str:
+        """Catch-all partition for rows outside the declared bounds."""
+        return f"""CREATE TABLE IF NOT EXISTS {self.qualified_table}_default
+    PARTITION OF {self.qualified_table} DEFAULT;"""
+
+    def _generate_list_partitions(self) -> str:
+        partitions = []
+        for name, values in self.config.values.items():
+            literals = ", ".join("'" + v.replace("'", "''") + "'" for v in values)
+            partitions.append(
+                f"""CREATE TABLE IF NOT EXISTS {self.qualified_table}_{name.lower()}
+    PARTITION OF {self.qualified_table} FOR VALUES IN ({literals});"""
+            )
+        partitions.append(self._generate_default_partition())
+        return "\n\n".join(partitions)
+
+    def _generate_hash_partitions(self) -> str:
+        modulus = self.config.partitions
+        return "\n\n".join(
+            f"""CREATE TABLE IF NOT EXISTS {self.qualified_table}_p{remainder}
+    PARTITION OF {self.qualified_table} FOR VALUES WITH (MODULUS {modulus}, REMAINDER {remainder});"""
+            for remainder in range(modulus)
+        )
+
+    def _generate_range_partitions(self) -> str:
+        return "\n\n".join(
+            [
+                self._generate_default_partition(),
+                self._generate_create_partitions_function(),
+                self._generate_drop_partitions_function(),
+                self._generate_maintain_partitions_function(),
+                f"-- Create the current and upcoming partitions\n"
+                f"SELECT {self.entity.schema}.create_{self.table_name}_partitions();",
+            ]
+        )
+
+    def _generate_create_partitions_function(self) -> str:
+        """Generate create_tb_{entity}_partitions(): current bucket plus premake ahead."""
+        schema = self.entity.schema
+        interval = self.config.interval
+        suffix_format = RANGE_SUFFIX_FORMATS[interval]
+
+        return f"""CREATE OR REPLACE FUNCTION {schema}.create_{self.table_name}_partitions(
+    p_from TIMESTAMPTZ DEFAULT now(),
+    p_premake INTEGER DEFAULT {self.config.premake}
+) RETURNS INTEGER AS $$
+DECLARE
+    v_start {self.key_type} := date_trunc('{interval}', p_from);
+    v_end {self.key_type};
+    v_partition TEXT;
+    v_created INTEGER := 0;
+BEGIN
+    FOR i IN 0..p_premake LOOP
+        v_end := v_start + INTERVAL '1 {interval}';
+        v_partition := '{self.table_name}_p' || to_char(v_start, '{suffix_format}');
+
+        IF to_regclass(format('%I.%I', '{schema}', v_partition)) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I.%I PARTITION OF {self.qualified_table} FOR VALUES FROM (%L) TO (%L)',
+                '{schema}', v_partition, v_start, v_end
+            );
+            v_created := v_created + 1;
+        END IF;
+
+        v_start := v_end;
+    END LOOP;
+
+    RETURN v_created;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION {schema}.create_{self.table_name}_partitions IS
+'Creates missing per-{interval} partitions of {self.qualified_table} from p_from through p_premake buckets ahead.';"""
+
+    def _generate_drop_partitions_function(self) -> str:
+        """Generate drop_tb_{entity}_partitions(): drop partitions past the retention window."""
+        schema = self.entity.schema
+        retention = self.config.retention
+        retention_default = f"INTERVAL '{retention}'" if retention else "NULL"
+
+        return f"""CREATE OR REPLACE FUNCTION {schema}.drop_{self.table_name}_partitions(
+    p_retention INTERVAL DEFAULT {retention_default}
+) RETURNS INTEGER AS $$
+DECLARE
+    v_partition RECORD;
+    v_dropped INTEGER := 0;
+BEGIN
+    IF p_retention IS NULL THEN
+        RETURN 0;
+    END IF;
+
+    -- Dropping whole partitions avoids bulk DELETE, dead tuples and VACUUM churn
+    FOR v_partition IN
+        SELECT bounds.partition_name, bounds.upper_bound
+        FROM (
+            SELECT c.oid::regclass AS partition_name,
+                   (regexp_match(
+                       pg_get_expr(c.relpartbound, c.oid),
+                       'TO \\(''([^'']+)''\\)'
+                   ))[1] AS upper_bound
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = '{self.qualified_table}'::regclass
+        ) bounds
+        WHERE bounds.upper_bound IS NOT NULL
+          AND bounds.upper_bound::TIMESTAMPTZ <= now() - p_retention
+    LOOP
+        EXECUTE format('DROP TABLE %s', v_partition.partition_name);
+        v_dropped := v_dropped + 1;
+    END LOOP;
+
+    RETURN v_dropped;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION {schema}.drop_{self.table_name}_partitions IS
+'Drops partitions of {self.qualified_table} whose upper bound is older than p_retention.';"""
+
+    def _generate_maintain_partitions_function(self) -> str:
+        """Generate maintain_tb_{entity}_partitions() for scheduled jobs (e.g. pg_cron)."""
+        schema = self.entity.schema
+
+        return f"""CREATE OR REPLACE FUNCTION {schema}.maintain_{self.table_name}_partitions()
+RETURNS void AS $$
+BEGIN
+    PERFORM {schema}.create_{self.table_name}_partitions();
+    PERFORM {schema}.drop_{self.table_name}_partitions();
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION {schema}.maintain_{self.table_name}_partitions IS
+'Partition maintenance for {self.qualified_table}: premakes upcoming partitions and applies retention. Schedule periodically.';"""
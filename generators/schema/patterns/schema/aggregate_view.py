@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 
-from core.ast_models import Entity
+from core.ast_models import Entity, FieldDefinition
 
 
 @dataclass
@@ -23,8 +23,10 @@ class AggregateViewPattern:
         """
         Apply aggregate view pattern.
 
-        Creates a materialized view with GROUP BY and aggregate functions,
-        with optional auto-refresh triggers.
+        Creates a materialized view with GROUP BY and aggregate functions.
+        Auto mode refreshes it concurrently after each write statement;
+        incremental mode replaces it with a summary table kept up to date
+        by trigger-applied deltas.
 
         Args:
             entity: Entity to create aggregate view for
@@ -38,17 +40,7 @@ class AggregateViewPattern:
             Tuple of (modified_entity, additional_sql)
         """
         config = cls._parse_config(params)
-
-        # Generate aggregate view DDL
-        view_ddl = cls._generate_view_ddl(entity, config)
-
-        # Generate indexes if specified
-        index_ddls = cls._generate_indexes(entity, config)
-
-        # Generate refresh triggers if auto mode
-        trigger_ddl = ""
-        if config.refresh_mode == "auto":
-            trigger_ddl = cls._generate_refresh_triggers(entity, config)
+        view_ddl, index_ddls, trigger_ddl = cls._build(entity, config)
 
         # Store aggregate view info in entity for template access
         if not hasattr(entity, "aggregate_views"):
@@ -72,6 +64,38 @@ class AggregateViewPattern:
         # Return empty additional_sql since template handles rendering
         return entity, ""
 
+    @classmethod
+    def generate_sql(cls, entity: Entity, params: dict) -> str:
+        """
+        Generate the complete aggregate view SQL for the entity.
+
+        Same DDL as apply(), as one script: the view (or summary table), its
+        indexes and its refresh functions and triggers.
+        """
+        view_ddl, index_ddls, trigger_ddl = cls._build(entity, cls._parse_config(params))
+        return "\n\n".join(part for part in [view_ddl, *index_ddls, trigger_ddl] if part)
+
+    @classmethod
+    def _build(cls, entity: Entity, config: AggregateViewConfig) -> tuple[str, list[str], str]:
+        """(view DDL, index DDLs, refresh DDL) for the configured refresh mode."""
+        index_ddls = cls._generate_indexes(entity, config)
+
+        if config.refresh_mode == "incremental":
+            # Summary table maintained by per-statement deltas (no full refresh)
+            view_ddl = cls._generate_summary_table_ddl(entity, config)
+            trigger_ddl = cls._generate_incremental_triggers(entity, config)
+        else:
+            view_ddl = cls._generate_view_ddl(entity, config)
+
+            if config.refresh_mode == "auto":
+                # Auto mode refreshes concurrently, which needs a unique group index
+                index_ddls.insert(0, cls._generate_unique_group_index(entity, config))
+                trigger_ddl = cls._generate_refresh_triggers(entity, config)
+            else:
+                trigger_ddl = cls._generate_manual_refresh(entity, config)
+
+        return view_ddl, index_ddls, trigger_ddl
+
     @classmethod
     def _parse_config(cls, params: dict) -> AggregateViewConfig:
         """Parse pattern parameters."""
@@ -92,7 +116,7 @@ class AggregateViewPattern:
 
             # Generate default alias if not provided
             if not alias:
-                alias = f"{function.lower()}_{field}"
+                alias = f"{function.lower()}_{field or 'all'}"
 
             processed_aggregates.append(
                 {"field": field, "function": function.upper(), "alias": alias}
@@ -123,34 +147,20 @@ class AggregateViewPattern:
         # Add group by columns
         for field in config.group_by:
             # Check if it's a reference field
-            field_def = entity.fields.get(field)
-            if field_def and field_def.type_name == "ref":
-                # Use FK column name
-                fk_column = f"fk_{field}"
-                select_parts.append(f"{fk_column} AS {field}")
-            else:
-                select_parts.append(field)
+            column = cls._get_source_column(entity, field)
+            select_parts.append(f"{column} AS {field}" if column != field else field)
 
         # Add aggregate functions
         for agg in config.aggregates:
-            field = agg["field"]
+            field = cls._get_source_column(entity, agg["field"]) if agg["field"] else "*"
             function = agg["function"]
             alias = agg["alias"]
             select_parts.append(f"{function}({field}) AS {alias}")
 
         select_clause = ",\n    ".join(select_parts)
 
-        # Build GROUP BY clause
-        group_by_parts = []
-        for field in config.group_by:
-            field_def = entity.fields.get(field)
-            if field_def and field_def.type_name == "ref":
-                # Use FK column name
-                group_by_parts.append(f"fk_{field}")
-            else:
-                group_by_parts.append(field)
-
-        group_by_clause = ", ".join(group_by_parts)
+        # Build GROUP BY clause (refs group on their FK column)
+        group_by_clause = ", ".join(cls._get_source_column(entity, f) for f in config.group_by)
 
         # Build DDL
         ddl = f"""CREATE MATERIALIZED VIEW {full_view_name} AS
@@ -178,19 +188,12 @@ COMMENT ON MATERIALIZED VIEW {full_view_name} IS '@fraiseql:type=aggregate_view
             fields = idx.get("fields", [])
             using = idx.get("using", "btree")
 
-            if not idx_name or not fields:
+            if not fields:
                 continue
+            idx_name = idx_name or f"idx_{view_name}_{fields[0]}"
 
-            # Build field list (handle FK references)
-            field_list = []
-            for field in fields:
-                field_def = entity.fields.get(field)
-                if field_def and field_def.type_name == "ref":
-                    field_list.append(f"fk_{field}")
-                else:
-                    field_list.append(field)
-
-            fields_str = ", ".join(field_list)
+            # View columns use logical names (refs are selected as fk_x AS x)
+            fields_str = ", ".join(fields)
             index_sql = f"CREATE INDEX {idx_name} ON {full_view_name} USING {using} ({fields_str});"
             index_statements.append(index_sql)
 
@@ -198,7 +201,11 @@ COMMENT ON MATERIALIZED VIEW {full_view_name} IS '@fraiseql:type=aggregate_view
 
     @classmethod
     def _generate_refresh_triggers(cls, entity: Entity, config: AggregateViewConfig) -> str:
-        """Generate auto-refresh triggers for materialized view."""
+        """Generate statement-level auto-refresh triggers for materialized view.
+
+        REFRESH ... CONCURRENTLY keeps the view readable while it refreshes and
+        relies on the unique group index from _generate_unique_group_index().
+        """
         view_name = cls._get_view_name(entity)
         full_view_name = f"{entity.schema}.{view_name}"
         table_name = f"{entity.schema}.tb_{entity.name.lower()}"
@@ -210,14 +217,316 @@ RETURNS TRIGGER
 LANGUAGE plpgsql
 AS $$
 BEGIN
-    REFRESH MATERIALIZED VIEW {full_view_name};
+    REFRESH MATERIALIZED VIEW CONCURRENTLY {full_view_name};
     RETURN NULL;
 END;
 $$;
 
 CREATE TRIGGER {trigger_name}
-AFTER INSERT OR UPDATE OR DELETE ON {table_name}
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table_name}
 FOR EACH STATEMENT
 EXECUTE FUNCTION {function_name}();"""
 
         return ddl
+
+    @classmethod
+    def _generate_manual_refresh(cls, entity: Entity, config: AggregateViewConfig) -> str:
+        """Generate refresh_{view}() for manual mode (callers choose when to refresh)."""
+        view_name = cls._get_view_name(entity)
+
+        return f"""CREATE OR REPLACE FUNCTION {entity.schema}.refresh_{view_name}()
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW {entity.schema}.{view_name};
+END;
+$$;"""
+
+    @classmethod
+    def _generate_unique_group_index(cls, entity: Entity, config: AggregateViewConfig) -> str:
+        """Generate the unique index on group columns required by REFRESH CONCURRENTLY."""
+        view_name = cls._get_view_name(entity)
+        full_view_name = f"{entity.schema}.{view_name}"
+        columns = ", ".join(config.group_by)
+
+        return f"CREATE UNIQUE INDEX idx_{view_name}_group ON {full_view_name} ({columns});"
+
+    # ------------------------------------------------------------------
+    # Incremental mode: summary table + trigger-maintained deltas
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def _generate_summary_table_ddl(cls, entity: Entity, config: AggregateViewConfig) -> str:
+        """Generate the summary table that replaces the materialized view in incremental mode.
+
+        The table keeps the view's name and column names so readers are unaffected.
+        SUM/AVG are exposed as generated columns over internal running sums and
+        non-null counts; COUNT columns are plain counters; MIN/MAX are stored values.
+        """
+        view_name = cls._get_view_name(entity)
+        full_view_name = f"{entity.schema}.{view_name}"
+
+        columns = []
+        for field in config.group_by:
+            columns.append(f"{field} {cls._get_group_column_type(entity, field)}")
+
+        columns.append("_row_count BIGINT NOT NULL DEFAULT 0")
+
+        for agg in config.aggregates:
+            alias = agg["alias"]
+            function = agg["function"]
+
+            if function == "COUNT":
+                columns.append(f"{alias} BIGINT NOT NULL DEFAULT 0")
+            elif function in ("SUM", "AVG"):
+                columns.append(f"_sum_{alias} NUMERIC NOT NULL DEFAULT 0")
+                columns.append(f"_cnt_{alias} BIGINT NOT NULL DEFAULT 0")
+                expression = (
+                    f"_sum_{alias}" if function == "SUM" else f"_sum_{alias} / _cnt_{alias}"
+                )
+                columns.append(
+                    f"{alias} NUMERIC GENERATED ALWAYS AS "
+                    f"(CASE WHEN _cnt_{alias} > 0 THEN {expression} END) STORED"
+                )
+            elif function in ("MIN", "MAX"):
+                field_def = entity.fields.get(agg["field"])
+                column_type = field_def.get_postgres_type() if field_def else "NUMERIC"
+                columns.append(f"{alias} {column_type}")
+            else:
+                raise ValueError(
+                    f"Aggregate function '{function}' is not supported in incremental mode "
+                    "(supported: COUNT, SUM, AVG, MIN, MAX)"
+                )
+
+        # NULLS NOT DISTINCT (PostgreSQL 15+) lets ON CONFLICT match NULL group keys
+        columns.append(f"UNIQUE NULLS NOT DISTINCT ({', '.join(config.group_by)})")
+
+        column_defs = ",\n    ".join(columns)
+
+        return f"""CREATE TABLE {full_view_name} (
+    {column_defs}
+);
+
+COMMENT ON TABLE {full_view_name} IS '@fraiseql:type=aggregate_view @fraiseql:refresh_mode={config.refresh_mode}';"""
+
+    @classmethod
+    def _generate_incremental_triggers(cls, entity: Entity, config: AggregateViewConfig) -> str:
+        """Generate the delta-maintenance function, its triggers and a full rebuild function."""
+        view_name = cls._get_view_name(entity)
+        full_view_name = f"{entity.schema}.{view_name}"
+        table_name = f"{entity.schema}.tb_{entity.name.lower()}"
+        function_name = f"{entity.schema}.apply_{view_name}_delta"
+        rebuild_name = f"{entity.schema}.refresh_{view_name}"
+
+        apply_new = cls._indent(cls._build_delta_upsert(entity, config, "new_rows", 1), 8)
+        apply_old = cls._indent(cls._build_delta_upsert(entity, config, "old_rows", -1), 8)
+        rebuild = cls._indent(cls._build_delta_upsert(entity, config, table_name, 1), 4)
+        recompute = cls._build_extreme_recompute(entity, config)
+        group_match = cls._build_group_match(entity, config, "o", logical=True)
+
+        old_block = [apply_old]
+        if recompute:
+            old_block.append(recompute)
+        old_block.append(
+            f"""-- Drop groups whose last row went away
+        DELETE FROM {full_view_name} s
+        USING (SELECT DISTINCT {cls._build_group_select(entity, config)} FROM old_rows) o
+        WHERE {group_match}
+          AND s._row_count = 0;"""
+        )
+        old_statements = "\n\n        ".join(old_block)
+
+        triggers = []
+        for event, referencing in (
+            ("INSERT", "NEW TABLE AS new_rows"),
+            ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+            ("DELETE", "OLD TABLE AS old_rows"),
+        ):
+            triggers.append(
+                f"""CREATE TRIGGER tr_{view_name}_{event.lower()}
+AFTER {event} ON {table_name}
+REFERENCING {referencing}
+FOR EACH STATEMENT
+EXECUTE FUNCTION {function_name}();"""
+            )
+        triggers.append(
+            f"""CREATE TRIGGER tr_{view_name}_truncate
+AFTER TRUNCATE ON {table_name}
+FOR EACH STATEMENT
+EXECUTE FUNCTION {function_name}();"""
+        )
+        trigger_ddl = "\n\n".join(triggers)
+
+        return f"""-- Incremental maintenance: one aggregated delta per statement (transition tables)
+CREATE OR REPLACE FUNCTION {function_name}()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        -- No transition tables for TRUNCATE: rebuild from the (now empty) base table
+        PERFORM {rebuild_name}();
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        {apply_new}
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        {old_statements}
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+{trigger_ddl}
+
+-- Full rebuild (initial load or repair)
+CREATE OR REPLACE FUNCTION {rebuild_name}()
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    DELETE FROM {full_view_name};
+
+    {rebuild}
+END;
+$$;"""
+
+    @classmethod
+    def _build_delta_upsert(
+        cls, entity: Entity, config: AggregateViewConfig, source: str, sign: int
+    ) -> str:
+        """Build the grouped upsert applying rows from `source` with the given sign."""
+        view_name = cls._get_view_name(entity)
+        full_view_name = f"{entity.schema}.{view_name}"
+        sign_sql = "" if sign > 0 else "-"
+
+        insert_columns = list(config.group_by) + ["_row_count"]
+        select_values = [
+            f"{cls._get_source_column(entity, field)} AS {field}" for field in config.group_by
+        ]
+        select_values.append(f"{sign_sql}COUNT(*)")
+        updates = ["_row_count = s._row_count + EXCLUDED._row_count"]
+
+        for agg in config.aggregates:
+            alias = agg["alias"]
+            function = agg["function"]
+            column = cls._get_source_column(entity, agg["field"]) if agg["field"] else None
+
+            if function == "COUNT":
+                insert_columns.append(alias)
+                select_values.append(f"{sign_sql}COUNT({column or '*'})")
+                updates.append(f"{alias} = s.{alias} + EXCLUDED.{alias}")
+            elif function in ("SUM", "AVG"):
+                insert_columns.extend([f"_sum_{alias}", f"_cnt_{alias}"])
+                select_values.append(f"{sign_sql}COALESCE(SUM({column}), 0)")
+                select_values.append(f"{sign_sql}COUNT({column})")
+                updates.append(f"_sum_{alias} = s._sum_{alias} + EXCLUDED._sum_{alias}")
+                updates.append(f"_cnt_{alias} = s._cnt_{alias} + EXCLUDED._cnt_{alias}")
+            elif function in ("MIN", "MAX"):
+                # Removed rows never widen the extreme; they are recomputed afterwards
+                if sign > 0:
+                    insert_columns.append(alias)
+                    select_values.append(f"{function}({column})")
+                    combine = "LEAST" if function == "MIN" else "GREATEST"
+                    updates.append(f"{alias} = {combine}(s.{alias}, EXCLUDED.{alias})")
+
+        group_columns = ", ".join(cls._get_source_column(entity, f) for f in config.group_by)
+        select_clause = ",\n    ".join(select_values)
+        update_clause = ",\n    ".join(updates)
+
+        return f"""INSERT INTO {full_view_name} AS s ({", ".join(insert_columns)})
+SELECT
+    {select_clause}
+FROM {source}
+GROUP BY {group_columns}
+ON CONFLICT ({", ".join(config.group_by)}) DO UPDATE SET
+    {update_clause};"""
+
+    @classmethod
+    def _build_extreme_recompute(cls, entity: Entity, config: AggregateViewConfig) -> str:
+        """Recompute MIN/MAX from the base table only where a removed row held the extreme."""
+        view_name = cls._get_view_name(entity)
+        full_view_name = f"{entity.schema}.{view_name}"
+        table_name = f"{entity.schema}.tb_{entity.name.lower()}"
+
+        statements = []
+        for agg in config.aggregates:
+            if agg["function"] not in ("MIN", "MAX"):
+                continue
+
+            alias = agg["alias"]
+            column = cls._get_source_column(entity, agg["field"])
+            base_match = cls._build_group_match(entity, config, "b")
+            old_match = cls._build_group_match(entity, config, "o")
+
+            statements.append(
+                f"""-- Recompute {alias} where a removed row held the current {agg["function"].lower()}
+        UPDATE {full_view_name} s
+        SET {alias} = (
+            SELECT {agg["function"]}(b.{column}) FROM {table_name} b
+            WHERE {base_match}
+        )
+        WHERE EXISTS (
+            SELECT 1 FROM old_rows o
+            WHERE {old_match}
+              AND o.{column} = s.{alias}
+        );"""
+            )
+
+        return "\n\n        ".join(statements)
+
+    @classmethod
+    def _build_group_match(
+        cls, entity: Entity, config: AggregateViewConfig, row_alias: str, logical: bool = False
+    ) -> str:
+        """Build a NULL-safe match between summary row `s` and rows aliased `row_alias`.
+
+        Base and transition tables expose physical columns; `logical=True` is for
+        subqueries that already renamed them to the summary's column names.
+        """
+        conditions = []
+        for field in config.group_by:
+            column = field if logical else cls._get_source_column(entity, field)
+            row_col = f"{row_alias}.{column}"
+            conditions.append(
+                f"({row_col} = s.{field} OR ({row_col} IS NULL AND s.{field} IS NULL))"
+            )
+        return "\n              AND ".join(conditions)
+
+    @classmethod
+    def _build_group_select(cls, entity: Entity, config: AggregateViewConfig) -> str:
+        """Select group columns from a transition table under their logical names."""
+        return ", ".join(
+            f"{cls._get_source_column(entity, field)} AS {field}" for field in config.group_by
+        )
+
+    @staticmethod
+    def _indent(sql: str, spaces: int) -> str:
+        """Indent continuation lines (the first line follows the template's indentation)."""
+        return ("\n" + " " * spaces).join(sql.split("\n"))
+
+    @classmethod
+    def _get_source_column(cls, entity: Entity, field: str) -> str:
+        """Map a logical field name to its physical column on tb_ (refs use fk_)."""
+        if cls._is_reference(entity.fields.get(field)):
+            return f"fk_{field}"
+        return field
+
+    @staticmethod
+    def _is_reference(field_def: FieldDefinition | None) -> bool:
+        return field_def is not None and (field_def.type_name == "ref" or field_def.is_reference())
+
+    @classmethod
+    def _get_group_column_type(cls, entity: Entity, field: str) -> str:
+        """SQL type of a group column in the summary table."""
+        field_def = entity.fields.get(field)
+        if field_def is None:
+            return "TEXT"
+        if cls._is_reference(field_def):
+            return "INTEGER"
+        return field_def.get_postgres_type()
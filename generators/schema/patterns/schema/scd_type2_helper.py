@@ -48,12 +48,14 @@ class SCDType2HelperPattern:
         # Add indexes for performance
         cls._add_scd_indexes(entity, config)
 
-        # Generate helper function for creating new versions
+        # Generate bulk merge and the single-row helper that delegates to it
+        merge_sql = cls._generate_merge_function(entity, config)
         function_sql = cls._generate_helper_function(entity, config)
 
-        # Store function in entity.functions for template rendering
+        # Store functions in entity.functions for template rendering
         if not hasattr(entity, "functions") or entity.functions is None:
             entity.functions = []
+        entity.functions.append(merge_sql)
         entity.functions.append(function_sql)
 
         # Return entity and empty additional SQL (functions rendered via template)
@@ -155,25 +157,20 @@ class SCDType2HelperPattern:
         )
         entity.indexes.append(current_index)
 
+        # At most one current version per natural key; also the merge's lookup index
+        entity.indexes.append(
+            Index(
+                name=f"uq_tb_{entity.name.lower()}_current_version",
+                columns=list(config.natural_key),
+                type="btree",
+                unique=True,
+                where=f"{config.is_current_field} = true",
+            )
+        )
+
     @classmethod
-    def _generate_helper_function(cls, entity: Entity, config: SCDType2Config) -> str:
-        """Generate helper function for creating new SCD versions."""
-        function_name = f"{entity.schema}.create_new_version_{entity.name.lower()}"
-        table_name = f"{entity.schema}.tb_{entity.name.lower()}"
-
-        # Build natural key WHERE clause
-        natural_key_where = []
-        for key_field in config.natural_key:
-            field_def = entity.fields.get(key_field)
-            if field_def:
-                pg_type = field_def.get_postgres_type()
-                natural_key_where.append(
-                    f"{key_field} = (natural_key_values->>'{key_field}')::{pg_type}"
-                )
-
-        natural_key_where_clause = " AND ".join(natural_key_where)
-
-        # Build field list for INSERT (excluding SCD fields)
+    def _scd_fields(cls, config: SCDType2Config) -> set[str]:
+        """SCD bookkeeping fields (not part of the versioned data)."""
         scd_fields = {
             config.effective_date_field,
             config.expiry_date_field,
@@ -181,51 +178,166 @@ class SCDType2HelperPattern:
         }
         if config.version_field:
             scd_fields.add(config.version_field)
+        return scd_fields
 
-        insert_fields = []
-        for field_name, field_def in entity.fields.items():
-            if field_name not in scd_fields:
-                insert_fields.append(field_name)
-
-        field_list = ", ".join(insert_fields)
+    @classmethod
+    def _generate_merge_function(cls, entity: Entity, config: SCDType2Config) -> str:
+        """
+        Generate the set-based bulk merge function.
 
-        # Build field values from JSONB
-        field_values = []
-        for field_name in insert_fields:
-            field_def = entity.fields[field_name]
-            pg_type = field_def.get_postgres_type()
-            field_values.append(f"(new_data->>'{field_name}')::{pg_type}")
+        Incoming rows are compared with the current versions by an md5 hash of the
+        tracked fields. Changed rows are expired in one UPDATE and new versions are
+        inserted in one INSERT, so unchanged rows never produce a new version.
+        """
+        entity_lower = entity.name.lower()
+        function_name = f"{entity.schema}.merge_versions_{entity_lower}"
+        table_name = f"{entity.schema}.tb_{entity_lower}"
+
+        scd_fields = cls._scd_fields(config)
+        data_fields = [name for name in entity.fields if name not in scd_fields]
+        tracked = config.tracked_fields or [
+            name for name in data_fields if name not in config.natural_key
+        ]
 
-        field_list_from_jsonb = ", ".join(field_values)
+        # Incoming rows, typed from JSONB; the last occurrence of a natural key wins
+        src_columns = ",\n            ".join(
+            f"(r.value->>'{name}')::{entity.fields[name].get_postgres_type()} AS {name}"
+            for name in data_fields
+        )
+        natural_key_list = ", ".join(f"(r.value->>'{key}')" for key in config.natural_key)
+        src_cte = f"""src AS (
+        SELECT DISTINCT ON ({natural_key_list})
+            {src_columns}
+        FROM jsonb_array_elements(p_rows) WITH ORDINALITY AS r(value, ord)
+        ORDER BY {natural_key_list}, r.ord DESC
+    )"""
+
+        # Staging rows read in place (%s is filled by format()); the physically last row wins
+        staging_columns = ",\n            ".join(
+            f"st.{name}::{entity.fields[name].get_postgres_type()} AS {name}"
+            for name in data_fields
+        )
+        staging_key_list = ", ".join(f"st.{key}" for key in config.natural_key)
+        staging_cte = f"""src AS (
+        SELECT DISTINCT ON ({staging_key_list})
+            {staging_columns}
+        FROM %s st
+        ORDER BY {staging_key_list}, st.ctid DESC
+    )"""
+
+        def key_match(alias: str) -> str:
+            return " AND ".join(f"{alias}.{key} = s.{key}" for key in config.natural_key)
+
+        def row_hash(alias: str) -> str:
+            return f"md5(ROW({', '.join(f'{alias}.{name}' for name in tracked)})::text)"
+
+        field_list = ", ".join(data_fields)
+        src_field_list = ", ".join(f"s.{name}" for name in data_fields)
+        version_column = f",\n        {config.version_field}" if config.version_field else ""
+        version_value = (
+            f""",
+        (
+            SELECT COALESCE(MAX(v.{config.version_field}), 0) + 1
+            FROM {table_name} v
+            WHERE {key_match("v")}
+        )"""
+            if config.version_field
+            else ""
+        )
 
-        # Generate function SQL
-        function_sql = f"""CREATE OR REPLACE FUNCTION {function_name}(
-    natural_key_values jsonb,
-    new_data jsonb
-)
-RETURNS void
-LANGUAGE plpgsql
-AS $$
-BEGIN
-    -- Expire the current version
-    UPDATE {table_name}
+        def expire_sql(cte: str) -> str:
+            return f"""WITH {cte}
+    UPDATE {table_name} t
     SET
         {config.expiry_date_field} = CURRENT_TIMESTAMP,
         {config.is_current_field} = false
-    WHERE {natural_key_where_clause}
-      AND {config.is_current_field} = true;
+    FROM src s
+    WHERE {key_match("t")}
+      AND t.{config.is_current_field} = true
+      AND {row_hash("t")} <> {row_hash("s")}"""
 
-    -- Insert new version
+        def insert_sql(cte: str) -> str:
+            return f"""WITH {cte}
     INSERT INTO {table_name} (
         {field_list},
         {config.effective_date_field},
         {config.expiry_date_field},
-        {config.is_current_field}
-    ) VALUES (
-        {field_list_from_jsonb},
+        {config.is_current_field}{version_column}
+    )
+    SELECT
+        {src_field_list},
         CURRENT_TIMESTAMP,
         NULL,
-        true
+        true{version_value}
+    FROM src s
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM {table_name} t
+        WHERE {key_match("t")}
+          AND t.{config.is_current_field} = true
+    )"""
+
+        return f"""-- Bulk SCD Type 2 merge: only rows whose tracked fields changed get a new version
+CREATE OR REPLACE FUNCTION {function_name}(
+    p_rows jsonb,
+    OUT expired_count INTEGER,
+    OUT inserted_count INTEGER
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- Expire current versions whose tracked fields differ from the incoming row
+    {expire_sql(src_cte)};
+
+    GET DIAGNOSTICS expired_count = ROW_COUNT;
+
+    -- New versions for expired and previously unseen keys (unchanged keys are still current)
+    {insert_sql(src_cte)};
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+END;
+$$;
+
+-- Bulk merge from a staging table with the entity's columns, read in place
+CREATE OR REPLACE FUNCTION {function_name}_from_staging(
+    p_staging regclass,
+    OUT expired_count INTEGER,
+    OUT inserted_count INTEGER
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    EXECUTE format($merge$
+    {expire_sql(staging_cte)}
+    $merge$, p_staging);
+
+    GET DIAGNOSTICS expired_count = ROW_COUNT;
+
+    EXECUTE format($merge$
+    {insert_sql(staging_cte)}
+    $merge$, p_staging);
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+END;
+$$;"""
+
+    @classmethod
+    def _generate_helper_function(cls, entity: Entity, config: SCDType2Config) -> str:
+        """Generate helper function for creating a new SCD version of one natural key."""
+        entity_lower = entity.name.lower()
+        function_name = f"{entity.schema}.create_new_version_{entity_lower}"
+
+        # Single-row merge: a no-op when new_data matches the current version
+        function_sql = f"""CREATE OR REPLACE FUNCTION {function_name}(
+    natural_key_values jsonb,
+    new_data jsonb
+)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM {entity.schema}.merge_versions_{entity_lower}(
+        jsonb_build_array(new_data || natural_key_values)
     );
 END;
 $$;"""
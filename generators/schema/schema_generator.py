@@ -10,6 +10,8 @@ Generates complete PostgreSQL DDL from parsed AST:
 - Table code integration with NamingConventions registry
 """
 
+from jinja2 import Environment, FileSystemLoader
+
 from core.ast_models import EntityDefinition, FieldDefinition
 from generators.schema.audit_fields import generate_audit_fields
 from generators.schema.composite_type_mapper import CompositeTypeMapper
@@ -23,6 +25,7 @@ from generators.schema.node_info_split import (
     generate_node_info_split_ddl,
     should_split_entity,
 )
+from generators.schema.online_ddl import concurrently
 from generators.schema.tenant_indexes import generate_tenant_indexes
 from utils.safe_slug import safe_table_name
 
@@ -30,10 +33,17 @@ from utils.safe_slug import safe_table_name
 class SchemaGenerator:
     """Generates PostgreSQL schema DDL from EntityDefinition AST"""
 
-    def __init__(self, registry_path: str = "registry/domain_registry.yaml"):
+    def __init__(
+        self,
+        registry_path: str = "registry/domain_registry.yaml",
+        online: bool = False,
+        templates_dir: str = "templates/sql",
+    ):
+        self.env = Environment(loader=FileSystemLoader(templates_dir))
         self.composite_mapper = CompositeTypeMapper()
-        self.fk_generator = ForeignKeyGenerator()
+        self.fk_generator = ForeignKeyGenerator(online=online)
         self.naming = NamingConventions(registry_path)
+        self.online = online  # Lock-light DDL: CONCURRENTLY indexes, NOT VALID FKs
 
     def generate_table(self, entity: EntityDefinition) -> str:
         """
@@ -48,7 +58,7 @@ class SchemaGenerator:
         # Check if entity should use node+info split pattern
         if should_split_entity(entity):
             ddl_statements = generate_node_info_split_ddl(entity, entity.schema)
-            return "\n\n".join(ddl_statements)
+            return self._online("\n\n".join(ddl_statements))
 
         # Standard single table generation
         table_name = f"{entity.schema}.{safe_table_name(entity.name)}"
@@ -93,11 +103,29 @@ class SchemaGenerator:
         ddl_parts.append(");")
         ddl_parts.append("")
 
+        # Online mode: FK constraints are added NOT VALID after the table, then validated
+        if self.online:
+            for field_def in entity.fields.values():
+                if field_def.is_reference():
+                    fk_ddl = self.fk_generator.map_field(field_def)
+                    ddl_parts.append(
+                        self.fk_generator.generate_constraint_ddl(
+                            entity.schema, safe_table_name(entity.name), fk_ddl
+                        )
+                    )
+                    ddl_parts.append("")
+
         # Add explicit validation pattern comment for hierarchical entities
         if self._is_entity_hierarchical(entity):
             ddl_parts.append(self._generate_explicit_validation_comment(entity))
             ddl_parts.append("")
 
+            # LTREE path maintenance, for hierarchies that store a path column
+            if "path" in entity.fields:
+                ddl_parts.append("-- Hierarchy Path Functions")
+                ddl_parts.extend(self._generate_path_functions(entity))
+                ddl_parts.append("")
+
         # Validation functions for composites
         validation_functions = self._generate_validation_functions(entity)
         if validation_functions:
@@ -134,7 +162,7 @@ class SchemaGenerator:
             ddl_parts.append("")
 
         # Tenant-scoped composite indexes
-        tenant_indexes = generate_tenant_indexes(entity, entity.schema)
+        tenant_indexes = generate_tenant_indexes(entity, entity.schema, online=self.online)
         if tenant_indexes:
             ddl_parts.append("-- Tenant Indexes")
             ddl_parts.extend(tenant_indexes)
@@ -143,7 +171,11 @@ class SchemaGenerator:
         # NOTE: Explicit validation pattern replaces safety constraint triggers
         # Validation is now handled explicitly in mutation functions, not via triggers
 
-        return "\n".join(ddl_parts)
+        return self._online("\n".join(ddl_parts))
+
+    def _online(self, ddl: str) -> str:
+        """Build every index CONCURRENTLY in online mode."""
+        return concurrently(ddl) if self.online else ddl
 
     def _generate_field_ddl(self, field: FieldDefinition) -> str:
         """Generate DDL for a single field based on tier"""
@@ -191,6 +223,23 @@ class SchemaGenerator:
                     return True
         return False
 
+    def _generate_path_functions(self, entity: EntityDefinition) -> list[str]:
+        """Render calculate_path and recalculate_descendant_paths for a hierarchical entity"""
+        parent_field = next(
+            field_def
+            for field_def in entity.fields.values()
+            if field_def.is_reference() and field_def.reference_entity == entity.name
+        )
+        context = {
+            "schema": entity.schema,
+            "entity_lower": entity.name.lower(),
+            "parent_column": f"fk_{parent_field.name}",
+        }
+        return [
+            self.env.get_template(f"hierarchy/{name}.sql.jinja2").render(**context).strip()
+            for name in ("calculate_path", "recalculate_descendants")
+        ]
+
     def _generate_explicit_validation_comment(self, entity: EntityDefinition) -> str:
         """Generate comment explaining explicit validation pattern."""
         entity_lower = entity.name.lower()
@@ -5,7 +5,21 @@ Resolves dependency order for tv_ generation and refresh operations.
 Uses topological sort to ensure proper ordering of table view creation and updates.
 """
 
-from core.ast_models import EntityDefinition
+from core.ast_models import EntityDefinition, FieldDefinition
+
+
+def reference_target(field: FieldDefinition) -> str:
+    """
+    Entity referenced by a ref field
+
+    The parser sets reference_entity (type_name "ref"); hand-built ASTs may only
+    carry type_name "ref(Entity)".
+    """
+    if field.reference_entity:
+        return field.reference_entity
+    if field.type_name.startswith("ref(") and field.type_name.endswith(")"):
+        return field.type_name[4:-1]
+    return field.type_name
 
 
 class TableViewDependencyResolver:
@@ -23,12 +37,7 @@ class TableViewDependencyResolver:
             # Find ref() fields - these create dependencies
             for field_name, field in entity.fields.items():
                 if field.is_reference():
-                    # Extract entity name from ref(Entity) type
-                    ref_entity = (
-                        field.type_name[4:-1]
-                        if field.type_name.startswith("ref(") and field.type_name.endswith(")")
-                        else field.type_name
-                    )
+                    ref_entity = reference_target(field)
                     if ref_entity != entity.name and ref_entity in graph:  # Not self-reference
                         # entity depends on ref_entity, so ref_entity has entity as dependent
                         graph[ref_entity].add(entity.name)
@@ -7,7 +7,10 @@ These denormalized tables expose data to FraiseQL for auto-GraphQL generation.
 Key Innovation: JSONB composition from related tv_ tables (not tb_ tables)
 """
 
-from core.ast_models import EntityDefinition, ExtraFilterColumn, IncludeRelation
+from core.ast_models import EntityDefinition, ExtraFilterColumn, FieldDefinition, IncludeRelation
+from generators.schema.table_view_dependency import reference_target
+from generators.schema.translation_helper_generator import TranslationHelperGenerator
+from utils.safe_slug import safe_slug
 
 
 class TableViewGenerator:
@@ -54,7 +57,7 @@ class TableViewGenerator:
         # Foreign keys (INTEGER + UUID)
         for field_name, field in self.entity.fields.items():
             if field.is_reference():
-                ref_entity = self._extract_ref_entity(field.type_name)
+                ref_entity = self._extract_ref_entity(field)
                 ref_lower = ref_entity.lower()
 
                 # INTEGER FK for JOINs
@@ -103,7 +106,7 @@ CREATE TABLE {schema}.tv_{entity_lower} (
         # UUID foreign key indexes (auto-inferred)
         for field_name, field in self.entity.fields.items():
             if field.is_reference():
-                ref_entity = self._extract_ref_entity(field.type_name)
+                ref_entity = self._extract_ref_entity(field)
                 ref_lower = ref_entity.lower()
 
                 indexes.append(
@@ -157,43 +160,165 @@ CREATE TABLE {schema}.tv_{entity_lower} (
         return "\n".join(indexes)
 
     def _generate_refresh_function(self) -> str:
-        """Generate refresh_tv_{entity}() function with JSONB composition."""
+        """Generate refresh_tv_{entity}() functions with JSONB composition.
+
+        Three entry points are emitted:
+        - refresh_tv_{entity}_batch(INTEGER[]): set-based diff refresh for many pks
+        - refresh_tv_{entity}(INTEGER): single-pk wrapper kept for existing callers
+        - rebuild_tv_{entity}(chunk_size): chunked full rebuild for initial loads
+        """
+        return "\n\n".join(
+            [
+                self._generate_batch_refresh_function(),
+                self._generate_single_refresh_function(),
+                self._generate_rebuild_procedure(),
+            ]
+        )
+
+    def _generate_batch_refresh_function(self) -> str:
+        """Generate refresh_tv_{entity}_batch(INTEGER[]) with upsert + vanished-row delete."""
         entity_lower = self.entity.name.lower()
         schema = self.entity.schema
+        pks_param = f"p_pks_{entity_lower}"
 
-        # Build SELECT columns
-        select_columns = self._build_select_columns()
+        scoped = self._build_diff_refresh_statement(
+            base_scope=f"base.pk_{entity_lower} = ANY({pks_param})",
+            tv_scope=f"tv.pk_{entity_lower} = ANY({pks_param})",
+        )
+        full = self._build_diff_refresh_statement()
 
-        # Build FROM clause with JOINs to tv_ tables
-        from_clause = self._build_from_clause_with_tv_joins()
+        return f"""
+-- Batch refresh function for tv_{entity_lower}
+-- Composes JSONB from related tv_ tables (not tb_ tables!)
+-- Upserts only rows whose content changed and deletes rows that vanished,
+-- so unchanged rows cost no WAL, bloat or index churn.
+-- NULL refreshes the whole table.
+CREATE OR REPLACE FUNCTION {schema}.refresh_tv_{entity_lower}_batch(
+    {pks_param} INTEGER[]
+) RETURNS void AS $$
+BEGIN
+    IF {pks_param} IS NULL THEN
+        {self._indent(full, 8)}
+    ELSE
+        {self._indent(scoped, 8)}
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+""".strip()
 
-        # Build SELECT values
-        select_values = self._build_select_values()
+    def _generate_single_refresh_function(self) -> str:
+        """Generate refresh_tv_{entity}(INTEGER) delegating to the batch function."""
+        entity_lower = self.entity.name.lower()
+        schema = self.entity.schema
 
         return f"""
--- Refresh function for tv_{entity_lower}
--- Composes JSONB from related tv_ tables (not tb_ tables!)
+-- Refresh function for tv_{entity_lower} (single pk, NULL = all rows)
 CREATE OR REPLACE FUNCTION {schema}.refresh_tv_{entity_lower}(
     p_pk_{entity_lower} INTEGER DEFAULT NULL
 ) RETURNS void AS $$
 BEGIN
-    -- Delete existing rows
-    DELETE FROM {schema}.tv_{entity_lower}
-    WHERE p_pk_{entity_lower} IS NULL OR pk_{entity_lower} = p_pk_{entity_lower};
+    PERFORM {schema}.refresh_tv_{entity_lower}_batch(
+        CASE WHEN p_pk_{entity_lower} IS NULL THEN NULL ELSE ARRAY[p_pk_{entity_lower}] END
+    );
+END;
+$$ LANGUAGE plpgsql;
+""".strip()
 
-    -- Insert refreshed data
-    INSERT INTO {schema}.tv_{entity_lower} (
-        {", ".join(select_columns)}
-    )
-    SELECT
-        {select_values}
-    {from_clause}
-    WHERE base.deleted_at IS NULL
-      AND (p_pk_{entity_lower} IS NULL OR base.pk_{entity_lower} = p_pk_{entity_lower});
+    def _generate_rebuild_procedure(self) -> str:
+        """Generate rebuild_tv_{entity}() procedure that refreshes in committed chunks."""
+        entity_lower = self.entity.name.lower()
+        schema = self.entity.schema
+
+        return f"""
+-- Chunked full rebuild for tv_{entity_lower} (initial loads)
+-- Walks tb_{entity_lower} in pk order and commits after each chunk.
+-- Usage: CALL {schema}.rebuild_tv_{entity_lower}(10000);
+CREATE OR REPLACE PROCEDURE {schema}.rebuild_tv_{entity_lower}(
+    p_chunk_size INTEGER DEFAULT 10000
+) AS $$
+DECLARE
+    v_last_pk INTEGER;
+    v_pks INTEGER[];
+BEGIN
+    LOOP
+        SELECT array_agg(chunk.pk_{entity_lower} ORDER BY chunk.pk_{entity_lower})
+        INTO v_pks
+        FROM (
+            SELECT pk_{entity_lower}
+            FROM {schema}.tb_{entity_lower}
+            WHERE v_last_pk IS NULL OR pk_{entity_lower} > v_last_pk
+            ORDER BY pk_{entity_lower}
+            LIMIT p_chunk_size
+        ) chunk;
+
+        EXIT WHEN v_pks IS NULL;
+
+        PERFORM {schema}.refresh_tv_{entity_lower}_batch(v_pks);
+        v_last_pk := v_pks[array_upper(v_pks, 1)];
+        COMMIT;
+    END LOOP;
+
+    -- Remove rows whose base row was hard-deleted
+    DELETE FROM {schema}.tv_{entity_lower} tv
+    WHERE NOT EXISTS (
+        SELECT 1 FROM {schema}.tb_{entity_lower} base
+        WHERE base.pk_{entity_lower} = tv.pk_{entity_lower}
+    );
+    COMMIT;
 END;
 $$ LANGUAGE plpgsql;
 """.strip()
 
+    def _build_diff_refresh_statement(
+        self, base_scope: str | None = None, tv_scope: str | None = None
+    ) -> str:
+        """Build the single-statement diff refresh (source CTE, upsert, delete vanished)."""
+        entity_lower = self.entity.name.lower()
+        schema = self.entity.schema
+        pk_column = f"pk_{entity_lower}"
+
+        columns = self._build_select_columns()
+        compared = [col for col in columns if col != pk_column]
+        from_clause = self._build_from_clause_with_tv_joins()
+        select_values = self._build_select_values()
+
+        where_lines = ["WHERE base.deleted_at IS NULL"]
+        if base_scope:
+            where_lines.append(f"  AND {base_scope}")
+        where_clause = "\n    ".join(where_lines)
+
+        update_set = ",\n        ".join(f"{col} = EXCLUDED.{col}" for col in compared)
+        current_row = ", ".join(f"tv.{col}" for col in compared)
+        excluded_row = ", ".join(f"EXCLUDED.{col}" for col in compared)
+
+        delete_scope = f"{tv_scope}\n  AND " if tv_scope else ""
+
+        return f"""WITH src AS (
+    SELECT
+        {select_values}
+    {from_clause}
+    {where_clause}
+),
+upserted AS (
+    INSERT INTO {schema}.tv_{entity_lower} AS tv (
+        {", ".join(columns)}
+    )
+    SELECT {", ".join(columns)} FROM src
+    ON CONFLICT ({pk_column}) DO UPDATE SET
+        {update_set},
+        refreshed_at = now()
+    WHERE ({current_row})
+        IS DISTINCT FROM ({excluded_row})
+)
+DELETE FROM {schema}.tv_{entity_lower} tv
+WHERE {delete_scope}NOT EXISTS (SELECT 1 FROM src WHERE src.{pk_column} = tv.{pk_column});"""
+
+    @staticmethod
+    def _indent(sql: str, spaces: int) -> str:
+        """Indent all lines but the first (the first follows the template's indentation)."""
+        padding = " " * spaces
+        return ("\n" + padding).join(sql.split("\n"))
+
     def _infer_column_type(self, col: ExtraFilterColumn) -> str:
         """Infer SQL type for extra filter column."""
         if col.type:
@@ -227,19 +352,16 @@ $$ LANGUAGE plpgsql;
         }
         return mapping.get(field_type.lower(), "TEXT")
 
-    def _extract_ref_entity(self, type_name: str) -> str:
-        """Extract entity name from ref(Entity) type."""
-        # ref(User) -> User
-        if type_name.startswith("ref(") and type_name.endswith(")"):
-            return type_name[4:-1]
-        return type_name  # fallback
+    def _extract_ref_entity(self, field: FieldDefinition) -> str:
+        """Extract entity name from a ref field (ref(User) -> User)."""
+        return reference_target(field)
 
     def _is_entity_hierarchical(self) -> bool:
         """Determine if an entity is hierarchical by checking for self-referencing parent fields."""
         for field_name, field_def in self.entity.fields.items():
             if field_def.is_reference():
                 # Check if this field references the same entity (parent relationship)
-                ref_entity = self._extract_ref_entity(field_def.type_name)
+                ref_entity = self._extract_ref_entity(field_def)
                 if ref_entity == self.entity.name:
                     return True
         return False
@@ -252,7 +374,7 @@ $$ LANGUAGE plpgsql;
         # FK columns (INTEGER + UUID)
         for field_name, field in self.entity.fields.items():
             if field.is_reference():
-                ref_entity = self._extract_ref_entity(field.type_name)
+                ref_entity = self._extract_ref_entity(field)
                 ref_lower = ref_entity.lower()
                 columns.append(f"fk_{ref_lower}")
                 columns.append(f"{ref_lower}_id")
@@ -281,7 +403,7 @@ $$ LANGUAGE plpgsql;
         # Join to tv_ tables (composition!)
         for field_name, field in self.entity.fields.items():
             if field.is_reference():
-                ref_entity = self._extract_ref_entity(field.type_name)
+                ref_entity = self._extract_ref_entity(field)
                 ref_lower = ref_entity.lower()
 
                 # Get referenced entity schema
@@ -294,8 +416,23 @@ $$ LANGUAGE plpgsql;
                     f"ON tv_{ref_lower}.pk_{ref_lower} = base.fk_{ref_lower}"
                 )
 
+        # Translated fields: one set-based join to the inlinable localized SRF
+        if self._translated_fields():
+            localized = TranslationHelperGenerator.localized_function_name(self.entity)
+            lines.append(
+                f"LEFT JOIN {localized}() tl "
+                f"ON tl.fk_{safe_slug(self.entity.name)} = base.pk_{entity_lower}"
+            )
+
         return "\n    ".join(lines)
 
+    def _translated_fields(self) -> list[str]:
+        """Translatable fields (empty unless translations are enabled)."""
+        translations = self.entity.translations
+        if not translations or not translations.enabled:
+            return []
+        return translations.fields
+
     def _build_select_values(self) -> str:
         """Build SELECT values for INSERT."""
         entity_lower = self.entity.name.lower()
@@ -304,7 +441,7 @@ $$ LANGUAGE plpgsql;
         # FK values
         for field_name, field in self.entity.fields.items():
             if field.is_reference():
-                ref_entity = self._extract_ref_entity(field.type_name)
+                ref_entity = self._extract_ref_entity(field)
                 ref_lower = ref_entity.lower()
 
                 # INTEGER FK
@@ -344,10 +481,15 @@ $$ LANGUAGE plpgsql;
         parts = []
 
         # Add entity's own fields
+        translated = self._translated_fields()
         for field_name, field in self.entity.fields.items():
             if not field.is_reference():
-                # Scalar field
-                parts.append(f"'{field_name}', base.{field_name}")
+                if field_name in translated:
+                    # Default-locale translation, falling back to the base value
+                    parts.append(f"'{field_name}', COALESCE(tl.{field_name}, base.{field_name})")
+                else:
+                    # Scalar field
+                    parts.append(f"'{field_name}', base.{field_name}")
 
         # Add related entities (compose from tv_.data)
         config = self.entity.table_views
@@ -358,7 +500,7 @@ $$ LANGUAGE plpgsql;
             # No explicit config - include all ref fields with all data
             for field_name, field in self.entity.fields.items():
                 if field.is_reference():
-                    ref_entity = self._extract_ref_entity(field.type_name)
+                    ref_entity = self._extract_ref_entity(field)
                     ref_lower = ref_entity.lower()
 
                     # Include full tv_.data
@@ -372,7 +514,7 @@ $$ LANGUAGE plpgsql;
         ref_entity = None
         for field_name, field in self.entity.fields.items():
             if field.is_reference() and field_name == rel.entity_name:
-                ref_entity = self._extract_ref_entity(field.type_name)
+                ref_entity = self._extract_ref_entity(field)
                 break
 
         if ref_entity is None:
@@ -0,0 +1,196 @@
+"""
+Table View Refresh Queue Generator
+
+Generates the deferred, deduplicated refresh engine behind the `batch` refresh scope.
+
+Mutations call app.enqueue_tv_refresh('Entity', pk). The session-local queue is
+created on first use with a primary key on (entity, pk), so repeated writes to the
+same row queue a single refresh. A deferred constraint trigger drains the queue once
+per transaction, refreshing entities in tv_ dependency order through the
+array-based refresh_tv_{entity}_batch() functions.
+"""
+
+from core.ast_models import EntityDefinition
+from generators.schema.table_view_dependency import TableViewDependencyResolver, reference_target
+from generators.schema.table_view_generator import TableViewGenerator
+
+
+class TableViewRefreshQueueGenerator:
+    """Generate app.enqueue_tv_refresh() and the dependency-ordered queue drain."""
+
+    def __init__(self, entities: list[EntityDefinition]):
+        self.entities = entities
+
+    def generate(self) -> str:
+        """Generate the complete refresh queue SQL (empty if no tv_ tables exist)."""
+        refresh_order = self._get_refresh_order()
+        if not refresh_order:
+            return ""
+
+        return "\n\n".join(
+            [
+                self._generate_drain_function(refresh_order),
+                self._generate_trigger_function(),
+                self._generate_enqueue_function(),
+            ]
+        )
+
+    def _get_refresh_order(self) -> list[EntityDefinition]:
+        """Entities with tv_ tables, parents before the entities that compose them."""
+        all_entities = {e.name: e for e in self.entities}
+        resolver = TableViewDependencyResolver(self.entities)
+
+        ordered = []
+        for entity_name in resolver.get_generation_order():
+            entity = all_entities[entity_name]
+            if TableViewGenerator(entity, all_entities).should_generate():
+                ordered.append(entity)
+        return ordered
+
+    def _generate_drain_function(self, refresh_order: list[EntityDefinition]) -> str:
+        """Generate app.drain_tv_refresh_queue() with one batch refresh per entity."""
+        blocks = []
+        for entity in refresh_order:
+            entity_lower = entity.name.lower()
+            drain = f"""WITH drained AS (
+    DELETE FROM pg_temp.tv_refresh_queue
+    WHERE entity = '{entity.name}'
+    RETURNING pk
+)
+SELECT array_agg(pk) INTO v_pks FROM drained;"""
+            refresh = f"PERFORM {entity.schema}.refresh_tv_{entity_lower}_batch(v_pks);"
+            refresh = "\n".join([refresh, *self._enqueue_dependents(entity, refresh_order)])
+
+            if self._is_self_referencing(entity):
+                # Children compose their parent's tv_ row: repeat until the subtree is done
+                block = f"""LOOP
+{self._indent(drain, 4)}
+    EXIT WHEN v_pks IS NULL;
+{self._indent(refresh, 4)}
+END LOOP;"""
+            else:
+                block = f"""{drain}
+IF v_pks IS NOT NULL THEN
+{self._indent(refresh, 4)}
+END IF;"""
+            blocks.append(self._indent(block, 4))
+
+        refresh_blocks = "\n\n".join(blocks)
+
+        return f"""
+-- ============================================================================
+-- DEFERRED TV_ REFRESH QUEUE
+-- Drains pg_temp.tv_refresh_queue in dependency order (parents first),
+-- queueing the dependent rows that compose each refreshed parent
+-- ============================================================================
+CREATE OR REPLACE FUNCTION app.drain_tv_refresh_queue()
+RETURNS void AS $$
+DECLARE
+    v_pks INTEGER[];
+BEGIN
+    IF to_regclass('pg_temp.tv_refresh_queue') IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- Disarm first so rows queued after this drain re-arm the deferred trigger
+    DELETE FROM pg_temp.tv_refresh_pending;
+
+{refresh_blocks}
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION app.drain_tv_refresh_queue IS
+'Refreshes all queued tv_ rows and the tv_ rows composing them in dependency order. Runs automatically at commit; may be called explicitly to flush early.';
+""".strip()
+
+    def _enqueue_dependents(
+        self, entity: EntityDefinition, refresh_order: list[EntityDefinition]
+    ) -> list[str]:
+        """INSERTs queueing the tv_ rows of entities that compose the refreshed entity."""
+        statements = []
+        entity_lower = entity.name.lower()
+        for dependent in refresh_order:
+            if not self._references(dependent, entity):
+                continue
+            dependent_lower = dependent.name.lower()
+            statements.append(
+                f"""INSERT INTO pg_temp.tv_refresh_queue (entity, pk)
+SELECT '{dependent.name}', pk_{dependent_lower}
+FROM {dependent.schema}.tv_{dependent_lower}
+WHERE fk_{entity_lower} = ANY(v_pks)
+ON CONFLICT DO NOTHING;"""
+            )
+        return statements
+
+    @staticmethod
+    def _references(dependent: EntityDefinition, entity: EntityDefinition) -> bool:
+        """Whether dependent has a ref(entity) field (its tv_ rows compose entity's)."""
+        return any(
+            field.is_reference() and reference_target(field) == entity.name
+            for field in dependent.fields.values()
+        )
+
+    def _is_self_referencing(self, entity: EntityDefinition) -> bool:
+        return self._references(entity, entity)
+
+    @staticmethod
+    def _indent(sql: str, spaces: int) -> str:
+        pad = " " * spaces
+        return "\n".join(pad + line if line else line for line in sql.splitlines())
+
+    def _generate_trigger_function(self) -> str:
+        """Generate the trigger function fired by the deferred constraint trigger."""
+        return """
+CREATE OR REPLACE FUNCTION app.tv_refresh_queue_trigger()
+RETURNS trigger AS $$
+BEGIN
+    PERFORM app.drain_tv_refresh_queue();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+""".strip()
+
+    def _generate_enqueue_function(self) -> str:
+        """Generate app.enqueue_tv_refresh() which creates the queue on first use."""
+        return """
+CREATE OR REPLACE FUNCTION app.enqueue_tv_refresh(
+    p_entity TEXT,
+    p_pk INTEGER
+) RETURNS void AS $$
+BEGIN
+    IF p_pk IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- Create the session-local queue on first use
+    IF to_regclass('pg_temp.tv_refresh_queue') IS NULL THEN
+        CREATE TEMP TABLE tv_refresh_queue (
+            entity TEXT NOT NULL,
+            pk INTEGER NOT NULL,
+            PRIMARY KEY (entity, pk)
+        );
+
+        -- One row per transaction arms the deferred drain exactly once
+        CREATE TEMP TABLE tv_refresh_pending (
+            armed BOOLEAN PRIMARY KEY
+        );
+
+        CREATE CONSTRAINT TRIGGER trg_drain_tv_refresh_queue
+            AFTER INSERT ON pg_temp.tv_refresh_pending
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION app.tv_refresh_queue_trigger();
+    END IF;
+
+    INSERT INTO pg_temp.tv_refresh_queue (entity, pk)
+    VALUES (p_entity, p_pk)
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO pg_temp.tv_refresh_pending (armed)
+    VALUES (TRUE)
+    ON CONFLICT DO NOTHING;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION app.enqueue_tv_refresh IS
+'Queues a deduplicated tv_ refresh for (entity, pk), drained once at commit by app.drain_tv_refresh_queue().';
+""".strip()
@@ -1,14 +1,18 @@
 """Tenant-scoped composite index generation for multi-tenant performance."""
 
 from core.ast_models import EntityDefinition
+from generators.schema.online_ddl import concurrently
 
 
-def generate_tenant_indexes(entity: EntityDefinition, schema: str) -> list[str]:
+def generate_tenant_indexes(
+    entity: EntityDefinition, schema: str, online: bool = False
+) -> list[str]:
     """Generate tenant-scoped composite indexes for optimal multi-tenant performance.
 
     Args:
         entity: Entity definition from AST
         schema: Schema name (tenant, catalog, etc.)
+        online: Build the indexes CONCURRENTLY
 
     Returns:
         List of SQL CREATE INDEX statements
@@ -51,7 +55,7 @@ def generate_tenant_indexes(entity: EntityDefinition, schema: str) -> list[str]:
     WHERE deleted_at IS NULL;"""
         )
 
-    return indexes
+    return [concurrently(index) for index in indexes] if online else indexes
 
 
 def _is_entity_hierarchical(entity: EntityDefinition) -> bool:
@@ -64,20 +68,26 @@ def _is_entity_hierarchical(entity: EntityDefinition) -> bool:
     return False
 
 
-def generate_tenant_isolation_index(entity: EntityDefinition, schema: str) -> str:
+def generate_tenant_isolation_index(
+    entity: EntityDefinition, schema: str, online: bool = False
+) -> str:
     """Generate just the tenant isolation index (most critical for performance)."""
     entity_name = entity.name.lower()
     table_name = f"{schema}.tb_{entity_name}"
+    concurrently_clause = " CONCURRENTLY" if online else ""
 
-    return f"""CREATE INDEX idx_{entity_name}_tenant
+    return f"""CREATE INDEX{concurrently_clause} idx_{entity_name}_tenant
     ON {table_name}(tenant_id)
     WHERE deleted_at IS NULL;"""
 
 
-def generate_tenant_id_lookup_index(entity: EntityDefinition, schema: str) -> str:
+def generate_tenant_id_lookup_index(
+    entity: EntityDefinition, schema: str, online: bool = False
+) -> str:
     """Generate tenant + ID lookup index."""
     entity_name = entity.name.lower()
     table_name = f"{schema}.tb_{entity_name}"
+    concurrently_clause = " CONCURRENTLY" if online else ""
 
-    return f"""CREATE UNIQUE INDEX idx_{entity_name}_tenant_id
+    return f"""CREATE UNIQUE INDEX{concurrently_clause} idx_{entity_name}_tenant_id
     ON {table_name}(tenant_id, id);"""
@@ -9,8 +9,17 @@ class TranslationHelperGenerator:
     Creates functions like get_{entity}_{field}() that retrieve translated
     field values with automatic locale fallback. Requires get_default_locale()
     function to be available in the target schema.
+
+    Also creates get_{entity}_localized(), an inlinable set-returning function
+    with every translatable field for one locale, for set-based reads (list
+    queries, tv_ refresh) that would otherwise call the per-field helpers per row.
     """
 
+    @staticmethod
+    def localized_function_name(entity: EntityDefinition) -> str:
+        """Qualified name of the entity's localized set-returning function."""
+        return f"{entity.schema}.get_{safe_slug(entity.name)}_localized"
+
     def generate(self, entity: EntityDefinition) -> str:
         """
         Generate helper functions for all translatable fields.
@@ -38,6 +47,8 @@ class TranslationHelperGenerator:
         for field_name in entity.translations.fields:
             helpers.append(self._generate_field_helper(entity, field_name))
 
+        helpers.append(self._generate_localized_function(entity))
+
         return "\n\n".join(helpers)
 
     def _validate_translatable_fields(self, entity: EntityDefinition) -> None:
@@ -59,7 +70,7 @@ class TranslationHelperGenerator:
     def _generate_field_helper(self, entity: EntityDefinition, field_name: str) -> str:
         """Generate helper function for a single translatable field"""
         table_name = safe_slug(entity.name)
-        translation_table = f"tl_{table_name}"
+        translation_table = self._get_translation_table_name(entity)
 
         # Get field SQL type
         field_def = entity.fields[field_name]
@@ -68,7 +79,7 @@ class TranslationHelperGenerator:
         function_sql = f"""
 -- Helper function: Get translated {field_name}
 CREATE OR REPLACE FUNCTION {entity.schema}.get_{table_name}_{field_name}(
-    p_{table_name}_pk UUID,
+    p_{table_name}_pk INTEGER,
     p_locale_pk UUID DEFAULT NULL
 )
 RETURNS {return_type} AS $$
@@ -84,12 +95,58 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql STABLE;
 
-COMMENT ON FUNCTION {entity.schema}.get_{table_name}_{field_name}(UUID, UUID) IS
+COMMENT ON FUNCTION {entity.schema}.get_{table_name}_{field_name}(INTEGER, UUID) IS
     'Get translated {field_name} for {entity.name}. Falls back to default locale if translation not found.';
 """.strip()
 
         return function_sql
 
+    def _generate_localized_function(self, entity: EntityDefinition) -> str:
+        """Generate the inlinable localized SRF (one translation row per parent)."""
+        table_name = safe_slug(entity.name)
+        translation_table = self._get_translation_table_name(entity)
+        function_name = self.localized_function_name(entity)
+        fields = entity.translations.fields
+
+        return_columns = ",\n    ".join(
+            [f"fk_{table_name} INTEGER", "fk_locale UUID"]
+            + [f"{name} {self._map_field_type(entity.fields[name])}" for name in fields]
+        )
+        select_columns = ", ".join(
+            [f"tl.fk_{table_name}", "tl.fk_locale"] + [f"tl.{name}" for name in fields]
+        )
+
+        # Plain LANGUAGE sql + STABLE + single SELECT: the planner inlines it into the
+        # caller, so the translation table is joined once instead of per row and field
+        return f"""
+-- Localized rows: requested locale, falling back to the default locale
+CREATE OR REPLACE FUNCTION {function_name}(
+    p_locale_pk UUID DEFAULT NULL
+)
+RETURNS TABLE (
+    {return_columns}
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT DISTINCT ON (tl.fk_{table_name})
+        {select_columns}
+    FROM {entity.schema}.{translation_table} tl
+    WHERE tl.fk_locale IN (p_locale_pk, {entity.schema}.get_default_locale())
+      AND tl.deleted_at IS NULL
+    ORDER BY tl.fk_{table_name}, (tl.fk_locale = p_locale_pk) DESC NULLS LAST
+$$;
+
+COMMENT ON FUNCTION {function_name}(UUID) IS
+    'Translated fields of {entity.name} for one locale (default locale fallback). Inlinable: join it instead of calling get_{table_name}_<field>() per row.';
+""".strip()
+
+    def _get_translation_table_name(self, entity: EntityDefinition) -> str:
+        """Translation table name (custom table_name or tl_{entity_slug})."""
+        if entity.translations and entity.translations.table_name:
+            return entity.translations.table_name
+        return f"tl_{safe_slug(entity.name)}"
+
     def _map_field_type(self, field_def) -> str:
         """
         Map SpecQL field type to SQL return type for helper functions.
@@ -67,7 +67,7 @@ class TranslationTableGenerator:
 
         # Foreign keys
         ddl_parts.append("    -- Foreign Keys")
-        ddl_parts.append(f"    fk_{parent_table_name} UUID NOT NULL")
+        ddl_parts.append(f"    fk_{parent_table_name} INTEGER NOT NULL")
         ddl_parts.append(
             f"        REFERENCES {entity.schema}.tb_{parent_table_name}(pk_{parent_table_name})"
         )
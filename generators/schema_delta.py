@@ -0,0 +1,687 @@
+"""
+Schema snapshots and delta migrations
+
+A SchemaSnapshot is a machine-readable summary of generated DDL: tables with their
+columns and constraints, indexes, named constraints, function signatures with body
+hashes, and the remaining statements keyed by identity. SchemaDeltaGenerator compares
+the snapshot of a previous run with the current one and emits only the statements
+needed to move a database from one to the other, in dependency order.
+
+Used by `specql generate --delta-from <snapshot>`.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.dependencies import PGLAST
+from generators.schema.online_ddl import (
+    CONCURRENT_FILE_HEADER,
+    VALIDATION_FILE_HEADER,
+    add_constraint,
+    concurrently,
+    lock_timeout_preamble,
+    set_not_null,
+    split_validation,
+)
+
+SNAPSHOT_FORMAT = 1
+
+# Statement kinds that must exist before tables and functions are created
+PRELUDE_KINDS = {
+    "CreateSchemaStmt",
+    "CreateExtensionStmt",
+    "CompositeTypeStmt",
+    "CreateEnumStmt",
+    "CreateDomainStmt",
+    "DefineStmt",
+    "CreateSeqStmt",
+}
+
+# Delta phases, in execution order
+PHASES = [
+    (
+        "drop_dependents",
+        "Drop removed or re-signatured functions, changed types, triggers and views",
+    ),
+    ("drop_constraints", "Drop removed or changed indexes and constraints"),
+    ("prelude", "Schemas, extensions and types"),
+    ("create_tables", "New tables (foreign key order)"),
+    ("alter_tables", "Column changes"),
+    ("constraints", "Constraints"),
+    ("indexes", "Indexes"),
+    ("functions", "New and changed functions"),
+    ("objects", "Triggers, views, comments and other statements"),
+    ("destructive", "Dropped columns and tables"),
+    ("validate", "Constraint validation"),  # Online mode: separate files
+    ("concurrent", "Concurrent index builds"),
+]
+
+# Online mode: phases run after the delta has committed
+POST_MIGRATION_PHASES = {"validate", "concurrent"}
+
+
+def _normalize(sql: str) -> str:
+    """Collapse whitespace so formatting-only changes do not count as changes."""
+    return " ".join(sql.split())
+
+
+def _hash(sql: str) -> str:
+    return hashlib.sha256(_normalize(sql).encode()).hexdigest()
+
+
+def _strip_literals(sql: str) -> str:
+    """SQL without string literals and comments (e.g. COMMENT ... IS '<text>')."""
+    return re.sub(r"'(?:[^']|'')*'|--[^\n]*", "''", sql)
+
+
+def _qualified(relation) -> str:
+    return f"{relation.schemaname or 'public'}.{relation.relname}"
+
+
+@dataclass
+class SchemaSnapshot:
+    """
+    Summary of a generated schema, persisted as JSON between runs.
+
+    Keys:
+        tables: "schema.table" -> {"columns": {name: {"type", "not_null", "default",
+            "constraints", "definition"}}, "constraints": {name: sql}, "references": [...],
+            "partitioned": bool}
+        indexes: "schema.index" -> {"table", "hash"}
+        constraints: "schema.table.name" -> {"table", "name", "hash"} (ALTER TABLE ADD)
+        functions: "name(arg types)" -> {"kind", "returns", "hash"}
+        objects: identity -> {"kind", "hash"} (triggers, views, comments, other statements)
+
+    The statement text for each key is kept in memory (statements/order) to render a
+    delta, but is not persisted.
+    """
+
+    tables: dict[str, dict] = field(default_factory=dict)
+    indexes: dict[str, dict] = field(default_factory=dict)
+    constraints: dict[str, dict] = field(default_factory=dict)
+    functions: dict[str, dict] = field(default_factory=dict)
+    objects: dict[str, dict] = field(default_factory=dict)
+    statements: dict[str, str] = field(default_factory=dict, repr=False)
+    order: list[str] = field(default_factory=list, repr=False)
+
+    @classmethod
+    def from_sql(cls, sql: str) -> "SchemaSnapshot":
+        """Build a snapshot from generated DDL (requires pglast)."""
+        PGLAST.require()
+        import pglast
+
+        snapshot = cls()
+        for statement in pglast.split(sql, with_parser=False):
+            try:
+                (raw,) = pglast.parse_sql(statement)
+            except Exception:
+                snapshot._add_object("statement", f"statement:{_hash(statement)}", statement)
+                continue
+            snapshot._add_statement(raw.stmt, statement[raw.stmt_location :].strip())
+        return snapshot
+
+    @classmethod
+    def from_files(cls, paths: list[Path]) -> "SchemaSnapshot":
+        """Build a snapshot from generated SQL files, in execution order."""
+        return cls.from_sql(";\n".join(Path(path).read_text() for path in paths))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SchemaSnapshot":
+        if data.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(
+                f"Unsupported schema snapshot format {data.get('format')!r} "
+                f"(expected {SNAPSHOT_FORMAT})"
+            )
+        return cls(
+            tables=data.get("tables", {}),
+            indexes=data.get("indexes", {}),
+            constraints=data.get("constraints", {}),
+            functions=data.get("functions", {}),
+            objects=data.get("objects", {}),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SchemaSnapshot":
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+    def to_dict(self) -> dict:
+        return {
+            "format": SNAPSHOT_FORMAT,
+            "tables": self.tables,
+            "indexes": self.indexes,
+            "constraints": self.constraints,
+            "functions": self.functions,
+            "objects": self.objects,
+        }
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2, sort_keys=True) + "\n")
+
+    def _remember(self, key: str, sql: str) -> None:
+        if key not in self.statements:
+            self.order.append(key)
+        self.statements[key] = sql
+
+    def _add_object(self, kind: str, key: str, sql: str) -> None:
+        self.objects[key] = {"kind": kind, "hash": _hash(sql)}
+        self._remember(key, sql)
+
+    def _add_statement(self, node, sql: str) -> None:
+        kind = type(node).__name__
+        if kind == "CreateStmt":
+            self._add_table(node, sql)
+        elif kind == "IndexStmt" and node.idxname:
+            key = f"{node.relation.schemaname or 'public'}.{node.idxname}"
+            # Online and offline builds of the same index are the same index
+            plain = re.sub(r"(?i)\bCONCURRENTLY\s+", "", sql)
+            self.indexes[key] = {"table": _qualified(node.relation), "hash": _hash(plain)}
+            self._remember(f"index:{key}", sql)
+        elif kind == "AlterTableStmt" and self._add_constraints(node):
+            pass
+        elif kind == "CreateFunctionStmt":
+            self._add_function(node, sql)
+        elif kind == "CreateTrigStmt":
+            key = f"trigger:{_qualified(node.relation)}.{node.trigname}"
+            self._add_object(kind, key, sql)
+        elif kind == "CompositeTypeStmt":
+            self._add_object(kind, f"type:{_qualified(node.typevar)}", sql)
+        elif kind == "CreateEnumStmt":
+            name = ".".join(part.sval for part in node.typeName)
+            self._add_object(kind, f"type:{name if '.' in name else f'public.{name}'}", sql)
+        elif kind == "ViewStmt":
+            self._add_object(kind, f"view:{_qualified(node.view)}", sql)
+        elif kind == "CommentStmt":
+            match = re.match(r"(?is)\s*(COMMENT\s+ON\s+.+?)\s+IS\s", sql)
+            identity = _normalize(match.group(1)) if match else _hash(sql)
+            self._add_object(kind, f"comment:{identity}", sql)
+        else:
+            self._add_object(kind, f"statement:{_hash(sql)}", sql)
+
+    def _add_table(self, node, sql: str) -> None:
+        from pglast.enums import ConstrType
+        from pglast.stream import RawStream
+
+        key = _qualified(node.relation)
+        columns: dict[str, dict] = {}
+        constraints: dict[str, str] = {}
+        references = [_qualified(parent) for parent in node.inhRelations or ()]
+
+        for element in node.tableElts or ():
+            if type(element).__name__ == "ColumnDef":
+                column = {
+                    "type": RawStream()(element.typeName),
+                    "not_null": False,
+                    "default": None,
+                    "constraints": [],
+                    "definition": RawStream()(element),
+                }
+                for constraint in element.constraints or ():
+                    if constraint.contype in (ConstrType.CONSTR_NOTNULL, ConstrType.CONSTR_PRIMARY):
+                        column["not_null"] = True
+                    if constraint.contype == ConstrType.CONSTR_DEFAULT:
+                        column["default"] = RawStream()(constraint.raw_expr)
+                    elif constraint.contype == ConstrType.CONSTR_FOREIGN:
+                        references.append(_qualified(constraint.pktable))
+                    if constraint.contype not in (
+                        ConstrType.CONSTR_NOTNULL,
+                        ConstrType.CONSTR_NULL,
+                        ConstrType.CONSTR_DEFAULT,
+                    ):
+                        column["constraints"].append(RawStream()(constraint))
+                columns[element.colname] = column
+            elif type(element).__name__ == "Constraint":
+                text = RawStream()(element)
+                constraints[element.conname or f"hash:{_hash(text)}"] = text
+                if element.contype == ConstrType.CONSTR_FOREIGN:
+                    references.append(_qualified(element.pktable))
+
+        self.tables[key] = {
+            "columns": columns,
+            "constraints": constraints,
+            "references": sorted(set(references) - {key}),
+            "partitioned": node.partspec is not None,
+        }
+        self._remember(f"table:{key}", sql)
+
+    def _add_constraints(self, node) -> bool:
+        """Record ALTER TABLE ... ADD CONSTRAINT name; other ALTERs are plain objects."""
+        from pglast.enums import AlterTableType
+        from pglast.stream import RawStream
+
+        commands = node.cmds or ()
+        if not commands or not all(
+            command.subtype == AlterTableType.AT_AddConstraint and command.def_.conname
+            for command in commands
+        ):
+            return False
+
+        table = _qualified(node.relation)
+        for command in commands:
+            name = command.def_.conname
+            command.def_.skip_validation = False  # NOT VALID (online mode) is not a change
+            definition = RawStream()(command.def_).removeprefix(f"CONSTRAINT {name} ")
+            key = f"{table}.{name}"
+            self.constraints[key] = {"table": table, "name": name, "hash": _hash(definition)}
+            self._remember(f"constraint:{key}", definition)
+        return True
+
+    def _add_function(self, node, sql: str) -> None:
+        from pglast.enums import FunctionParameterMode
+        from pglast.stream import RawStream
+
+        name = ".".join(part.sval for part in node.funcname)
+        if "." not in name:
+            name = f"public.{name}"
+        outputs_only = (
+            FunctionParameterMode.FUNC_PARAM_OUT,
+            FunctionParameterMode.FUNC_PARAM_TABLE,
+        )
+        arguments, outputs = [], []
+        for parameter in node.parameters or ():
+            type_name = RawStream()(parameter.argType)
+            if parameter.mode not in outputs_only:
+                arguments.append(type_name)
+            if parameter.mode in (*outputs_only, FunctionParameterMode.FUNC_PARAM_INOUT):
+                outputs.append(f"{parameter.name} {type_name}")
+
+        returns = RawStream()(node.returnType) if node.returnType else None
+        if outputs:
+            returns = f"{returns or 'record'} ({', '.join(outputs)})"
+
+        key = f"{name}({', '.join(arguments)})"
+        self.functions[key] = {
+            "kind": "procedure" if node.is_procedure else "function",
+            "returns": returns,
+            "hash": _hash(sql),
+        }
+        self._remember(f"function:{key}", sql)
+
+
+@dataclass
+class DeltaStep:
+    """One statement of a delta migration."""
+
+    phase: str
+    sql: str
+
+
+class SchemaDeltaGenerator:
+    """
+    Emit the DDL that turns the `old` snapshot into the `new` one.
+
+    Functions, indexes and named constraints whose hash is unchanged are skipped.
+    Changes that cannot be expressed safely (e.g. an edited unnamed CHECK constraint)
+    are emitted as `-- REVIEW:` comments instead of statements. Destructive drops of
+    columns and tables run last.
+
+    With online=True the delta uses lock-light DDL (see generators.schema.online_ddl):
+    constraint validation moves to generate_validation() and index builds to
+    generate_concurrent(), both to run after the delta has committed. Partitioned
+    tables keep plain DDL, as PostgreSQL supports neither NOT VALID foreign keys nor
+    concurrent index builds on them.
+    """
+
+    def __init__(self, old: SchemaSnapshot, new: SchemaSnapshot, online: bool = False):
+        self.old = old
+        self.new = new
+        self.online = online
+        self.column_types = {
+            column["type"] for table in new.tables.values() for column in table["columns"].values()
+        }
+        # Changed types are dropped with CASCADE and re-created with their dependents
+        self.recreated_types = [
+            key[len("type:") :]
+            for key, entry in old.objects.items()
+            if key.startswith("type:")
+            and key in new.objects
+            and new.objects[key]["hash"] != entry["hash"]
+            and key[len("type:") :] not in self.column_types
+        ]
+        # ... which drops the functions taking or returning them, and what hangs off those
+        self.recreated_functions = [
+            key
+            for key, function in new.functions.items()
+            if self._mentions(
+                f"{key.partition('(')[2]} {function['returns'] or ''}", self.recreated_types
+            )
+        ]
+
+    def is_online(self, table: str, tables: dict[str, dict] | None = None) -> bool:
+        """Online DDL applies to non-partitioned tables only (of `tables`, default new)."""
+        tables = self.new.tables if tables is None else tables
+        return self.online and not tables.get(table, {}).get("partitioned", False)
+
+    def generate(self) -> str:
+        """Render the delta migration as SQL."""
+        steps = [step for step in self.steps() if step.phase not in POST_MIGRATION_PHASES]
+        if not steps:
+            return "-- SpecQL delta migration: no schema changes\n"
+
+        lines = [
+            "-- SpecQL delta migration",
+            f"-- {len(steps)} statement(s); unchanged objects are skipped",
+        ]
+        if self.online:
+            lines.extend(["", lock_timeout_preamble()])
+        phases = [entry for entry in PHASES if entry[0] not in POST_MIGRATION_PHASES]
+        for number, (phase, title) in enumerate(phases, 1):
+            phase_steps = [step for step in steps if step.phase == phase]
+            if not phase_steps:
+                continue
+            lines.extend(["", f"-- {number}. {title}"])
+            lines.extend(self._terminate(step.sql) for step in phase_steps)
+        return "\n".join(lines) + "\n"
+
+    def generate_concurrent(self) -> str | None:
+        """Online mode: index drops/builds to run after generate(), outside a transaction."""
+        steps = [step for step in self.steps() if step.phase == "concurrent"]
+        if not steps:
+            return None
+        return (
+            CONCURRENT_FILE_HEADER
+            + "\n"
+            + "\n".join(self._terminate(step.sql) for step in steps)
+            + "\n"
+        )
+
+    def generate_validation(self) -> str | None:
+        """Online mode: constraint validation to run after generate() has committed."""
+        steps = [step for step in self.steps() if step.phase == "validate"]
+        if not steps:
+            return None
+        return (
+            VALIDATION_FILE_HEADER
+            + "\n"
+            + "\n".join(self._terminate(step.sql) for step in steps)
+            + "\n"
+        )
+
+    def steps(self) -> list[DeltaStep]:
+        """Delta statements, ordered by phase."""
+        steps: list[DeltaStep] = []
+        steps.extend(self._table_steps())
+        steps.extend(self._index_steps())
+        steps.extend(self._constraint_steps())
+        steps.extend(self._function_steps())
+        steps.extend(self._object_steps())
+        if self.online:
+            steps = self._split_validation(steps)
+        order = {phase: position for position, (phase, _) in enumerate(PHASES)}
+        return sorted(steps, key=lambda step: order[step.phase])
+
+    @staticmethod
+    def _split_validation(steps: list[DeltaStep]) -> list[DeltaStep]:
+        """Move the VALIDATE / SET NOT NULL part of online constraint steps to `validate`."""
+        split = []
+        for step in steps:
+            sql, validation = split_validation(step.sql)
+            if sql.strip():
+                split.append(DeltaStep(step.phase, sql.strip()))
+            if validation:
+                split.append(DeltaStep("validate", validation))
+        return split
+
+    @staticmethod
+    def _terminate(sql: str) -> str:
+        sql = sql.strip()
+        return sql if sql.startswith("--") or sql.endswith(";") else f"{sql};"
+
+    def _new_keys(self, prefix: str, entries: dict) -> list[str]:
+        """Keys of `entries` in generation order."""
+        keys = (key[len(prefix) :] for key in self.new.order if key.startswith(prefix))
+        return [key for key in keys if key in entries]
+
+    def _table_steps(self) -> list[DeltaStep]:
+        old, new = self.old.tables, self.new.tables
+        steps = [
+            DeltaStep("create_tables", self.new.statements[f"table:{key}"])
+            for key in self._topological(
+                [key for key in self._new_keys("table:", new) if key not in old], new
+            )
+        ]
+
+        for key in self._new_keys("table:", new):
+            if key in old:
+                steps.extend(self._alter_table_steps(key, old[key], new[key]))
+
+        removed = [key for key in old if key not in new]
+        steps.extend(
+            DeltaStep("destructive", f"DROP TABLE IF EXISTS {key};")
+            for key in reversed(self._topological(removed, old))
+        )
+        return steps
+
+    @staticmethod
+    def _topological(keys: list[str], tables: dict[str, dict]) -> list[str]:
+        """Order tables so referenced tables come first (ties keep input order)."""
+        pending = list(keys)
+        ordered: list[str] = []
+        while pending:
+            ready = [
+                key
+                for key in pending
+                if not any(ref in pending and ref != key for ref in tables[key]["references"])
+            ]
+            ready = ready or pending[:1]  # Reference cycle: fall back to input order
+            ordered.extend(ready)
+            pending = [key for key in pending if key not in ready]
+        return ordered
+
+    def _alter_table_steps(self, table: str, old: dict, new: dict) -> list[DeltaStep]:
+        steps = []
+        alter = f"ALTER TABLE {table}"
+
+        for name, column in new["columns"].items():
+            before = old["columns"].get(name)
+            if before is None:
+                steps.extend(self._add_column_steps(table, name, column))
+                continue
+            if column["type"] != before["type"]:
+                steps.append(
+                    DeltaStep(
+                        "alter_tables",
+                        f"{alter} ALTER COLUMN {name} TYPE {column['type']} "
+                        f"USING {name}::{column['type']};",
+                    )
+                )
+            if column["default"] != before["default"]:
+                action = f"SET DEFAULT {column['default']}" if column["default"] else "DROP DEFAULT"
+                steps.append(DeltaStep("alter_tables", f"{alter} ALTER COLUMN {name} {action};"))
+            if column["not_null"] and not before["not_null"]:
+                steps.append(
+                    DeltaStep("alter_tables", set_not_null(table, name, self.is_online(table)))
+                )
+            elif before["not_null"] and not column["not_null"]:
+                steps.append(
+                    DeltaStep("alter_tables", f"{alter} ALTER COLUMN {name} DROP NOT NULL;")
+                )
+            if column["constraints"] != before["constraints"]:
+                steps.append(
+                    DeltaStep(
+                        "alter_tables",
+                        f"-- REVIEW: inline constraints of {table}.{name} changed: "
+                        f"{', '.join(before['constraints']) or 'none'} -> "
+                        f"{', '.join(column['constraints']) or 'none'}",
+                    )
+                )
+
+        for name, text in old["constraints"].items():
+            if new["constraints"].get(name) == text:
+                continue
+            if name.startswith("hash:"):
+                steps.append(
+                    DeltaStep("drop_constraints", f"-- REVIEW: unnamed constraint removed: {text}")
+                )
+            else:
+                steps.append(
+                    DeltaStep("drop_constraints", f"{alter} DROP CONSTRAINT IF EXISTS {name};")
+                )
+        for name, text in new["constraints"].items():
+            if old["constraints"].get(name) == text:
+                continue
+            if name.startswith("hash:"):
+                steps.append(DeltaStep("constraints", f"{alter} ADD {text};"))
+            else:
+                definition = text.removeprefix(f"CONSTRAINT {name} ")
+                steps.append(
+                    DeltaStep(
+                        "constraints",
+                        add_constraint(table, name, definition, self.is_online(table)),
+                    )
+                )
+
+        steps.extend(
+            DeltaStep("destructive", f"{alter} DROP COLUMN IF EXISTS {name};")
+            for name in old["columns"]
+            if name not in new["columns"]
+        )
+        return steps
+
+    def _add_column_steps(self, table: str, name: str, column: dict) -> list[DeltaStep]:
+        """ADD COLUMN; NOT NULL without a default goes through a nullable column + backfill."""
+        alter = f"ALTER TABLE {table}"
+        definition = column["definition"]
+        without_not_null = re.sub(r"(?<!IS)\s+NOT\s+NULL\b", "", definition, flags=re.IGNORECASE)
+        if column["default"] is not None or without_not_null == definition:
+            return [DeltaStep("alter_tables", f"{alter} ADD COLUMN {definition};")]
+
+        return [
+            DeltaStep("alter_tables", f"{alter} ADD COLUMN {without_not_null};"),
+            DeltaStep(
+                "alter_tables",
+                f"-- REVIEW: {table}.{name} is NOT NULL without a default: backfill existing "
+                f"rows (UPDATE {table} SET {name} = ... WHERE {name} IS NULL) before SET NOT NULL",
+            ),
+            DeltaStep("alter_tables", set_not_null(table, name, self.is_online(table))),
+        ]
+
+    def _index_steps(self) -> list[DeltaStep]:
+        old, new = self.old.indexes, self.new.indexes
+        steps = []
+        for key, index in old.items():
+            if key in new and new[key]["hash"] == index["hash"]:
+                continue
+            if self.is_online(index["table"], self.old.tables):
+                steps.append(DeltaStep("concurrent", f"DROP INDEX CONCURRENTLY IF EXISTS {key};"))
+            else:
+                steps.append(DeltaStep("drop_constraints", f"DROP INDEX IF EXISTS {key};"))
+
+        for key in self._new_keys("index:", new):
+            if key in old and old[key]["hash"] == new[key]["hash"]:
+                continue
+            sql = self.new.statements[f"index:{key}"]
+            if self.is_online(new[key]["table"]):
+                steps.append(DeltaStep("concurrent", concurrently(sql)))
+            else:
+                steps.append(DeltaStep("indexes", sql))
+        return steps
+
+    def _constraint_steps(self) -> list[DeltaStep]:
+        old, new = self.old.constraints, self.new.constraints
+        steps = [
+            DeltaStep(
+                "drop_constraints",
+                f"ALTER TABLE {entry['table']} DROP CONSTRAINT IF EXISTS {entry['name']};",
+            )
+            for key, entry in old.items()
+            if (key not in new or new[key]["hash"] != entry["hash"])
+            and entry["table"] in self.new.tables
+        ]
+        for key in self._new_keys("constraint:", new):
+            if key in old and old[key]["hash"] == new[key]["hash"]:
+                continue
+            table, _, name = key.rpartition(".")
+            definition = self.new.statements[f"constraint:{key}"]
+            steps.append(
+                DeltaStep(
+                    "constraints", add_constraint(table, name, definition, self.is_online(table))
+                )
+            )
+        return steps
+
+    def _function_steps(self) -> list[DeltaStep]:
+        old, new = self.old.functions, self.new.functions
+        steps = []
+        for key, function in old.items():
+            current = new.get(key)
+            if current is None or current["returns"] != function["returns"]:
+                kind = function.get("kind", "function").upper()
+                steps.append(DeltaStep("drop_dependents", f"DROP {kind} IF EXISTS {key};"))
+
+        steps.extend(
+            DeltaStep("functions", self.new.statements[f"function:{key}"])
+            for key in self._new_keys("function:", new)
+            if key not in old
+            or old[key]["hash"] != new[key]["hash"]
+            or self._uses_recreated_type(f"function:{key}")
+        )
+        return steps
+
+    def _object_steps(self) -> list[DeltaStep]:
+        old, new = self.old.objects, self.new.objects
+        steps = []
+        for key, entry in old.items():
+            if key in new and new[key]["hash"] == entry["hash"]:
+                continue
+            drop = self._drop_object(key)
+            if drop:
+                steps.append(DeltaStep("drop_dependents", drop))
+
+        for key in self._new_keys("", new):
+            entry = new[key]
+            unchanged = key in old and old[key]["hash"] == entry["hash"]
+            if unchanged and not self._uses_recreated_type(key):
+                continue
+            if key.startswith("type:") and key in old and not self._recreated(key):
+                steps.append(
+                    DeltaStep(
+                        "prelude", f"-- REVIEW: {key[len('type:') :]} changed but is a column type"
+                    )
+                )
+                continue
+            phase = "prelude" if entry["kind"] in PRELUDE_KINDS else "objects"
+            steps.append(DeltaStep(phase, self.new.statements[key]))
+        return steps
+
+    def _recreated(self, key: str) -> bool:
+        return key.startswith("type:") and key[len("type:") :] in self.recreated_types
+
+    def _uses_recreated_type(self, key: str) -> bool:
+        """
+        Whether a statement was dropped by CASCADE along with a re-created type.
+
+        That covers functions whose signature uses the type and everything attached to
+        them (comments, grants, triggers), and other objects referencing the type.
+        """
+        if self._recreated(key):
+            return False
+        if key.startswith("function:"):
+            return key[len("function:") :] in self.recreated_functions
+
+        function_names = [function.partition("(")[0] for function in self.recreated_functions]
+        code = _strip_literals(self.new.statements[key])
+        return self._mentions(code, self.recreated_types) or self._mentions(code, function_names)
+
+    @staticmethod
+    def _mentions(sql: str, names) -> bool:
+        """Whether sql references one of the qualified names (bare too, for public)."""
+        variants = set(names) | {
+            name[len("public.") :] for name in names if name.startswith("public.")
+        }
+        return any(
+            re.search(rf"(?<![\w.]){re.escape(name)}\b", sql, re.IGNORECASE) for name in variants
+        )
+
+    def _drop_object(self, key: str) -> str | None:
+        """DROP for a changed or removed trigger/view/type; other objects are re-run or left."""
+        if self._recreated(key):
+            return f"DROP TYPE IF EXISTS {key[len('type:') :]} CASCADE;"
+        if key.startswith("trigger:"):
+            table, _, trigger = key[len("trigger:") :].rpartition(".")
+            return f"DROP TRIGGER IF EXISTS {trigger} ON {table};"
+        if key.startswith("view:"):
+            return f"DROP VIEW IF EXISTS {key[len('view:') :]};"
+        return None
@@ -6,17 +6,25 @@ Coordinates table + type generation for complete schema
 from dataclasses import dataclass
 
 from core.ast_models import Entity, EntityDefinition
-from generators.app_schema_generator import AppSchemaGenerator
+from generators.app_schema_generator import AppSchemaGenerator, AuditLogConfig
 from generators.app_wrapper_generator import AppWrapperGenerator
 from generators.composite_type_generator import CompositeTypeGenerator
 from generators.core_logic_generator import CoreLogicGenerator
 from generators.fraiseql.mutation_annotator import MutationAnnotator
 from generators.fraiseql.table_view_annotator import TableViewAnnotator
+from generators.function_volatility import FunctionVolatilityAnalyzer
 from generators.schema.naming_conventions import NamingConventions
+from generators.schema.online_ddl import (
+    concurrently,
+    lock_timeout_preamble,
+    split_concurrent,
+    split_validation,
+)
 from generators.schema.pattern_transformer import PatternTransformerRegistry
 from generators.schema.schema_registry import SchemaRegistry
 from generators.schema.table_view_dependency import TableViewDependencyResolver
 from generators.schema.table_view_generator import TableViewGenerator
+from generators.schema.table_view_refresh_queue import TableViewRefreshQueueGenerator
 from generators.schema.transformers.aggregate_view_transformer import AggregateViewTransformer
 from generators.schema.transformers.computed_column_transformer import ComputedColumnTransformer
 from generators.schema.transformers.scd_type2_transformer import SCDType2Transformer
@@ -49,6 +57,8 @@ class SchemaOutput:
         MutationFunctionPair
     ]  # → db/schema/30_functions/{action_name}.sql (ONE FILE EACH!)
     input_types_sql: str | None = None  # → db/schema/00_foundation/002_{entity}_input_types.sql
+    concurrent_indexes_sql: str | None = None  # Online mode: run outside a transaction
+    validation_sql: str | None = None  # Online mode: run after table_sql has committed
 
 
 class SchemaOrchestrator:
@@ -59,6 +69,9 @@ class SchemaOrchestrator:
         naming_conventions: NamingConventions | None = None,
         enable_performance_monitoring: bool = False,
         registry_optional: bool = False,
+        audit_log: AuditLogConfig | None = None,
+        infer_volatility: bool = False,
+        online: bool = False,
     ) -> None:
         self.logger = get_team_logger("Schema", __name__)
         self.logger.debug("Initializing SchemaOrchestrator")
@@ -70,9 +83,10 @@ class SchemaOrchestrator:
         # Create schema registry
         schema_registry = SchemaRegistry(naming_conventions.registry)
 
-        self.app_gen = AppSchemaGenerator()
+        self.app_gen = AppSchemaGenerator(audit_log=audit_log)
         self.app_wrapper_gen = AppWrapperGenerator()
-        self.table_gen = TableGenerator(schema_registry)
+        self.table_gen = TableGenerator(schema_registry, online=online)
+        self.online = online
         self.type_gen = CompositeTypeGenerator()
         self.helper_gen = TrinityHelperGenerator(schema_registry)
         self.core_gen = CoreLogicGenerator(schema_registry)
@@ -87,6 +101,9 @@ class SchemaOrchestrator:
         self.pattern_transformers.register(SCDType2Transformer())
         self.pattern_transformers.register(AggregateViewTransformer())
 
+        # Post-generation volatility / parallel-safety inference (opt-in)
+        self.volatility_analyzer = FunctionVolatilityAnalyzer() if infer_volatility else None
+
         # Performance monitoring
         self.enable_performance_monitoring = enable_performance_monitoring
         self.perf_monitor = get_performance_monitor() if enable_performance_monitoring else None
@@ -225,7 +242,27 @@ class SchemaOrchestrator:
         logger.info(
             f"Successfully generated complete schema for '{entity.name}' ({len(parts)} components)"
         )
-        return "\n\n".join(parts)
+        return self._online_script(self._infer_function_attributes("\n\n".join(parts)))
+
+    def _online_script(self, sql: str) -> str:
+        """
+        Online mode: lock timeout first, validation and CONCURRENTLY builds last.
+
+        The script must run statement by statement (psql -f without
+        --single-transaction), so the trailing steps run after the DDL has committed.
+        """
+        if not self.online:
+            return sql
+        sql, concurrent = split_concurrent(sql)
+        sql, validation = split_validation(sql)
+        parts = [lock_timeout_preamble(), sql.strip()]
+        if validation:
+            parts.append(
+                "-- Constraint validation (after the DDL above has committed)\n" + validation
+            )
+        if concurrent:
+            parts.append("-- Concurrent index builds (outside a transaction block)\n" + concurrent)
+        return "\n\n".join(parts) + "\n"
 
     def _generate_translation_components(self, entity: Entity) -> list[str]:
         """
@@ -322,6 +359,17 @@ class SchemaOrchestrator:
 
             # Apply pattern transformations
             table_sql = self._apply_pattern_transformations(entity, table_ddl)
+            table_sql = self._infer_function_attributes(table_sql)
+
+            # Online mode: CONCURRENTLY builds cannot run in the table's transaction
+            # and constraint validation must not scan under its ACCESS EXCLUSIVE locks
+            concurrent_indexes_sql = validation_sql = None
+            if self.table_gen.is_online(entity):
+                table_sql = concurrently(table_sql)  # Also pattern-added indexes
+            if self.online:
+                table_sql, concurrent_indexes_sql = split_concurrent(table_sql)
+                table_sql, validation_sql = split_validation(table_sql)
+                table_sql = f"{lock_timeout_preamble()}\n\n{table_sql}"
 
             # Team B: Helper functions (Trinity pattern utilities)
             logger.debug("Generating helper functions")
@@ -330,6 +378,7 @@ class SchemaOrchestrator:
                     helpers_sql = self.helper_gen.generate_all_helpers(entity)
             else:
                 helpers_sql = self.helper_gen.generate_all_helpers(entity)
+            helpers_sql = self._infer_function_attributes(helpers_sql)
 
             # Generate input types for all actions
             input_types_parts = []
@@ -377,8 +426,10 @@ class SchemaOrchestrator:
                     else:  # custom
                         core_sql = self.core_gen.generate_core_custom_action(entity, action)
 
-                # Generate app wrapper
+                # Generate app wrapper (analyzed after the core function it calls)
+                core_sql = self._infer_function_attributes(core_sql)
                 app_sql = app_wrapper_gen.generate_app_wrapper(entity, action)
+                app_sql = self._infer_function_attributes(app_sql)
 
                 # Generate FraiseQL comments
                 annotator = MutationAnnotator(entity.schema, entity.name)
@@ -401,6 +452,8 @@ class SchemaOrchestrator:
                 helpers_sql=helpers_sql,
                 mutations=mutations,
                 input_types_sql=input_types_sql,
+                concurrent_indexes_sql=concurrent_indexes_sql or None,
+                validation_sql=validation_sql or None,
             )
         finally:
             # Exit performance tracking context
@@ -425,6 +478,12 @@ class SchemaOrchestrator:
 
         return transformed_ddl
 
+    def _infer_function_attributes(self, sql: str) -> str:
+        """Tighten volatility / parallel safety of emitted functions (if enabled)."""
+        if self.volatility_analyzer is None or not sql:
+            return sql
+        return self.volatility_analyzer.analyze(sql)
+
     def generate_table_views(self, entities: list[EntityDefinition]) -> str:
         """
         Generate tv_ tables for all entities in dependency order.
@@ -433,7 +492,7 @@ class SchemaOrchestrator:
             entities: All entities to generate tv_ tables for
 
         Returns:
-            Complete SQL for all tv_ tables and refresh functions
+            Complete SQL for all tv_ tables, refresh functions and the refresh queue
         """
         if not entities:
             return ""
@@ -464,7 +523,12 @@ class SchemaOrchestrator:
                         + annotations
                     )
 
-        return "\n\n".join(parts)
+        # Deferred refresh queue for the `batch` refresh scope
+        refresh_queue = TableViewRefreshQueueGenerator(entities).generate()
+        if refresh_queue:
+            parts.append(refresh_queue)
+
+        return self._infer_function_attributes("\n\n".join(parts))
 
     def generate_app_foundation_only(self) -> str:
         """
@@ -473,7 +537,7 @@ class SchemaOrchestrator:
         Returns:
             SQL for app schema foundation
         """
-        return self.app_gen.generate_app_foundation()
+        return self._infer_function_attributes(self.app_gen.generate_app_foundation())
 
     def generate_schema_summary(self, entity: Entity) -> dict[str, str | list[str]]:
         """
@@ -13,6 +13,8 @@ from generators.comment_generator import CommentGenerator
 from generators.constraint_generator import ConstraintGenerator
 from generators.index_generator import IndexGenerator
 from generators.schema.ddl_deduplicator import DDLDeduplicator
+from generators.schema.online_ddl import add_constraint, concurrently
+from generators.schema.partition_generator import PartitionGenerator
 from generators.schema.schema_registry import SchemaRegistry
 from utils.safe_slug import safe_table_name
 
@@ -32,16 +34,33 @@ class TableGenerator:
         "decimal": "DECIMAL",
     }
 
-    def __init__(self, schema_registry: SchemaRegistry, templates_dir: str = "templates/sql"):
-        """Initialize with Jinja2 templates and schema registry"""
+    def __init__(
+        self,
+        schema_registry: SchemaRegistry,
+        templates_dir: str = "templates/sql",
+        online: bool = False,
+    ):
+        """
+        Initialize with Jinja2 templates and schema registry
+
+        Args:
+            online: Emit lock-light DDL (indexes built CONCURRENTLY, foreign keys added
+                NOT VALID then validated). Partitioned tables support neither and keep
+                plain DDL.
+        """
         self.schema_registry = schema_registry
         self.templates_dir = templates_dir
+        self.online = online
         self.env = Environment(
             loader=FileSystemLoader(templates_dir), trim_blocks=True, lstrip_blocks=True
         )
         self.constraint_generator = ConstraintGenerator()
         self.comment_generator = CommentGenerator()
-        self.index_generator = IndexGenerator()
+        self.index_generator = IndexGenerator(online=online)
+
+    def is_online(self, entity: Entity) -> bool:
+        """Online DDL applies to non-partitioned tables only."""
+        return self.online and not PartitionGenerator(entity).is_partitioned()
 
     def _load_template(self, template_name: str):
         """Load template with fallback to package resources"""
@@ -83,6 +102,8 @@ class TableGenerator:
         # Load and render template
         template = self._load_template("table.sql.j2")
         table_sql = template.render(**context)
+        if self.is_online(entity):
+            table_sql = concurrently(table_sql)
 
         # Combine table SQL with pattern-generated SQL
         if additional_sql:
@@ -164,6 +185,16 @@ class TableGenerator:
         # Patterns are now processed by PatternApplier in SchemaOrchestrator
         pattern_extensions = self._process_patterns(entity)
 
+        # Declarative partitioning (PARTITION BY clause + partitions/maintenance)
+        partition_gen = PartitionGenerator(entity)
+        partitioning = None
+        if partition_gen.is_partitioned():
+            partitioning = {
+                "key": partition_gen.key_column,
+                "clause": partition_gen.partition_clause(),
+                "ddl": partition_gen.generate(),
+            }
+
         # Build context
         context = {
             "entity": {
@@ -180,6 +211,8 @@ class TableGenerator:
                 "constraints": table_constraints,
                 "multi_tenant": is_tenant_specific,
                 "patterns": pattern_extensions,
+                "partitioning": partitioning,
+                "online": self.is_online(entity),
             }
         }
 
@@ -223,6 +256,8 @@ class TableGenerator:
             return ""
 
         fk_statements = []
+        # ONLY is rejected for foreign keys on partitioned tables
+        only = not PartitionGenerator(entity).is_partitioned()
 
         for field_name, field_def in entity.fields.items():
             if field_def.type_name == "ref" and field_def.reference_entity:
@@ -233,11 +268,15 @@ class TableGenerator:
                 ref_table = f"{entity.schema}.tb_{target_entity_lower}"
                 ref_column = f"pk_{target_entity_lower}"
 
-                fk_sql = f"""ALTER TABLE ONLY {table_name}
-    ADD CONSTRAINT tb_{entity_name_lower}_{field_name}_fkey
-    FOREIGN KEY ({fk_name}) REFERENCES {ref_table}({ref_column});"""
-
-                fk_statements.append(fk_sql)
+                fk_statements.append(
+                    add_constraint(
+                        table_name,
+                        f"tb_{entity_name_lower}_{field_name}_fkey",
+                        f"FOREIGN KEY ({fk_name}) REFERENCES {ref_table}({ref_column})",
+                        online=self.is_online(entity),
+                        only=only,
+                    )
+                )
 
         return "\n\n".join(fk_statements)
 
@@ -298,24 +337,27 @@ class TableGenerator:
                 else:
                     # Legacy Index object
                     index_type = getattr(index_def, "type", "btree")
+                    create = "CREATE UNIQUE INDEX" if index_def.unique else "CREATE INDEX"
+                    where = f" WHERE {index_def.where}" if index_def.where else ""
                     # Special case for daterange indexes - assume GIST
                     if index_def.name and "daterange" in str(index_def.name):
                         indexes.append(
-                            f"CREATE INDEX {index_def.name} ON {table_name} USING gist ({', '.join(index_def.columns)});"
+                            f"{create} {index_def.name} ON {table_name} USING gist ({', '.join(index_def.columns)}){where};"
                         )
                     elif index_type != "btree":
                         indexes.append(
-                            f"CREATE INDEX {index_def.name} ON {table_name} USING {index_type} ({', '.join(index_def.columns)});"
+                            f"{create} {index_def.name} ON {table_name} USING {index_type} ({', '.join(index_def.columns)}){where};"
                         )
                     else:
                         indexes.append(
-                            f"CREATE INDEX {index_def.name} ON {table_name} ({', '.join(index_def.columns)});"
+                            f"{create} {index_def.name} ON {table_name} ({', '.join(index_def.columns)}){where};"
                         )
 
         # Deduplicate indexes to prevent duplicate statements
         indexes = DDLDeduplicator.deduplicate_indexes(indexes)
 
-        return "\n".join(indexes)
+        ddl = "\n".join(indexes)
+        return concurrently(ddl) if self.is_online(entity) else ddl
 
     def generate_field_comments(self, entity: Entity) -> list[str]:
         """Generate COMMENT ON COLUMN statements for all fields with deduplication"""
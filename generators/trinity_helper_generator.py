@@ -8,6 +8,7 @@ import importlib.resources as resources
 from jinja2 import Environment, FileSystemLoader, TemplateNotFound
 
 from core.ast_models import Entity
+from generators.schema.partition_generator import PartitionGenerator
 from generators.schema.schema_registry import SchemaRegistry
 from utils.safe_slug import safe_slug, safe_table_name
 
@@ -57,6 +58,9 @@ class TrinityHelperGenerator:
                 "pk_column": f"pk_{safe_slug(entity.name)}",
             },
             "is_tenant_specific": is_tenant_specific,
+            "partition_key": PartitionGenerator(entity).pruning_key(
+                tenant_filtered=is_tenant_specific
+            ),
         }
 
         template = self._load_template("trinity_helpers.sql.j2")
@@ -74,7 +78,8 @@ class TrinityHelperGenerator:
                 "schema": entity.schema,
                 "table_name": safe_table_name(entity.name),
                 "pk_column": f"pk_{safe_slug(entity.name)}",
-            }
+            },
+            "partition_key": PartitionGenerator(entity).pruning_key(),
         }
 
         template = self._load_template("trinity_helpers.sql.j2")
@@ -0,0 +1,277 @@
+"""Closure table support for recursive validation patterns."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ClosureTableConfig:
+    """Edge table whose transitive closure is materialized."""
+
+    schema: str
+    edge_table: str  # e.g. tb_feature_dependency
+    source_column: str  # Edge start (e.g. feature_id)
+    target_column: str  # Edge end (e.g. requires_feature_id)
+    filter_column: str | None = None  # Only edges where filter_column = filter_value
+    filter_value: str | None = None  # e.g. dependency_type = 'REQUIRES'
+    key_type: str = "UUID"
+
+    @property
+    def closure_table(self) -> str:
+        return f"{self.edge_table}_closure"
+
+    @property
+    def qualified_closure_table(self) -> str:
+        return f"{self.schema}.{self.closure_table}"
+
+
+class ClosureTableGenerator:
+    """
+    Generate a closure table kept in sync with an edge table by triggers.
+
+    Each row (source_id, target_id, depth, path_count) records that target_id is
+    reachable from source_id through path_count distinct paths of `depth` edges. Path
+    counts make edge deletion exact on DAGs: removing an edge subtracts the paths it
+    contributed, and pairs that drop to zero paths are deleted.
+
+    Cycles cannot be represented, so edges that would close one are rejected by the
+    maintenance trigger using a single indexed lookup (`reaches_{closure}`).
+
+    Maintenance takes a SHARE ROW EXCLUSIVE lock on the closure table (self-conflicting,
+    readers unaffected), so concurrent edge writes are serialized: two transactions
+    cannot each pass the cycle check for the two halves of a cycle, nor lose each
+    other's path counts.
+    """
+
+    def __init__(self, config: ClosureTableConfig):
+        self.config = config
+        schema, closure = config.schema, config.closure_table
+        self.reaches_function = f"{schema}.reaches_{closure}"
+        self.apply_edge_function = f"{schema}.apply_{closure}_edge"
+        self.sync_function = f"{schema}.sync_{closure}"
+        self.rebuild_function = f"{schema}.rebuild_{closure}"
+
+    def generate(self) -> str:
+        """Generate closure table, reachability lookup, maintenance trigger and rebuild."""
+        return "\n".join(
+            [
+                self._generate_table(),
+                self._generate_reaches_function(),
+                self._generate_apply_edge_function(),
+                self._generate_trigger(),
+                self._generate_rebuild_function(),
+            ]
+        )
+
+    def reaches(self, source: str, target: str) -> str:
+        """SQL expression: is target reachable from source (or equal to it)?"""
+        return f"{self.reaches_function}({source}, {target})"
+
+    def _edge_predicate(self, row: str) -> str:
+        """Predicate selecting maintained edges for NEW/OLD (or a table alias)."""
+        c = self.config
+        predicate = f"{row}.{c.target_column} IS NOT NULL"
+        if c.filter_column:
+            predicate += f" AND {row}.{c.filter_column} = '{c.filter_value}'"
+        return predicate
+
+    def _lock(self) -> str:
+        return f"LOCK TABLE {self.config.qualified_closure_table} IN SHARE ROW EXCLUSIVE MODE;"
+
+    def _generate_table(self) -> str:
+        c = self.config
+        return f"""
+-- Closure table: transitive reachability over {c.schema}.{c.edge_table}
+CREATE TABLE IF NOT EXISTS {c.qualified_closure_table} (
+    source_id {c.key_type} NOT NULL,
+    target_id {c.key_type} NOT NULL,
+    depth INTEGER NOT NULL,
+    path_count BIGINT NOT NULL,
+    PRIMARY KEY (source_id, target_id, depth)
+);
+
+CREATE INDEX IF NOT EXISTS idx_{c.closure_table}_target
+    ON {c.qualified_closure_table} (target_id, source_id);
+
+COMMENT ON TABLE {c.qualified_closure_table}
+IS 'Materialized transitive closure of {c.schema}.{c.edge_table}, maintained by trigger';
+"""
+
+    def _generate_reaches_function(self) -> str:
+        c = self.config
+        return f"""
+-- Reachability lookup (single index probe)
+CREATE OR REPLACE FUNCTION {self.reaches_function}(
+    p_source {c.key_type},
+    p_target {c.key_type}
+)
+RETURNS BOOLEAN
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT p_source = p_target
+        OR EXISTS (
+            SELECT 1
+            FROM {c.qualified_closure_table}
+            WHERE source_id = p_source
+              AND target_id = p_target
+        );
+$$;
+"""
+
+    def _generate_apply_edge_function(self) -> str:
+        c = self.config
+        cl = c.qualified_closure_table
+        return f"""
+-- Add (p_sign = 1) or remove (p_sign = -1) the paths running through one edge
+CREATE OR REPLACE FUNCTION {self.apply_edge_function}(
+    p_source {c.key_type},
+    p_target {c.key_type},
+    p_sign INTEGER
+)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_sources {c.key_type}[];
+    v_targets {c.key_type}[];
+BEGIN
+    {self._lock()}
+
+    v_sources := ARRAY(
+        SELECT DISTINCT source_id FROM {cl} WHERE target_id = p_source
+    ) || p_source;
+    v_targets := ARRAY(
+        SELECT DISTINCT target_id FROM {cl} WHERE source_id = p_target
+    ) || p_target;
+
+    -- Every path x ~> p_source -> p_target ~> y
+    INSERT INTO {cl} AS c (source_id, target_id, depth, path_count)
+    SELECT
+        a.source_id,
+        d.target_id,
+        a.depth + d.depth + 1,
+        SUM(p_sign * a.path_count * d.path_count)
+    FROM (
+        SELECT source_id, depth, path_count FROM {cl} WHERE target_id = p_source
+        UNION ALL
+        SELECT p_source, 0, 1
+    ) a
+    CROSS JOIN (
+        SELECT target_id, depth, path_count FROM {cl} WHERE source_id = p_target
+        UNION ALL
+        SELECT p_target, 0, 1
+    ) d
+    GROUP BY a.source_id, d.target_id, a.depth + d.depth + 1
+    ON CONFLICT (source_id, target_id, depth)
+    DO UPDATE SET path_count = c.path_count + EXCLUDED.path_count;
+
+    IF p_sign < 0 THEN
+        DELETE FROM {cl}
+        WHERE source_id = ANY(v_sources)
+          AND target_id = ANY(v_targets)
+          AND path_count <= 0;
+    END IF;
+END;
+$$;
+"""
+
+    def _generate_trigger(self) -> str:
+        c = self.config
+        cl = c.qualified_closure_table
+        edge = f"{c.schema}.{c.edge_table}"
+        watched = [c.source_column, c.target_column]
+        if c.filter_column:
+            watched.append(c.filter_column)
+
+        return f"""
+-- Keep {cl} in sync with edge writes; reject edges that would close a cycle
+CREATE OR REPLACE FUNCTION {self.sync_function}()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- Serialize edge writes: the cycle check and path counts read the closure
+    {self._lock()}
+
+    IF TG_OP IN ('UPDATE', 'DELETE') AND {self._edge_predicate("OLD")} THEN
+        PERFORM {self.apply_edge_function}(OLD.{c.source_column}, OLD.{c.target_column}, -1);
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND {self._edge_predicate("NEW")} THEN
+        IF {self.reaches_function}(NEW.{c.target_column}, NEW.{c.source_column}) THEN
+            RAISE EXCEPTION 'Circular dependency: % already reaches %',
+                NEW.{c.target_column}, NEW.{c.source_column};
+        END IF;
+        PERFORM {self.apply_edge_function}(NEW.{c.source_column}, NEW.{c.target_column}, 1);
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER trg_{c.closure_table}_sync
+    AFTER INSERT OR DELETE OR UPDATE OF {", ".join(watched)} ON {edge}
+    FOR EACH ROW
+    EXECUTE FUNCTION {self.sync_function}();
+"""
+
+    def _generate_rebuild_function(self) -> str:
+        c = self.config
+        cl = c.qualified_closure_table
+        edge = f"{c.schema}.{c.edge_table}"
+
+        return f"""
+-- Rebuild {cl} from scratch, extending a frontier one depth level at a time
+CREATE OR REPLACE FUNCTION {self.rebuild_function}()
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_depth INTEGER := 1;
+    v_rows INTEGER;
+BEGIN
+    {self._lock()}
+    DELETE FROM {cl};
+
+    DROP TABLE IF EXISTS pg_temp.closure_frontier;
+    CREATE TEMP TABLE closure_frontier ON COMMIT DROP AS
+    SELECT e.{c.source_column} AS source_id, e.{c.target_column} AS target_id,
+           COUNT(*) AS path_count
+    FROM {edge} e
+    WHERE {self._edge_predicate("e")}
+    GROUP BY e.{c.source_column}, e.{c.target_column};
+
+    LOOP
+        INSERT INTO {cl} (source_id, target_id, depth, path_count)
+        SELECT source_id, target_id, v_depth, path_count
+        FROM pg_temp.closure_frontier;
+
+        GET DIAGNOSTICS v_rows = ROW_COUNT;
+        EXIT WHEN v_rows = 0;
+
+        IF EXISTS (SELECT 1 FROM pg_temp.closure_frontier WHERE source_id = target_id) THEN
+            RAISE EXCEPTION 'Circular dependency in {edge}; closure cannot be built';
+        END IF;
+
+        CREATE TEMP TABLE closure_next ON COMMIT DROP AS
+        SELECT f.source_id, e.{c.target_column} AS target_id, SUM(f.path_count) AS path_count
+        FROM pg_temp.closure_frontier f
+        JOIN {edge} e ON e.{c.source_column} = f.target_id
+        WHERE {self._edge_predicate("e")}
+        GROUP BY f.source_id, e.{c.target_column};
+
+        DROP TABLE pg_temp.closure_frontier;
+        ALTER TABLE pg_temp.closure_next RENAME TO closure_frontier;
+        v_depth := v_depth + 1;
+    END LOOP;
+
+    DROP TABLE pg_temp.closure_frontier;
+
+    SELECT COUNT(*) INTO v_rows FROM {cl};
+    RETURN v_rows;
+END;
+$$;
+
+COMMENT ON FUNCTION {self.rebuild_function}()
+IS 'Rebuild the closure of {edge} (initial load or repair). Returns the row count.';
+"""
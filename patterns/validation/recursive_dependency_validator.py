@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 
 from core.ast_models import EntityDefinition
+from patterns.validation.closure_table import ClosureTableConfig, ClosureTableGenerator
 
 
 @dataclass
@@ -13,6 +14,7 @@ class DependencyConfig:
     parent_field: str | None = None  # Field for self-referencing hierarchies
     max_depth: int = 10
     check_circular: bool = True
+    closure_table: bool = False  # Materialize the REQUIRES closure instead of recursive CTEs
 
 
 class RecursiveDependencyValidator:
@@ -28,11 +30,15 @@ class RecursiveDependencyValidator:
         2. Validation function to check dependencies
         3. Conflict detection function
 
+        With closure_table: true, a trigger-maintained closure table replaces the
+        recursive CTEs, and edges that would close a cycle are rejected on write.
+
         Args:
             entity: Entity to validate (e.g., ProductConfiguration)
             params:
                 - dependency_entity: Entity storing dependency rules
                 - max_depth: Maximum recursion depth (default: 10)
+                - closure_table: Use a materialized closure table (default: False)
         """
         config = cls._parse_config(params)
 
@@ -64,11 +70,37 @@ class RecursiveDependencyValidator:
         allow_cycles = params.get("allow_cycles", False)  # Default to False (check for cycles)
         check_circular = not allow_cycles
 
+        closure_table = params.get("closure_table", False)
+        if closure_table and allow_cycles:
+            raise ValueError("'closure_table' requires an acyclic graph and cannot allow cycles")
+
         return DependencyConfig(
             dependency_entity=dependency_entity,
             parent_field=parent_field,
             max_depth=params.get("max_depth", 10),
             check_circular=check_circular,
+            closure_table=closure_table,
+        )
+
+    @classmethod
+    def _closure_generator(
+        cls, entity: EntityDefinition, config: DependencyConfig
+    ) -> ClosureTableGenerator:
+        """Closure table over REQUIRES edges of the dependency table."""
+        dep_table = (
+            f"tb_{config.dependency_entity.lower()}"
+            if config.dependency_entity
+            else entity.table_name
+        )
+        return ClosureTableGenerator(
+            ClosureTableConfig(
+                schema=entity.schema,
+                edge_table=dep_table,
+                source_column="feature_id",
+                target_column="requires_feature_id",
+                filter_column="dependency_type",
+                filter_value="REQUIRES",
+            )
         )
 
     @classmethod
@@ -78,6 +110,10 @@ class RecursiveDependencyValidator:
         """Generate all validation functions."""
         functions = []
 
+        # 0. Closure table (must exist before the functions reading it)
+        if config.closure_table:
+            functions.append(cls._closure_generator(entity, config).generate())
+
         # 1. Find all dependencies (recursive)
         functions.append(cls._generate_find_dependencies_function(entity, config))
 
@@ -113,6 +149,37 @@ class RecursiveDependencyValidator:
         else:
             dep_table = f"tb_{entity.name.lower()}"
 
+        if config.closure_table:
+            closure = cls._closure_generator(entity, config).config.qualified_closure_table
+            return f"""
+-- Find all dependencies from the closure table
+CREATE OR REPLACE FUNCTION {entity.schema}.{func_name}(
+    p_feature_ids UUID[]
+)
+RETURNS TABLE(
+    feature_id UUID,
+    requires_feature_id UUID,
+    depth INTEGER,
+    path UUID[]
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        c.source_id,
+        c.target_id,
+        MIN(c.depth),
+        ARRAY[c.source_id, c.target_id]
+    FROM {closure} c
+    WHERE c.source_id = ANY(p_feature_ids)
+      AND c.depth <= {config.max_depth}
+    GROUP BY c.source_id, c.target_id;
+$$;
+
+COMMENT ON FUNCTION {entity.schema}.{func_name}(UUID[])
+IS 'Find all dependencies up to depth {config.max_depth} (closure table; path holds the endpoints only)';
+"""
+
         return f"""
 -- Find all dependencies recursively
 CREATE OR REPLACE FUNCTION {entity.schema}.{func_name}(
@@ -283,6 +350,49 @@ IS 'Check for conflicting features in selection';
             else entity.table_name
         )
 
+        if config.closure_table:
+            closure = cls._closure_generator(entity, config)
+            entity_lower = entity.name.lower()
+            return f"""
+-- Check whether a new dependency edge would close a cycle (single indexed lookup)
+CREATE OR REPLACE FUNCTION {entity.schema}.would_create_cycle_{entity_lower}(
+    p_feature_id UUID,
+    p_requires_feature_id UUID
+)
+RETURNS BOOLEAN
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT {closure.reaches("p_requires_feature_id", "p_feature_id")};
+$$;
+
+COMMENT ON FUNCTION {entity.schema}.would_create_cycle_{entity_lower}(UUID, UUID)
+IS 'True if p_requires_feature_id already reaches p_feature_id';
+
+-- Detect circular dependencies in dependency graph
+CREATE OR REPLACE FUNCTION {entity.schema}.{func_name}()
+RETURNS TABLE(
+    has_circular BOOLEAN,
+    circular_path UUID[],
+    error_message TEXT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    -- Cycle-closing edges are rejected on write, so a self-reachable node means
+    -- the closure is out of sync (rebuild it)
+    SELECT
+        EXISTS(SELECT 1 FROM {closure.config.qualified_closure_table} WHERE source_id = target_id),
+        (SELECT ARRAY[source_id, target_id] FROM {closure.config.qualified_closure_table}
+         WHERE source_id = target_id LIMIT 1),
+        (SELECT 'Circular dependency detected at ' || source_id
+         FROM {closure.config.qualified_closure_table} WHERE source_id = target_id LIMIT 1);
+$$;
+
+COMMENT ON FUNCTION {entity.schema}.{func_name}()
+IS 'Detect circular dependencies in feature dependency graph (closure table)';
+"""
+
         return f"""
 -- Detect circular dependencies in dependency graph
 CREATE OR REPLACE FUNCTION {entity.schema}.{func_name}()
@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 
 from core.ast_models import EntityDefinition, FieldDefinition, Index
+from patterns.validation.closure_table import ClosureTableConfig, ClosureTableGenerator
 
 
 @dataclass
@@ -13,6 +14,8 @@ class TemplateConfig:
     template_field: str = "template_id"
     max_depth: int = 5
     merge_strategy: str = "override"  # 'override', 'merge', 'append'
+    parent_field: str = "parent_template_id"  # Template -> parent template link
+    closure_table: bool = False  # Materialize template ancestry instead of recursive CTEs
 
 
 class TemplateInheritancePattern:
@@ -63,6 +66,22 @@ class TemplateInheritancePattern:
             template_field=params.get("template_field", "template_id"),
             max_depth=params.get("max_depth", 5),
             merge_strategy=params.get("merge_strategy", "override"),
+            parent_field=params.get("parent_field", "parent_template_id"),
+            closure_table=params.get("closure_table", False),
+        )
+
+    @classmethod
+    def _closure_generator(
+        cls, entity: EntityDefinition, config: TemplateConfig
+    ) -> ClosureTableGenerator:
+        """Closure table over template -> parent template links."""
+        return ClosureTableGenerator(
+            ClosureTableConfig(
+                schema=entity.schema,
+                edge_table=f"tb_{config.template_entity.lower()}",
+                source_column="id",
+                target_column=config.parent_field,
+            )
         )
 
     @classmethod
@@ -70,7 +89,10 @@ class TemplateInheritancePattern:
         cls, entity: EntityDefinition, config: TemplateConfig
     ) -> list[str]:
         """Generate template resolution functions."""
-        return [
+        closure_ddl = (
+            [cls._closure_generator(entity, config).generate()] if config.closure_table else []
+        )
+        return closure_ddl + [
             cls._generate_resolve_template_function(entity, config),
             cls._generate_get_template_chain_function(entity, config),
             cls._generate_depth_validation_function(entity, config),
@@ -85,6 +107,60 @@ class TemplateInheritancePattern:
         func_name = f"resolve_template_{entity.name.lower()}"
         template_table = f"tb_{config.template_entity.lower()}"
 
+        if config.closure_table:
+            closure = cls._closure_generator(entity, config).config.qualified_closure_table
+            return f"""
+-- Resolve configuration from template inheritance chain (closure table)
+CREATE OR REPLACE FUNCTION {entity.schema}.{func_name}(
+    p_entity_id UUID
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    WITH template_chain AS (
+        -- Entity's direct template
+        SELECT
+            1 as level,
+            t.id as template_id,
+            t.config_data
+        FROM {entity.schema}.{entity.table_name} e
+        JOIN {entity.schema}.{template_table} t ON t.id = e.{config.template_field}
+        WHERE e.id = p_entity_id
+
+        UNION ALL
+
+        -- Its ancestors, one indexed closure lookup
+        SELECT
+            c.depth + 1,
+            t.id,
+            t.config_data
+        FROM {entity.schema}.{entity.table_name} e
+        JOIN {closure} c ON c.source_id = e.{config.template_field}
+        JOIN {entity.schema}.{template_table} t ON t.id = c.target_id
+        WHERE e.id = p_entity_id
+          AND c.depth < {config.max_depth}
+    )
+    -- Merge configurations (deepest first, then override with specific)
+    SELECT
+        COALESCE(
+            (
+                SELECT jsonb_object_agg(key, value)
+                FROM (
+                    SELECT key, value
+                    FROM template_chain,
+                         LATERAL jsonb_each(config_data)
+                    ORDER BY level DESC  -- Parent first, child overrides
+                ) merged
+            ),
+            '{{}}'::jsonb
+        );
+$$;
+
+COMMENT ON FUNCTION {entity.schema}.{func_name}(UUID)
+IS 'Resolve merged configuration from template inheritance chain (max depth: {config.max_depth})';
+"""
+
         return f"""
 -- Resolve configuration from template inheritance chain
 CREATE OR REPLACE FUNCTION {entity.schema}.{func_name}(
@@ -144,6 +220,43 @@ IS 'Resolve merged configuration from template inheritance chain (max depth: {co
         func_name = f"get_template_chain_{entity.name.lower()}"
         template_table = f"tb_{config.template_entity.lower()}"
 
+        if config.closure_table:
+            closure = cls._closure_generator(entity, config).config.qualified_closure_table
+            return f"""
+-- Get template inheritance chain (closure table)
+CREATE OR REPLACE FUNCTION {entity.schema}.{func_name}(
+    p_entity_id UUID
+)
+RETURNS TABLE(
+    level INTEGER,
+    template_id UUID,
+    template_name TEXT,
+    config_data JSONB
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT 1, t.id, t.identifier, t.config_data
+    FROM {entity.schema}.{entity.table_name} e
+    JOIN {entity.schema}.{template_table} t ON t.id = e.{config.template_field}
+    WHERE e.id = p_entity_id
+
+    UNION ALL
+
+    SELECT c.depth + 1, t.id, t.identifier, t.config_data
+    FROM {entity.schema}.{entity.table_name} e
+    JOIN {closure} c ON c.source_id = e.{config.template_field}
+    JOIN {entity.schema}.{template_table} t ON t.id = c.target_id
+    WHERE e.id = p_entity_id
+      AND c.depth < {config.max_depth}
+
+    ORDER BY 1;
+$$;
+
+COMMENT ON FUNCTION {entity.schema}.{func_name}(UUID)
+IS 'Get template inheritance chain for debugging';
+"""
+
         return f"""
 -- Get template inheritance chain
 CREATE OR REPLACE FUNCTION {entity.schema}.{func_name}(
@@ -194,6 +307,42 @@ IS 'Get template inheritance chain for debugging';
         func_name = f"validate_template_depth_{entity.name.lower()}"
         template_table = f"tb_{config.template_entity.lower()}"
 
+        if config.closure_table:
+            closure = cls._closure_generator(entity, config).config.qualified_closure_table
+            return f"""
+-- Validate template inheritance depth (closure table)
+CREATE OR REPLACE FUNCTION {entity.schema}.{func_name}(
+    p_entity_id UUID
+)
+RETURNS boolean
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  v_depth integer;
+BEGIN
+  -- Entity + its template + the template's deepest ancestor
+  SELECT CASE
+           WHEN e.{config.template_field} IS NULL THEN 1
+           ELSE 2 + COALESCE(MAX(c.depth), 0)
+         END
+  INTO v_depth
+  FROM {entity.schema}.tb_{entity.name.lower()} e
+  LEFT JOIN {closure} c ON c.source_id = e.{config.template_field}
+  WHERE e.id = p_entity_id
+  GROUP BY e.{config.template_field};
+
+  IF v_depth > {config.max_depth} THEN
+    RAISE EXCEPTION 'Template hierarchy exceeds maximum depth of {config.max_depth}';
+  END IF;
+
+  RETURN true;
+END;
+$$;
+
+COMMENT ON FUNCTION {entity.schema}.{func_name}(UUID)
+IS 'Validate template inheritance depth does not exceed maximum';
+"""
+
         return f"""
 -- Validate template inheritance depth
 CREATE OR REPLACE FUNCTION {entity.schema}.{func_name}(
@@ -82,19 +82,21 @@ class AlgorithmicParser:
 
         return result
 
-    def parse(self, sql: str) -> ConversionResult:
+    def parse(self, sql: str, parsed_func: ParsedFunction | None = None) -> ConversionResult:
         """
         Parse SQL function to SpecQL
 
         Args:
             sql: SQL CREATE FUNCTION statement
+            parsed_func: Statement already parsed to AST (skips stage 1)
 
         Returns:
             ConversionResult with SpecQL steps and confidence
         """
         try:
             # Stage 1: Try to parse SQL to AST
-            parsed_func = self.sql_parser.parse_function(sql)
+            if parsed_func is None:
+                parsed_func = self.sql_parser.parse_function(sql)
             # Stage 2: Map AST to SpecQL primitives
             result = self.mapper.map_function(parsed_func)
         except Exception as e:
@@ -111,17 +113,18 @@ class AlgorithmicParser:
 
         return result
 
-    def parse_to_yaml(self, sql: str) -> str:
+    def parse_to_yaml(self, sql: str, parsed_func: ParsedFunction | None = None) -> str:
         """
         Parse SQL and convert to YAML
 
         Args:
             sql: SQL CREATE FUNCTION statement
+            parsed_func: Statement already parsed to AST (see parse)
 
         Returns:
             SpecQL YAML string
         """
-        result = self.parse(sql)
+        result = self.parse(sql, parsed_func)
         return self._to_yaml(result)
 
     def _to_yaml(self, result: ConversionResult) -> str:
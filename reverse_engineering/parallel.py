@@ -0,0 +1,137 @@
+"""Process-parallel reverse engineering of source files"""
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from .parse_cache import ParseCache
+
+T = TypeVar("T")
+
+# Target chunks per worker: small files are sent in batches, big ones still spread out
+_CHUNKS_PER_WORKER = 4
+
+
+class FileLog:
+    """Messages of one file's parsing, replayed by the CLI in file order"""
+
+    def __init__(self):
+        self.messages: list[tuple[str, str]] = []  # (level, message)
+
+    def info(self, message: str) -> None:
+        self.messages.append(("info", message))
+
+    def warning(self, message: str) -> None:
+        self.messages.append(("warning", message))
+
+    def replay(self, output) -> None:
+        """Print the messages with the CLI output (cli.utils.output)"""
+        for level, message in self.messages:
+            getattr(output, level)(message)
+
+
+class ReverseExecutor:
+    """
+    Parse the files of a `reverse` command on a process pool
+
+    A parse function takes (path, log, **options) and returns picklable parse
+    products for one file. Results come back in file order whatever the worker
+    count, so the CLI merges them and runs its cross-file steps (FK maps,
+    info/instance pairing, translation detection) deterministically afterwards.
+    With one worker, files are parsed in this process. With a cache, only
+    files without a cached result are parsed.
+    """
+
+    def __init__(self, workers: int = 1, cache: "ParseCache | None" = None):
+        """
+        Args:
+            workers: Worker processes
+            cache: Parse products cache, None to parse every file
+        """
+        self.workers = workers
+        self.cache = cache
+
+    def map(
+        self, parse_file: Callable[..., T], paths: list[Path], **options: Any
+    ) -> Iterator[tuple[Path, T, FileLog]]:
+        """
+        Parse every path with parse_file(path, log, **options)
+
+        Yields:
+            (path, result, log) in path order
+        """
+        if self.cache is None:
+            yield from self._parse_all(parse_file, paths, options)
+            return
+
+        keys, cached = {}, {}
+        for path in paths:
+            try:
+                keys[path] = self.cache.key(parse_file, path, options)
+            except OSError:
+                continue  # Unreadable: parse_file reports it
+            products = self.cache.get(keys[path])
+            if products is not None:
+                cached[path] = products
+
+        parsed = self._parse_all(parse_file, [p for p in paths if p not in cached], options)
+        for path in paths:
+            if path in cached:
+                result, messages = cached[path]
+                log = FileLog()
+                log.messages = messages
+            else:
+                _, result, log = next(parsed)
+                if path in keys:
+                    self.cache.put(keys[path], (result, log.messages))
+            yield path, result, log
+        self.cache.evict()
+
+    def _parse_all(
+        self, parse_file: Callable[..., T], paths: list[Path], options: dict[str, Any]
+    ) -> Iterator[tuple[Path, T, FileLog]]:
+        task = partial(_parse, parse_file, options)
+        if self.workers <= 1 or len(paths) <= 1:
+            _init_worker()
+            try:
+                for path in paths:
+                    yield path, *task(path)
+            finally:
+                _instances.clear()
+            return
+
+        workers = min(self.workers, len(paths))
+        chunksize = max(1, len(paths) // (workers * _CHUNKS_PER_WORKER))
+        with ProcessPoolExecutor(workers, initializer=_init_worker) as pool:
+            for path, (result, log) in zip(paths, pool.map(task, paths, chunksize=chunksize)):
+                yield path, result, log
+
+
+def worker_instance(factory: Callable[..., T], *args: Any) -> T:
+    """
+    Instance of factory(*args) shared by the files parsed in this worker
+
+    Parsers (tree-sitter languages, pglast) are built once per worker and run
+    rather than once per file.
+    """
+    key = (factory, args)
+    instance = _instances.get(key)
+    if instance is None:
+        instance = _instances[key] = factory(*args)
+    return instance
+
+
+# Worker process state, reset by _init_worker
+_instances: dict[tuple, Any] = {}
+
+
+def _init_worker() -> None:
+    _instances.clear()
+
+
+def _parse(parse_file: Callable[..., T], options: dict[str, Any], path: Path) -> tuple[T, FileLog]:
+    log = FileLog()
+    return parse_file(path, log, **options), log
@@ -0,0 +1,174 @@
+"""
+Persistent cache of per-file reverse engineering parse products
+
+Entries are keyed by the file's content hash and path, the language, the parse
+options and the parser version (package version plus a digest of the parser
+sources), and hold the parse function's result with its messages (see
+reverse_engineering.parallel). Re-running a `reverse` command on a
+mostly unchanged codebase then only parses the changed files. Least recently
+used entries are evicted beyond a total size.
+"""
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+from collections.abc import Callable
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+# Bump when the parse products (ParsedSQLFile, entity/route extractions) change shape
+PARSE_CACHE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """~/.cache/specql/reverse, or under $XDG_CACHE_HOME"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "specql" / "reverse"
+
+
+def _parser_version() -> str:
+    """
+    Package version, PARSE_CACHE_VERSION and a digest of reverse_engineering/*.py
+
+    The digest invalidates entries when parser code changes without a release
+    (editable installs, development checkouts).
+    """
+    try:
+        package_version = version("specql")
+    except PackageNotFoundError:
+        package_version = "dev"
+    digest = hashlib.sha256()
+    for source in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(source.name.encode())
+        digest.update(source.read_bytes())
+    return f"{package_version}/{PARSE_CACHE_VERSION}/{digest.hexdigest()[:16]}"
+
+
+@functools.cache
+def _module_digest(module_name: str) -> str:
+    """Digest of a module's source ("" when it has none, e.g. built-ins)"""
+    module = sys.modules.get(module_name)
+    try:
+        source = Path(inspect.getsourcefile(module)).read_bytes()
+    except (TypeError, OSError):
+        return ""
+    return hashlib.sha256(source).hexdigest()
+
+
+class ParseCache:
+    """Content-addressed store of parse products for one language"""
+
+    def __init__(
+        self,
+        language: str,
+        cache_dir: Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Args:
+            language: Reverse command the products come from (sql, rust, ...)
+            cache_dir: Cache directory, default_cache_dir() by default
+            max_bytes: Total entry size kept by evict()
+        """
+        self.language = language
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.parser_version = _parser_version()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, parse_file: Callable, path: Path, options: dict[str, Any]) -> str:
+        """
+        Entry key of parsing path with parse_file(path, log, **options)
+
+        The path is part of the key as products embed it (file names,
+        namespaces, Next.js routes). So is the source digest of parse_file's
+        module, which may live outside reverse_engineering (CLI commands).
+        """
+        digest = hashlib.sha256()
+        for part in (
+            self.language,
+            self.parser_version,
+            f"{parse_file.__module__}.{parse_file.__qualname__}",
+            _module_digest(parse_file.__module__),
+            repr(sorted(options.items())),
+            str(path),
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        with open(path, "rb") as file:
+            digest.update(hashlib.file_digest(file, "sha256").digest())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Stored products, or None on a miss (unreadable entries are dropped)"""
+        entry = self._entry(key)
+        try:
+            with open(entry, "rb") as file:
+                products = pickle.load(file)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            entry.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        # Mark as recently used for eviction
+        with contextlib.suppress(OSError):
+            os.utime(entry)
+        self.hits += 1
+        return products
+
+    def put(self, key: str, products: Any) -> None:
+        """
+        Store products (atomically: concurrent runs may share the cache)
+
+        The cache is best effort: products are not stored if the cache
+        directory is not writable or they cannot be pickled.
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(products, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_name, self._entry(key))
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            pass
+        finally:
+            Path(temp_name).unlink(missing_ok=True)  # Left when not replaced
+
+    def evict(self) -> int:
+        """Remove least recently used entries beyond max_bytes; returns the count removed"""
+        entries = []
+        for entry in self.cache_dir.glob("*.pickle"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # Evicted by a concurrent run
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(OSError):
+                entry.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / f"{self.language}-{key}.pickle"
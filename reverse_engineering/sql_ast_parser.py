@@ -56,38 +56,48 @@ class SQLASTParser:
             ast = self.pglast.parse_sql(sql)
 
             # Extract function definition
-            stmt = ast[0].stmt
+            return self.parse_function_stmt(ast[0].stmt)
 
-            if not isinstance(stmt, self.pglast.ast.CreateFunctionStmt):
-                raise ValueError("Not a CREATE FUNCTION statement")
+        except Exception as e:
+            raise ValueError(f"Failed to parse SQL: {e}")
 
-            func_stmt = stmt
+    def parse_function_stmt(self, stmt) -> ParsedFunction:
+        """
+        Parse an already parsed CREATE FUNCTION statement
 
-            # Extract function name
-            func_name_parts = [n.sval for n in func_stmt.funcname]
-            schema = func_name_parts[0] if len(func_name_parts) > 1 else "public"
-            function_name = func_name_parts[-1]
+        Args:
+            stmt: pglast CreateFunctionStmt node
 
-            # Extract parameters
-            parameters = self._parse_parameters(func_stmt.parameters)
+        Returns:
+            ParsedFunction with AST
+        """
+        if not isinstance(stmt, self.pglast.ast.CreateFunctionStmt):
+            raise ValueError("Not a CREATE FUNCTION statement")
 
-            # Extract return type
-            return_type = self._parse_return_type(func_stmt.returnType)
+        func_stmt = stmt
 
-            # Extract body
-            body = self._parse_body(func_stmt)
+        # Extract function name
+        func_name_parts = [n.sval for n in func_stmt.funcname]
+        schema = func_name_parts[0] if len(func_name_parts) > 1 else "public"
+        function_name = func_name_parts[-1]
 
-            return ParsedFunction(
-                function_name=function_name,
-                schema=schema,
-                parameters=parameters,
-                return_type=return_type,
-                body=body,
-                language="plpgsql",
-            )
+        # Extract parameters
+        parameters = self._parse_parameters(func_stmt.parameters)
 
-        except Exception as e:
-            raise ValueError(f"Failed to parse SQL: {e}")
+        # Extract return type
+        return_type = self._parse_return_type(func_stmt.returnType)
+
+        # Extract body
+        body = self._parse_body(func_stmt)
+
+        return ParsedFunction(
+            function_name=function_name,
+            schema=schema,
+            parameters=parameters,
+            return_type=return_type,
+            body=body,
+            language="plpgsql",
+        )
 
     def _parse_parameters(self, params) -> list[dict[str, str]]:
         """Extract function parameters"""
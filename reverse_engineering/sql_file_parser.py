@@ -0,0 +1,245 @@
+"""
+SQL File Parser using pglast
+
+Parses the statements reverse engineering reads from a SQL file (CREATE TABLE,
+CREATE FUNCTION, ALTER TABLE ... FOREIGN KEY, COMMENT ON) in batches of one pglast
+call each, as the splitter yields them, and feeds each AST node to the table,
+function, foreign key and comment extraction. Statements pglast rejects fall back
+to regex parsing.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+
+from core.dependencies import PGLAST
+
+from .fk_detector import ForeignKeyDetector, ForeignKeyInfo
+from .sql_ast_parser import ParsedFunction, SQLASTParser
+from .sql_splitter import (
+    COMMENT,
+    CREATE_FUNCTION,
+    CREATE_TABLE,
+    FOREIGN_KEY,
+    SQLStatement,
+    split_file,
+    split_statements,
+)
+from .table_parser import ParsedTable, SQLTableParser
+
+# Lazy import with availability check
+_pglast = None
+
+
+def _get_pglast():
+    global _pglast
+    if _pglast is None:
+        PGLAST.require()  # Raises helpful error if not installed
+        import pglast
+
+        _pglast = pglast
+    return _pglast
+
+
+# Statement kinds parsed; others are skipped undecoded by the splitter
+REVERSED_KINDS = {CREATE_TABLE, CREATE_FUNCTION, FOREIGN_KEY, COMMENT}
+
+# Statements per pglast call: bounds memory on large dumps
+PARSE_BATCH_SIZE = 500
+
+# Fallback for COMMENT statements pglast rejects
+_COMMENT_PATTERN = re.compile(
+    r"COMMENT\s+ON\s+(TABLE|COLUMN)\s+([\w.]+)\s+IS\s+'((?:[^']|'')*)'", re.IGNORECASE
+)
+_ALTER_TABLE_NAME = re.compile(r"ALTER\s+TABLE\s+(?:ONLY\s+)?([\w.]+)", re.IGNORECASE)
+
+
+@dataclass
+class FunctionDefinition:
+    """CREATE FUNCTION statement, with its AST when pglast accepted it"""
+
+    sql: str
+    parsed: ParsedFunction | None = None
+
+
+@dataclass
+class ParsedSQLFile:
+    """Reverse engineering input extracted from one SQL file"""
+
+    tables: list[ParsedTable] = field(default_factory=list)  # With comments attached
+    functions: list[FunctionDefinition] = field(default_factory=list)
+    # Lowercased table name (without schema) -> its foreign keys
+    foreign_keys: dict[str, list[ForeignKeyInfo]] = field(default_factory=dict)
+    skipped: int = 0  # CREATE TABLE statements that could not be parsed
+    warnings: list[str] = field(default_factory=list)
+
+
+class SQLFileParser:
+    """Parse SQL files for reverse engineering with one pglast parse per statement batch"""
+
+    def __init__(self, table_parser: SQLTableParser | None = None):
+        # Check dependency on instantiation
+        self.pglast = _get_pglast()
+        self.table_parser = table_parser or SQLTableParser()
+        self.function_parser = SQLASTParser()
+        self.fk_detector = ForeignKeyDetector()
+
+    def parse_file(self, path: Path | str) -> ParsedSQLFile:
+        """Parse a SQL file, split by streaming over its memory map"""
+        return self.parse_statements(split_file(path, REVERSED_KINDS))
+
+    def parse(self, sql: str) -> ParsedSQLFile:
+        """Parse SQL content"""
+        return self.parse_statements(split_statements(sql, REVERSED_KINDS))
+
+    def parse_statements(self, statements: Iterable[SQLStatement]) -> ParsedSQLFile:
+        """Parse classified statements (see reverse_engineering.sql_splitter)"""
+        result = ParsedSQLFile()
+        table_comments: dict[str, str] = {}
+        column_comments: dict[str, dict[str, str]] = {}
+
+        for statement, node in self._parsed(statements):
+            if statement.kind == CREATE_TABLE:
+                try:
+                    if node is None:
+                        # Raises pglast's error
+                        result.tables.append(self.table_parser.parse_table(statement.sql))
+                    else:
+                        table = self.table_parser.parse_create_stmt(node, statement.sql)
+                        result.tables.append(table)
+                except Exception as e:
+                    result.warnings.append(f"Failed to parse table: {e}")
+                    result.skipped += 1
+            elif statement.kind == CREATE_FUNCTION:
+                try:
+                    parsed = self.function_parser.parse_function_stmt(node)
+                except Exception:
+                    parsed = None  # AlgorithmicParser falls back to text parsing
+                result.functions.append(FunctionDefinition(statement.sql, parsed))
+            elif statement.kind == FOREIGN_KEY:
+                if node is not None:
+                    table_name, fks = self._foreign_keys(node)
+                else:
+                    table_name, fks = self._foreign_keys_from_sql(statement.sql)
+                if table_name:
+                    result.foreign_keys.setdefault(table_name, []).extend(fks)
+            elif statement.kind == COMMENT:
+                if node is not None:
+                    comment = self._comment(node)
+                else:
+                    comment = self._comment_from_sql(statement.sql)
+                if comment:
+                    target, table_name, column_name, text = comment
+                    if target == "TABLE":
+                        table_comments[table_name] = text
+                    else:
+                        column_comments.setdefault(table_name, {})[column_name] = text
+
+        # Associate comments with the parsed tables
+        for table in result.tables:
+            full_table_name = f"{table.schema}.{table.table_name}".lower()
+            if full_table_name in table_comments:
+                table.table_comment = table_comments[full_table_name]
+            if full_table_name in column_comments:
+                table.column_comments = column_comments[full_table_name]
+
+        return result
+
+    def _parsed(self, statements: Iterable[SQLStatement]) -> Iterator[tuple]:
+        """Yield (statement, AST node) pairs, parsing PARSE_BATCH_SIZE statements at a time"""
+        statements = iter(statements)
+        while batch := list(islice(statements, PARSE_BATCH_SIZE)):
+            yield from zip(batch, self._parse_nodes(batch))
+
+    def _parse_nodes(self, statements: list[SQLStatement]) -> list:
+        """AST node of each statement (None if rejected), parsing all at once when possible"""
+        try:
+            raw_statements = self.pglast.parse_sql(
+                "\n".join(_terminated(statement.sql) for statement in statements)
+            )
+            if len(raw_statements) == len(statements):
+                return [raw.stmt for raw in raw_statements]
+        except Exception:
+            pass
+
+        # Some statement is rejected: parse them one by one to isolate it
+        nodes = []
+        for statement in statements:
+            try:
+                nodes.append(self.pglast.parse_sql(statement.sql)[0].stmt)
+            except Exception:
+                nodes.append(None)
+        return nodes
+
+    def _foreign_keys(self, stmt) -> tuple[str | None, list[ForeignKeyInfo]]:
+        """(table name, single-column FKs) of an AlterTableStmt"""
+        enums = self.pglast.enums
+        foreign_keys = []
+        for cmd in stmt.cmds or ():
+            constraint = cmd.def_
+            if (
+                cmd.subtype != enums.AlterTableType.AT_AddConstraint
+                or constraint.contype != enums.ConstrType.CONSTR_FOREIGN
+                or len(constraint.fk_attrs or ()) != 1
+                or len(constraint.pk_attrs or ()) != 1
+            ):
+                continue
+            ref_table = constraint.pktable.relname
+            foreign_keys.append(
+                ForeignKeyInfo(
+                    column=constraint.fk_attrs[0].sval,
+                    references_schema=constraint.pktable.schemaname or "public",
+                    references_table=ref_table,
+                    references_column=constraint.pk_attrs[0].sval,
+                    entity_name=self.fk_detector._infer_entity_name(ref_table),
+                )
+            )
+        return stmt.relation.relname.lower(), foreign_keys
+
+    def _foreign_keys_from_sql(self, sql: str) -> tuple[str | None, list[ForeignKeyInfo]]:
+        match = _ALTER_TABLE_NAME.search(sql)
+        if not match:
+            return None, []
+        table_name = match.group(1).split(".")[-1].lower()
+        return table_name, self.fk_detector._parse_alter_table_fk(sql)
+
+    def _comment(self, stmt) -> tuple[str, str, str | None, str] | None:
+        """(TABLE/COLUMN, schema.table, column, comment) of a CommentStmt"""
+        object_type = self.pglast.enums.ObjectType
+        if stmt.comment is None or stmt.objtype not in (
+            object_type.OBJECT_TABLE,
+            object_type.OBJECT_COLUMN,
+        ):
+            return None
+        names = [name.sval for name in stmt.object]
+        if stmt.objtype == object_type.OBJECT_TABLE:
+            return "TABLE", _qualified(names), None, stmt.comment
+        return "COLUMN", _qualified(names[:-1]), names[-1], stmt.comment
+
+    @staticmethod
+    def _comment_from_sql(sql: str) -> tuple[str, str, str | None, str] | None:
+        match = _COMMENT_PATTERN.match(sql)
+        if not match:
+            return None
+        target, name, comment = match.groups()
+        comment = comment.replace("''", "'")  # Unescape quotes
+        names = name.lower().split(".")
+        if target.upper() == "TABLE":
+            return "TABLE", _qualified(names), None, comment
+        if len(names) < 2:
+            return None
+        return "COLUMN", _qualified(names[:-1]), names[-1], comment
+
+
+def _qualified(names: list[str]) -> str:
+    """Lowercased schema.table of a (possibly unqualified or catalog-qualified) name"""
+    if len(names) == 1:
+        names = ["public", *names]
+    return f"{names[-2]}.{names[-1]}".lower()
+
+
+def _terminated(sql: str) -> str:
+    # On its own line: an unterminated last statement may end with a line comment
+    return sql if sql.endswith(";") else f"{sql}\n;"
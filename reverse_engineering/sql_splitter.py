@@ -0,0 +1,202 @@
+"""
+Streaming SQL statement splitter
+
+Splits SQL scripts (e.g. `pg_dump --schema-only` output) into statements in one
+pass, skipping over string literals, quoted identifiers, comments, dollar-quoted
+bodies and SQL-standard `BEGIN ATOMIC ... END` routine bodies, and classifies
+each statement from its leading keywords.
+Files are memory-mapped, so only the statements being yielded are held in memory.
+"""
+
+import mmap
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+CREATE_TABLE = "create_table"
+CREATE_FUNCTION = "create_function"
+FOREIGN_KEY = "foreign_key"  # ALTER TABLE ... ADD CONSTRAINT ... FOREIGN KEY
+COMMENT = "comment"  # COMMENT ON TABLE / COLUMN
+OTHER = "other"
+
+# Everything but statement ends and block comments, skipped in one regex match:
+# plain text, literals, quoted identifiers, line comments and dollar quotes.
+# Constructs it cannot close (unterminated, nested) are left to _statement_spans.
+_SKIPPABLE = re.compile(
+    rb"""(?:
+        [^;'"$/\-Ee]++
+        | '[^']*+(?:''[^']*+)*+'
+        | (?<![\w\x80-\xff$])[Ee]'[^'\\]*+(?:(?:\\.|'')[^'\\]*+)*+'
+        | [Ee]
+        | "[^"]*+(?:""[^"]*+)*+"
+        | --[^\n]*+
+        | -
+        | /(?!\*)
+        | (?<![\w\x80-\xff$])\$(?P<tag>(?:[A-Za-z_\x80-\xff][\w\x80-\xff]*+)?)\$.*?\$(?P=tag)\$
+        | (?<=[\w\x80-\xff$])\$
+        | \$(?=\d)
+    )*+""",
+    re.VERBOSE | re.DOTALL,
+)
+_DOLLAR_TAG = re.compile(rb"\$(?:[A-Za-z_\x80-\xff][\w\x80-\xff]*)?\$")
+_COMMENT_DELIMITER = re.compile(rb"/\*|\*/")
+_WHITESPACE_AND_LINE_COMMENTS = re.compile(rb"(?:\s++|--[^\n]*+)*+")
+
+# Routines whose SQL-standard body (BEGIN ATOMIC ... END) holds semicolons
+_ROUTINE = re.compile(rb"CREATE\s+(?:OR\s+REPLACE\s+)?(?:FUNCTION|PROCEDURE)\s", re.IGNORECASE)
+# Literals, quoted identifiers, comments and dollar quotes, dropped before counting blocks
+_NON_KEYWORDS = re.compile(
+    rb"""(?<![\w$])[Ee]'(?:[^'\\]|\\.|'')*+'
+    | '(?:[^']|'')*+'
+    | "(?:[^"]|"")*+"
+    | --[^\n]*+
+    | /\*.*?\*/
+    | \$(?P<tag>(?:[A-Za-z_][\w]*)?)\$.*?\$(?P=tag)\$""",
+    re.VERBOSE | re.DOTALL,
+)
+# Blocks of a BEGIN ATOMIC body: the body itself and CASE expressions, both closed by END
+_BLOCK_KEYWORD = re.compile(rb"\b(?:BEGIN\s+ATOMIC|CASE|END)\b", re.IGNORECASE)
+
+# Kinds by leading keywords, as named groups (ALTER TABLE is checked for FOREIGN KEY later)
+_NAME = rb'(?:[\w.]|"(?:[^"]|"")*")+'
+_KIND = re.compile(
+    rb"(?P<create_table>CREATE\s+(?:(?:GLOBAL|LOCAL)\s+)?(?:(?:TEMP|TEMPORARY|UNLOGGED)\s+)?"
+    rb"TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?" + _NAME + rb"\s*\()"
+    rb"|(?P<create_function>CREATE\s+(?:OR\s+REPLACE\s+)?FUNCTION\s)"
+    rb"|(?P<foreign_key>ALTER\s+TABLE\s)"
+    rb"|(?P<comment>COMMENT\s+ON\s+(?:TABLE|COLUMN)\s)",
+    re.IGNORECASE,
+)
+_FOREIGN_KEY = re.compile(
+    r"\bADD\s+CONSTRAINT\s+" + _NAME.decode() + r"\s+FOREIGN\s+KEY\b", re.IGNORECASE
+)
+
+
+@dataclass
+class SQLStatement:
+    """One statement of a SQL script, with its terminating semicolon"""
+
+    kind: str
+    sql: str
+
+
+def split_statements(
+    source: bytes | str | mmap.mmap, kinds: set[str] | None = None
+) -> Iterator[SQLStatement]:
+    """
+    Yield the statements of a SQL script in order
+
+    Args:
+        source: Script content; str is encoded as UTF-8
+        kinds: Only yield statements of these kinds; None yields all. Other
+            statements are skipped without being decoded.
+    """
+    buffer = source.encode() if isinstance(source, str) else source
+    for start, stop in _statement_spans(buffer):
+        match = _KIND.match(buffer, start, stop)
+        kind = match.lastgroup if match else OTHER
+        if kinds is not None and kind not in kinds and kind != FOREIGN_KEY:
+            continue
+        sql = bytes(buffer[start:stop]).decode("utf-8", errors="replace").strip()
+        if kind == FOREIGN_KEY and not _FOREIGN_KEY.search(sql):
+            kind = OTHER
+        if kinds is None or kind in kinds:
+            yield SQLStatement(kind, sql)
+
+
+def split_file(path: Path | str, kinds: set[str] | None = None) -> Iterator[SQLStatement]:
+    """Yield the statements of a SQL file, memory-mapped rather than read (see split_statements)"""
+    with open(path, "rb") as file:
+        # mmap rejects empty files
+        if not file.seek(0, 2):
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from split_statements(buffer, kinds)
+
+
+def _statement_spans(buffer) -> Iterator[tuple[int, int]]:
+    """(start, stop) offsets of each non-blank statement, leading comments excluded"""
+    size = len(buffer)
+    start = pos = 0
+    # BEGIN ATOMIC / CASE blocks open in the routine being split, counted up to segment
+    depth = 0
+    segment = 0
+
+    while True:
+        pos = _SKIPPABLE.match(buffer, pos).end()
+        if pos >= size:
+            break
+        char = buffer[pos : pos + 1]
+
+        if char == b";":
+            statement_start = _skip_comments(buffer, start, pos)
+            if _ROUTINE.match(buffer, statement_start, pos):
+                depth += _block_depth(bytes(buffer[max(segment, statement_start) : pos]))
+                segment = pos + 1
+                if depth > 0:
+                    pos += 1  # Statement of the routine body
+                    continue
+            if statement_start < pos:
+                yield statement_start, pos + 1
+            start = pos = segment = pos + 1
+            depth = 0
+        elif char == b"/":
+            pos = _block_comment_end(buffer, pos)
+        elif char == b"'":
+            pos = _quoted_end(buffer, pos + 1, b"'")
+        elif char == b'"':
+            pos = _quoted_end(buffer, pos + 1, b'"')
+        else:
+            tag = _DOLLAR_TAG.match(buffer, pos)
+            if tag is None:
+                pos += 1
+            else:
+                end = buffer.find(tag.group(), tag.end())
+                pos = size if end == -1 else end + len(tag.group())
+
+    # Unterminated last statement
+    statement_start = _skip_comments(buffer, start, size)
+    if statement_start < size:
+        yield statement_start, size
+
+
+def _skip_comments(buffer, pos: int, stop: int) -> int:
+    """Offset of the first byte after pos that is not whitespace or a comment"""
+    while True:
+        pos = _WHITESPACE_AND_LINE_COMMENTS.match(buffer, pos, stop).end()
+        if buffer[pos : pos + 2] != b"/*" or pos >= stop:
+            return pos
+        pos = _block_comment_end(buffer, pos)
+
+
+def _block_depth(sql: bytes) -> int:
+    """BEGIN ATOMIC and CASE blocks opened minus ENDs in sql"""
+    depth = 0
+    for match in _BLOCK_KEYWORD.finditer(_NON_KEYWORDS.sub(b" ", sql)):
+        depth += -1 if match.group().upper() == b"END" else 1
+    return depth
+
+
+def _quoted_end(buffer, pos: int, quote: bytes) -> int:
+    """Offset after the quote closing a literal or identifier (doubled quotes escape)"""
+    while True:
+        end = buffer.find(quote, pos)
+        if end == -1:
+            return len(buffer)
+        if buffer[end + 1 : end + 2] != quote:
+            return end + 1
+        pos = end + 2
+
+
+def _block_comment_end(buffer, pos: int) -> int:
+    """Offset after the */ closing the (possibly nested) comment opened at pos"""
+    depth = 0
+    while True:
+        match = _COMMENT_DELIMITER.search(buffer, pos)
+        if match is None:
+            return len(buffer)
+        depth += 1 if match.group() == b"/*" else -1
+        pos = match.end()
+        if depth == 0:
+            return pos
@@ -104,66 +104,73 @@ class SQLTableParser:
     def parse_table(self, sql: str) -> ParsedTable:
         """Parse CREATE TABLE statement"""
         try:
-            # Extract original table name before pglast normalizes it
-            original_table_name = self._extract_original_table_name(sql)
-
             # Parse SQL to AST
             ast = self.pglast.parse_sql(sql)
 
             # Extract table definition
-            stmt = ast[0].stmt
+            return self.parse_create_stmt(ast[0].stmt, sql)
 
-            if not isinstance(stmt, self.pglast.ast.CreateStmt):
-                raise ValueError("Not a CREATE TABLE statement")
+        except Exception as e:
+            raise ValueError(f"Failed to parse SQL: {e}")
 
-            table_stmt = stmt
+    def parse_create_stmt(self, stmt, sql: str) -> ParsedTable:
+        """Parse an already parsed CREATE TABLE statement (a pglast CreateStmt)
 
-            # Extract table name
-            if hasattr(table_stmt.relation, "schemaname") and table_stmt.relation.schemaname:
-                schema = table_stmt.relation.schemaname
-            else:
-                schema = "public"
-
-            # Use original table name if we could extract it, otherwise fall back to pglast
-            table_name = original_table_name or table_stmt.relation.relname
-
-            # Extract columns and constraints
-            columns = []
-            primary_key = None
-            unique_constraints = []
-            check_constraints = []
-            inline_primary_keys = []
-
-            for table_elt in table_stmt.tableElts:
-                if isinstance(table_elt, self.pglast.ast.ColumnDef):
-                    column, is_primary = self._parse_column(table_elt)
-                    columns.append(column)
-                    if is_primary:
-                        inline_primary_keys.append(column.name)
-                elif isinstance(table_elt, self.pglast.ast.Constraint):
-                    pk, uk, ck = self._parse_table_constraint(table_elt)
-                    if pk:
-                        primary_key = pk
-                    if uk:
-                        unique_constraints.append(uk)
-                    if ck:
-                        check_constraints.append(ck)
-
-            # If no table-level PRIMARY KEY but we have inline ones, use those
-            if not primary_key and inline_primary_keys:
-                primary_key = inline_primary_keys
-
-            return ParsedTable(
-                schema=schema,
-                table_name=table_name,
-                columns=columns,
-                primary_key=primary_key,
-                unique_constraints=unique_constraints,
-                check_constraints=check_constraints,
-            )
+        Args:
+            stmt: CreateStmt node
+            sql: Statement text, for the original case of the table name
+        """
+        if not isinstance(stmt, self.pglast.ast.CreateStmt):
+            raise ValueError("Not a CREATE TABLE statement")
 
-        except Exception as e:
-            raise ValueError(f"Failed to parse SQL: {e}")
+        # Extract original table name before pglast normalizes it
+        original_table_name = self._extract_original_table_name(sql)
+
+        table_stmt = stmt
+
+        # Extract table name
+        if hasattr(table_stmt.relation, "schemaname") and table_stmt.relation.schemaname:
+            schema = table_stmt.relation.schemaname
+        else:
+            schema = "public"
+
+        # Use original table name if we could extract it, otherwise fall back to pglast
+        table_name = original_table_name or table_stmt.relation.relname
+
+        # Extract columns and constraints
+        columns = []
+        primary_key = None
+        unique_constraints = []
+        check_constraints = []
+        inline_primary_keys = []
+
+        for table_elt in table_stmt.tableElts:
+            if isinstance(table_elt, self.pglast.ast.ColumnDef):
+                column, is_primary = self._parse_column(table_elt)
+                columns.append(column)
+                if is_primary:
+                    inline_primary_keys.append(column.name)
+            elif isinstance(table_elt, self.pglast.ast.Constraint):
+                pk, uk, ck = self._parse_table_constraint(table_elt)
+                if pk:
+                    primary_key = pk
+                if uk:
+                    unique_constraints.append(uk)
+                if ck:
+                    check_constraints.append(ck)
+
+        # If no table-level PRIMARY KEY but we have inline ones, use those
+        if not primary_key and inline_primary_keys:
+            primary_key = inline_primary_keys
+
+        return ParsedTable(
+            schema=schema,
+            table_name=table_name,
+            columns=columns,
+            primary_key=primary_key,
+            unique_constraints=unique_constraints,
+            check_constraints=check_constraints,
+        )
 
     def _parse_column(self, col_def) -> tuple[ColumnInfo, bool]:
         """Parse a column definition"""
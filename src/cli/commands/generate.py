@@ -26,6 +26,43 @@ from cli.utils.output import output
     help="Output format: hierarchical or confiture",
 )
 @click.option("--with-impacts", is_flag=True, help="Generate mutation impacts JSON")
+@click.option(
+    "--audit-log-partitioned",
+    is_flag=True,
+    help="Range-partition app.tb_mutation_audit_log by month (BRIN on created_at)",
+)
+@click.option(
+    "--audit-retention",
+    help="Drop audit log partitions older than this interval (e.g. '12 months')",
+)
+@click.option(
+    "--lean-audit",
+    "lean_audit",
+    multiple=True,
+    help="Entity whose audit rows skip the full object JSON (repeatable)",
+)
+@click.option(
+    "--infer-volatility",
+    is_flag=True,
+    help="Infer volatility/strictness/parallel safety of generated functions and report changes",
+)
+@click.option(
+    "--online",
+    is_flag=True,
+    help="Lock-light DDL: CONCURRENTLY indexes (separate file), NOT VALID constraints, "
+    "lock_timeout",
+)
+@click.option(
+    "--advise-indexes",
+    is_flag=True,
+    help="Propose composite/covering/partial indexes from the generated queries "
+    "(advised_indexes.sql)",
+)
+@click.option(
+    "--delta-from",
+    type=click.Path(dir_okay=False),
+    help="Previous schema snapshot: write delta.sql with only the changed DDL",
+)
 @click.option("--performance", is_flag=True, help="Enable performance monitoring")
 @click.option("--performance-output", type=click.Path(), help="Write performance metrics to file")
 @click.pass_context
@@ -44,6 +81,13 @@ def generate(
     use_registry=False,
     output_format="hierarchical",
     with_impacts=False,
+    audit_log_partitioned=False,
+    audit_retention=None,
+    lean_audit=(),
+    infer_volatility=False,
+    online=False,
+    advise_indexes=False,
+    delta_from=None,
     performance=False,
     performance_output=None,
     **kwargs,
@@ -56,6 +100,11 @@ def generate(
         specql generate contact.yaml --frontend=src/generated
         specql generate entities/*.yaml --dry-run
         specql generate entities/*.yaml --with-impacts --use-registry
+        specql generate entities/*.yaml --audit-log-partitioned --audit-retention "12 months"
+        specql generate entities/*.yaml --infer-volatility
+        specql generate entities/*.yaml --delta-from migrations/schema_snapshot.json
+        specql generate entities/*.yaml --online --delta-from migrations/schema_snapshot.json
+        specql generate entities/*.yaml --include-tv --advise-indexes
     """
     with handle_cli_error():
         # Validate common options
@@ -65,6 +114,10 @@ def generate(
         output.verbose = verbose
         output.quiet = quiet
 
+        if audit_retention and not audit_log_partitioned:
+            output.error("--audit-retention requires --audit-log-partitioned")
+            raise SystemExit(1)
+
         # Set default output directory
         if output_path is None:
             output_path = "migrations"
@@ -86,6 +139,16 @@ def generate(
                 output.info("Would generate: mutation impacts")
             if use_registry:
                 output.info("Would use: registry-based table codes")
+            if audit_log_partitioned:
+                output.info("Would generate: partitioned mutation audit log")
+            if infer_volatility:
+                output.info("Would infer: function volatility and parallel safety")
+            if online:
+                output.info("Would generate: online-safe DDL")
+            if advise_indexes:
+                output.info("Would generate: workload-driven index advice")
+            if delta_from:
+                output.info(f"Would generate: delta migration from {delta_from}")
             return
 
         # Show progress
@@ -93,11 +156,19 @@ def generate(
 
         # Initialize the orchestrator
         from cli.orchestrator import CLIOrchestrator
+        from generators.app_schema_generator import AuditLogConfig
 
         orchestrator = CLIOrchestrator(
             use_registry=use_registry,
             output_format=output_format,
             enable_performance_monitoring=performance,
+            audit_log=AuditLogConfig(
+                partitioned=audit_log_partitioned,
+                retention=audit_retention,
+                lean_entities=list(lean_audit),
+            ),
+            infer_volatility=infer_volatility,
+            online=online,
         )
 
         # Generate migrations
@@ -120,12 +191,28 @@ def generate(
             for warning in result.warnings:
                 output.warning(f"  {warning}")
 
+        if infer_volatility:
+            output.info(f"Inferred function attributes: {len(result.function_changes)} changed")
+            for change in result.function_changes:
+                output.info(f"  {change}")
+
         # Success summary
         output.success(f"Generated {len(result.migrations)} migration file(s)")
         for migration in result.migrations:
             if migration.path:
                 output.info(f"  {migration.path}")
 
+        if result.concurrent_files:
+            output.info("Run outside a transaction, after the migrations above:")
+            for path in result.concurrent_files:
+                output.info(f"  {path}")
+
+        if delta_from:
+            _write_delta(delta_from, output_path, result.written_files, online)
+
+        if advise_indexes:
+            _write_index_advice(output_path, result.written_files, online)
+
         # Write performance metrics if requested
         if performance and performance_output:
             import json
@@ -136,3 +223,62 @@ def generate(
             perf_monitor = get_performance_monitor()
             metrics = perf_monitor.get_metrics()
             Path(performance_output).write_text(json.dumps(metrics, indent=2))
+
+
+def _write_delta(delta_from: str, output_path: str, written_files: list, online: bool) -> None:
+    """Write delta.sql against the previous snapshot and save the new snapshot."""
+    from pathlib import Path
+
+    from generators.schema_delta import SchemaDeltaGenerator, SchemaSnapshot
+
+    previous = Path(delta_from)
+    if previous.exists():
+        old = SchemaSnapshot.load(previous)
+    else:
+        output.warning(f"No snapshot at {previous}: delta contains the full schema")
+        old = SchemaSnapshot()
+
+    new = SchemaSnapshot.from_files(written_files)
+    generator = SchemaDeltaGenerator(old, new, online=online)
+    steps = generator.steps()
+
+    delta_path = Path(output_path) / "delta.sql"
+    snapshot_path = Path(output_path) / "schema_snapshot.json"
+    delta_path.write_text(generator.generate())
+    new.save(snapshot_path)
+
+    output.success(f"Delta migration: {len(steps)} statement(s)")
+    output.info(f"  {delta_path}")
+    output.info(f"  {snapshot_path}")
+
+    # Online mode: post-migration files
+    for name, post_sql in (
+        ("delta_validate.sql", generator.generate_validation()),
+        ("delta_concurrent.sql", generator.generate_concurrent()),
+    ):
+        post_path = Path(output_path) / name
+        if post_sql:
+            post_path.write_text(post_sql)
+            output.info(f"  {post_path} (run outside a transaction, after delta.sql)")
+        elif post_path.exists():
+            post_path.unlink()  # Stale from a previous run
+
+
+def _write_index_advice(output_path: str, written_files: list, online: bool) -> None:
+    """Write advised_indexes.sql from the queries in the generated files."""
+    from pathlib import Path
+
+    from generators.index_advisor import IndexAdvisor
+
+    advisor = IndexAdvisor()
+    for path in written_files:
+        advisor.observe(Path(path).read_text())
+    advice = advisor.advise()
+
+    advice_path = Path(output_path) / "advised_indexes.sql"
+    advice_path.write_text(advice.render(online=online))
+
+    output.success(f"Index advice: {len(advice.recommendations)} index(es) proposed")
+    for line in advice.report():
+        output.info(f"  {line}")
+    output.info(f"  {advice_path}")
@@ -14,6 +14,8 @@ import yaml
 
 from cli.utils.error_handler import handle_cli_error
 from cli.utils.output import output
+from reverse_engineering.parallel import FileLog, ReverseExecutor, worker_instance
+from reverse_engineering.parse_cache import ParseCache
 
 
 def _detect_java_orm(source_code: str) -> str:
@@ -112,9 +114,17 @@ def _generate_yaml_from_entity(entity) -> str:
     help="ORM framework override (auto-detected if not specified)",
 )
 @click.option("--preview", is_flag=True, help="Preview without writing")
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Worker processes parsing files (output is identical for any count)",
+)
+@click.option("--no-cache", is_flag=True, help="Parse every file, ignoring the parse cache")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress non-error output")
-def java(files, output_dir, orm, preview, verbose, quiet, **kwargs):
+def java(files, output_dir, orm, preview, workers, no_cache, verbose, quiet, **kwargs):
     """Reverse engineer Java JPA/Hibernate entities to SpecQL YAML.
 
     Supports JPA, Hibernate (jakarta.persistence), and Spring Data entities.
@@ -142,27 +152,13 @@ def java(files, output_dir, orm, preview, verbose, quiet, **kwargs):
         # Track all parsed entities
         all_entities = []  # (entity, orm_type, source_file)
 
-        for file_path in files:
-            path = Path(file_path)
+        # Files are parsed on workers and merged in file order
+        executor = ReverseExecutor(workers, None if no_cache else ParseCache("java"))
+        paths = [Path(f) for f in files]
+        for path, entities, log in executor.map(_reverse_java_file, paths, orm=orm):
             output.info(f"  Parsing: {path.name}")
-
-            try:
-                source_code = path.read_text(encoding="utf-8")
-            except UnicodeDecodeError:
-                output.warning(f"    Could not read file (encoding error): {path.name}")
-                continue
-
-            if not source_code.strip():
-                output.info("    Empty file, skipping")
-                continue
-
-            # Detect ORM type
-            detected_orm = orm or _detect_java_orm(source_code)
-            if detected_orm != "unknown":
-                output.info(f"    Detected ORM: {detected_orm}")
-
-            # Parse Java file
-            _parse_java_file(path, all_entities, detected_orm)
+            log.replay(output)
+            all_entities.extend(entities)
 
         # Summary
         output.info(f"  Found {len(all_entities)} entity/entities")
@@ -185,26 +181,50 @@ def java(files, output_dir, orm, preview, verbose, quiet, **kwargs):
         output.success(f"Generated {len(generated_files)} file(s)")
 
 
-def _parse_java_file(path: Path, all_entities: list, orm_type: str):
+def _reverse_java_file(path: Path, log: FileLog, orm: str | None) -> list:
+    """Parse one Java file (runs on a worker); returns its (entity, orm_type, source_file)."""
+    entities: list = []
+
+    try:
+        source_code = path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        log.warning(f"    Could not read file (encoding error): {path.name}")
+        return entities
+
+    if not source_code.strip():
+        log.info("    Empty file, skipping")
+        return entities
+
+    # Detect ORM type
+    detected_orm = orm or _detect_java_orm(source_code)
+    if detected_orm != "unknown":
+        log.info(f"    Detected ORM: {detected_orm}")
+
+    # Parse Java file
+    _parse_java_file(path, entities, detected_orm, log)
+    return entities
+
+
+def _parse_java_file(path: Path, all_entities: list, orm_type: str, log: FileLog):
     """Parse a Java file using JavaParser."""
     try:
         from reverse_engineering.java.java_parser import JavaParser
     except ImportError as e:
-        output.warning(f"    Java parser not available: {e}")
+        log.warning(f"    Java parser not available: {e}")
         return
 
     try:
-        parser = JavaParser()
+        parser = worker_instance(JavaParser)
         result = parser.parse_file(str(path))
 
         if result.errors:
             for error in result.errors:
-                output.warning(f"    {error}")
+                log.warning(f"    {error}")
 
         if result.entities:
-            output.info(f"    Found {len(result.entities)} JPA entity/entities")
+            log.info(f"    Found {len(result.entities)} JPA entity/entities")
             for entity in result.entities:
                 all_entities.append((entity, orm_type, path.name))
 
     except Exception as e:
-        output.warning(f"    Failed to parse Java file: {e}")
+        log.warning(f"    Failed to parse Java file: {e}")
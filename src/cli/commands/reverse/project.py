@@ -105,7 +105,12 @@ def _should_exclude_path(path: Path, directory: Path) -> bool:
 
 
 def process_project(
-    directory: Path, framework: str, output_dir: Path, preview: bool = False
+    directory: Path,
+    framework: str,
+    output_dir: Path,
+    preview: bool = False,
+    workers: int = 1,
+    no_cache: bool = False,
 ) -> list[Path]:
     """Process all relevant files in a project."""
     handler_config = FRAMEWORK_HANDLERS.get(framework)
@@ -126,35 +131,26 @@ def process_project(
             output.info(f"  - {f.relative_to(directory)}")
         return []
 
-    # Process each file with progress reporting
-    generated = []
-    runner = CliRunner()
-    processed_count = 0
+    if not files:
+        return []
 
-    for file in files:
-        try:
-            processed_count += 1
-            if len(files) > 5:  # Show progress for larger projects
-                output.info(f"Processing {processed_count}/{len(files)}: {file.name}")
-
-            result = runner.invoke(
-                app, ["reverse", handler_config["handler"], str(file), "-o", str(output_dir)]
-            )
-
-            if result.exit_code == 0:
-                # Find generated YAML files (search recursively for hierarchical output)
-                yaml_files = list(output_dir.glob("**/*.yaml"))
-                generated.extend(yaml_files)
-                for yaml_file in yaml_files:
-                    output.info(f"  📄 {file.name} → {yaml_file.name}")
-            else:
-                output.warning(f"Warning: Failed to process {file}: {result.output}")
+    # One handler run over all files, so parsers are set up once and files
+    # are parsed on `workers` processes
+    output.info(f"Processing {len(files)} file(s) with reverse {handler_config['handler']}")
+    args = ["reverse", handler_config["handler"], *map(str, files), "-o", str(output_dir)]
+    args += ["--workers", str(workers), *(["--no-cache"] if no_cache else [])]
+    result = CliRunner().invoke(app, args)
+    if result.exit_code != 0:
+        output.warning(f"Warning: Failed to process {directory}: {result.output}")
+        return []
 
-        except Exception as e:
-            output.warning(f"Warning: Failed to process {file}: {str(e)}")
+    # Find generated YAML files (search recursively for hierarchical output)
+    generated = sorted(output_dir.glob("**/*.yaml"))
+    for yaml_file in generated:
+        output.info(f"  📄 {yaml_file.relative_to(output_dir)}")
 
     # Deduplicate entities if same entity found in multiple files
-    if len(generated) > len(set(generated)):
+    if len(generated) > len({f.stem for f in generated}):
         output.info("Deduping entities found in multiple files...")
         seen_entities = set()
         deduped = []
@@ -177,7 +173,15 @@ def process_project(
 @click.option("-o", "--output-dir", required=True, type=click.Path(), help="Output directory")
 @click.option("--framework", help="Override auto-detection")
 @click.option("--preview", is_flag=True, help="Preview without writing")
-def project(directory, output_dir, framework, preview, **kwargs):
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Worker processes parsing files (output is identical for any count)",
+)
+@click.option("--no-cache", is_flag=True, help="Parse every file, ignoring the parse cache")
+def project(directory, output_dir, framework, preview, workers, no_cache, **kwargs):
     """Reverse engineer an entire project to SpecQL YAML.
 
     Auto-detects project type (Django, FastAPI, Rust/Diesel, Prisma, etc.)
@@ -208,7 +212,9 @@ def project(directory, output_dir, framework, preview, **kwargs):
             output.info("🔍 Preview mode: no files will be written")
 
         # Process the project (preview mode will just list files)
-        generated_files = process_project(project_path, project_type, output_path, preview)
+        generated_files = process_project(
+            project_path, project_type, output_path, preview, workers, no_cache=no_cache
+        )
 
         if not preview:
             output.success(f"Successfully processed {project_type} project")
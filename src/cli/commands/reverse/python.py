@@ -13,6 +13,8 @@ import yaml
 
 from cli.utils.error_handler import handle_cli_error
 from cli.utils.output import output as cli_output
+from reverse_engineering.parallel import FileLog, ReverseExecutor, worker_instance
+from reverse_engineering.parse_cache import ParseCache
 
 
 def _detect_framework(source_code: str) -> str:
@@ -54,6 +56,33 @@ def _generate_yaml_from_entity(entity, detected_patterns: list[str]) -> str:
     return yaml.dump(yaml_dict, default_flow_style=False, sort_keys=False)
 
 
+def _reverse_python_file(path: Path, log: FileLog, framework: str | None) -> list:
+    """Parse one Python file (runs on a worker); returns its (entity, patterns, source_file)."""
+    from reverse_engineering.python_ast_parser import PythonASTParser
+
+    try:
+        source_code = path.read_text()
+    except Exception as e:
+        log.warning(f"    Failed to read file: {e}")
+        return []
+
+    # Detect or use specified framework
+    detected_framework = framework or _detect_framework(source_code)
+    log.info(f"    Framework: {detected_framework}")
+
+    # Parse entities
+    parser = worker_instance(PythonASTParser)
+    try:
+        entities = parser.parse(source_code, str(path))
+        # Detect patterns
+        return [(entity, parser.detect_patterns(entity), path.name) for entity in entities]
+    except SyntaxError as e:
+        log.warning(f"    Syntax error: {e}")
+    except Exception as e:
+        log.warning(f"    Failed to parse: {e}")
+    return []
+
+
 @click.command()
 @click.argument("files", nargs=-1, required=True, type=click.Path(exists=True))
 @click.option("-o", "--output", required=True, type=click.Path(), help="Output directory")
@@ -63,9 +92,17 @@ def _generate_yaml_from_entity(entity, detected_patterns: list[str]) -> str:
     help="Framework override (auto-detected if not specified)",
 )
 @click.option("--preview", is_flag=True, help="Preview without writing")
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Worker processes parsing files (output is identical for any count)",
+)
+@click.option("--no-cache", is_flag=True, help="Parse every file, ignoring the parse cache")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress non-error output")
-def python(files, output, framework, preview, verbose, quiet, **kwargs):
+def python(files, output, framework, preview, workers, no_cache, verbose, quiet, **kwargs):
     """Reverse engineer Python models to SpecQL YAML.
 
     Supports Django, FastAPI, Flask-SQLAlchemy, SQLAlchemy, Pydantic, and dataclasses.
@@ -99,49 +136,25 @@ def python(files, output, framework, preview, verbose, quiet, **kwargs):
                 break
 
         try:
-            from reverse_engineering.python_ast_parser import PythonASTParser
+            import reverse_engineering.python_ast_parser  # noqa: F401
         except ImportError as e:
             cli_output.error(f"Python parser not available: {e}")
             cli_output.info("Install with: pip install specql[reverse]")
             raise click.Abort() from e
 
-        parser = PythonASTParser()
-
         # Prepare output directory
         output_path = Path(output)
         output_path.mkdir(parents=True, exist_ok=True)
 
         all_entities = []
 
-        for file_path in files:
-            path = Path(file_path)
+        # Files are parsed on workers and merged in file order
+        executor = ReverseExecutor(workers, None if no_cache else ParseCache("python"))
+        paths = [Path(f) for f in files]
+        for path, entities, log in executor.map(_reverse_python_file, paths, framework=framework):
             cli_output.info(f"  Parsing: {path.name}")
-
-            try:
-                source_code = path.read_text()
-            except Exception as e:
-                cli_output.warning(f"    Failed to read file: {e}")
-                continue
-
-            # Detect or use specified framework
-            detected_framework = framework or _detect_framework(source_code)
-            cli_output.info(f"    Framework: {detected_framework}")
-
-            # Parse entities
-            try:
-                entities = parser.parse(source_code, str(path))
-
-                for entity in entities:
-                    # Detect patterns
-                    patterns = parser.detect_patterns(entity)
-                    all_entities.append((entity, patterns, path.name))
-
-            except SyntaxError as e:
-                cli_output.warning(f"    Syntax error: {e}")
-                continue
-            except Exception as e:
-                cli_output.warning(f"    Failed to parse: {e}")
-                continue
+            log.replay(cli_output)
+            all_entities.extend(entities)
 
         cli_output.info(f"Found {len(all_entities)} entity/entities")
 
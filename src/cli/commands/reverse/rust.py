@@ -14,6 +14,8 @@ import yaml
 
 from cli.utils.error_handler import handle_cli_error
 from cli.utils.output import output
+from reverse_engineering.parallel import FileLog, ReverseExecutor, worker_instance
+from reverse_engineering.parse_cache import ParseCache
 
 
 def _detect_rust_orm(source_code: str) -> str:
@@ -179,9 +181,17 @@ def _generate_yaml_from_routes(routes: list, source_file: str, framework: str) -
     help="ORM framework override (auto-detected if not specified)",
 )
 @click.option("--preview", is_flag=True, help="Preview without writing")
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Worker processes parsing files (output is identical for any count)",
+)
+@click.option("--no-cache", is_flag=True, help="Parse every file, ignoring the parse cache")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress non-error output")
-def rust(files, output_dir, framework, preview, verbose, quiet, **kwargs):
+def rust(files, output_dir, framework, preview, workers, no_cache, verbose, quiet, **kwargs):
     """Reverse engineer Rust schemas to SpecQL YAML.
 
     Supports Diesel, SeaORM, and SQLx schemas. Also extracts routes from
@@ -212,34 +222,17 @@ def rust(files, output_dir, framework, preview, verbose, quiet, **kwargs):
         all_seaorm_entities = []  # (seaorm_entity, source_file)
         all_routes = []  # (routes, framework, source_file)
 
-        for file_path in files:
-            path = Path(file_path)
+        # Files are parsed on workers and merged in file order
+        executor = ReverseExecutor(workers, None if no_cache else ParseCache("rust"))
+        paths = [Path(f) for f in files]
+        for path, parsed, log in executor.map(_reverse_rust_file, paths, framework=framework):
             output.info(f"  Parsing: {path.name}")
+            log.replay(output)
 
-            source_code = path.read_text()
-
-            # Detect ORM type
-            detected_orm = framework or _detect_rust_orm(source_code)
-            output.info(f"    Detected ORM: {detected_orm}")
-
-            # Detect web framework
-            web_framework = _detect_rust_web_framework(source_code)
-            if web_framework:
-                output.info(f"    Detected Web: {web_framework}")
-
-            # Parse based on ORM type
-            if detected_orm == "seaorm":
-                _parse_seaorm_file(path, source_code, all_seaorm_entities)
-            elif detected_orm == "diesel":
-                _parse_diesel_file(path, all_entities, detected_orm)
-            else:
-                # Try both approaches
-                _parse_diesel_file(path, all_entities, detected_orm)
-                _parse_seaorm_file(path, source_code, all_seaorm_entities)
-
-            # Extract routes if web framework detected
-            if web_framework:
-                _parse_routes(path, source_code, all_routes, web_framework)
+            entities, seaorm_entities, routes = parsed
+            all_entities.extend(entities)
+            all_seaorm_entities.extend(seaorm_entities)
+            all_routes.extend(routes)
 
         # Summary
         entity_count = len(all_entities) + len(all_seaorm_entities)
@@ -290,63 +283,101 @@ def rust(files, output_dir, framework, preview, verbose, quiet, **kwargs):
         output.success(f"Generated {len(generated_files)} file(s)")
 
 
-def _parse_seaorm_file(path: Path, source_code: str, all_seaorm_entities: list):
+def _reverse_rust_file(path: Path, log: FileLog, framework: str | None) -> tuple:
+    """Parse one Rust file (runs on a worker).
+
+    Returns:
+        (entities, seaorm_entities, routes) in the shapes of the command's lists
+    """
+    entities: list = []
+    seaorm_entities: list = []
+    routes: list = []
+
+    source_code = path.read_text()
+
+    # Detect ORM type
+    detected_orm = framework or _detect_rust_orm(source_code)
+    log.info(f"    Detected ORM: {detected_orm}")
+
+    # Detect web framework
+    web_framework = _detect_rust_web_framework(source_code)
+    if web_framework:
+        log.info(f"    Detected Web: {web_framework}")
+
+    # Parse based on ORM type
+    if detected_orm == "seaorm":
+        _parse_seaorm_file(path, source_code, seaorm_entities, log)
+    elif detected_orm == "diesel":
+        _parse_diesel_file(path, entities, detected_orm, log)
+    else:
+        # Try both approaches
+        _parse_diesel_file(path, entities, detected_orm, log)
+        _parse_seaorm_file(path, source_code, seaorm_entities, log)
+
+    # Extract routes if web framework detected
+    if web_framework:
+        _parse_routes(path, source_code, routes, web_framework, log)
+
+    return entities, seaorm_entities, routes
+
+
+def _parse_seaorm_file(path: Path, source_code: str, all_seaorm_entities: list, log: FileLog):
     """Parse a SeaORM entity file."""
     try:
         from reverse_engineering.seaorm_parser import SeaORMParser
     except ImportError as e:
-        output.warning(f"    SeaORM parser not available: {e}")
+        log.warning(f"    SeaORM parser not available: {e}")
         return
 
     try:
-        parser = SeaORMParser()
+        parser = worker_instance(SeaORMParser)
         entities = parser.extract_entities(source_code)
 
         if entities:
-            output.info(f"    Found {len(entities)} SeaORM entity/entities")
+            log.info(f"    Found {len(entities)} SeaORM entity/entities")
             for entity in entities:
                 all_seaorm_entities.append((entity, path.name))
 
     except Exception as e:
-        output.warning(f"    Failed to parse SeaORM: {e}")
+        log.warning(f"    Failed to parse SeaORM: {e}")
 
 
-def _parse_diesel_file(path: Path, all_entities: list, orm_type: str):
+def _parse_diesel_file(path: Path, all_entities: list, orm_type: str, log: FileLog):
     """Parse a Diesel file using RustReverseEngineeringService."""
     try:
         from reverse_engineering.rust_parser import RustReverseEngineeringService
     except ImportError as e:
-        output.warning(f"    Rust parser not available: {e}")
+        log.warning(f"    Rust parser not available: {e}")
         return
 
     try:
-        service = RustReverseEngineeringService()
+        service = worker_instance(RustReverseEngineeringService)
         entities = service.reverse_engineer_file(path)
 
         if entities:
-            output.info(f"    Found {len(entities)} Diesel entity/entities")
+            log.info(f"    Found {len(entities)} Diesel entity/entities")
             for entity in entities:
                 all_entities.append((entity, orm_type, path.name))
 
     except Exception as e:
-        output.warning(f"    Failed to parse Diesel: {e}")
+        log.warning(f"    Failed to parse Diesel: {e}")
 
 
-def _parse_routes(path: Path, source_code: str, all_routes: list, framework: str):
+def _parse_routes(path: Path, source_code: str, all_routes: list, framework: str, log: FileLog):
     """Parse route handlers from a Rust file."""
     try:
         from reverse_engineering.rust_parser import RustParser
     except ImportError as e:
-        output.warning(f"    Rust parser not available: {e}")
+        log.warning(f"    Rust parser not available: {e}")
         return
 
     try:
-        parser = RustParser()
+        parser = worker_instance(RustParser)
         _, _, _, _, _, routes = parser.parse_file(path)
 
         if routes:
-            output.info(f"    Found {len(routes)} route(s)")
+            log.info(f"    Found {len(routes)} route(s)")
             all_routes.append((routes, framework, path.name))
 
     except Exception as e:
-        output.warning(f"    Failed to parse routes: {e}")
+        log.warning(f"    Failed to parse routes: {e}")
@@ -2,13 +2,13 @@
 Reverse SQL subcommand - Convert SQL DDL and functions to SpecQL YAML.
 
 Integrates with:
-- SQLTableParser: Parses CREATE TABLE statements using pglast
+- SQLFileParser: Parses each file once with pglast (tables, functions, FKs, comments)
 - PatternDetectionOrchestrator: Detects Trinity, audit_trail, soft_delete patterns
-- ForeignKeyDetector: Parses ALTER TABLE FOREIGN KEY statements
 - EntityYAMLGenerator: Generates SpecQL YAML from parsed data
 - AlgorithmicParser: Parses CREATE FUNCTION statements
 """
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -17,9 +17,12 @@ import click
 
 from cli.utils.error_handler import handle_cli_error
 from cli.utils.output import output as cli_output
+from reverse_engineering.parallel import FileLog, ReverseExecutor, worker_instance
+from reverse_engineering.parse_cache import ParseCache
 
 if TYPE_CHECKING:
     from reverse_engineering.info_instance_detector import InfoInstanceDetector
+    from reverse_engineering.sql_file_parser import FunctionDefinition, ParsedSQLFile
     from reverse_engineering.table_parser import ParsedTable
     from reverse_engineering.translation_detector import TranslationTableDetector
 
@@ -33,8 +36,6 @@ def _to_snake_case(name: str) -> str:
         OrganizationType → organization_type
         already_snake_case → already_snake_case
     """
-    import re
-
     # Handle acronyms at the start (e.g., TLAdministrative -> TL_Administrative)
     # Insert underscore before uppercase letters that follow lowercase letters
     # or before uppercase letters followed by lowercase letters (for acronyms)
@@ -58,47 +59,6 @@ def _table_to_filename(table_name: str) -> str:
     return f"{name}.yaml"
 
 
-def _extract_comments(content: str) -> tuple[dict[str, str], dict[str, dict[str, str]]]:
-    """Extract COMMENT ON statements from SQL content.
-
-    Returns:
-        (table_comments, column_comments) where:
-        - table_comments: {table_name: comment}
-        - column_comments: {table_name: {column_name: comment}}
-    """
-    import re
-
-    table_comments = {}
-    column_comments = {}
-
-    # Match: COMMENT ON TABLE schema.table IS 'comment';
-    # Handle escaped quotes by matching until the final unescaped quote
-    table_pattern = r"COMMENT\s+ON\s+TABLE\s+([\w.]+)\s+IS\s+'((?:[^']|'')*)'"
-    for match in re.finditer(table_pattern, content, re.IGNORECASE):
-        full_table_name = match.group(1)
-        comment = match.group(2).replace("''", "'")  # Unescape quotes
-        table_comments[full_table_name] = comment
-
-    # Match: COMMENT ON COLUMN schema.table.column IS 'comment';
-    # Handle escaped quotes by matching until the final unescaped quote
-    column_pattern = r"COMMENT\s+ON\s+COLUMN\s+([\w.]+)\s+IS\s+'((?:[^']|'')*)'"
-    for match in re.finditer(column_pattern, content, re.IGNORECASE):
-        full_column_name = match.group(1)
-        comment = match.group(2).replace("''", "'")  # Unescape quotes
-
-        # Split schema.table.column into components
-        parts = full_column_name.split(".")
-        if len(parts) >= 3:
-            table_name = f"{parts[-3]}.{parts[-2]}"  # schema.table
-            column_name = parts[-1]
-
-            if table_name not in column_comments:
-                column_comments[table_name] = {}
-            column_comments[table_name][column_name] = comment
-
-    return table_comments, column_comments
-
-
 @dataclass
 class SourceFileInfo:
     """Metadata extracted from source file path."""
@@ -115,8 +75,6 @@ def _parse_source_path(file_path: Path) -> SourceFileInfo:
     Input: db/0_schema/01_write_side/010_i18n/0101_locale/01011_language/010111_tb_language.sql
     Output: SourceFileInfo(prefix="010111", table_name="tb_language", parent_dirs=[...])
     """
-    import re
-
     filename = file_path.stem  # "010111_tb_language"
     match = re.match(r"^(\d+)_(.+)$", filename)
 
@@ -238,46 +196,14 @@ def _generate_project_yaml(
     output.success(f"    Created: {registry_path.relative_to(output_dir)}")
 
 
-def _extract_statements(content: str) -> tuple[list[str], list[str], list[str]]:
-    """
-    Extract CREATE TABLE, CREATE FUNCTION, and ALTER TABLE statements from SQL.
-
-    Returns:
-        tuple of (create_tables, create_functions, alter_tables)
-    """
-    import re
-
-    # Split content into statements (handle $$ blocks for functions)
-    # Simple approach: split by semicolon but respect $$ blocks
-    create_tables = []
-    create_functions = []
-    alter_tables = []
-
-    # Find CREATE TABLE statements
-    table_pattern = r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?[\w.]+\s*\([^;]+\);"
-    for match in re.finditer(table_pattern, content, re.IGNORECASE | re.DOTALL):
-        create_tables.append(match.group(0))
-
-    # Find CREATE FUNCTION statements (with $$ delimited bodies)
-    func_pattern = r"CREATE\s+(?:OR\s+REPLACE\s+)?FUNCTION[^$]+\$\$[^$]*\$\$[^;]*;"
-    for match in re.finditer(func_pattern, content, re.IGNORECASE | re.DOTALL):
-        create_functions.append(match.group(0))
-
-    # Find ALTER TABLE ... FOREIGN KEY statements
-    alter_pattern = r"ALTER\s+TABLE\s+[\w.]+\s+ADD\s+CONSTRAINT[^;]+FOREIGN\s+KEY[^;]+;"
-    for match in re.finditer(alter_pattern, content, re.IGNORECASE | re.DOTALL):
-        alter_tables.append(match.group(0))
+def _reverse_sql_file(path: Path, log: FileLog) -> "ParsedSQLFile":
+    """Parse one SQL file with one streaming split and one pglast parse (runs on a worker)."""
+    from reverse_engineering.sql_file_parser import SQLFileParser
 
-    return create_tables, create_functions, alter_tables
-
-
-def _parse_table_safe(parser, sql: str) -> "ParsedTable | None":
-    """Parse a single CREATE TABLE statement, returning None on error."""
-    try:
-        return parser.parse_table(sql)
-    except Exception as e:
-        cli_output.warning(f"    Failed to parse table: {e}")
-        return None
+    parsed_file = worker_instance(SQLFileParser).parse_file(path)
+    for warning in parsed_file.warnings:
+        log.warning(f"    {warning}")
+    return parsed_file
 
 
 @click.command()
@@ -288,6 +214,14 @@ def _parse_table_safe(parser, sql: str) -> "ParsedTable | None":
 @click.option("--merge-translations/--no-merge-translations", default=True)
 @click.option("--preview", is_flag=True, help="Preview without writing")
 @click.option("--with-patterns", is_flag=True, help="Auto-detect and apply patterns")
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Worker processes parsing files (output is identical for any count)",
+)
+@click.option("--no-cache", is_flag=True, help="Parse every file, ignoring the parse cache")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress non-error output")
 def sql(
@@ -298,6 +232,8 @@ def sql(
     merge_translations,
     preview,
     with_patterns,
+    workers,
+    no_cache,
     verbose,
     quiet,
     **kwargs,
@@ -326,7 +262,6 @@ def sql(
         # Import parsers (lazy to handle optional dependencies)
         try:
             from reverse_engineering.entity_generator import EntityYAMLGenerator
-            from reverse_engineering.fk_detector import ForeignKeyDetector
             from reverse_engineering.info_instance_detector import InfoInstanceDetector
             from reverse_engineering.pattern_orchestrator import PatternDetectionOrchestrator
             from reverse_engineering.table_parser import SQLTableParser
@@ -336,16 +271,15 @@ def sql(
             cli_output.info("Install with: pip install specql[reverse]")
             raise click.Abort() from e
 
-        # Initialize parsers
+        # Check pglast here; files are parsed by per-worker parsers
         try:
-            table_parser = SQLTableParser()
+            SQLTableParser()
         except ImportError as e:
             cli_output.error(f"pglast not available: {e}")
             cli_output.info("Install with: pip install specql[reverse]")
             raise click.Abort() from e
 
         pattern_detector = PatternDetectionOrchestrator()
-        fk_detector = ForeignKeyDetector()
         yaml_generator = EntityYAMLGenerator()
 
         # Initialize new detectors for enhanced reverse engineering
@@ -368,58 +302,28 @@ def sql(
 
         # Collect all statements from all files
         all_tables: list[tuple[SourceFileInfo, ParsedTable]] = []  # (source_info, parsed_table)
-        all_functions: list[tuple[str, str]] = []  # (source_file, function_sql)
-        all_alter_statements: list[str] = []
+        all_functions: list[tuple[str, FunctionDefinition]] = []  # (source_file, function)
+        fk_map: dict[str, list] = {}  # lowercased table_name -> list of FKs
         skipped_count = 0
 
-        for file_path in files:
-            path = Path(file_path)
+        # Files are parsed on workers and merged in file order
+        executor = ReverseExecutor(workers, None if no_cache else ParseCache("sql"))
+        for path, parsed_file, log in executor.map(_reverse_sql_file, [Path(f) for f in files]):
             cli_output.info(f"  Parsing: {path.name}")
-            content = path.read_text()
+            log.replay(cli_output)
 
             # Parse source file information
             source_info = _parse_source_path(path)
 
-            create_tables, create_functions, alter_tables = _extract_statements(content)
-
-            # Extract comments from full file content
-            table_comments, column_comments = _extract_comments(content)
-
-            # Parse tables
-            for table_sql in create_tables:
-                parsed = _parse_table_safe(table_parser, table_sql)
-                if parsed:
-                    # Associate comments with the parsed table
-                    full_table_name = f"{parsed.schema}.{parsed.table_name}"
-                    if full_table_name in table_comments:
-                        parsed.table_comment = table_comments[full_table_name]
-                    if full_table_name in column_comments:
-                        parsed.column_comments = column_comments[full_table_name]
-
-                    all_tables.append((source_info, parsed))
-                else:
-                    skipped_count += 1
+            all_tables.extend((source_info, table) for table in parsed_file.tables)
+            skipped_count += parsed_file.skipped
 
             # Collect functions for later processing
-            all_functions.extend((path.name, func_sql) for func_sql in create_functions)
-
-            # Collect ALTER TABLE statements for FK detection
-            all_alter_statements.extend(alter_tables)
-
-        # Detect foreign keys across all ALTER TABLE statements
-        # Note: FK detector needs a ParsedTable but we use it for regex parsing only
-        fk_map: dict[str, list] = {}  # table_name -> list of FKs
-        for alter_sql in all_alter_statements:
-            # Extract table name from ALTER TABLE statement
-            import re
-
-            table_match = re.search(r"ALTER\s+TABLE\s+([\w.]+)", alter_sql, re.IGNORECASE)
-            if table_match:
-                table_name = table_match.group(1).split(".")[-1]  # Get just the table name
-                fks = fk_detector._parse_alter_table_fk(alter_sql)
-                if table_name not in fk_map:
-                    fk_map[table_name] = []
-                fk_map[table_name].extend(fks)
+            all_functions.extend((path.name, function) for function in parsed_file.functions)
+
+            # Merge foreign keys across files
+            for table_name, fks in parsed_file.foreign_keys.items():
+                fk_map.setdefault(table_name, []).extend(fks)
 
         # Process tables with enhanced detectors
         pairs, standalone_tables, translation_map = _process_tables_with_detectors(
@@ -442,10 +346,8 @@ def sql(
                     source_info, entity_name, table.table_name
                 )
                 cli_output.info(f"    {output_path} (from {source_info.full_path.name})")
-            for source_file, func_sql in all_functions:
-                import re
-
-                func_match = re.search(r"FUNCTION\s+([\w.]+)", func_sql, re.IGNORECASE)
+            for source_file, function in all_functions:
+                func_match = re.search(r"FUNCTION\s+([\w.]+)", function.sql, re.IGNORECASE)
                 if func_match:
                     cli_output.info(f"    {func_match.group(1)}.yaml (from {source_file})")
             return
@@ -459,7 +361,7 @@ def sql(
             patterns = pattern_detector.detect_all(table)
 
             # Get foreign keys for this table
-            table_fks = fk_map.get(table.table_name, [])
+            table_fks = fk_map.get(table.table_name.lower(), [])
 
             # Generate YAML
             yaml_content = yaml_generator.generate(table, patterns, table_fks)
@@ -483,23 +385,21 @@ def sql(
             generated_files.append(str(relative_path))
             cli_output.success(f"    Created: {relative_path}")
 
-            # Generate YAML for functions (if parser available)
-            if func_parser and all_functions:
-                for source_file, func_sql in all_functions:
-                    try:
-                        yaml_content = func_parser.parse_to_yaml(func_sql)
-                        # Extract function name for filename
-                        import re
-
-                        func_match = re.search(r"FUNCTION\s+([\w.]+)", func_sql, re.IGNORECASE)
-                        if func_match:
-                            func_name = func_match.group(1).split(".")[-1]
-                            yaml_path = cli_output_dir / f"{func_name}_action.yaml"
-                            yaml_path.write_text(yaml_content)
-                            generated_files.append(yaml_path.name)
-                            cli_output.success(f"    Created: {yaml_path.name} (action)")
-                    except Exception as e:
-                        cli_output.warning(f"    Failed to parse function: {e}")
+        # Generate YAML for functions (if parser available), from the AST parsed above
+        if func_parser and all_functions:
+            for source_file, function in all_functions:
+                try:
+                    yaml_content = func_parser.parse_to_yaml(function.sql, function.parsed)
+                    # Extract function name for filename
+                    func_match = re.search(r"FUNCTION\s+([\w.]+)", function.sql, re.IGNORECASE)
+                    if func_match:
+                        func_name = func_match.group(1).split(".")[-1]
+                        yaml_path = cli_output_dir / f"{func_name}_action.yaml"
+                        yaml_path.write_text(yaml_content)
+                        generated_files.append(yaml_path.name)
+                        cli_output.success(f"    Created: {yaml_path.name} (action)")
+                except Exception as e:
+                    cli_output.warning(f"    Failed to parse function: {e}")
 
         # Generate project.yaml
         if all_tables:
@@ -13,6 +13,8 @@ import yaml
 
 from cli.utils.error_handler import handle_cli_error
 from cli.utils.output import output
+from reverse_engineering.parallel import FileLog, ReverseExecutor, worker_instance
+from reverse_engineering.parse_cache import ParseCache
 
 
 def _is_prisma_file(file_path: Path) -> bool:
@@ -171,9 +173,17 @@ def _generate_yaml_from_routes(routes: list, source_file: str) -> str | None:
     help="Framework override (auto-detected if not specified)",
 )
 @click.option("--preview", is_flag=True, help="Preview without writing")
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Worker processes parsing files (output is identical for any count)",
+)
+@click.option("--no-cache", is_flag=True, help="Parse every file, ignoring the parse cache")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress non-error output")
-def typescript(files, output_dir, framework, preview, verbose, quiet, **kwargs):
+def typescript(files, output_dir, framework, preview, workers, no_cache, verbose, quiet, **kwargs):
     """Reverse engineer TypeScript/Prisma to SpecQL YAML.
 
     Supports Prisma schemas, Express routes, Fastify routes, and Next.js.
@@ -202,16 +212,16 @@ def typescript(files, output_dir, framework, preview, verbose, quiet, **kwargs):
         all_entities = []  # (entity, enums, source_file)
         all_routes = []  # (routes, source_file)
 
-        for file_path in files:
-            path = Path(file_path)
+        # Files are parsed on workers and merged in file order
+        executor = ReverseExecutor(workers, None if no_cache else ParseCache("typescript"))
+        paths = [Path(f) for f in files]
+        for path, parsed, log in executor.map(_reverse_typescript_file, paths, framework=framework):
             output.info(f"  Parsing: {path.name}")
+            log.replay(output)
 
-            if _is_prisma_file(path):
-                # Parse Prisma schema
-                _parse_prisma_file(path, all_entities, framework)
-            else:
-                # Parse TypeScript routes
-                _parse_typescript_file(path, all_routes, framework)
+            entities, routes = parsed
+            all_entities.extend(entities)
+            all_routes.extend(routes)
 
         # Summary
         entity_count = len(all_entities)
@@ -252,48 +262,67 @@ def typescript(files, output_dir, framework, preview, verbose, quiet, **kwargs):
         output.success(f"Generated {len(generated_files)} file(s)")
 
 
-def _parse_prisma_file(path: Path, all_entities: list, framework: str | None):
+def _reverse_typescript_file(path: Path, log: FileLog, framework: str | None) -> tuple:
+    """Parse one Prisma schema or TypeScript file (runs on a worker).
+
+    Returns:
+        (entities, routes) in the shapes of the command's lists
+    """
+    entities: list = []
+    routes: list = []
+
+    if _is_prisma_file(path):
+        # Parse Prisma schema
+        _parse_prisma_file(path, entities, framework, log)
+    else:
+        # Parse TypeScript routes
+        _parse_typescript_file(path, routes, framework, log)
+
+    return entities, routes
+
+
+def _parse_prisma_file(path: Path, all_entities: list, framework: str | None, log: FileLog):
     """Parse a Prisma schema file and add entities to the list."""
     try:
         from reverse_engineering.prisma_parser import PrismaSchemaParser
     except ImportError as e:
-        output.warning(f"    Prisma parser not available: {e}")
-        output.info("    Install with: pip install specql[reverse]")
+        log.warning(f"    Prisma parser not available: {e}")
+        log.info("    Install with: pip install specql[reverse]")
         return
 
     try:
-        parser = PrismaSchemaParser()
+        parser = worker_instance(PrismaSchemaParser)
         source_code = path.read_text()
         entities = parser.parse_schema(source_code)
 
         # Get enums for type mapping
         enums = parser.enums
 
-        output.info(f"    Detected: Prisma schema ({len(entities)} models)")
+        log.info(f"    Detected: Prisma schema ({len(entities)} models)")
 
         for entity in entities:
             all_entities.append((entity, enums, path.name))
 
     except Exception as e:
-        output.warning(f"    Failed to parse Prisma schema: {e}")
+        log.warning(f"    Failed to parse Prisma schema: {e}")
 
 
-def _parse_typescript_file(path: Path, all_routes: list, framework: str | None):
+def _parse_typescript_file(path: Path, all_routes: list, framework: str | None, log: FileLog):
     """Parse a TypeScript file for routes and add to the list."""
     try:
         from reverse_engineering.typescript_parser import TypeScriptParser
     except ImportError as e:
-        output.warning(f"    TypeScript parser not available: {e}")
+        log.warning(f"    TypeScript parser not available: {e}")
         return
 
     try:
-        parser = TypeScriptParser()
+        parser = worker_instance(TypeScriptParser)
         source_code = path.read_text()
         file_path_str = str(path)
 
         # Detect framework
         detected_framework = framework or _detect_typescript_framework(source_code, file_path_str)
-        output.info(f"    Detected: {detected_framework}")
+        log.info(f"    Detected: {detected_framework}")
 
         routes = []
 
@@ -316,13 +345,13 @@ def _parse_typescript_file(path: Path, all_routes: list, framework: str | None):
         # Server Actions
         if detected_framework == "nextjs-server-actions":
             actions = parser.extract_server_actions(source_code)
-            output.info(f"    Found {len(actions)} server action(s)")
+            log.info(f"    Found {len(actions)} server action(s)")
 
         if routes:
-            output.info(f"    Found {len(routes)} route(s)")
+            log.info(f"    Found {len(routes)} route(s)")
             all_routes.append((routes, path.name))
         else:
-            output.info("    No routes found")
+            log.info("    No routes found")
 
     except Exception as e:
-        output.warning(f"    Failed to parse TypeScript: {e}")
+        log.warning(f"    Failed to parse TypeScript: {e}")
@@ -28,6 +28,11 @@ from cli.utils.output import set_output_config
     help="Include constraint violation tests",
 )
 @click.option("--with-seed", is_flag=True, help="Generate seed data alongside tests")
+@click.option(
+    "--shards",
+    type=click.IntRange(min=1),
+    help="Write pgTAP tests as N shards balanced by estimated runtime (for pg_prove -j N)",
+)
 @click.option("--dry-run", is_flag=True, help="Preview without writing files")
 @click.pass_context
 def generate(
@@ -41,6 +46,7 @@ def generate(
     include_actions,
     include_constraints,
     with_seed,
+    shards,
     dry_run,
 ):
     """Auto-generate test files from SpecQL entities.
@@ -58,6 +64,10 @@ def generate(
 
         # Tests with seed data
         specql test generate entities/*.yaml --with-seed
+
+        # 8 runtime-balanced pgTAP shards, run concurrently
+        specql test generate entities/*.yaml --type pgtap --shards 8
+        pg_prove -j 8 tests/pgtap/test_shard_*.sql
     """
     with handle_cli_error():
         validate_common_options(verbose=verbose, quiet=quiet)
@@ -72,6 +82,7 @@ def generate(
         pytest_gen = PytestGenerator()
 
         output_dir = Path(output) if output else Path("tests")
+        shard_blocks = []
 
         for file_path in files:
             with open(file_path) as f:
@@ -84,7 +95,19 @@ def generate(
             generated_files = []
 
             # Generate pgTAP tests
-            if test_type in ("pgtap", "both"):
+            if test_type in ("pgtap", "both") and shards:
+                shard_blocks.extend(
+                    _pgtap_blocks(
+                        pgtap_gen,
+                        entity_config,
+                        field_mappings,
+                        actions,
+                        include_crud,
+                        include_actions,
+                        include_constraints,
+                    )
+                )
+            elif test_type in ("pgtap", "both"):
                 pgtap_content = _generate_pgtap(
                     pgtap_gen,
                     entity_config,
@@ -159,10 +182,38 @@ def generate(
                 for f in generated_files:
                     cli_output.success(f"Generated {f}")
 
+        if shard_blocks:
+            _write_pgtap_shards(shard_blocks, shards, output_dir / "pgtap", dry_run)
+
         if not dry_run:
             cli_output.success(f"\nTests written to {output_dir}/")
 
 
+def _write_pgtap_shards(blocks, shard_count, pgtap_dir, dry_run) -> None:
+    """Write balanced shard files and their cost manifest"""
+    import json
+
+    from testing.pgtap.sharding import balance_shards, shard_manifest
+
+    shards = balance_shards(blocks, shard_count)
+    for shard in shards:
+        content = shard.render()
+        if dry_run:
+            cli_output.info(f"\n--- pgtap/{shard.filename} ---")
+            cli_output.info(content[:2000])
+        else:
+            pgtap_dir.mkdir(parents=True, exist_ok=True)
+            (pgtap_dir / shard.filename).write_text(content)
+            cli_output.success(
+                f"Generated {pgtap_dir / shard.filename} "
+                f"({len(shard.blocks)} blocks, ~{shard.cost_ms:.0f}ms)"
+            )
+
+    if not dry_run:
+        manifest = json.dumps(shard_manifest(shards), indent=2)
+        (pgtap_dir / "shards.json").write_text(manifest + "\n")
+
+
 def _generate_pgtap(
     generator,
     entity_config,
@@ -173,14 +224,42 @@ def _generate_pgtap(
     include_constraints,
 ) -> str:
     """Generate combined pgTAP test file"""
-    sections = []
+    blocks = _pgtap_blocks(
+        generator,
+        entity_config,
+        field_mappings,
+        actions,
+        include_crud,
+        include_actions,
+        include_constraints,
+    )
+    return "\n\n".join(block.sql for block in blocks)
+
+
+def _pgtap_blocks(
+    generator,
+    entity_config,
+    field_mappings,
+    actions,
+    include_crud,
+    include_actions,
+    include_constraints,
+) -> list:
+    """Generate the pgTAP test blocks of an entity, with estimated costs"""
+    from testing.pgtap.sharding import PgTAPBlock
+
+    entity = entity_config["entity_name"]
+    blocks = []
 
     # Structure tests (always included)
-    sections.append(generator.generate_structure_tests(entity_config))
+    blocks.append(
+        PgTAPBlock(entity, "structure", generator.generate_structure_tests(entity_config))
+    )
 
     # CRUD tests
     if include_crud:
-        sections.append(generator.generate_crud_tests(entity_config, field_mappings))
+        sql = generator.generate_crud_tests(entity_config, field_mappings)
+        blocks.append(PgTAPBlock(entity, "crud", sql))
 
     # Constraint tests
     if include_constraints:
@@ -192,7 +271,8 @@ def _generate_pgtap(
                 "expected_error_code": "duplicate",
             }
         ]
-        sections.append(generator.generate_constraint_tests(entity_config, scenarios))
+        sql = generator.generate_constraint_tests(entity_config, scenarios)
+        blocks.append(PgTAPBlock(entity, "constraints", sql))
 
     # Action tests
     if include_actions and actions:
@@ -205,9 +285,10 @@ def _generate_pgtap(
             }
             for a in actions
         ]
-        sections.append(generator.generate_action_tests(entity_config, actions, scenarios))
+        sql = generator.generate_action_tests(entity_config, actions, scenarios)
+        blocks.append(PgTAPBlock(entity, "actions", sql))
 
-    return "\n\n".join(sections)
+    return blocks
 
 
 def _filter_crud_tests(content: str) -> str:
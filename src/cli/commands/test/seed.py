@@ -1,6 +1,7 @@
 """Seed data generation command"""
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
 
 import click
@@ -20,14 +21,44 @@ from cli.utils.output import set_output_config
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["sql", "json", "csv"]),
+    type=click.Choice(["sql", "copy", "copy-csv", "json", "csv"]),
     default="sql",
-    help="Output format",
+    help="Output format (copy/copy-csv: COPY FROM STDIN blocks, loadable with psql)",
+)
+@click.option(
+    "--rows-per-insert",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Rows per multi-row INSERT ... VALUES statement (sql format)",
+)
+@click.option(
+    "--database-url",
+    help="Bulk load rows into this database with COPY instead of writing files "
+    "(ref fields then reference rows of the database)",
+)
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Worker processes (output is identical for any count)",
 )
 @click.option("--dry-run", is_flag=True, help="Preview without writing files")
 @click.pass_context
 def seed(
-    ctx, files, output, verbose, quiet, count, scenario, deterministic, output_format, dry_run
+    ctx,
+    files,
+    output,
+    verbose,
+    quiet,
+    count,
+    scenario,
+    deterministic,
+    output_format,
+    rows_per_insert,
+    database_url,
+    workers,
+    dry_run,
 ):
     """Generate seed data SQL for testing.
 
@@ -44,13 +75,23 @@ def seed(
 
         # JSON format for API testing
         specql test seed order.yaml --format json
+
+        # 10M rows at COPY speed, straight into a database
+        specql test seed entities/*.yaml -n 10000000 --database-url postgresql://localhost/test
+
+        # Generate on 8 processes (entities of a dependency level and row ranges)
+        specql test seed entities/*.yaml -n 1000000 --deterministic -j 8
+
+    Rows are generated and written as a stream: only the pks of referenced
+    entities are kept in memory (for their children's FKs), or none with
+    --database-url, where FKs are resolved from the loaded tables.
     """
     with handle_cli_error():
         validate_common_options(verbose=verbose, quiet=quiet)
         set_output_config(verbose=verbose, quiet=quiet)
 
         from core.specql_parser import SpecQLParser
-        from testing.seed.seed_generator import EntitySeedGenerator
+        from testing.seed.fk_resolver import ParentRecordIndex
         from testing.seed.sql_generator import SeedSQLGenerator
 
         parser = SpecQLParser()
@@ -69,42 +110,166 @@ def seed(
 
         output_dir = Path(output) if output else Path("seeds")
 
-        for entity, file_path in entities:
-            entity_config = _build_entity_config(entity)
-            field_mappings = _build_field_mappings(entity)
+        connection = None
+        parent_index = None
+        if database_url and not dry_run:
+            import psycopg
 
-            generator = EntitySeedGenerator(
-                entity_config=entity_config, field_mappings=field_mappings, seed=seed_value
+            connection = psycopg.connect(database_url, autocommit=True)
+        else:
+            # Pks of referenced parents seeded earlier in the run, to resolve child FKs offline
+            referenced = {
+                target
+                for entity, _ in entities
+                for field in entity.fields.values()
+                if (target := _reference_target(field))
+            }
+            parent_index = ParentRecordIndex(
+                fields=tuple(sorted(_pk_field(target) for target in referenced)),
+                entities=referenced,
             )
+        loading_url = database_url if connection is not None else None
 
-            records = generator.generate_batch(count=count, scenario=scenario)
+        # Serial and parallel runs generate in the same level order, so FKs match
+        levels = _dependency_levels(entities)
+        if workers > 1:
+            streams = _parallel_streams(
+                levels, count, scenario, seed_value, parent_index, workers, loading_url
+            )
+        else:
+            streams = _serial_streams(
+                levels, count, scenario, seed_value, parent_index, loading_url
+            )
 
-            if output_format == "sql":
-                sql_gen = SeedSQLGenerator(entity_config)
-                content = sql_gen.generate_file(
-                    entities=records, scenario=scenario, description=f"Generated {count} records"
+        for entity, entity_config, records in streams:
+            sql_gen = SeedSQLGenerator(entity_config)
+
+            if connection is not None:
+                with connection.transaction():
+                    loaded = sql_gen.copy_to(connection, records)
+                cli_output.success(f"Loaded {sql_gen.schema}.{sql_gen.table} ({loaded} records)")
+                continue
+
+            if output_format in ("sql", "copy", "copy-csv"):
+                chunks = sql_gen.stream_file(
+                    records,
+                    scenario=scenario,
+                    description=f"Generated {count} records",
+                    mode={"sql": "insert", "copy": "copy", "copy-csv": "copy_csv"}[output_format],
+                    rows_per_insert=rows_per_insert,
                 )
                 filename = f"seed_{entity.name.lower()}.sql"
             elif output_format == "json":
-                content = json.dumps(records, indent=2, default=str)
+                chunks = _iter_json(records)
                 filename = f"seed_{entity.name.lower()}.json"
             else:  # csv
-                content = _to_csv(records)
+                chunks = _iter_csv(records)
                 filename = f"seed_{entity.name.lower()}.csv"
 
             if dry_run:
                 cli_output.info(f"\n--- {filename} ---")
-                cli_output.info(content[:2000])  # Preview first 2000 chars
+                cli_output.info(_preview(chunks, 2000))  # Preview first 2000 chars
+                # Parents must still be fully generated for their children's FKs
+                for _ in records:
+                    pass
             else:
                 output_dir.mkdir(parents=True, exist_ok=True)
                 output_file = output_dir / filename
-                output_file.write_text(content)
+                with output_file.open("w") as f:
+                    f.writelines(chunks)
                 cli_output.success(f"Generated {filename} ({count} records)")
 
-        if not dry_run:
+        if connection is not None:
+            connection.close()
+        elif not dry_run:
             cli_output.success(f"\nSeed data written to {output_dir}/")
 
 
+def _serial_streams(
+    levels: list, count, scenario, seed_value, parent_index, database_url=None
+) -> Iterator:
+    """
+    (entity, entity_config, records) per entity, generated in this process
+
+    With database_url, FKs resolve from prefetched pools of the database's rows,
+    read on their own connection (the loading one is busy with COPY).
+    """
+    from testing.seed.seed_generator import EntitySeedGenerator
+
+    connection = None
+    if database_url:
+        import psycopg
+
+        connection = psycopg.connect(database_url, autocommit=True)
+
+    schemas = _entity_schemas(levels)
+    try:
+        for entity in (entity for level in levels for entity in level):
+            entity_config = _build_entity_config(entity, explicit_pk=connection is None)
+            generator = EntitySeedGenerator(
+                entity_config=entity_config,
+                field_mappings=_build_field_mappings(entity, schemas),
+                db_connection=connection,
+                seed=seed_value,
+                prefetch_fk=connection is not None,
+                parent_index=parent_index,
+                columnar=True,
+            )
+            yield entity, entity_config, generator.iter_batch(count=count, scenario=scenario)
+    finally:
+        if connection is not None:
+            connection.close()
+
+
+def _parallel_streams(
+    levels: list, count, scenario, seed_value, parent_index, workers, database_url=None
+) -> Iterator:
+    """(entity, entity_config, records) per entity, generated level by level on a pool"""
+    from testing.seed.parallel import ParallelSeedGenerator, SeedJob
+
+    runner = ParallelSeedGenerator(workers, parent_index, database_url)
+    schemas = _entity_schemas(levels)
+    for level in levels:
+        jobs = [
+            SeedJob(
+                entity_config=_build_entity_config(entity, explicit_pk=database_url is None),
+                field_mappings=_build_field_mappings(entity, schemas),
+                count=count,
+                scenario=scenario,
+                seed=seed_value,
+                columnar=True,
+            )
+            for entity in level
+        ]
+        for entity, (job, records) in zip(level, runner.run_level(jobs), strict=True):
+            yield entity, job.entity_config, records
+
+
+def _dependency_levels(entities: list) -> list[list]:
+    """
+    Group dependency-sorted entities into levels whose FK targets are all earlier
+
+    References to entities later in the order (cycles) are ignored, as they are
+    when generating serially.
+    """
+    levels: dict[str, int] = {}
+    grouped: list[list] = []
+    for entity, _ in entities:
+        level = max(
+            (
+                levels[target] + 1
+                for field in entity.fields.values()
+                if (target := _reference_target(field)) in levels
+            ),
+            default=0,
+        )
+        levels[entity.name] = level
+        if level == len(grouped):
+            grouped.append([])
+        grouped[level].append(entity)
+    return grouped
+
+
 def _sort_by_dependencies(entities: list) -> list:
     """Sort entities so FK targets come before FK sources"""
     # Simple topological sort based on ref() fields
@@ -114,10 +279,9 @@ def _sort_by_dependencies(entities: list) -> list:
     for entity, path in entities:
         entity_deps = set()
         for field in entity.fields.values():
-            if field.type_name.startswith("ref("):
-                target = field.type_name[4:-1]
-                if target in entity_names:
-                    entity_deps.add(target)
+            target = _reference_target(field)
+            if target in entity_names:
+                entity_deps.add(target)
         deps[entity.name] = entity_deps
 
     # Kahn's algorithm
@@ -140,9 +304,33 @@ def _sort_by_dependencies(entities: list) -> list:
     return result
 
 
-def _build_entity_config(entity) -> dict:
-    """Build entity config dict for EntitySeedGenerator"""
-    return {
+def _reference_target(field) -> str | None:
+    """Entity referenced by a ref field (parsed `ref` + reference_entity, or raw `ref(X)`)"""
+    if field.type_name == "ref":
+        return field.reference_entity
+    if field.type_name.startswith("ref("):
+        return field.type_name[4:-1]
+    return None
+
+
+def _pk_field(entity_name: str) -> str:
+    """INTEGER primary key column of an entity's table (Trinity pattern)"""
+    return f"pk_{entity_name.lower()}"
+
+
+def _entity_schemas(levels: list) -> dict[str, str]:
+    """Schema of each entity of the run, by name"""
+    return {entity.name: entity.schema or "public" for level in levels for entity in level}
+
+
+def _build_entity_config(entity, explicit_pk: bool = True) -> dict:
+    """
+    Build entity config dict for EntitySeedGenerator
+
+    explicit_pk seeds pk_<entity> for offline FK resolution; without it the
+    identity assigns pks (loading into a database that may hold rows already).
+    """
+    config = {
         "entity_name": entity.name,
         "schema_name": entity.schema or "public",
         "table_name": f"tb_{entity.name.lower()}",
@@ -150,10 +338,18 @@ def _build_entity_config(entity) -> dict:
         "is_tenant_scoped": False,  # TODO: determine from entity metadata
         "default_tenant_id": "01232122-0000-0000-2000-000000000001",
     }
+    if explicit_pk:
+        config["pk_field"] = _pk_field(entity.name)
+    return config
+
 
+def _build_field_mappings(entity, schemas: dict[str, str] | None = None) -> list:
+    """
+    Build field mappings list for EntitySeedGenerator
 
-def _build_field_mappings(entity) -> list:
-    """Build field mappings list for EntitySeedGenerator"""
+    schemas maps entity names to their schema, for ref targets outside the
+    entity's schema (database resolution)
+    """
     mappings = []
     priority = 10
 
@@ -165,8 +361,16 @@ def _build_field_mappings(entity) -> list:
             "priority_order": priority,
         }
 
-        if field.type_name.startswith("ref("):
+        target = _reference_target(field)
+        if target:
+            # ref fields are INTEGER fk_<field> columns holding the parent's pk
+            mapping["field_name"] = f"fk_{name}"
             mapping["generator_type"] = "fk_resolve"
+            mapping["fk_target_entity"] = target
+            mapping["fk_target_field"] = _pk_field(target)
+            mapping["fk_target_schema"] = (schemas or {}).get(target, entity.schema or "public")
+            mapping["fk_target_table"] = f"tb_{target.lower()}"
+            mapping["fk_target_pk_field"] = _pk_field(target)
             priority = max(priority, 20)  # FKs need higher priority
         elif field.type_name.startswith("enum("):
             mapping["generator_type"] = "random"
@@ -181,16 +385,38 @@ def _build_field_mappings(entity) -> list:
     return sorted(mappings, key=lambda x: x["priority_order"])
 
 
-def _to_csv(records: list) -> str:
-    """Convert records to CSV format"""
-    if not records:
-        return ""
+def _iter_json(records) -> Iterator[str]:
+    """Stream records as the JSON array json.dumps(records, indent=2) would produce"""
+    first = True
+    for record in records:
+        item = json.dumps(record, indent=2, default=str).replace("\n", "\n  ")
+        yield ("[\n  " if first else ",\n  ") + item
+        first = False
+    yield "[]" if first else "\n]"
+
 
+def _iter_csv(records) -> Iterator[str]:
+    """Stream records as CSV, header from the first record"""
     import csv
     import io
 
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=records[0].keys())
-    writer.writeheader()
-    writer.writerows(records)
-    return output.getvalue()
+    buffer = io.StringIO()
+    writer = None
+    for record in records:
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=record.keys())
+            writer.writeheader()
+        writer.writerow(record)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def _preview(chunks: Iterator[str], limit: int) -> str:
+    """First limit characters of a stream, without consuming more chunks than needed"""
+    preview = ""
+    for chunk in chunks:
+        preview += chunk
+        if len(preview) >= limit:
+            break
+    return preview[:limit]
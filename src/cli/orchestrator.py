@@ -1,11 +1,15 @@
 """CLI Orchestrator for unified generation workflows."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from core.ast_models import Action, Entity
+from core.exceptions import SpecQLValidationError
 from core.specql_parser import SpecQLParser
+from generators.app_schema_generator import AuditLogConfig
 from generators.schema.naming_conventions import NamingConventions  # NEW
+from generators.schema.online_ddl import CONCURRENT_FILE_HEADER, VALIDATION_FILE_HEADER
+from generators.schema.partition_generator import validate_partition_references
 from generators.schema_orchestrator import SchemaOrchestrator
 from utils.performance_monitor import get_performance_monitor
 
@@ -27,6 +31,7 @@ def convert_entity_definition_to_entity(entity_def):
         actions=actions,
         agents=entity_def.agents,
         organization=getattr(entity_def, "organization", None),
+        partitioning=getattr(entity_def, "partitioning", None),
     )
 
     return entity
@@ -50,6 +55,11 @@ class GenerationResult:
     migrations: list[MigrationFile]
     errors: list[str]
     warnings: list[str]
+    function_changes: list[str] = field(default_factory=list)  # --infer-volatility report
+    written_files: list[Path] = field(default_factory=list)  # In write order (--delta-from)
+    concurrent_files: list[Path] = field(
+        default_factory=list
+    )  # --online: run outside a transaction, after the migrations
 
 
 class CLIOrchestrator:
@@ -61,6 +71,9 @@ class CLIOrchestrator:
         output_format: str = "hierarchical",
         enable_performance_monitoring: bool = False,
         logger=None,
+        audit_log: AuditLogConfig | None = None,
+        infer_volatility: bool = False,
+        online: bool = False,
     ):
         self.enable_performance_monitoring = enable_performance_monitoring
         self.perf_monitor = get_performance_monitor() if enable_performance_monitoring else None
@@ -71,6 +84,9 @@ class CLIOrchestrator:
         self.schema_orchestrator = SchemaOrchestrator(
             enable_performance_monitoring=enable_performance_monitoring,
             registry_optional=not use_registry,  # Make registry optional when not explicitly using it
+            audit_log=audit_log,
+            infer_volatility=infer_volatility,
+            online=online,
         )
 
         # NEW: Registry integration
@@ -178,7 +194,8 @@ class CLIOrchestrator:
             result.migrations.append(migration)
             # Write the file
             if migration.path:
-                migration.path.write_text(migration.content)
+                self._write(result, migration.path, migration.content)
+            result.function_changes = self._function_changes()
             return result
 
         # Generate foundation first
@@ -189,7 +206,7 @@ class CLIOrchestrator:
                 foundation_dir = Path("db/schema/00_foundation")
                 foundation_dir.mkdir(parents=True, exist_ok=True)
                 foundation_path = foundation_dir / "000_app_foundation.sql"
-                foundation_path.write_text(foundation_sql)
+                self._write(result, foundation_path, foundation_sql)
                 migration = MigrationFile(
                     number=0,
                     name="app_foundation",
@@ -204,6 +221,7 @@ class CLIOrchestrator:
                     content=foundation_sql,
                     path=output_path / "000_app_foundation.sql",
                 )
+                self._write(result, migration.path, foundation_sql)
             result.migrations.append(migration)
 
         # Parse all entities
@@ -216,6 +234,13 @@ class CLIOrchestrator:
             except Exception as e:
                 result.errors.append(f"Failed to parse {entity_file}: {e}")
 
+        # Cross-entity checks
+        try:
+            validate_partition_references(entity_defs)
+        except SpecQLValidationError as e:
+            result.errors.append(str(e))
+            return result
+
         # Generate entity migrations
         for entity_def in entity_defs:
             try:
@@ -235,13 +260,13 @@ class CLIOrchestrator:
                     table_dir = schema_base / "10_tables"
                     table_dir.mkdir(parents=True, exist_ok=True)
                     table_path = table_dir / f"{entity.name.lower()}.sql"
-                    table_path.write_text(schema_output.table_sql)
+                    self._write(result, table_path, schema_output.table_sql)
 
                     # 2. Helper functions (db/schema/20_helpers/)
                     helpers_dir = schema_base / "20_helpers"
                     helpers_dir.mkdir(parents=True, exist_ok=True)
                     helpers_path = helpers_dir / f"{entity.name.lower()}_helpers.sql"
-                    helpers_path.write_text(schema_output.helpers_sql)
+                    self._write(result, helpers_path, schema_output.helpers_sql)
 
                     # 3. Input types (db/schema/00_foundation/002_{entity}_input_types.sql)
                     if schema_output.input_types_sql:
@@ -257,7 +282,7 @@ class CLIOrchestrator:
 
 {schema_output.input_types_sql}
 """
-                        input_types_path.write_text(input_types_content)
+                        self._write(result, input_types_path, input_types_content)
 
                     # 4. Mutations - ONE FILE PER MUTATION (db/schema/30_functions/)
                     functions_dir = schema_base / "30_functions"
@@ -277,7 +302,9 @@ class CLIOrchestrator:
 
 {mutation.fraiseql_comments_sql}
 """
-                        mutation_path.write_text(mutation_content)
+                        self._write(result, mutation_path, mutation_content)
+
+                    self._write_post_migration(result, output_path, entity, schema_output)
 
                     # Register entity if using registry
                     if self.naming:
@@ -306,13 +333,13 @@ class CLIOrchestrator:
                     table_dir = schema_base / "10_tables"
                     table_dir.mkdir(parents=True, exist_ok=True)
                     table_path = table_dir / f"{entity.name.lower()}.sql"
-                    table_path.write_text(schema_output.table_sql)
+                    self._write(result, table_path, schema_output.table_sql)
 
                     # 2. Helper functions (db/schema/20_helpers/)
                     helpers_dir = schema_base / "20_helpers"
                     helpers_dir.mkdir(parents=True, exist_ok=True)
                     helpers_path = helpers_dir / f"{entity.name.lower()}_helpers.sql"
-                    helpers_path.write_text(schema_output.helpers_sql)
+                    self._write(result, helpers_path, schema_output.helpers_sql)
 
                     # 3. Input types (db/schema/00_foundation/002_{entity}_input_types.sql)
                     if schema_output.input_types_sql:
@@ -328,7 +355,7 @@ class CLIOrchestrator:
 
 {schema_output.input_types_sql}
 """
-                        input_types_path.write_text(input_types_content)
+                        self._write(result, input_types_path, input_types_content)
 
                     # 4. Mutations - ONE FILE PER MUTATION (db/schema/30_functions/)
                     functions_dir = schema_base / "30_functions"
@@ -348,7 +375,9 @@ class CLIOrchestrator:
 
 {mutation.fraiseql_comments_sql}
 """
-                        mutation_path.write_text(mutation_content)
+                        self._write(result, mutation_path, mutation_content)
+
+                    self._write_post_migration(result, output_path, entity, schema_output)
 
                     # Use sequential numbering for backward compatibility
                     entity_count = len([m for m in result.migrations if m.number >= 100])
@@ -384,6 +413,33 @@ class CLIOrchestrator:
         # Write migrations to disk
         for migration in result.migrations:
             if migration.path:
-                migration.path.write_text(migration.content)
+                self._write(result, migration.path, migration.content)
 
+        result.function_changes = self._function_changes()
         return result
+
+    def _write_post_migration(
+        self, result: GenerationResult, output_path: Path, entity, schema_output
+    ) -> None:
+        """Write online-mode constraint validation and CONCURRENTLY index builds to own files."""
+        for suffix, header, sql in (
+            ("validate_constraints", VALIDATION_FILE_HEADER, schema_output.validation_sql),
+            ("concurrent_indexes", CONCURRENT_FILE_HEADER, schema_output.concurrent_indexes_sql),
+        ):
+            if not sql:
+                continue
+            path = output_path / f"{entity.name.lower()}_{suffix}.sql"
+            self._write(result, path, header + "\n" + sql + "\n")
+            result.concurrent_files.append(path)
+
+    @staticmethod
+    def _write(result: GenerationResult, path: Path, content: str) -> None:
+        """Write a generated file and record it in write order."""
+        path.write_text(content)
+        if path not in result.written_files:
+            result.written_files.append(path)
+
+    def _function_changes(self) -> list[str]:
+        """Functions whose attributes --infer-volatility rewrote."""
+        analyzer = self.schema_orchestrator.volatility_analyzer
+        return [str(change) for change in analyzer.changes] if analyzer else []
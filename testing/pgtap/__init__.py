@@ -1,5 +1,6 @@
 """pgTAP test generation for PostgreSQL database testing."""
 
 from .pgtap_generator import PgTAPGenerator
+from .sharding import PgTAPBlock, Shard, balance_shards
 
-__all__ = ["PgTAPGenerator"]
+__all__ = ["PgTAPBlock", "PgTAPGenerator", "Shard", "balance_shards"]
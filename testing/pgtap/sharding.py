@@ -0,0 +1,134 @@
+"""Runtime-balanced sharding of generated pgTAP test blocks."""
+
+import heapq
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+# Rough costs (ms) used to rank blocks; only their ratios matter for balancing
+BLOCK_OVERHEAD_MS = 2.0
+ASSERTION_MS = 0.5
+FUNCTION_CALL_MS = 5.0  # app.create_x(...), schema.action(...): mutations with triggers
+
+_ASSERTION = re.compile(
+    r"\b(?:ok|is|isnt|like|unlike|lives_ok|throws_ok|has_table|has_column|"
+    r"col_is_pk|col_is_unique)\s*\(",
+)
+_FUNCTION_CALL = re.compile(r"\b[a-z_]\w*\.[a-z_]\w*\s*\(", re.IGNORECASE)
+
+# Per-block transaction framing, replaced by the shard's transaction and savepoints
+_FRAMING = re.compile(
+    r"^(?:BEGIN;|ROLLBACK;|SELECT plan\(\d+\);|SELECT \* FROM finish\(\);)\s*$\n?",
+    re.MULTILINE,
+)
+
+
+@dataclass
+class PgTAPBlock:
+    """One generated test block (structure, crud, constraints or actions) of an entity."""
+
+    entity: str
+    kind: str
+    sql: str
+    cost_ms: float = 0.0
+
+    def __post_init__(self):
+        if not self.cost_ms:
+            self.cost_ms = estimate_cost(self.sql)
+
+
+@dataclass
+class Shard:
+    """Test blocks run by one pg_prove job, in one transaction."""
+
+    index: int
+    blocks: list[PgTAPBlock] = field(default_factory=list)
+
+    @property
+    def cost_ms(self) -> float:
+        return sum(block.cost_ms for block in self.blocks)
+
+    @property
+    def filename(self) -> str:
+        return f"test_shard_{self.index + 1:03d}.sql"
+
+    def render(self) -> str:
+        """pgTAP file running every block in a savepoint of one rolled back transaction.
+
+        Nothing is committed, so shards can run concurrently against one template
+        database (`pg_prove -j N`).
+        """
+        lines = [
+            f"-- pgTAP shard {self.index + 1}: {len(self.blocks)} blocks, "
+            f"estimated {self.cost_ms:.1f}ms",
+            "BEGIN;",
+            "SELECT no_plan();",
+            "",
+        ]
+        for number, block in enumerate(self.blocks, start=1):
+            savepoint = f"block_{number}"
+            lines += [
+                f"-- {block.entity}: {block.kind} (estimated {block.cost_ms:.1f}ms)",
+                f"SAVEPOINT {savepoint};",
+                _FRAMING.sub("", block.sql).strip(),
+                f"ROLLBACK TO SAVEPOINT {savepoint};",
+                # PREPAREd fixtures are session state, untouched by the rollback
+                "DEALLOCATE ALL;",
+                "",
+            ]
+        lines += ["SELECT * FROM finish();", "ROLLBACK;", ""]
+        return "\n".join(lines)
+
+
+def estimate_cost(sql: str) -> float:
+    """Estimated runtime (ms) of a test block from its assertions and function calls."""
+    assertions = len(_ASSERTION.findall(sql))
+    calls = len(_FUNCTION_CALL.findall(sql))
+    return BLOCK_OVERHEAD_MS + assertions * ASSERTION_MS + calls * FUNCTION_CALL_MS
+
+
+def balance_shards(blocks: list[PgTAPBlock], shard_count: int) -> list[Shard]:
+    """Split blocks into shard_count shards of similar estimated runtime.
+
+    Blocks of one entity stay together: they create the same fixture rows, which
+    concurrent shards would otherwise wait on until the other rolls back. Entities
+    are assigned longest first to the cheapest shard (LPT), deterministically.
+    """
+    if shard_count < 1:
+        raise ValueError(f"Shard count must be at least 1, got {shard_count}")
+
+    entities: dict[str, list[PgTAPBlock]] = {}
+    for block in blocks:
+        entities.setdefault(block.entity, []).append(block)
+
+    shards = [Shard(index) for index in range(shard_count)]
+    heap = [(0.0, index) for index in range(shard_count)]
+    for entity, entity_blocks in sorted(
+        entities.items(), key=lambda item: (-sum(b.cost_ms for b in item[1]), item[0])
+    ):
+        cost, index = heapq.heappop(heap)
+        shards[index].blocks.extend(entity_blocks)
+        heapq.heappush(heap, (cost + sum(b.cost_ms for b in entity_blocks), index))
+
+    return [shard for shard in shards if shard.blocks]
+
+
+def shard_manifest(shards: list[Shard]) -> dict[str, Any]:
+    """Estimated cost per shard and block, written next to the shards."""
+    return {
+        "shards": [
+            {
+                "file": shard.filename,
+                "estimated_ms": round(shard.cost_ms, 1),
+                "blocks": [
+                    {
+                        "entity": block.entity,
+                        "kind": block.kind,
+                        "estimated_ms": round(block.cost_ms, 1),
+                    }
+                    for block in shard.blocks
+                ],
+            }
+            for shard in shards
+        ]
+    }
@@ -1,9 +1,14 @@
 """Field value generators for SpecQL test data"""
 
+import hashlib
 import random
+from datetime import date, datetime, timedelta
 from typing import Any
 
-from core.dependencies import FAKER
+from core.dependencies import FAKER, NUMPY
+
+# Generator types whose values never depend on other fields of the row
+COLUMN_GENERATOR_TYPES = ("random", "fixed", "sequence")
 
 # Lazy import with availability check
 _faker = None
@@ -19,6 +24,22 @@ def _get_faker():
     return _faker
 
 
+def derive_seed(seed: int, *parts: Any) -> int:
+    """
+    Seed of an independent RNG stream for parts under a master seed
+
+    Stable across processes and Python runs (unlike hash()), so a stream such as
+    (entity, scenario, instance range) generates the same values wherever it runs.
+    """
+    digest = hashlib.blake2b(repr((seed, *parts)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+# Reference "now" of seeded generation: dates and timestamps fall in the year
+# before it, so deterministic output does not drift with the wall clock
+SEED_EPOCH = datetime(2025, 1, 1)
+
+
 class FieldValueGenerator:
     """Generate field values based on type and metadata"""
 
@@ -29,9 +50,17 @@ class FieldValueGenerator:
         """
         Faker = _get_faker()
         self.faker = Faker()
-        if seed:
-            Faker.seed(seed)
-            random.seed(seed)
+        # Own RNG streams: no global random / Faker class state is touched
+        self.rng = random.Random()
+        self.epoch: datetime | None = None  # None: relative to the current time
+        if seed is not None:
+            self.reseed(seed)
+
+    def reseed(self, seed: int) -> None:
+        """Restart both RNG streams (random values and Faker providers) from seed"""
+        self.rng.seed(seed)
+        self.faker.seed_instance(seed)
+        self.epoch = SEED_EPOCH
 
     def generate(self, field_mapping: dict[str, Any], context: dict[str, Any] = None) -> Any:
         """
@@ -58,13 +87,66 @@ class FieldValueGenerator:
         else:
             raise ValueError(f"Unsupported generator type: {generator_type}")
 
+    def generate_column(
+        self,
+        field_mapping: dict[str, Any],
+        count: int,
+        start_instance: int = 1,
+        seed: int | None = None,
+        offset: int = 0,
+    ) -> list[Any]:
+        """
+        Generate the values of count consecutive instances at once
+
+        Numeric, date and choice (enum, boolean, example values) fields are drawn
+        as whole columns. Seeded columns always use stdlib random batches, so a
+        seed gives the same values with or without NumPy; unseeded columns use
+        NumPy when installed. Faker-backed types loop over the provider.
+
+        Args:
+            field_mapping: Mapping of a COLUMN_GENERATOR_TYPES field
+            count: Number of values
+            start_instance: Instance number of the first value (sequences)
+            seed: Seed of the column's RNG stream
+            offset: Position of the first value in the seeded stream. The values
+                before it are drawn and dropped, so a stream gives the same column
+                generated in one call or in several
+
+        Returns:
+            List of count values
+        """
+        generator_type = field_mapping["generator_type"]
+
+        if generator_type == "fixed":
+            return [field_mapping["generator_params"]["fixed_value"]] * count
+        elif generator_type == "sequence":
+            params = field_mapping.get("generator_params", {})
+            step = params.get("step", 1)
+            first = params.get("start", 1) + (start_instance - 1) * step
+            return [first + i * step for i in range(count)]
+        elif generator_type != "random":
+            raise ValueError(f"Unsupported column generator type: {generator_type}")
+
+        if seed is None:
+            offset = 0
+        spec = _column_spec(field_mapping, SEED_EPOCH if seed is not None else None)
+        if spec is None:
+            if seed is not None:
+                self.reseed(seed)
+            values = [self._generate_random(field_mapping) for _ in range(offset + count)]
+        elif seed is None and NUMPY.available:
+            values = _draw_numpy(spec, offset + count, seed)
+        else:
+            values = _draw_stdlib(spec, offset + count, seed)
+        return values[offset:]
+
     def _generate_random(self, mapping: dict[str, Any]) -> Any:
         """Generate random value based on field type"""
         field_type = mapping["field_type"]
 
         # Use example values if provided
         if mapping.get("example_values"):
-            return random.choice(mapping["example_values"])
+            return self.rng.choice(mapping["example_values"])
 
         # Rich scalar types
         if field_type == "email":
@@ -77,10 +159,10 @@ class FieldValueGenerator:
             return self.faker.url()
 
         elif field_type == "money":
-            return round(random.uniform(10, 10000), 2)
+            return round(self.rng.uniform(10, 10000), 2)
 
         elif field_type == "percentage":
-            return round(random.uniform(0, 100), 2)
+            return round(self.rng.uniform(0, 100), 2)
 
         elif field_type == "ipAddress":
             return self.faker.ipv4()
@@ -96,25 +178,21 @@ class FieldValueGenerator:
             dist = mapping.get("seed_distribution", {})
             min_val = dist.get("min", 1)
             max_val = dist.get("max", 1000)
-            return random.randint(min_val, max_val)
+            return self.rng.randint(min_val, max_val)
 
         elif field_type == "boolean":
-            return random.choice([True, False])
+            return self.rng.choice([True, False])
 
         elif field_type.startswith("enum("):
-            # Parse: "enum(lead, qualified, customer)" → ["lead", "qualified", "customer"]
-            if mapping.get("enum_values"):
-                values = mapping["enum_values"]
-            else:
-                values = field_type[5:-1].split(",")
-                values = [v.strip() for v in values]
-            return random.choice(values)
+            return self.rng.choice(_enum_values(mapping))
 
         elif field_type == "date":
-            return self.faker.date_between(start_date="-1y", end_date="today")
+            end = self.epoch.date() if self.epoch else date.today()
+            return self.faker.date_between(start_date=end - timedelta(days=365), end_date=end)
 
         elif field_type == "timestamptz":
-            return self.faker.date_time_between(start_date="-1y", end_date="now")
+            end = self.epoch or datetime.now()
+            return self.faker.date_time_between(start_date=end - timedelta(days=365), end_date=end)
 
         else:
             # Fallback
@@ -128,3 +206,82 @@ class FieldValueGenerator:
         instance_num = context.get("instance_num", 1)
 
         return start + (instance_num - 1) * step
+
+
+def _enum_values(mapping: dict[str, Any]) -> list[str]:
+    """Parse: "enum(lead, qualified, customer)" → ["lead", "qualified", "customer"]"""
+    if mapping.get("enum_values"):
+        return mapping["enum_values"]
+    return [v.strip() for v in mapping["field_type"][5:-1].split(",")]
+
+
+def _column_spec(mapping: dict[str, Any], epoch: datetime | None = None) -> tuple | None:
+    """
+    (kind, *params) of a vectorizable random field, None for Faker-backed types
+
+    Dates and timestamps span the year before epoch (the current time by default).
+    """
+    field_type = mapping["field_type"]
+
+    if mapping.get("example_values"):
+        return ("choice", list(mapping["example_values"]))
+    elif field_type == "boolean":
+        return ("choice", [True, False])
+    elif field_type.startswith("enum("):
+        return ("choice", list(_enum_values(mapping)))
+    elif field_type == "integer":
+        dist = mapping.get("seed_distribution", {})
+        return ("integer", dist.get("min", 1), dist.get("max", 1000))
+    elif field_type == "money":
+        return ("decimal", 10, 10000)
+    elif field_type == "percentage":
+        return ("decimal", 0, 100)
+    elif field_type == "date":
+        today = (epoch.date() if epoch else date.today()).toordinal()
+        return ("date", today - 365, today)
+    elif field_type == "timestamptz":
+        now = epoch or datetime.now()
+        return ("datetime", now - timedelta(days=365), now)
+    return None
+
+
+def _draw_numpy(spec: tuple, count: int, seed: int | None) -> list[Any]:
+    """Column of spec values drawn with a NumPy Generator"""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    kind = spec[0]
+
+    if kind == "choice":
+        values = spec[1]
+        return [values[i] for i in rng.integers(0, len(values), count).tolist()]
+    elif kind == "integer":
+        return rng.integers(spec[1], spec[2] + 1, count).tolist()
+    elif kind == "decimal":
+        return np.round(rng.uniform(spec[1], spec[2], count), 2).tolist()
+    elif kind == "date":
+        return [date.fromordinal(o) for o in rng.integers(spec[1], spec[2] + 1, count).tolist()]
+    else:  # datetime
+        start, end = spec[1], spec[2]
+        seconds = rng.uniform(0, (end - start).total_seconds(), count).tolist()
+        return [start + timedelta(seconds=s) for s in seconds]
+
+
+def _draw_stdlib(spec: tuple, count: int, seed: int | None) -> list[Any]:
+    """Column of spec values drawn with stdlib random batches"""
+    rng = random.Random(seed)
+    kind = spec[0]
+
+    if kind == "choice":
+        return rng.choices(spec[1], k=count)
+    elif kind == "integer":
+        return rng.choices(range(spec[1], spec[2] + 1), k=count)
+    elif kind == "decimal":
+        low, span = spec[1], spec[2] - spec[1]
+        return [round(low + span * rng.random(), 2) for _ in range(count)]
+    elif kind == "date":
+        return [date.fromordinal(o) for o in rng.choices(range(spec[1], spec[2] + 1), k=count)]
+    else:  # datetime
+        start, end = spec[1], spec[2]
+        span = (end - start).total_seconds()
+        return [start + timedelta(seconds=span * rng.random()) for _ in range(count)]
@@ -1,20 +1,102 @@
 """FK Resolver and Group Leader components for SpecQL seed data generation"""
 
+import random
+import re
 from typing import Any
 
 import psycopg
 
+from .field_generators import derive_seed
+
+# Trailing "pick one at random" of a group leader query
+_RANDOM_PICK = re.compile(r"\s+ORDER\s+BY\s+RANDOM\(\)\s+LIMIT\s+1\s*;?\s*$", re.IGNORECASE)
+
+
+def _sql_seed(seed: int, *parts: Any) -> int:
+    """Non-negative 31-bit seed for SQL (TABLESAMPLE REPEATABLE) derived from seed and parts"""
+    return derive_seed(seed, *parts) % 2**31
+
+
+def _random_order(expression: str, seed: int | None, *parts: Any) -> str:
+    """
+    ORDER BY expression picking a random subset with LIMIT
+
+    RANDOM() without a seed; with one, a hash of the row expression salted with
+    the seed, so the subset is the same on every run and not biased towards low pks.
+    """
+    if seed is None:
+        return "RANDOM()"
+    return f"md5({expression} || '{_sql_seed(seed, *parts)}')"
+
+
+class _CandidatePools:
+    """
+    Candidate rows fetched once per key and sampled in-process.
+
+    Replaces one `ORDER BY RANDOM() LIMIT 1` query (a sort of the whole target
+    table plus a roundtrip) per generated value with one query per pool.
+    """
+
+    def __init__(self, db_connection: psycopg.Connection, rng: random.Random | None = None):
+        self.db = db_connection
+        self.rng = rng or random.Random()
+        self.pools: dict[Any, list] = {}
+        self.queries = 0  # Pool-filling queries sent (for benchmarks)
+
+    def pick(self, key: Any, queries: list[str]) -> Any | None:
+        """Random row of the pool for key, filled by the first query returning rows."""
+        pool = self.pools.get(key)
+        if pool is None:
+            pool = []
+            for query in queries:
+                self.queries += 1
+                pool = self.db.execute(query).fetchall()
+                if pool:
+                    break
+            # Sorted so the seeded RNG picks the same rows regardless of scan order
+            pool = sorted(pool, key=repr)
+            self.pools[key] = pool
+        return self.rng.choice(pool) if pool else None
+
 
 class ForeignKeyResolver:
     """Resolve foreign key values by querying database"""
 
-    def __init__(self, db_connection: psycopg.Connection):
+    def __init__(
+        self,
+        db_connection: psycopg.Connection,
+        prefetch: bool = False,
+        pool_size: int | None = None,
+        sample_percent: float | None = None,
+        rng: random.Random | None = None,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            db_connection: Connection to the seeded database
+            prefetch: Fetch candidate pks once per (target, tenant, filter) and sample
+                them in-process instead of querying per value
+            pool_size: Cap on candidates per pool (random subset); None fetches all
+            sample_percent: Read the target with TABLESAMPLE SYSTEM (percent) when
+                prefetching, instead of scanning it
+            rng: Seeded RNG used to sample pools (deterministic seeding)
+            seed: Master seed. Pool queries then select the same rows on every run
+                (TABLESAMPLE ... REPEATABLE, pk-hash order) instead of RANDOM()
+        """
         self.db = db_connection
+        self.prefetch = prefetch
+        self.pool_size = pool_size
+        self.sample_percent = sample_percent
+        self.seed = seed
+        self.pools = _CandidatePools(db_connection, rng) if prefetch else None
 
     def resolve(self, field_mapping: dict[str, Any], context: dict[str, Any]) -> int | None:
         """
         Resolve FK value by querying target table
 
+        Custom `fk_resolution_query` mappings are always sent per value, since they
+        may depend on the row's context.
+
         Returns:
             INTEGER pk value from target table
         """
@@ -33,6 +115,12 @@ class ForeignKeyResolver:
                     query = query.replace(f"${key}", f"'{value}'")
                 else:
                     query = query.replace(f"${key}", str(value))
+        elif self.pools is not None:
+            row = self.pools.pick(
+                self._pool_key(field_mapping, context),
+                self._build_pool_queries(field_mapping, context),
+            )
+            return row[0] if row else None
         else:
             # Default: random selection from target table
             query = self._build_default_query(field_mapping, context)
@@ -42,11 +130,25 @@ class ForeignKeyResolver:
 
     def _build_default_query(self, mapping: dict, context: dict) -> str:
         """Build default FK resolution query"""
+        query = self._build_candidates_query(mapping, context)
+        query += " ORDER BY RANDOM() LIMIT 1"
+
+        return query
+
+    def _build_candidates_query(
+        self, mapping: dict, context: dict, sample_percent: float | None = None
+    ) -> str:
+        """SELECT of every live candidate pk of the FK target"""
         schema = mapping["fk_target_schema"]
         table = mapping["fk_target_table"]
         pk_field = mapping["fk_target_pk_field"]
 
-        query = f"SELECT {pk_field} FROM {schema}.{table} WHERE deleted_at IS NULL"
+        query = f"SELECT {pk_field} FROM {schema}.{table}"
+        if sample_percent:
+            query += f" TABLESAMPLE SYSTEM ({sample_percent})"
+            if self.seed is not None:
+                query += f" REPEATABLE ({_sql_seed(self.seed, schema, table)})"
+        query += " WHERE deleted_at IS NULL"
 
         # Add tenant filter if tenant-scoped
         if "tenant_id" in context:
@@ -56,16 +158,69 @@ class ForeignKeyResolver:
         if mapping.get("fk_filter_conditions"):
             query += f" AND {mapping['fk_filter_conditions']}"
 
-        query += " ORDER BY RANDOM() LIMIT 1"
-
         return query
 
+    def _build_pool_queries(self, mapping: dict, context: dict) -> list[str]:
+        """Pool queries in fallback order (a small table may sample to no rows)"""
+        pk_field = mapping["fk_target_pk_field"]
+        queries = []
+        if self.sample_percent:
+            query = self._build_candidates_query(mapping, context, self.sample_percent)
+            if self.pool_size:
+                if self.seed is not None:
+                    query += f" ORDER BY {pk_field}"
+                query += f" LIMIT {self.pool_size}"
+            queries.append(query)
+
+        query = self._build_candidates_query(mapping, context)
+        if self.pool_size:
+            order = _random_order(
+                f"{pk_field}::text",
+                self.seed,
+                mapping["fk_target_schema"],
+                mapping["fk_target_table"],
+            )
+            query += f" ORDER BY {order} LIMIT {self.pool_size}"
+        queries.append(query)
+        return queries
+
+    @staticmethod
+    def _pool_key(mapping: dict, context: dict) -> tuple:
+        return (
+            mapping["fk_target_schema"],
+            mapping["fk_target_table"],
+            mapping["fk_target_pk_field"],
+            context.get("tenant_id"),
+            mapping.get("fk_filter_conditions"),
+        )
+
 
 class GroupLeaderExecutor:
     """Execute group leader queries to get multiple related field values"""
 
-    def __init__(self, db_connection: psycopg.Connection):
+    def __init__(
+        self,
+        db_connection: psycopg.Connection,
+        prefetch: bool = False,
+        pool_size: int | None = None,
+        rng: random.Random | None = None,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            db_connection: Connection to the seeded database
+            prefetch: Run each leader query once and sample its rows in-process. A
+                trailing `ORDER BY RANDOM() LIMIT 1` is dropped to fetch the candidates.
+            pool_size: Cap on candidate rows per leader query; None fetches all
+            rng: Seeded RNG used to sample pools (deterministic seeding)
+            seed: Master seed. Capped pools then keep the same rows on every run
+                (row-hash order) instead of RANDOM()
+        """
         self.db = db_connection
+        self.prefetch = prefetch
+        self.pool_size = pool_size
+        self.seed = seed
+        self.pools = _CandidatePools(db_connection, rng) if prefetch else None
 
     def execute(self, leader_mapping: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
         """
@@ -78,10 +233,129 @@ class GroupLeaderExecutor:
         query = leader_mapping["generator_params"]["leader_query"]
         dependent_fields = leader_mapping["group_dependency_fields"]
 
-        result = self.db.execute(query).fetchone()
+        if self.pools is not None:
+            result = self.pools.pick(query, [self._build_pool_query(query)])
+        else:
+            result = self.db.execute(query).fetchone()
 
         if not result:
             raise ValueError(f"Group leader query returned no results: {query}")
 
         # Map result columns to dependent field names
         return dict(zip(dependent_fields, result))
+
+    def _build_pool_query(self, query: str) -> str:
+        """Candidate rows of a leader query; a deterministic query keeps its first row"""
+        if not _RANDOM_PICK.search(query):
+            return f"SELECT * FROM ({query.rstrip().rstrip(';')}) AS leader LIMIT 1"
+        candidates = _RANDOM_PICK.sub("", query)
+        if self.pool_size:
+            if self.seed is None:
+                return candidates + f" ORDER BY RANDOM() LIMIT {self.pool_size}"
+            order = _random_order("leader::text", self.seed, candidates)
+            return f"SELECT * FROM ({candidates}) AS leader ORDER BY {order} LIMIT {self.pool_size}"
+        return candidates
+
+
+class ParentRecordIndex:
+    """
+    Records generated earlier in the same run, indexed by (entity, tenant).
+
+    Lets child FK fields resolve without a database: `test seed` generates
+    entities in dependency order, so every parent is indexed before its children.
+    """
+
+    def __init__(self, fields: tuple[str, ...] | None = None, entities: set[str] | None = None):
+        """
+        Args:
+            fields: Only keep these fields of each record (e.g. ("id",)), so that
+                streamed runs hold the referenced values instead of whole records
+            entities: Only index these (referenced) entities; None indexes all
+        """
+        self.fields = fields
+        self.entities = entities
+        self.records: dict[tuple[str, Any], list[dict[str, Any]]] = {}
+        self.aliases: dict[str, str] = {}  # "schema.tb_x" / "tb_x" -> entity name
+
+    def register(self, entity_config: dict[str, Any]) -> str:
+        """Make the entity's table names resolve to it; returns the entity name"""
+        entity = entity_config["entity_name"]
+        table = entity_config.get("table_name")
+        if table:
+            self.aliases[table] = entity
+            self.aliases[f"{entity_config.get('schema_name')}.{table}"] = entity
+        return entity
+
+    def add(self, entity_config: dict[str, Any], record: dict[str, Any]) -> None:
+        """Index one generated record of the configured entity"""
+        entity = self.register(entity_config)
+        if self.entities is not None and entity not in self.entities:
+            return
+        key = (entity, record.get("tenant_id"))
+        if self.fields is not None:
+            record = {field: record.get(field) for field in self.fields}
+        self.records.setdefault(key, []).append(record)
+
+    def candidates(self, entity: str, tenant_id: Any = None) -> list[dict[str, Any]]:
+        """Parent records of entity visible to tenant (falls back to non-tenant parents)"""
+        entity = self.aliases.get(entity, entity)
+        return self.records.get((entity, tenant_id)) or self.records.get((entity, None), [])
+
+
+class OfflineForeignKeyResolver:
+    """Resolve foreign key values from a ParentRecordIndex, without database roundtrips"""
+
+    def __init__(
+        self,
+        index: ParentRecordIndex,
+        rng: random.Random | None = None,
+        exclude_entity: str | None = None,
+    ):
+        """
+        Args:
+            index: Parent records generated earlier in the run
+            rng: Seeded RNG picking the parent (reproducible references)
+            exclude_entity: Entity being generated. Its records are still being
+                added, so references to it resolve to None rather than depend on
+                how far (or in which process) its generation got
+        """
+        self.index = index
+        self.rng = rng or random.Random()
+        self.exclude_entity = exclude_entity
+
+    def resolve(self, field_mapping: dict[str, Any], context: dict[str, Any]) -> Any | None:
+        """
+        Resolve FK value from a random indexed parent
+
+        The target is `fk_target_entity`, or `fk_target_table` (optionally with
+        `fk_target_schema`) for metadata-driven mappings. The value is the parent's
+        `fk_target_field` (default `id`, its deterministic SpecQL UUID).
+
+        Returns:
+            Parent value, or None when no parent was generated
+        """
+        dependencies = field_mapping.get("fk_dependencies", [])
+        for dep in dependencies:
+            if dep not in context:
+                raise ValueError(f"FK dependency not satisfied: {dep}")
+
+        for key in ("fk_resolution_query", "fk_filter_conditions"):
+            if field_mapping.get(key):
+                raise ValueError(
+                    f"FK resolution with {key} requires database connection: "
+                    f"{field_mapping['field_name']}"
+                )
+
+        target = field_mapping.get("fk_target_entity")
+        if not target:
+            target = field_mapping["fk_target_table"]
+            if field_mapping.get("fk_target_schema"):
+                target = f"{field_mapping['fk_target_schema']}.{target}"
+
+        if self.exclude_entity and self.index.aliases.get(target, target) == self.exclude_entity:
+            return None
+
+        candidates = self.index.candidates(target, context.get("tenant_id"))
+        if not candidates:
+            return None
+        return self.rng.choice(candidates).get(field_mapping.get("fk_target_field", "id"))
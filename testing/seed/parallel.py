@@ -0,0 +1,135 @@
+"""Process-parallel seed generation over deterministic instance blocks"""
+
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from .fk_resolver import ParentRecordIndex
+from .seed_generator import SEED_BLOCK_SIZE, EntitySeedGenerator
+
+
+@dataclass
+class SeedJob:
+    """Records of one entity to generate"""
+
+    entity_config: dict[str, Any]
+    field_mappings: list[dict[str, Any]]
+    count: int
+    scenario: int = 0
+    seed: int | None = None
+    overrides: dict[str, Any] | None = None
+    columnar: bool = False
+
+
+class ParallelSeedGenerator:
+    """
+    Generate the entities of a dependency level on a process pool
+
+    Every job is split into blocks of SEED_BLOCK_SIZE instances, which are the
+    units of EntitySeedGenerator's RNG streams, so rows are identical for any
+    number of workers. Rows come back in instance order and are indexed in
+    parent_index by this process, for the FKs of the next levels.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        parent_index: ParentRecordIndex | None = None,
+        database_url: str | None = None,
+    ):
+        """
+        Args:
+            workers: Worker processes
+            parent_index: Records of the run (see EntitySeedGenerator)
+            database_url: Resolve FKs and group leaders from this database (prefetched
+                pools, one connection per worker) instead of parent_index
+        """
+        self.workers = workers
+        self.parent_index = parent_index
+        self.database_url = database_url
+
+    def run_level(self, jobs: list[SeedJob]) -> Iterator[tuple[SeedJob, Iterator[dict[str, Any]]]]:
+        """
+        Generate jobs whose FK targets are all in earlier levels
+
+        Yields:
+            (job, rows) in job order; rows must be consumed before the next job.
+            At most 2 blocks per worker are in flight, so memory stays flat.
+        """
+        blocks = (
+            (index, start, min(start + SEED_BLOCK_SIZE, job.count + 1))
+            for index, job in enumerate(jobs)
+            for start in range(1, job.count + 1, SEED_BLOCK_SIZE)
+        )
+        pending: deque[tuple[int, Future]] = deque()
+
+        with ProcessPoolExecutor(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(jobs, self.parent_index, self.database_url),
+        ) as pool:
+
+            def submit() -> None:
+                while len(pending) < self.workers * 2:
+                    block = next(blocks, None)
+                    if block is None:
+                        return
+                    pending.append((block[0], pool.submit(_generate_block, *block)))
+
+            def rows(index: int, job: SeedJob) -> Iterator[dict[str, Any]]:
+                while pending and pending[0][0] == index:
+                    block_rows = pending.popleft()[1].result()
+                    submit()
+                    for row in block_rows:
+                        if self.parent_index is not None:
+                            self.parent_index.add(job.entity_config, row)
+                        yield row
+
+            submit()
+            for index, job in enumerate(jobs):
+                yield job, rows(index, job)
+
+
+# Worker process state, set once per level by _init_worker
+_jobs: list[SeedJob] = []
+_parent_index: ParentRecordIndex | None = None
+_connection = None
+_generators: dict[int, EntitySeedGenerator] = {}
+
+
+def _init_worker(
+    jobs: list[SeedJob], parent_index: ParentRecordIndex | None, database_url: str | None
+) -> None:
+    global _jobs, _parent_index, _connection
+    _jobs = jobs
+    _parent_index = parent_index
+    _connection = None
+    if database_url:
+        import psycopg
+
+        # Read-only FK lookups; the worker's pool is torn down with the level
+        _connection = psycopg.connect(database_url, autocommit=True)
+    _generators.clear()
+
+
+def _generate_block(index: int, start: int, stop: int) -> list[dict[str, Any]]:
+    """Rows of instances [start, stop) of job index"""
+    job = _jobs[index]
+    generator = _generators.get(index)
+    if generator is None:
+        generator = EntitySeedGenerator(
+            job.entity_config,
+            job.field_mappings,
+            db_connection=_connection,
+            seed=job.seed,
+            prefetch_fk=_connection is not None,
+            parent_index=_parent_index,
+            columnar=job.columnar,
+        )
+        # Rows are indexed by the parent process, in instance order
+        generator.parent_index = None
+        _generators[index] = generator
+
+    return generator.generate_block(job.scenario, start, stop, job.overrides)
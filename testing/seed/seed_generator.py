@@ -1,11 +1,23 @@
 """Entity Seed Generator for SpecQL test data generation"""
 
+import random
+from collections.abc import Iterator
 from typing import Any
 
-from .field_generators import FieldValueGenerator
-from .fk_resolver import ForeignKeyResolver, GroupLeaderExecutor
+from .field_generators import COLUMN_GENERATOR_TYPES, FieldValueGenerator, derive_seed
+from .fk_resolver import (
+    ForeignKeyResolver,
+    GroupLeaderExecutor,
+    OfflineForeignKeyResolver,
+    ParentRecordIndex,
+)
 from .uuid_generator import SpecQLUUIDGenerator
 
+# Instances per deterministic RNG stream. Each (entity, scenario, block of
+# SEED_BLOCK_SIZE instances) is seeded independently from the master seed, so a
+# block generates the same rows in any process and in any order.
+SEED_BLOCK_SIZE = 1000
+
 
 class EntitySeedGenerator:
     """Generate complete entity records with all fields"""
@@ -16,16 +28,47 @@ class EntitySeedGenerator:
         field_mappings: list[dict[str, Any]],
         db_connection=None,
         seed: int | None = None,
+        prefetch_fk: bool = False,
+        parent_index: ParentRecordIndex | None = None,
+        columnar: bool = False,
     ):
+        """
+        Args:
+            entity_config: Entity metadata. With a `pk_field`, records set that column
+                to their instance number, so offline FK fields can reference it
+            prefetch_fk: Fetch FK and group leader candidates once per target and
+                sample them in-process (see ForeignKeyResolver)
+            parent_index: Records of the run, shared by all generators. Generated
+                records are added to it, and without db_connection FK fields
+                resolve from it (no database roundtrips). The entity's own
+                records are not FK candidates, so self-references resolve to None
+            columnar: Batch APIs (generate_block, iter_batch) generate fields that
+                do not depend on the row (random, fixed, sequence) as whole columns,
+                and only FK / group leader fields row by row
+        """
         self.config = entity_config
         self.field_mappings = sorted(field_mappings, key=lambda x: x["priority_order"])
+        self.seed = seed
+        self.columnar = columnar
 
         self.uuid_gen = SpecQLUUIDGenerator.from_metadata(entity_config)
-        self.field_gen = FieldValueGenerator(seed=seed)
+        self.field_gen = FieldValueGenerator()
+        self.parent_index = parent_index
+
+        # FK candidate picks, reseeded with the field values (see SEED_BLOCK_SIZE)
+        self.fk_rng = random.Random()
+        self._stream: tuple[int, int] | None = None
+        self._next: tuple[int, int] | None = None  # (scenario, instance) continuing a block
 
         if db_connection:
-            self.fk_resolver = ForeignKeyResolver(db_connection)
-            self.group_leader = GroupLeaderExecutor(db_connection)
+            options = {"prefetch": prefetch_fk, "rng": self.fk_rng, "seed": seed}
+            self.fk_resolver = ForeignKeyResolver(db_connection, **options)
+            self.group_leader = GroupLeaderExecutor(db_connection, **options)
+        elif parent_index is not None:
+            self.fk_resolver = OfflineForeignKeyResolver(
+                parent_index, self.fk_rng, exclude_entity=parent_index.register(entity_config)
+            )
+            self.group_leader = None
         else:
             self.fk_resolver = None
             self.group_leader = None
@@ -39,6 +82,72 @@ class EntitySeedGenerator:
         Returns:
             Dict with all field values
         """
+        if self.seed is not None:
+            self._select_stream(scenario, instance)
+        return self._build_record(scenario, instance, overrides)
+
+    def generate_block(
+        self, scenario: int, start: int, stop: int, overrides: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Generate the records of instances [start, stop)
+
+        With a seed, the range must lie within one SEED_BLOCK_SIZE block and start
+        at its first instance or continue the previous call: row streams (FK picks,
+        and every field without columnar) run through the block in order. Output is
+        then independent of how instances are partitioned. Column streams are seeded
+        per (entity, scenario, block, field) and advanced to the start of the range.
+
+        Raises:
+            ValueError: Seeded range that spans blocks or starts mid-block elsewhere
+        """
+        if self.seed is not None:
+            self._check_range(scenario, start, stop)
+
+        if not self.columnar:
+            return [
+                self.generate(scenario=scenario, instance=instance, overrides=overrides)
+                for instance in range(start, stop)
+            ]
+
+        if self.seed is not None:
+            self._select_stream(scenario, start)
+        block = (start - 1) // SEED_BLOCK_SIZE
+
+        columns = {}
+        for mapping in self.field_mappings:
+            field_name = mapping["field_name"]
+            if mapping["generator_type"] not in COLUMN_GENERATOR_TYPES or (
+                overrides and field_name in overrides
+            ):
+                continue
+            seed = None
+            if self.seed is not None:
+                seed = derive_seed(
+                    self.seed, self.config["entity_name"], scenario, block, field_name
+                )
+            columns[field_name] = self.field_gen.generate_column(
+                mapping,
+                stop - start,
+                start_instance=start,
+                seed=seed,
+                offset=(start - 1) % SEED_BLOCK_SIZE,
+            )
+
+        return [
+            self._build_record(scenario, instance, overrides, columns, offset)
+            for offset, instance in enumerate(range(start, stop))
+        ]
+
+    def _build_record(
+        self,
+        scenario: int,
+        instance: int,
+        overrides: dict[str, Any] | None,
+        columns: dict[str, list[Any]] | None = None,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Record of instance, taking pre-generated column values at offset"""
         entity_data = {}
         context = {"instance_num": instance}
 
@@ -46,6 +155,12 @@ class EntitySeedGenerator:
         entity_data["id"] = self.uuid_gen.generate(scenario=scenario, instance=instance)
         context["id"] = entity_data["id"]
 
+        # Explicit INTEGER pk (the instance), so children reference it without a database
+        pk_field = self.config.get("pk_field")
+        if pk_field:
+            entity_data[pk_field] = instance
+            context[pk_field] = instance
+
         # Add tenant context
         if self.config["is_tenant_scoped"]:
             entity_data["tenant_id"] = self.config["default_tenant_id"]
@@ -66,7 +181,10 @@ class EntitySeedGenerator:
                 continue
 
             # Generate value
-            value = self._generate_field_value(mapping, context)
+            if columns and field_name in columns:
+                value = columns[field_name][offset]
+            else:
+                value = self._generate_field_value(mapping, context)
 
             # Group leader returns multiple values
             if isinstance(value, dict):
@@ -76,8 +194,34 @@ class EntitySeedGenerator:
                 entity_data[field_name] = value
                 context[field_name] = value
 
+        if self.parent_index is not None:
+            self.parent_index.add(self.config, entity_data)
+
         return entity_data
 
+    def _check_range(self, scenario: int, start: int, stop: int) -> None:
+        """Reject seeded ranges whose row streams would not match a whole-block run"""
+        block = (start - 1) // SEED_BLOCK_SIZE
+        if stop > start and (stop - 2) // SEED_BLOCK_SIZE != block:
+            raise ValueError(
+                f"Instances [{start}, {stop}) span several seed blocks of {SEED_BLOCK_SIZE}"
+            )
+        if (start - 1) % SEED_BLOCK_SIZE and (scenario, start) != self._next:
+            raise ValueError(
+                f"Instances [{start}, {stop}) start mid-block without continuing the previous call"
+            )
+        self._next = (scenario, stop)
+
+    def _select_stream(self, scenario: int, instance: int) -> None:
+        """Restart the RNG streams at the first instance of each block"""
+        block = (instance - 1) // SEED_BLOCK_SIZE
+        if (scenario, block) == self._stream and (instance - 1) % SEED_BLOCK_SIZE:
+            return
+        self._stream = (scenario, block)
+        entity = self.config["entity_name"]
+        self.field_gen.reseed(derive_seed(self.seed, entity, scenario, block))
+        self.fk_rng.seed(derive_seed(self.seed, entity, scenario, block, "fk"))
+
     def _generate_field_value(self, mapping: dict[str, Any], context: dict[str, Any]) -> Any:
         """Generate value for single field"""
 
@@ -88,7 +232,7 @@ class EntitySeedGenerator:
 
         elif gen_type == "fk_resolve":
             if not self.fk_resolver:
-                raise ValueError("FK resolution requires database connection")
+                raise ValueError("FK resolution requires database connection or parent index")
             return self.fk_resolver.resolve(mapping, context)
 
         elif gen_type == "group_leader":
@@ -103,7 +247,12 @@ class EntitySeedGenerator:
         self, count: int, scenario: int = 0, overrides: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
         """Generate batch of entity records"""
-        return [
-            self.generate(scenario=scenario, instance=i + 1, overrides=overrides)
-            for i in range(count)
-        ]
+        return list(self.iter_batch(count, scenario=scenario, overrides=overrides))
+
+    def iter_batch(
+        self, count: int, scenario: int = 0, overrides: dict[str, Any] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Generate entity records lazily, block by block (flat memory for streaming writers)"""
+        for start in range(1, count + 1, SEED_BLOCK_SIZE):
+            stop = min(start + SEED_BLOCK_SIZE, count + 1)
+            yield from self.generate_block(scenario, start, stop, overrides)
@@ -1,10 +1,17 @@
 """SQL File Generator for SpecQL seed data generation"""
 
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from typing import Any
 
 from .uuid_generator import SpecQLUUID
 
+# Output modes of SeedSQLGenerator.stream_file
+STREAM_MODES = ("insert", "copy", "copy_csv")
+
+# Characters escaped in COPY text format
+_COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
 
 class SeedSQLGenerator:
     """Generate SQL INSERT statements from entity data"""
@@ -48,6 +55,134 @@ class SeedSQLGenerator:
 
         return "\n".join(lines)
 
+    def stream_file(
+        self,
+        rows: Iterable[dict[str, Any]],
+        scenario: int = 0,
+        description: str | None = None,
+        mode: str = "insert",
+        rows_per_insert: int = 1,
+    ) -> Iterator[str]:
+        """
+        Stream a seed file chunk by chunk, consuming rows lazily
+
+        Memory stays flat in the number of rows, so the record count moves to a
+        trailing comment.
+
+        Args:
+            rows: Entity records (typically EntitySeedGenerator.iter_batch)
+            mode: "insert" (INSERT ... VALUES), "copy" (COPY FROM STDIN text format)
+                or "copy_csv" (COPY FROM STDIN CSV), all loadable with psql
+            rows_per_insert: Rows per multi-row VALUES statement in insert mode
+
+        Yields:
+            Newline-terminated chunks of the file
+        """
+        if mode not in STREAM_MODES:
+            raise ValueError(f"Unknown seed output mode: {mode}")
+
+        yield (
+            f"-- Seed data for {self.config['entity_name']}\n"
+            f"-- Schema: {self.schema}\n"
+            f"-- Scenario: {scenario} ({description or 'default'})\n"
+            f"-- Generated: {datetime.now().isoformat()}\n\n"
+        )
+
+        counter = _Counter(rows)
+        if mode == "insert":
+            for statement in self.iter_inserts(counter, rows_per_insert):
+                yield statement + "\n"
+        else:
+            yield from self.iter_copy(counter, csv=mode == "copy_csv")
+
+        sync_identity = self.sync_identity_sql()
+        if sync_identity:
+            yield f"\n{sync_identity}\n"
+        yield f"\n-- Record count: {counter.count}\n"
+
+    def iter_inserts(
+        self, rows: Iterable[dict[str, Any]], rows_per_insert: int = 1
+    ) -> Iterator[str]:
+        """INSERT statements with up to rows_per_insert rows in their VALUES list"""
+        if rows_per_insert <= 1:
+            for entity_data in rows:
+                yield self.generate_insert(entity_data)
+            return
+
+        for columns, chunk in _chunks(rows, rows_per_insert):
+            values = ",\n".join(
+                f"    ({', '.join(self._format_value(v) for v in row.values())})" for row in chunk
+            )
+            yield f"INSERT INTO {self.schema}.{self.table} ({', '.join(columns)}) VALUES\n{values};"
+
+    def iter_copy(self, rows: Iterable[dict[str, Any]], csv: bool = False) -> Iterator[str]:
+        """`COPY ... FROM STDIN` blocks (one per column set) with their data lines"""
+        options = " WITH (FORMAT csv)" if csv else ""
+        format_row = self._format_copy_csv if csv else self._format_copy_text
+        for columns, chunk in _chunks(rows):
+            yield f"COPY {self.schema}.{self.table} ({', '.join(columns)}) FROM STDIN{options};\n"
+            for row in chunk:
+                yield format_row(row.values()) + "\n"
+            yield "\\.\n"
+
+    def copy_to(self, connection, rows: Iterable[dict[str, Any]]) -> int:
+        """
+        Bulk load rows with psycopg `cursor.copy()`, streaming them to the server
+
+        Returns:
+            Number of rows loaded
+        """
+        count = 0
+        with connection.cursor() as cursor:
+            for columns, chunk in _chunks(rows):
+                statement = f"COPY {self.schema}.{self.table} ({', '.join(columns)}) FROM STDIN"
+                with cursor.copy(statement) as copy:
+                    for row in chunk:
+                        copy.write(self._format_copy_text(row.values()) + "\n")
+                        count += 1
+            sync_identity = self.sync_identity_sql()
+            if sync_identity:
+                cursor.execute(sync_identity)
+        return count
+
+    def sync_identity_sql(self) -> str | None:
+        """
+        Statement moving the pk identity past explicitly seeded pks
+
+        Records carry the `pk_field` of the entity config when generated for
+        offline FK resolution; later inserts would otherwise reuse those pks.
+        """
+        pk_field = self.config.get("pk_field")
+        if not pk_field:
+            return None
+        table = f"{self.schema}.{self.table}"
+        return (
+            f"SELECT setval(pg_get_serial_sequence('{table}', '{pk_field}'), "
+            f"(SELECT max({pk_field}) FROM {table}));"
+        )
+
+    def _format_copy_text(self, values: Iterable[Any]) -> str:
+        """Data line in COPY text format (tab separated, \\N for NULL)"""
+        return "\t".join(
+            "\\N" if value is None else self._copy_value(value).translate(_COPY_TEXT_ESCAPES)
+            for value in values
+        )
+
+    def _format_copy_csv(self, values: Iterable[Any]) -> str:
+        """Data line in COPY CSV format (unquoted empty for NULL, quoted values)"""
+        return ",".join(
+            "" if value is None else '"' + self._copy_value(value).replace('"', '""') + '"'
+            for value in values
+        )
+
+    def _copy_value(self, value: Any) -> str:
+        """Format Python value as COPY input text"""
+        if isinstance(value, bool):
+            return "t" if value else "f"
+        elif isinstance(value, datetime):
+            return value.isoformat()
+        return str(value)
+
     def _format_value(self, value: Any) -> str:
         """Format Python value as SQL literal"""
         if value is None:
@@ -67,3 +202,43 @@ class SeedSQLGenerator:
         else:
             # Fallback for unknown types
             return f"'{value}'"
+
+
+class _Counter:
+    """Iterable wrapper counting the rows consumed"""
+
+    def __init__(self, rows: Iterable[dict[str, Any]]):
+        self.rows = rows
+        self.count = 0
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for row in self.rows:
+            self.count += 1
+            yield row
+
+
+def _chunks(
+    rows: Iterable[dict[str, Any]], size: int | None = None
+) -> Iterator[tuple[tuple[str, ...], Iterator[dict[str, Any]]]]:
+    """
+    Split rows lazily into runs sharing the same columns, of at most size rows
+
+    Each run must be consumed before the next one is requested.
+    """
+    rows = iter(rows)
+    following = [next(rows, None)]  # First row of the next run
+
+    def run(columns: tuple[str, ...]) -> Iterator[dict[str, Any]]:
+        row, following[0] = following[0], None
+        count = 0
+        while row is not None:
+            yield row
+            count += 1
+            row = next(rows, None)
+            if row is not None and (count == size or tuple(row) != columns):
+                following[0] = row
+                return
+
+    while following[0] is not None:
+        columns = tuple(following[0])
+        yield columns, run(columns)
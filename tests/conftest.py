@@ -89,6 +89,13 @@ def temp_output_dir(tmp_path: Path) -> Path:
     return output_dir
 
 
+@pytest.fixture(autouse=True)
+def isolated_parse_cache(tmp_path: Path, monkeypatch):
+    """Keep `reverse` parse cache entries out of the user's cache directory"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache" / "specql" / "reverse"
+
+
 @pytest.fixture
 def isolated_logger():
     """Create logger that works with Click CliRunner."""
@@ -223,9 +223,9 @@ def test_refresh_table_view_batch_scope_compilation():
     action = entity.actions[0]
     sql = generator.generate_custom_action(entity, action)
 
-    # Verify the generated SQL contains the queue INSERT
-    assert "INSERT INTO pg_temp.tv_refresh_queue VALUES ('Review', v_pk_review);" in sql
-    assert "-- Queue for batch refresh (deferred)" in sql
+    # Verify the generated SQL queues the refresh
+    assert "PERFORM app.enqueue_tv_refresh('Review', v_pk_review);" in sql
+    assert "-- Queue for batch refresh (deferred, drained once at commit)" in sql
 
 
 def test_mutation_result_returns_tv_data():
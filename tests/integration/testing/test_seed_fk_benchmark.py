@@ -0,0 +1,77 @@
+"""
+Performance benchmark: per-value FK resolution vs prefetched candidate pools
+
+Seeds child rows with three FK fields against parent tables of PARENT_ROWS rows
+and compares rows/sec of the per-value `ORDER BY RANDOM() LIMIT 1` path with
+pools fetched once per target (full read, and TABLESAMPLE).
+"""
+
+import random
+import time
+
+import pytest
+
+from testing.seed.fk_resolver import ForeignKeyResolver
+
+# Mark all tests as requiring database
+pytestmark = [pytest.mark.database, pytest.mark.benchmark]
+
+PARENT_ROWS = 20_000
+CHILD_ROWS = 500
+FK_TARGETS = ["tb_company", "tb_product", "tb_warehouse"]
+
+
+def _rows_per_second(resolver: ForeignKeyResolver, mappings: list[dict]) -> tuple[float, set]:
+    """Child rows/sec resolving every FK field, with the values picked"""
+    picked = set()
+    start = time.perf_counter()
+    for _ in range(CHILD_ROWS):
+        for mapping in mappings:
+            picked.add(resolver.resolve(mapping, {}))
+    return CHILD_ROWS / (time.perf_counter() - start), picked
+
+
+@pytest.mark.integration
+def test_prefetched_pools_vs_per_value_queries(test_db, isolated_schema):
+    """Benchmark: pools cost one query per target instead of one sort per value"""
+    cursor = test_db.cursor()
+    for table in FK_TARGETS:
+        pk = f"pk_{table[3:]}"
+        cursor.execute(
+            f"""
+            CREATE TABLE {isolated_schema}.{table} (
+                {pk} INTEGER PRIMARY KEY,
+                deleted_at TIMESTAMPTZ
+            );
+            INSERT INTO {isolated_schema}.{table} ({pk})
+            SELECT i FROM generate_series(1, {PARENT_ROWS}) i;
+            ANALYZE {isolated_schema}.{table};
+            """
+        )
+    test_db.commit()
+
+    mappings = [
+        {
+            "fk_target_schema": isolated_schema,
+            "fk_target_table": table,
+            "fk_target_pk_field": f"pk_{table[3:]}",
+        }
+        for table in FK_TARGETS
+    ]
+
+    per_value_rate, per_value = _rows_per_second(ForeignKeyResolver(test_db), mappings)
+    pooled = ForeignKeyResolver(test_db, prefetch=True, rng=random.Random(42))
+    pooled_rate, pooled_values = _rows_per_second(pooled, mappings)
+    sampled = ForeignKeyResolver(test_db, prefetch=True, sample_percent=10, rng=random.Random(42))
+    sampled_rate, sampled_values = _rows_per_second(sampled, mappings)
+
+    print(
+        f"\n{CHILD_ROWS} rows x {len(FK_TARGETS)} FKs over {PARENT_ROWS} parents: "
+        f"per-value {per_value_rate:,.0f} rows/s, pooled {pooled_rate:,.0f} rows/s, "
+        f"TABLESAMPLE pooled {sampled_rate:,.0f} rows/s"
+    )
+
+    assert pooled.pools.queries == sampled.pools.queries == len(FK_TARGETS)
+    for values in (per_value, pooled_values, sampled_values):
+        assert values <= set(range(1, PARENT_ROWS + 1))
+    assert pooled_rate > per_value_rate
@@ -1,4 +1,5 @@
 # tests/unit/cli/commands/reverse/test_sql_integration.py
+import re
 import sys
 from pathlib import Path
 
@@ -597,3 +598,87 @@ def test_reverse_sql_detects_info_instance_pairs(cli_runner):
         # Should create YAML files (basic integration test)
         yaml_files = list(Path("out/").glob("*.yaml"))
         assert len(yaml_files) > 0
+
+
+def test_reverse_sql_workers_output_matches_serial(cli_runner):
+    """Parsing files on worker processes should not change the output."""
+    from cli.main import app
+
+    files = {
+        "contact.sql": """
+        CREATE TABLE crm.tb_contact (
+            pk_contact INTEGER PRIMARY KEY,
+            email TEXT NOT NULL,
+            fk_company INTEGER
+        );
+        COMMENT ON TABLE crm.tb_contact IS 'Customer contacts';
+        """,
+        "company.sql": """
+        CREATE TABLE crm.tb_company (
+            pk_company INTEGER PRIMARY KEY,
+            name TEXT NOT NULL
+        );
+        """,
+        "constraints.sql": """
+        ALTER TABLE ONLY crm.tb_contact ADD CONSTRAINT fk_contact_company
+            FOREIGN KEY (fk_company) REFERENCES crm.tb_company(pk_company);
+        """,
+    }
+
+    with cli_runner.isolated_filesystem():
+        for name, sql in files.items():
+            Path(name).write_text(sql)
+
+        outputs = {}
+        for workers in ("1", "2"):
+            result = cli_runner.invoke(
+                app,
+                ["reverse", "sql", *files, "-o", f"out{workers}/", "-j", workers, "--no-cache"],
+            )
+            assert result.exit_code == 0
+            outputs[workers] = (
+                result.output.replace(f"out{workers}", "out"),
+                {
+                    p.name: re.sub(r"\d{4}-\d\d-\d\dT[\d:.]+", "<timestamp>", p.read_text())
+                    for p in Path(f"out{workers}").rglob("*.yaml")
+                },
+            )
+
+        assert outputs["1"] == outputs["2"]
+        assert "ref(Company)" in outputs["2"][1]["contact.yaml"]
+
+
+def test_reverse_sql_reuses_cached_parses(cli_runner, isolated_parse_cache, monkeypatch):
+    """A second run should reuse the parse products of unchanged files."""
+    from cli.main import app
+    from reverse_engineering.sql_file_parser import SQLFileParser
+
+    with cli_runner.isolated_filesystem():
+        Path("contact.sql").write_text(
+            "CREATE TABLE crm.tb_contact (pk_contact INTEGER PRIMARY KEY, email TEXT);"
+        )
+        Path("company.sql").write_text(
+            "CREATE TABLE crm.tb_company (pk_company INTEGER PRIMARY KEY, name TEXT);"
+        )
+        args = ["reverse", "sql", "contact.sql", "company.sql", "-o", "out/"]
+        first = cli_runner.invoke(app, args)
+        assert first.exit_code == 0
+        assert len(list(isolated_parse_cache.glob("sql-*.pickle"))) == 2
+
+        parsed = []
+        parse_file = SQLFileParser.parse_file
+        monkeypatch.setattr(
+            SQLFileParser,
+            "parse_file",
+            lambda self, path: parsed.append(path.name) or parse_file(self, path),
+        )
+        Path("company.sql").write_text(
+            "CREATE TABLE crm.tb_company (pk_company INTEGER PRIMARY KEY, label TEXT);"
+        )
+        second = cli_runner.invoke(app, args)
+        assert second.exit_code == 0
+        assert parsed == ["company.sql"]
+        assert "label" in next(Path("out").rglob("company.yaml")).read_text()
+
+        cli_runner.invoke(app, [*args, "--no-cache"])
+        assert parsed == ["company.sql", "contact.sql", "company.sql"]
@@ -111,3 +111,64 @@ def test_generate_help_shows_all_options():
     assert "--actions-only" in result.output
     assert "--frontend" in result.output
     assert "--tests" in result.output
+
+
+def test_generate_audit_retention_requires_partitioned_audit_log():
+    """--audit-retention is only valid with a partitioned audit log."""
+    from cli.main import app
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        Path("entity.yaml").write_text("entity: Test\nfields:\n  name: text")
+        result = runner.invoke(app, ["generate", "entity.yaml", "--audit-retention", "6 months"])
+
+        assert result.exit_code != 0
+        assert "--audit-log-partitioned" in result.output
+
+
+def test_generate_delta_from_snapshot():
+    """--delta-from writes delta.sql and a snapshot; a rerun has no changes."""
+    from cli.main import app
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        Path("entity.yaml").write_text("entity: Book\nschema: library\nfields:\n  title: text")
+        args = ["generate", "entity.yaml", "--delta-from", "migrations/schema_snapshot.json"]
+
+        first = runner.invoke(app, args)
+        assert first.exit_code == 0
+        assert "No snapshot at" in first.output
+        assert "CREATE TABLE library.tb_book" in Path("migrations/delta.sql").read_text()
+        assert Path("migrations/schema_snapshot.json").exists()
+
+        second = runner.invoke(app, args)
+        assert second.exit_code == 0
+        assert "Delta migration: 0 statement(s)" in second.output
+
+
+def test_generate_advise_indexes():
+    """--advise-indexes writes advised_indexes.sql with the workload behind each index."""
+    from cli.main import app
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        Path("entity.yaml").write_text(
+            "entity: Book\n"
+            "schema: library\n"
+            "fields:\n"
+            "  title: text\n"
+            "  genre: text\n"
+            "table_views:\n"
+            "  mode: force\n"
+            "  extra_filter_columns: [genre]\n"
+        )
+        result = runner.invoke(app, ["generate", "entity.yaml", "--include-tv", "--advise-indexes"])
+
+        assert result.exit_code == 0
+        advice = Path("migrations/advised_indexes.sql").read_text()
+        assert "-- FraiseQL filter library.tv_book.genre: tenant_id = ? AND genre = ?" in advice
+        assert (
+            "CREATE INDEX idx_tv_book_tenant_id_genre ON library.tv_book (tenant_id, genre);"
+            in (advice)
+        )
+        assert "Index advice: 1 index(es) proposed" in result.output
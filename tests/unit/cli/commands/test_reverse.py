@@ -271,74 +271,6 @@ def test_reverse_sql_creates_output_directory(cli_runner, sample_sql_ddl):
         assert Path("new_output").exists()
 
 
-# ==============================================================================
-# Reverse SQL - Statement Extraction Tests
-# ==============================================================================
-
-
-def test_extract_statements_finds_create_table():
-    """_extract_statements should find CREATE TABLE statements."""
-    from cli.commands.reverse.sql import _extract_statements
-
-    sql = """
-    CREATE TABLE crm.tb_contact (
-        pk_contact SERIAL PRIMARY KEY,
-        email TEXT NOT NULL
-    );
-    """
-
-    tables, functions, alters = _extract_statements(sql)
-
-    assert len(tables) == 1
-    assert "CREATE TABLE" in tables[0]
-    assert "crm.tb_contact" in tables[0]
-
-
-def test_extract_statements_finds_multiple_tables():
-    """_extract_statements should find multiple CREATE TABLE statements."""
-    from cli.commands.reverse.sql import _extract_statements
-
-    sql = """
-    CREATE TABLE crm.tb_contact (pk_contact SERIAL PRIMARY KEY);
-
-    CREATE TABLE crm.tb_task (pk_task SERIAL PRIMARY KEY);
-    """
-
-    tables, functions, alters = _extract_statements(sql)
-
-    assert len(tables) == 2
-
-
-def test_extract_statements_finds_alter_table_fk():
-    """_extract_statements should find ALTER TABLE FOREIGN KEY statements."""
-    from cli.commands.reverse.sql import _extract_statements
-
-    sql = """
-    ALTER TABLE crm.tb_contact ADD CONSTRAINT fk_contact_company
-        FOREIGN KEY (fk_company) REFERENCES management.tb_organization(pk_organization);
-    """
-
-    tables, functions, alters = _extract_statements(sql)
-
-    assert len(alters) == 1
-    assert "FOREIGN KEY" in alters[0]
-
-
-def test_extract_statements_handles_if_not_exists():
-    """_extract_statements should handle IF NOT EXISTS clause."""
-    from cli.commands.reverse.sql import _extract_statements
-
-    sql = """
-    CREATE TABLE IF NOT EXISTS crm.tb_contact (
-        pk_contact SERIAL PRIMARY KEY
-    );
-    """
-
-    tables, functions, alters = _extract_statements(sql)
-
-    assert len(tables) == 1
-
-
 # ==============================================================================
 # Reverse Project Tests
 # ==============================================================================
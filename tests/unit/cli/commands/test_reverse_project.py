@@ -215,6 +215,26 @@ CREATE TABLE crm.tb_contact (
         assert len(contact_files) > 0, f"Expected contact.yaml, found: {yaml_files}"
 
 
+def test_reverse_project_no_cache_bypasses_parse_cache(runner, tmp_path, isolated_parse_cache):
+    """--no-cache reaches the language command: nothing is read from or written to the cache"""
+    project = tmp_path / "myproject"
+    project.mkdir()
+    (project / "contact.sql").write_text(
+        "CREATE TABLE crm.tb_contact (pk_contact INTEGER PRIMARY KEY, email TEXT);"
+    )
+
+    args = ["reverse", "project", str(project), "-o", str(tmp_path / "output")]
+    result = runner.invoke(app, [*args, "--no-cache"])
+
+    assert result.exit_code == 0
+    assert not list(isolated_parse_cache.glob("sql-*.pickle"))
+
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 0
+    assert len(list(isolated_parse_cache.glob("sql-*.pickle"))) == 1
+
+
 def test_reverse_sql_project_root_files(runner):
     """Reverse engineering a SQL project with .sql files in root."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -46,6 +46,43 @@ actions:
         assert "has_table(" in content
         assert "qualify_lead" in content
 
+    def test_generate_pgtap_shards(self, runner, sample_entity, tmp_path):
+        """Test --shards writes balanced shard files and a cost manifest"""
+        import json
+
+        company = tmp_path / "company.yaml"
+        company.write_text("entity: Company\nschema: crm\nfields:\n  name: text\n")
+        output_dir = tmp_path / "tests"
+        result = runner.invoke(
+            app,
+            [
+                "test",
+                "generate",
+                str(sample_entity),
+                str(company),
+                "-o",
+                str(output_dir),
+                "--type",
+                "pgtap",
+                "--shards",
+                "2",
+            ],
+        )
+
+        assert result.exit_code == 0
+        pgtap_dir = output_dir / "pgtap"
+        assert sorted(p.name for p in pgtap_dir.iterdir()) == [
+            "shards.json",
+            "test_shard_001.sql",
+            "test_shard_002.sql",
+        ]
+        manifest = json.loads((pgtap_dir / "shards.json").read_text())
+        assert [s["blocks"][0]["entity"] for s in manifest["shards"]] == ["Contact", "Company"]
+        shard = (pgtap_dir / "test_shard_001.sql").read_text()
+        assert shard.count("BEGIN;") == 1
+        assert "SELECT plan(" not in shard
+        assert "ROLLBACK TO SAVEPOINT block_4;" in shard
+
     def test_generate_pytest_tests(self, runner, sample_entity, tmp_path):
         """Test pytest test file generation"""
         output_dir = tmp_path / "tests"
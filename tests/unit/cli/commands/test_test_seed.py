@@ -1,5 +1,8 @@
 """Tests for specql test seed command"""
 
+import json
+import re
+
 import pytest
 from click.testing import CliRunner
 
@@ -92,6 +95,49 @@ fields:
         seed_file = output_dir / "seed_contact.json"
         assert seed_file.exists()
 
+    def test_seed_copy_format(self, runner, sample_entity, tmp_path):
+        """Test COPY output streams rows as COPY FROM STDIN data lines"""
+        output_dir = tmp_path / "seeds"
+        result = runner.invoke(
+            app,
+            ["test", "seed", str(sample_entity), "-o", str(output_dir), "--format", "copy"],
+        )
+
+        assert result.exit_code == 0
+        lines = (output_dir / "seed_contact.sql").read_text().splitlines()
+        start = lines.index(
+            "COPY crm.tb_contact (id, pk_contact, email, first_name, last_name, status) FROM STDIN;"
+        )
+        assert lines[start + 11] == "\\."
+        assert lines[start + 13].startswith("SELECT setval(pg_get_serial_sequence(")
+        assert lines[-1] == "-- Record count: 10"
+
+    def test_seed_workers_produce_identical_output(self, runner, sample_entity, tmp_path):
+        """Test --workers splits generation without changing deterministic output"""
+        contents = []
+        for workers in ("1", "2"):
+            output_dir = tmp_path / f"seeds{workers}"
+            result = runner.invoke(
+                app,
+                [
+                    "test",
+                    "seed",
+                    str(sample_entity),
+                    "-o",
+                    str(output_dir),
+                    "--count",
+                    "1200",
+                    "--deterministic",
+                    "--workers",
+                    workers,
+                ],
+            )
+            assert result.exit_code == 0
+            content = (output_dir / "seed_contact.sql").read_text()
+            contents.append([line for line in content.splitlines() if "Generated:" not in line])
+
+        assert contents[0] == contents[1]
+
     def test_seed_scenario_parameter(self, runner, sample_entity, tmp_path):
         """Test scenario parameter affects UUID generation"""
         output_dir = tmp_path / "seeds"
@@ -143,3 +189,89 @@ fields:
         # Company should be seeded before Contact
         assert (output_dir / "seed_company.sql").exists()
         assert (output_dir / "seed_contact.sql").exists()
+        company_sql = (output_dir / "seed_company.sql").read_text()
+        contact_sql = (output_dir / "seed_contact.sql").read_text()
+        # Contacts reference the pks of companies generated in the same run, no database needed
+        company_pks = set(
+            re.findall(
+                r"INSERT INTO crm\.tb_company \(id, pk_company, .*?VALUES \('[^']+', (\d+),",
+                company_sql,
+            )
+        )
+        assert company_pks == {str(pk) for pk in range(1, 11)}
+        contact_fks = re.findall(
+            r"INSERT INTO crm\.tb_contact \(id, pk_contact, email, fk_company\) VALUES \(.*, (\d+)\);",
+            contact_sql,
+        )
+        assert len(contact_fks) == 10
+        assert set(contact_fks) <= company_pks
+
+    def test_seed_columns_match_generated_ddl(self, runner, table_generator, tmp_path):
+        """Seeded columns exist in the generated tables, ref fields as INTEGER fk_<field> pks"""
+        import pglast
+
+        from core.specql_parser import SpecQLParser
+
+        company_file = tmp_path / "company.yaml"
+        company_file.write_text("entity: Company\nschema: crm\nfields:\n  name: text\n")
+        contact_file = tmp_path / "contact.yaml"
+        contact_file.write_text(
+            "entity: Contact\nschema: crm\nfields:\n  email: text\n  company: ref(Company)\n"
+        )
+
+        output_dir = tmp_path / "seeds"
+        result = runner.invoke(
+            app,
+            ["test", "seed", str(company_file), str(contact_file), "-o", str(output_dir)]
+            + ["--format", "json", "-n", "3"],
+        )
+        assert result.exit_code == 0
+
+        for entity_file in (company_file, contact_file):
+            entity = SpecQLParser().parse(entity_file.read_text())
+            create = pglast.parse_sql(table_generator.generate_table_ddl(entity))[0].stmt
+            column_types = {
+                element.colname: element.typeName.names[-1].sval
+                for element in create.tableElts
+                if isinstance(element, pglast.ast.ColumnDef)
+            }
+            records = json.loads((output_dir / f"seed_{entity.name.lower()}.json").read_text())
+
+            for record in records:
+                assert set(record) <= set(column_types)
+            if entity.name == "Contact":
+                assert column_types["fk_company"] == "int4"
+                assert all(isinstance(record["fk_company"], int) for record in records)
+
+    def test_database_url_resolves_refs_from_the_database(self, monkeypatch):
+        """With --database-url, refs are pks read from the loaded parent table"""
+        from unittest.mock import MagicMock
+
+        import psycopg
+
+        from cli.commands.test.seed import _serial_streams
+        from core.specql_parser import SpecQLParser
+
+        connections = []
+
+        def connect(url, **kwargs):
+            connection = MagicMock()
+            connection.execute.return_value.fetchall.return_value = [(101,), (102,)]
+            connections.append(connection)
+            return connection
+
+        monkeypatch.setattr(psycopg, "connect", connect)
+        parser = SpecQLParser()
+        company = parser.parse("entity: Company\nschema: crm\nfields:\n  name: text\n")
+        contact = parser.parse("entity: Contact\nschema: sales\nfields:\n  company: ref(Company)\n")
+
+        streams = _serial_streams(
+            [[company], [contact]], 5, 0, 42, None, database_url="postgresql://test"
+        )
+        records = {entity.name: list(rows) for entity, _, rows in streams}
+
+        assert all("pk_company" not in record for record in records["Company"])
+        assert {record["fk_company"] for record in records["Contact"]} <= {101, 102}
+        ((query,),) = {call.args for call in connections[0].execute.call_args_list}
+        assert query.startswith("SELECT pk_company FROM crm.tb_company ")
+        assert connections[0].close.called
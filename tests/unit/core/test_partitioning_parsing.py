@@ -0,0 +1,124 @@
+"""Tests for partitioning configuration parsing."""
+
+import pytest
+
+from core.ast_models import PartitionStrategy
+from core.exceptions import SpecQLValidationError
+from core.specql_parser import SpecQLParser
+
+
+class TestPartitioningParsing:
+    """Test parsing partitioning configuration."""
+
+    def setup_method(self):
+        self.parser = SpecQLParser()
+
+    def test_parse_range_partitioning(self):
+        """Test parsing range partitioning with interval and retention."""
+        yaml_content = """
+entity: Event
+schema: analytics
+fields:
+  occurred_at: datetime
+
+partitioning:
+  strategy: range
+  key: occurred_at
+  interval: day
+  premake: 7
+  retention: 90 days
+"""
+
+        entity = self.parser.parse(yaml_content)
+        assert entity.partitioning.strategy == PartitionStrategy.RANGE
+        assert entity.partitioning.key == "occurred_at"
+        assert entity.partitioning.interval == "day"
+        assert entity.partitioning.premake == 7
+        assert entity.partitioning.retention == "90 days"
+
+    def test_parse_range_defaults_on_created_at(self):
+        """Test created_at is accepted as an implicit range key."""
+        yaml_content = """
+entity: Event
+schema: analytics
+fields:
+  name: text
+
+partitioning:
+  strategy: range
+  key: created_at
+"""
+
+        entity = self.parser.parse(yaml_content)
+        assert entity.partitioning.interval == "month"
+        assert entity.partitioning.premake == 3
+        assert entity.partitioning.retention is None
+
+    def test_parse_list_partitioning(self):
+        """Test parsing list partitioning values."""
+        yaml_content = """
+entity: Order
+schema: sales
+fields:
+  region: text
+
+partitioning:
+  strategy: list
+  key: region
+  values:
+    eu: [FR, DE]
+    us: [US]
+"""
+
+        entity = self.parser.parse(yaml_content)
+        assert entity.partitioning.strategy == PartitionStrategy.LIST
+        assert entity.partitioning.values == {"eu": ["FR", "DE"], "us": ["US"]}
+
+    def test_parse_hash_partitioning_on_tenant_id(self):
+        """Test parsing hash partitioning on the implicit tenant_id column."""
+        yaml_content = """
+entity: Order
+schema: sales
+fields:
+  name: text
+
+partitioning:
+  strategy: hash
+  key: tenant_id
+  partitions: 16
+"""
+
+        entity = self.parser.parse(yaml_content)
+        assert entity.partitioning.strategy == PartitionStrategy.HASH
+        assert entity.partitioning.partitions == 16
+
+    def test_no_partitioning_by_default(self):
+        """Test entities without a partitioning block are not partitioned."""
+        entity = self.parser.parse("entity: Order\nschema: sales\nfields:\n  name: text\n")
+        assert entity.partitioning is None
+
+    @pytest.mark.parametrize(
+        "block, message",
+        [
+            ("strategy: interval\n  key: created_at", "Invalid partitioning.strategy"),
+            ("strategy: range\n  key: missing", "partitioning.key 'missing'"),
+            ("strategy: range\n  key: name", "requires a date or timestamp key"),
+            ("strategy: range\n  key: created_at\n  interval: hour", "partitioning.interval"),
+            ("strategy: list\n  key: name", "requires partitioning.values"),
+            ("strategy: hash\n  key: tenant_id\n  partitions: 1", "partitioning.partitions"),
+        ],
+    )
+    def test_invalid_partitioning_rejected(self, block, message):
+        """Test invalid partitioning blocks raise validation errors."""
+        yaml_content = f"""
+entity: Order
+schema: sales
+fields:
+  name: text
+
+partitioning:
+  {block}
+"""
+
+        with pytest.raises(SpecQLValidationError, match=message):
+            self.parser.parse(yaml_content)
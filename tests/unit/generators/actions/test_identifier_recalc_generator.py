@@ -0,0 +1,82 @@
+"""
+Unit tests for IdentifierRecalcGenerator
+
+Tests subtree-scoped hierarchical identifier recalculation.
+"""
+
+import pglast
+
+from core.ast_models import Entity, FieldDefinition
+from generators.actions.identifier_recalc_generator import IdentifierRecalcGenerator
+
+
+class TestHierarchicalIdentifierRecalc:
+    """Test the hierarchical recalculation function"""
+
+    def setup_method(self):
+        """Generate the recalculation function for a hierarchical entity"""
+        entity = Entity(
+            name="Category",
+            schema="catalog",
+            fields={"name": FieldDefinition(name="name", type_name="text")},
+            hierarchical=True,
+        )
+        self.sql = IdentifierRecalcGenerator().generate_recalc_function(entity)
+
+    def test_accepts_batch_of_changed_pks(self):
+        """Test the function takes a batch of changed pks next to the context"""
+        assert "p_pks INTEGER[] DEFAULT NULL" in self.sql
+        assert "v_root_pks := p_pks;" in self.sql
+        assert "WHERE id = ctx.pk;" in self.sql
+
+    def test_drops_single_argument_overload(self):
+        """Test the old (ctx) signature is dropped before the batched one is created"""
+        drop = (
+            "DROP FUNCTION IF EXISTS catalog.recalculate_category_identifier(\n"
+            "    core.recalculation_context\n);"
+        )
+        assert drop in self.sql
+        assert self.sql.index(drop) < self.sql.index("CREATE OR REPLACE FUNCTION")
+
+    def test_nested_roots_collapsed_via_parents(self):
+        """Test roots inside another root's subtree are recomputed only once"""
+        assert "r.path" not in self.sql  # No path column to compare
+        assert "WITH RECURSIVE ancestors AS (" in self.sql
+        assert "WHERE a.pk_category = r.fk_parent_category" in self.sql
+        assert "WHERE ancestors.pk_category = ANY(v_root_pks)" in self.sql
+
+    def test_nested_roots_collapsed_via_path(self):
+        """Test entities with an ltree path find nested roots by path containment"""
+        entity = Entity(
+            name="Category",
+            schema="catalog",
+            fields={
+                "name": FieldDefinition(name="name", type_name="text"),
+                "path": FieldDefinition(name="path", type_name="ltree"),
+            },
+            hierarchical=True,
+        )
+        sql = IdentifierRecalcGenerator().generate_recalc_function(entity)
+
+        assert "AND r.path <@ a.path" in sql
+        assert "AND a.pk_category <> r.pk_category" in sql
+        assert "ancestors" not in sql
+
+    def test_subtree_roots_seeded_from_parent_identifier(self):
+        """Test scoped roots continue from their parent's stored identifier"""
+        assert "LEFT JOIN catalog.tb_category p" in self.sql
+        assert "ELSE p.base_identifier || '.' || public.safe_slug(t.name)" in self.sql
+        assert "WHEN v_root_pks IS NOT NULL THEN t.pk_category = ANY(v_root_pks)" in self.sql
+
+    def test_full_rebuild_only_without_scope(self):
+        """Test whole-table recalculation remains the unscoped fallback"""
+        assert "ELSE t.fk_parent_category IS NULL" in self.sql
+        assert "t.tenant_id = ctx.pk_tenant" in self.sql
+
+    def test_child_components_use_child_alias(self):
+        """Test recursive rows build identifiers from the child row"""
+        assert "parent.base_identifier || '.' || public.safe_slug(child.name)" in self.sql
+
+    def test_generated_sql_parses(self):
+        """Test the generated function is valid SQL"""
+        pglast.parse_sql(self.sql)
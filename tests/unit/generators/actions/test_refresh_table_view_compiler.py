@@ -198,8 +198,8 @@ class TestRefreshTableViewStepCompiler:
 
         # Verify
         expected = """
-    -- Queue for batch refresh (deferred)
-    INSERT INTO pg_temp.tv_refresh_queue VALUES ('Review', v_pk_review);
+    -- Queue for batch refresh (deferred, drained once at commit)
+    PERFORM app.enqueue_tv_refresh('Review', v_pk_review);
 """.strip()
 
         assert result == expected
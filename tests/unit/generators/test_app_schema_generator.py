@@ -2,7 +2,7 @@
 
 import pytest
 
-from generators.app_schema_generator import AppSchemaGenerator
+from generators.app_schema_generator import AppSchemaGenerator, AuditLogConfig
 
 
 class TestAppSchemaGenerator:
@@ -61,3 +61,53 @@ name: status
 type: String!
 required: true';"""
         assert expected_status_comment in sql
+
+
+class TestAuditLogOptions:
+    """Test audit log foundation options"""
+
+    def test_default_audit_log_is_heap_with_btree(self):
+        """Default audit log keeps the single-table layout"""
+        sql = AppSchemaGenerator()._generate_audit_log_table()
+
+        assert "id UUID PRIMARY KEY DEFAULT gen_random_uuid()" in sql
+        assert "PARTITION BY" not in sql
+        assert "ON app.tb_mutation_audit_log(created_at);" in sql
+
+    def test_partitioned_audit_log(self):
+        """Partitioned audit log is range-partitioned by month with BRIN on created_at"""
+        generator = AppSchemaGenerator(audit_log=AuditLogConfig(partitioned=True))
+        sql = generator._generate_audit_log_table()
+
+        assert "PRIMARY KEY (id, created_at)" in sql
+        assert ") PARTITION BY RANGE (created_at);" in sql
+        assert "ON app.tb_mutation_audit_log USING brin (created_at);" in sql
+        assert "CREATE OR REPLACE FUNCTION app.create_tb_mutation_audit_log_partitions(" in sql
+        assert "date_trunc('month', p_from)" in sql
+        assert "SELECT app.create_tb_mutation_audit_log_partitions();" in sql
+        assert "p_retention INTERVAL DEFAULT NULL" in sql
+
+    def test_partitioned_audit_log_retention(self):
+        """Retention becomes the default of the partition drop function"""
+        generator = AppSchemaGenerator(
+            audit_log=AuditLogConfig(partitioned=True, retention="6 months")
+        )
+        sql = generator._generate_audit_log_table()
+
+        assert "CREATE OR REPLACE FUNCTION app.drop_tb_mutation_audit_log_partitions(" in sql
+        assert "p_retention INTERVAL DEFAULT INTERVAL '6 months'" in sql
+
+    def test_lean_audit_skips_object_data(self):
+        """Lean entities store NULL object_data in the audit row"""
+        generator = AppSchemaGenerator(audit_log=AuditLogConfig(lean_entities=["Event", "Click"]))
+        sql = generator._generate_log_and_return_mutation()
+
+        assert "CASE WHEN p_entity IN ('click', 'event') THEN NULL ELSE p_object_data END" in sql
+        # Mutation result still returns the full object
+        assert "p_object_data,\n        p_extra_metadata\n    )::app.mutation_result" in sql
+
+    def test_full_audit_by_default(self):
+        """Without lean entities the full object_data is stored"""
+        sql = AppSchemaGenerator()._generate_log_and_return_mutation()
+
+        assert "CASE WHEN p_entity" not in sql
@@ -2,7 +2,7 @@
 
 import pytest
 
-from core.ast_models import Action, ActionStep, Entity, FieldDefinition
+from core.ast_models import Action, ActionStep, Entity, FieldDefinition, FieldTier
 
 
 @pytest.fixture
@@ -92,6 +92,64 @@ def test_core_function_uses_trinity_helpers(generator):
     assert "crm.company_pk(input_data.company_id::TEXT, auth_tenant_id)" in sql
 
 
+def _contact_with_company() -> Entity:
+    return Entity(
+        name="Contact",
+        schema="crm",
+        fields={
+            "email": FieldDefinition(name="email", type_name="text", nullable=False),
+            "company": FieldDefinition(
+                name="company",
+                type_name="ref",
+                reference_entity="Company",
+                tier=FieldTier.REFERENCE,
+                nullable=True,
+            ),
+        },
+    )
+
+
+def test_core_update_locks_and_fetches_once(generator):
+    """Core update locks the row once and reuses it as the before-image"""
+    sql = generator.generate_core_update_function(_contact_with_company())
+
+    assert "v_current crm.tb_contact%ROWTYPE;" in sql
+    assert "FOR UPDATE;" in sql
+    assert sql.count("FROM crm.tb_contact") == 1
+
+
+def test_core_update_returns_after_image(generator):
+    """Core update builds the audit payload from UPDATE ... RETURNING"""
+    sql = generator.generate_core_update_function(_contact_with_company())
+
+    assert "UPDATE crm.tb_contact AS t" in sql
+    assert "WHERE t.pk_contact = v_contact_pk" in sql
+    assert "RETURNING row_to_json(t.*)::JSONB INTO v_object_data;" in sql
+    assert "SELECT row_to_json" not in sql
+
+
+def test_core_update_audits_before_image(generator):
+    """The locked row is logged with the after-image of a successful update"""
+    sql = generator.generate_core_update_function(_contact_with_company())
+    success = sql[sql.index("'success'") :]
+
+    assert (
+        "v_object_data,\n        jsonb_build_object('before', row_to_json(v_current)::JSONB)"
+        in success
+    )
+
+
+def test_core_update_skips_unchanged_rows(generator):
+    """Core update reports NOOP without writing when no value changes"""
+    sql = generator.generate_core_update_function(_contact_with_company())
+
+    assert "IF (v_current.email, v_current.fk_company)" in sql
+    assert "IS NOT DISTINCT FROM (input_data.email::TEXT, v_fk_company) THEN" in sql
+    assert "'noop:no_changes'" in sql
+    # The no-op check happens before the write
+    assert sql.index("'noop:no_changes'") < sql.index("UPDATE crm.tb_contact")
+
+
 def test_core_function_populates_audit_fields(generator):
     """Core function populates all audit fields"""
     # Given: Entity with basic fields
@@ -0,0 +1,272 @@
+"""Tests for the post-generation function volatility analyzer"""
+
+import pglast
+import pytest
+
+from core.ast_models import Entity, FieldDefinition
+from core.dependencies import PGLAST
+from generators.function_volatility import (
+    FunctionVolatilityAnalyzer,
+    ParallelSafety,
+    Volatility,
+)
+from generators.schema_orchestrator import SchemaOrchestrator
+
+LOOKUP = """
+CREATE OR REPLACE FUNCTION catalog.get_product_name(p_pk UUID)
+RETURNS TEXT AS $$
+BEGIN
+    RETURN (SELECT name FROM catalog.tb_product WHERE id = p_pk LIMIT 1);
+END;
+$$ LANGUAGE plpgsql STABLE;
+"""
+
+CALCULATE_PATH = """
+CREATE OR REPLACE FUNCTION catalog.calculate_path(p_pk INTEGER)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT path::TEXT FROM catalog.tb_category WHERE pk_category = p_pk
+$$;
+"""
+
+WRITER = """
+CREATE FUNCTION catalog.touch(p_pk INTEGER) RETURNS void AS $$
+BEGIN
+    UPDATE catalog.tb_product SET updated_at = now() WHERE pk_product = p_pk;
+END;
+$$ LANGUAGE plpgsql STABLE;
+"""
+
+ADD = """
+CREATE FUNCTION public.add(a INTEGER, b INTEGER) RETURNS INTEGER AS $$
+BEGIN
+    IF a IS NULL OR b IS NULL THEN
+        RETURN NULL;
+    END IF;
+    RETURN a + b;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+@pytest.fixture(params=["pglast", "keyword scan"])
+def analyzer(request, monkeypatch):
+    """Analyzer with pglast, and with the keyword-scan fallback"""
+    if request.param == "keyword scan":
+        monkeypatch.setattr(PGLAST, "_available", False)
+    return FunctionVolatilityAnalyzer()
+
+
+def test_plain_plpgsql_lookup_becomes_inlinable_sql(analyzer):
+    """Single RETURN (SELECT ...) bodies are rewritten as LANGUAGE sql"""
+    sql = analyzer.analyze(LOOKUP)
+
+    assert (
+        "SELECT (SELECT name FROM catalog.tb_product WHERE id = get_product_name.p_pk LIMIT 1)"
+    ) in sql
+    assert "$$ LANGUAGE sql STABLE PARALLEL SAFE;" in sql
+    assert "BEGIN" not in sql
+    pglast.parse_sql(sql)
+
+
+def test_table_read_loosens_immutable_to_stable(analyzer):
+    """IMMUTABLE functions that read tables are corrected to STABLE"""
+    sql = analyzer.analyze(CALCULATE_PATH)
+
+    assert "LANGUAGE sql\nSTABLE\nPARALLEL SAFE\nAS $$" in sql
+    assert "IMMUTABLE" not in sql
+
+
+def test_writes_are_volatile_and_parallel_unsafe(analyzer):
+    """DML forces VOLATILE (default) and drops wrong hand-set volatility"""
+    sql = analyzer.analyze(WRITER)
+
+    assert "$$ LANGUAGE plpgsql;" in sql
+    assert "STABLE" not in sql
+
+
+def test_null_guard_over_all_inputs_makes_strict(analyzer):
+    """An IS NULL guard over every input returning NULL allows STRICT"""
+    sql = analyzer.analyze(ADD)
+
+    assert "$$ LANGUAGE plpgsql IMMUTABLE STRICT PARALLEL SAFE;" in sql
+
+
+def test_exception_block_is_parallel_restricted(analyzer):
+    """Subtransactions cannot run in parallel workers"""
+    sql = analyzer.analyze(
+        """
+CREATE FUNCTION public.safe_int(p TEXT) RETURNS INTEGER AS $$
+BEGIN
+    RETURN p::INTEGER;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+    )
+
+    assert "$$ LANGUAGE plpgsql IMMUTABLE PARALLEL RESTRICTED;" in sql
+
+
+def test_inlined_lookup_keeps_parameter_resolution(analyzer):
+    """SQL functions resolve a name to a column before a parameter: qualify parameters"""
+    sql = analyzer.analyze(
+        """
+CREATE FUNCTION catalog.product_id(name TEXT) RETURNS UUID AS $$
+BEGIN
+    RETURN (SELECT p.id FROM catalog.tb_product p WHERE p.name = name AND 'name' <> '');
+END;
+$$ LANGUAGE plpgsql STABLE;
+"""
+    )
+
+    assert "WHERE p.name = product_id.name AND 'name' <> ''" in sql
+    assert "$$ LANGUAGE sql STABLE PARALLEL SAFE;" in sql
+
+
+@pytest.mark.parametrize("target", ["timestamptz", "date", "regclass"])
+def test_setting_dependent_casts_are_stable(analyzer, target):
+    """Text input of timestamps, dates and reg* types depends on settings or catalogs"""
+    sql = analyzer.analyze(
+        f"""
+CREATE FUNCTION public.parse(p TEXT) RETURNS {target} AS $$
+    SELECT p::{target}
+$$ LANGUAGE sql IMMUTABLE;
+"""
+    )
+
+    assert "$$ LANGUAGE sql STABLE PARALLEL SAFE;" in sql
+
+
+def test_temp_table_access_is_parallel_restricted(analyzer):
+    """Temporary tables are session-local and cannot be read by parallel workers"""
+    sql = analyzer.analyze(
+        """
+CREATE FUNCTION public.queued(p_pk INTEGER) RETURNS BOOLEAN AS $$
+    SELECT EXISTS (SELECT 1 FROM pg_temp.refresh_queue WHERE pk = p_pk)
+$$ LANGUAGE sql;
+"""
+    )
+
+    assert "$$ LANGUAGE sql STABLE PARALLEL RESTRICTED;" in sql
+
+
+def test_unknown_calls_never_tighten(analyzer):
+    """Calls the analyzer cannot resolve keep the declared attributes as a floor"""
+    sql = """
+CREATE FUNCTION public.wrap(p INTEGER) RETURNS INTEGER AS $$
+    SELECT ext.unknown_fn(p)
+$$ LANGUAGE sql;
+"""
+    assert analyzer.analyze(sql) == sql
+    assert analyzer.changes == []
+
+
+def test_calls_resolve_to_previously_analyzed_functions(analyzer):
+    """Functions seen earlier (e.g. the foundation) resolve by qualified name"""
+    analyzer.analyze(ADD)
+    sql = analyzer.analyze(
+        """
+CREATE FUNCTION public.add3(a INTEGER, b INTEGER, c INTEGER) RETURNS INTEGER AS $$
+    SELECT public.add(public.add(a, b), c)
+$$ LANGUAGE sql;
+"""
+    )
+
+    assert "$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;" in sql
+
+
+def test_triggers_are_left_alone(analyzer):
+    """Trigger functions have no meaningful volatility"""
+    sql = """
+CREATE FUNCTION public.trg() RETURNS TRIGGER AS $$
+BEGIN
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+    assert analyzer.analyze(sql) == sql
+
+
+def test_changes_are_reported(analyzer):
+    """Every rewritten function is reported with before and after attributes"""
+    analyzer.analyze(LOOKUP + CALCULATE_PATH)
+
+    assert [str(change) for change in analyzer.changes] == [
+        "catalog.get_product_name: plpgsql STABLE -> sql STABLE PARALLEL SAFE",
+        "catalog.calculate_path: sql IMMUTABLE -> sql STABLE PARALLEL SAFE",
+    ]
+    assert analyzer.changes[1].after.volatility == Volatility.STABLE
+    assert analyzer.changes[1].after.parallel == ParallelSafety.SAFE
+
+
+def test_orchestrator_infers_helper_attributes():
+    """SchemaOrchestrator(infer_volatility=True) runs the pass on generated SQL"""
+    entity = Entity(
+        name="Book",
+        schema="library",
+        fields={"title": FieldDefinition(name="title", type_name="text")},
+    )
+
+    plain = SchemaOrchestrator(registry_optional=True).generate_split_schema(entity)
+    orchestrator = SchemaOrchestrator(registry_optional=True, infer_volatility=True)
+    inferred = orchestrator.generate_split_schema(entity)
+
+    assert "PARALLEL SAFE" not in plain.helpers_sql
+    assert "PARALLEL SAFE" in inferred.helpers_sql
+    assert orchestrator.volatility_analyzer.changes
+
+
+@pytest.mark.parametrize(
+    "expression", ["p_ts::text", "'at ' || p_ts", "CAST(p_ts AS varchar)", "'n' || p_n || p_ts"]
+)
+def test_setting_dependent_text_output_is_stable(analyzer, expression):
+    """timestamptz text output depends on TimeZone and DateStyle"""
+    sql = analyzer.analyze(
+        f"""
+CREATE FUNCTION public.label(p_ts timestamptz, p_n INTEGER) RETURNS TEXT AS $$
+BEGIN
+    RETURN {expression};
+END;
+$$ LANGUAGE plpgsql;
+"""
+    )
+
+    assert "$$ LANGUAGE sql STABLE PARALLEL SAFE;" in sql
+    assert "IMMUTABLE" not in sql
+
+
+@pytest.mark.parametrize(
+    "expression", ["p_n::text", "'#' || p_n || '-' || lower(p_code)", "v_prefix || p_code"]
+)
+def test_plain_text_output_stays_immutable(analyzer, expression):
+    """Integers and text concatenate to the same string under any setting"""
+    sql = analyzer.analyze(
+        f"""
+CREATE FUNCTION public.label(p_n INTEGER, p_code TEXT) RETURNS TEXT AS $$
+DECLARE
+    v_prefix TEXT := 'x';
+BEGIN
+    RETURN {expression};
+END;
+$$ LANGUAGE plpgsql;
+"""
+    )
+
+    assert "$$ LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE;" in sql
+
+
+def test_untyped_text_output_is_stable(analyzer):
+    """Expressions the analyzer cannot type fall back to STABLE"""
+    sql = analyzer.analyze(
+        """
+CREATE FUNCTION public.label(p_ts timestamptz, p_due timestamptz) RETURNS TEXT AS $$
+    SELECT 'at ' || greatest(p_ts, p_due)
+$$ LANGUAGE sql IMMUTABLE;
+"""
+    )
+
+    assert "$$ LANGUAGE sql STABLE PARALLEL SAFE;" in sql
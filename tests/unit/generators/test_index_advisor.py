@@ -0,0 +1,197 @@
+"""Tests for the workload-driven index advisor"""
+
+import pglast
+
+from generators.index_advisor import IndexAdvisor
+
+TABLES = """
+CREATE TABLE crm.tb_company (
+    pk_company INTEGER PRIMARY KEY,
+    id UUID NOT NULL UNIQUE,
+    tenant_id UUID NOT NULL,
+    name TEXT,
+    deleted_at TIMESTAMPTZ
+);
+
+CREATE TABLE crm.tb_contact (
+    pk_contact INTEGER PRIMARY KEY,
+    id UUID NOT NULL,
+    tenant_id UUID NOT NULL,
+    email TEXT,
+    status TEXT,
+    fk_company INTEGER,
+    created_at TIMESTAMPTZ,
+    deleted_at TIMESTAMPTZ,
+    CONSTRAINT tb_contact_id_key UNIQUE (id)
+);
+
+CREATE INDEX idx_tb_contact_tenant ON crm.tb_contact(tenant_id);
+"""
+
+
+def _advise(*chunks: str):
+    advisor = IndexAdvisor()
+    for sql in chunks:
+        advisor.observe(sql)
+    return advisor.advise()
+
+
+def _statements(advice) -> list[str]:
+    return [recommendation.sql() for recommendation in advice.recommendations]
+
+
+def test_join_in_refresh_with_soft_delete_becomes_partial_index():
+    """FK columns joined in refresh functions, restricted to live rows"""
+    advice = _advise(
+        TABLES,
+        """
+CREATE FUNCTION crm.refresh_tv_company_batch(p_pks INTEGER[]) RETURNS void AS $$
+BEGIN
+    DELETE FROM crm.tb_contact WHERE FALSE;
+    PERFORM count(*) FROM crm.tb_contact base
+    JOIN crm.tb_company c ON c.pk_company = base.fk_company
+    WHERE base.deleted_at IS NULL AND c.pk_company = ANY(p_pks);
+END;
+$$ LANGUAGE plpgsql;
+""",
+    )
+
+    assert _statements(advice) == [
+        "CREATE INDEX idx_tb_contact_fk_company_active ON crm.tb_contact (fk_company) "
+        "WHERE deleted_at IS NULL;"
+    ]
+    assert advice.recommendations[0].reasons == [
+        "crm.refresh_tv_company_batch: fk_company = crm.tb_company.pk_company "
+        "AND deleted_at IS NULL"
+    ]
+
+
+def test_composite_covering_index_with_range_last():
+    """Equality columns lead (tenant_id first), one range column follows, selected
+    columns become INCLUDE"""
+    advice = _advise(
+        TABLES,
+        """
+CREATE FUNCTION crm.recent_emails(p_tenant UUID, p_status TEXT) RETURNS SETOF TEXT
+LANGUAGE sql STABLE AS $$
+    SELECT email FROM crm.tb_contact
+    WHERE now() - interval '1 day' < created_at AND status = p_status AND tenant_id = p_tenant
+$$;
+""",
+    )
+
+    assert _statements(advice) == [
+        "CREATE INDEX idx_tb_contact_tenant_id_status_created_at "
+        "ON crm.tb_contact (tenant_id, status, created_at) INCLUDE (email);"
+    ]
+    assert advice.recommendations[0].reasons == [
+        "crm.recent_emails: created_at > ? AND status = ? AND tenant_id = ?"
+    ]
+
+
+def test_unique_and_indexed_lookups_need_nothing():
+    """Lookups by a unique key or an indexed prefix, and OR branches, are skipped"""
+    advice = _advise(
+        TABLES,
+        """
+CREATE FUNCTION crm.touch(p_id UUID, p_tenant UUID, p_text TEXT) RETURNS void AS $$
+BEGIN
+    UPDATE crm.tb_contact SET status = 'x' WHERE id = p_id AND tenant_id = p_tenant;
+    PERFORM pk_contact FROM crm.tb_contact
+    WHERE (id::TEXT = p_text OR pk_contact::TEXT = p_text) AND tenant_id = p_tenant;
+    PERFORM 1 FROM crm.tb_contact WHERE pk_contact > 10;
+END;
+$$ LANGUAGE plpgsql;
+""",
+    )
+
+    assert advice.recommendations == []
+    assert advice.redundant == []
+
+
+def test_variables_named_like_columns_elsewhere_are_values():
+    """Unqualified names resolve to columns of the tables in scope only"""
+    advice = _advise(
+        TABLES,
+        """
+CREATE FUNCTION crm.by_name(name TEXT) RETURNS INTEGER AS $$
+    SELECT pk_contact FROM crm.tb_contact WHERE email = name
+$$ LANGUAGE sql;
+""",
+    )
+
+    assert _statements(advice) == [
+        "CREATE INDEX idx_tb_contact_email ON crm.tb_contact (email) INCLUDE (pk_contact);"
+    ]
+
+
+def test_prefix_proposals_fold_and_existing_prefixes_are_reported():
+    """(tenant_id, status) folds into (tenant_id, status, email); the tenant index is redundant"""
+    advice = _advise(
+        TABLES,
+        """
+SELECT 1 FROM crm.tb_contact WHERE tenant_id = $1 AND status = $2;
+SELECT 1 FROM crm.tb_contact WHERE tenant_id = $1 AND status = $2 AND email = $3;
+""",
+    )
+
+    assert [r.columns for r in advice.recommendations] == [("tenant_id", "status", "email")]
+    assert len(advice.recommendations[0].reasons) == 2
+    assert advice.report()[-1] == (
+        "redundant: idx_tb_contact_tenant is a prefix of idx_tb_contact_tenant_id_status_email"
+    )
+
+
+def test_tv_filter_columns_are_tenant_scoped():
+    """`@fraiseql:filter index=btree` columns are queried together with tenant_id"""
+    advice = _advise(
+        """
+CREATE TABLE crm.tv_contact (pk_contact INTEGER PRIMARY KEY, tenant_id UUID, status TEXT);
+CREATE INDEX crm_idx_tv_contact_tenant ON crm.tv_contact(tenant_id);
+COMMENT ON COLUMN crm.tv_contact.tenant_id IS '@fraiseql:filter type=UUID,index=btree';
+COMMENT ON COLUMN crm.tv_contact.status IS '@fraiseql:filter type=String,index=btree';
+""",
+    )
+
+    assert _statements(advice) == [
+        "CREATE INDEX idx_tv_contact_tenant_id_status ON crm.tv_contact (tenant_id, status);"
+    ]
+    assert [str(r) for r in advice.redundant] == [
+        "crm_idx_tv_contact_tenant is a prefix of idx_tv_contact_tenant_id_status"
+    ]
+
+
+def test_render_is_valid_sql_and_online_builds_concurrently():
+    """advised_indexes.sql parses; --online uses CONCURRENTLY"""
+    advice = _advise(TABLES, "SELECT 1 FROM crm.tb_contact WHERE status = $1;")
+
+    rendered = advice.render()
+    online = advice.render(online=True)
+
+    assert "-- statement: status = ?" in rendered
+    assert "CREATE INDEX CONCURRENTLY idx_tb_contact_status" in online
+    assert "Run OUTSIDE a transaction block" in online
+    pglast.parse_sql(rendered)
+
+
+def test_names_truncated_alike_are_deduplicated_within_a_run():
+    """Two proposals sharing their first 63 name characters get distinct names"""
+    long_column = "a_column_name_long_enough_to_push_index_names_past_63"
+    advice = _advise(
+        f"""
+CREATE TABLE crm.tb_wide ({long_column}_x TEXT, {long_column}_y TEXT);
+
+CREATE FUNCTION crm.by_x(p TEXT) RETURNS SETOF TEXT LANGUAGE sql STABLE AS $$
+    SELECT 'x' FROM crm.tb_wide WHERE {long_column}_x = p
+$$;
+
+CREATE FUNCTION crm.by_y(p TEXT) RETURNS SETOF TEXT LANGUAGE sql STABLE AS $$
+    SELECT 'y' FROM crm.tb_wide WHERE {long_column}_y = p
+$$;
+"""
+    )
+
+    names = [recommendation.name for recommendation in advice.recommendations]
+    assert len(names) == 2
+    assert len(set(names)) == 2
+    assert all(len(name) <= 63 for name in names)
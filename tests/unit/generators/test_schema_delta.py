@@ -0,0 +1,312 @@
+"""Tests for schema snapshots and delta migrations"""
+
+import pytest
+
+from generators.app_schema_generator import AppSchemaGenerator, AuditLogConfig
+from generators.schema_delta import SchemaDeltaGenerator, SchemaSnapshot
+
+BASE = """
+CREATE SCHEMA IF NOT EXISTS crm;
+
+CREATE TABLE crm.tb_company (
+    pk_company INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+
+CREATE TABLE crm.tb_contact (
+    pk_contact INTEGER PRIMARY KEY,
+    email TEXT NOT NULL,
+    legacy_code TEXT,
+    fk_company INTEGER REFERENCES crm.tb_company (pk_company),
+    CONSTRAINT ck_contact_email CHECK (email <> '')
+);
+
+CREATE INDEX idx_tb_contact_email ON crm.tb_contact (email);
+
+CREATE TYPE app.type_create_contact_input AS (email TEXT);
+
+CREATE OR REPLACE FUNCTION crm.contact_pk(p_id UUID) RETURNS INTEGER AS $$
+    SELECT 1
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION crm.create_contact(input_data app.type_create_contact_input)
+RETURNS UUID AS $$
+BEGIN
+    RETURN gen_random_uuid();
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON TABLE crm.tb_contact IS 'Contacts';
+"""
+
+
+def _delta(old_sql: str, new_sql: str) -> str:
+    return SchemaDeltaGenerator(
+        SchemaSnapshot.from_dict(SchemaSnapshot.from_sql(old_sql).to_dict()),
+        SchemaSnapshot.from_sql(new_sql),
+    ).generate()
+
+
+def _statements(delta: str) -> list[str]:
+    return [line for line in delta.splitlines() if line and not line.startswith("--")]
+
+
+def test_snapshot_records_tables_indexes_and_function_hashes():
+    """Snapshots keep columns, references, indexes and function signatures"""
+    snapshot = SchemaSnapshot.from_sql(BASE)
+
+    contact = snapshot.tables["crm.tb_contact"]
+    assert contact["columns"]["email"]["not_null"] is True
+    assert contact["columns"]["legacy_code"]["type"] == "text"
+    assert contact["constraints"] == {
+        "ck_contact_email": "CONSTRAINT ck_contact_email CHECK (email <> '')"
+    }
+    assert contact["references"] == ["crm.tb_company"]
+    assert snapshot.indexes["crm.idx_tb_contact_email"]["table"] == "crm.tb_contact"
+    assert snapshot.functions["crm.contact_pk(uuid)"]["returns"] == "integer"
+    assert "type:app.type_create_contact_input" in snapshot.objects
+
+
+def test_snapshot_round_trips_through_json(tmp_path):
+    """Persisted snapshots compare equal to the in-memory summary"""
+    snapshot = SchemaSnapshot.from_sql(BASE)
+    path = tmp_path / "schema_snapshot.json"
+    snapshot.save(path)
+
+    assert SchemaSnapshot.load(path).to_dict() == snapshot.to_dict()
+
+
+def test_unknown_snapshot_format_is_rejected():
+    with pytest.raises(ValueError, match="snapshot format"):
+        SchemaSnapshot.from_dict({"format": 99})
+
+
+def test_unchanged_schema_has_empty_delta():
+    """Formatting-only differences are not changes"""
+    assert _delta(BASE, BASE.replace("    SELECT 1", "SELECT    1")) == (
+        "-- SpecQL delta migration: no schema changes\n"
+    )
+
+
+def test_only_changed_function_bodies_are_emitted():
+    """Functions whose body hash is unchanged are skipped"""
+    delta = _delta(BASE, BASE.replace("SELECT 1", "SELECT 2"))
+
+    assert "crm.contact_pk" in delta
+    assert "crm.create_contact" not in delta
+    assert "CREATE TABLE" not in delta
+
+
+def test_changed_return_type_drops_function_first():
+    """CREATE OR REPLACE cannot change the return type"""
+    delta = _delta(BASE, BASE.replace("RETURNS INTEGER AS $$", "RETURNS BIGINT AS $$"))
+
+    assert delta.index("DROP FUNCTION IF EXISTS crm.contact_pk(uuid);") < delta.index(
+        "CREATE OR REPLACE FUNCTION crm.contact_pk"
+    )
+
+
+def test_column_changes_become_alters():
+    """Added, retyped, defaulted and removed columns map to ALTER TABLE"""
+    new = BASE.replace("    legacy_code TEXT,\n", "    phone VARCHAR(20) DEFAULT 'n/a',\n").replace(
+        "name TEXT NOT NULL", "name VARCHAR(200)"
+    )
+
+    assert _statements(_delta(BASE, new)) == [
+        "ALTER TABLE crm.tb_company ALTER COLUMN name TYPE varchar(200) USING name::varchar(200);",
+        "ALTER TABLE crm.tb_company ALTER COLUMN name DROP NOT NULL;",
+        "ALTER TABLE crm.tb_contact ADD COLUMN phone varchar(20) DEFAULT 'n/a';",
+        "ALTER TABLE crm.tb_contact DROP COLUMN IF EXISTS legacy_code;",
+    ]
+
+
+def test_changed_index_and_constraint_are_replaced():
+    """Named indexes and constraints are dropped before being re-created"""
+    new = BASE.replace("(email);", "(lower(email));").replace("email <> ''", "length(email) > 3")
+
+    assert _statements(_delta(BASE, new)) == [
+        "ALTER TABLE crm.tb_contact DROP CONSTRAINT IF EXISTS ck_contact_email;",
+        "DROP INDEX IF EXISTS crm.idx_tb_contact_email;",
+        "ALTER TABLE crm.tb_contact",
+        "    ADD CONSTRAINT ck_contact_email",
+        "    CHECK (length(email) > 3);",
+        "CREATE INDEX idx_tb_contact_email ON crm.tb_contact (lower(email));",
+    ]
+
+
+def test_new_tables_follow_foreign_keys_and_drops_run_last():
+    """New tables are created referenced-first; removed tables are dropped last, in reverse"""
+    extra = """
+CREATE TABLE crm.tb_activity (id INTEGER, fk_note INTEGER REFERENCES crm.tb_note (id));
+CREATE TABLE crm.tb_note (id INTEGER PRIMARY KEY, fk_contact INTEGER REFERENCES crm.tb_contact);
+"""
+    forward = _statements(_delta(BASE, BASE + extra))
+    assert [s.split(" (")[0] for s in forward] == [
+        "CREATE TABLE crm.tb_note",
+        "CREATE TABLE crm.tb_activity",
+    ]
+
+    assert _statements(_delta(BASE + extra, BASE)) == [
+        "DROP TABLE IF EXISTS crm.tb_activity;",
+        "DROP TABLE IF EXISTS crm.tb_note;",
+    ]
+
+
+def test_changed_type_is_recreated_with_dependents():
+    """Types are dropped with CASCADE and their functions re-created after them"""
+    delta = _delta(BASE, BASE.replace("AS (email TEXT)", "AS (email TEXT, phone TEXT)"))
+
+    drop = delta.index("DROP TYPE IF EXISTS app.type_create_contact_input CASCADE;")
+    create = delta.index("CREATE TYPE app.type_create_contact_input AS (email TEXT, phone TEXT)")
+    assert drop < create < delta.index("CREATE OR REPLACE FUNCTION crm.create_contact")
+    assert "crm.contact_pk" not in delta
+
+
+def test_changed_type_recreates_what_hangs_off_dropped_functions():
+    """Statements attached to a function dropped by the CASCADE are re-emitted with it"""
+    base = (
+        BASE
+        + "COMMENT ON FUNCTION crm.create_contact IS 'Create a contact';\n"
+        + "COMMENT ON FUNCTION crm.contact_pk IS 'Input: app.type_create_contact_input';\n"
+    )
+    delta = _delta(base, base.replace("AS (email TEXT)", "AS (email TEXT, phone TEXT)"))
+
+    assert delta.index("CREATE OR REPLACE FUNCTION crm.create_contact") < delta.index(
+        "COMMENT ON FUNCTION crm.create_contact IS 'Create a contact';"
+    )
+    # Mentioning the type in comment text does not make contact_pk a dependent
+    assert "crm.contact_pk" not in delta
+
+
+def test_not_null_column_without_default_is_backfilled():
+    """ADD COLUMN ... NOT NULL fails on non-empty tables: add nullable, backfill, then SET"""
+    new = BASE.replace(
+        "    legacy_code TEXT,\n", "    legacy_code TEXT,\n    phone TEXT NOT NULL,\n"
+    )
+
+    assert _statements(_delta(BASE, new)) == [
+        "ALTER TABLE crm.tb_contact ADD COLUMN phone text;",
+        "ALTER TABLE crm.tb_contact ALTER COLUMN phone SET NOT NULL;",
+    ]
+    assert "-- REVIEW: crm.tb_contact.phone is NOT NULL without a default" in _delta(BASE, new)
+
+
+def test_empty_snapshot_emits_full_schema():
+    """Without a previous snapshot the delta creates everything"""
+    delta = SchemaDeltaGenerator(SchemaSnapshot(), SchemaSnapshot.from_sql(BASE)).generate()
+
+    assert delta.index("CREATE SCHEMA IF NOT EXISTS crm;") < delta.index(
+        "CREATE TABLE crm.tb_company"
+    )
+    assert delta.index("CREATE TABLE crm.tb_company") < delta.index("CREATE TABLE crm.tb_contact")
+    assert "COMMENT ON TABLE crm.tb_contact IS 'Contacts';" in delta
+
+
+def test_online_delta_uses_lock_light_ddl():
+    """Online mode: NOT VALID + VALIDATE, NOT NULL via CHECK, CONCURRENTLY in its own file"""
+    new = (
+        BASE.replace("    legacy_code TEXT,", "    legacy_code TEXT NOT NULL,")
+        .replace("(email);", "(lower(email));")
+        .replace("email <> ''", "length(email) > 3")
+    )
+    generator = SchemaDeltaGenerator(
+        SchemaSnapshot.from_sql(BASE), SchemaSnapshot.from_sql(new), online=True
+    )
+    delta, concurrent = generator.generate(), generator.generate_concurrent()
+
+    assert "SET lock_timeout = '5s';" in delta
+    assert "    CHECK (length(email) > 3) NOT VALID;" in delta
+    assert (
+        "ADD CONSTRAINT tb_contact_legacy_code_not_null CHECK (legacy_code IS NOT NULL) NOT VALID;"
+    ) in delta
+    assert "INDEX" not in delta
+    assert "DROP INDEX CONCURRENTLY IF EXISTS crm.idx_tb_contact_email;" in concurrent
+    assert "CREATE INDEX CONCURRENTLY idx_tb_contact_email ON crm.tb_contact (lower(email));" in (
+        concurrent
+    )
+
+
+def test_online_delta_validates_after_the_migration():
+    """VALIDATE and SET NOT NULL would scan under the migration's ACCESS EXCLUSIVE lock"""
+    new = BASE.replace("    legacy_code TEXT,", "    legacy_code TEXT NOT NULL,").replace(
+        "email <> ''", "length(email) > 3"
+    )
+    generator = SchemaDeltaGenerator(
+        SchemaSnapshot.from_sql(BASE), SchemaSnapshot.from_sql(new), online=True
+    )
+    delta, validation = generator.generate(), generator.generate_validation()
+
+    assert "VALIDATE" not in delta
+    assert "SET NOT NULL" not in delta
+    assert _statements(validation) == [
+        "ALTER TABLE crm.tb_contact VALIDATE CONSTRAINT tb_contact_legacy_code_not_null;",
+        "ALTER TABLE crm.tb_contact ALTER COLUMN legacy_code SET NOT NULL;",
+        "ALTER TABLE crm.tb_contact DROP CONSTRAINT tb_contact_legacy_code_not_null;",
+        "ALTER TABLE crm.tb_contact VALIDATE CONSTRAINT ck_contact_email;",
+    ]
+    assert (
+        SchemaDeltaGenerator(
+            SchemaSnapshot.from_sql(BASE), SchemaSnapshot.from_sql(new)
+        ).generate_validation()
+        is None
+    )
+
+
+def test_online_and_offline_snapshots_match():
+    """CONCURRENTLY and NOT VALID do not register as schema changes"""
+    online = BASE.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY") + (
+        "ALTER TABLE crm.tb_company ADD CONSTRAINT ck_name CHECK (name <> '') NOT VALID;"
+    )
+    offline = BASE + "ALTER TABLE crm.tb_company ADD CONSTRAINT ck_name CHECK (name <> '');"
+
+    assert SchemaSnapshot.from_sql(online).to_dict() == SchemaSnapshot.from_sql(offline).to_dict()
+
+
+EVENTS = """
+CREATE TABLE crm.tb_event (
+    pk_event INTEGER NOT NULL,
+    occurred_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (pk_event, occurred_at)
+) PARTITION BY RANGE (occurred_at);
+"""
+
+
+def test_online_delta_keeps_plain_ddl_on_partitioned_tables():
+    """Partitioned tables support neither NOT VALID foreign keys nor CONCURRENTLY"""
+    new = (
+        BASE
+        + EVENTS.replace("    occurred_at", "    fk_contact INTEGER,\n    occurred_at", 1)
+        + (
+            "ALTER TABLE crm.tb_event ADD CONSTRAINT fk_event_contact "
+            "FOREIGN KEY (fk_contact) REFERENCES crm.tb_contact (pk_contact);\n"
+            "CREATE INDEX idx_tb_event_contact ON crm.tb_event (fk_contact);"
+        )
+    )
+    generator = SchemaDeltaGenerator(
+        SchemaSnapshot.from_sql(BASE + EVENTS), SchemaSnapshot.from_sql(new), online=True
+    )
+    delta = generator.generate()
+
+    assert SchemaSnapshot.from_sql(new).tables["crm.tb_event"]["partitioned"] is True
+    assert "    FOREIGN KEY (fk_contact) REFERENCES crm.tb_contact (pk_contact);" in delta
+    assert "NOT VALID" not in delta
+    assert "CREATE INDEX idx_tb_event_contact ON crm.tb_event (fk_contact);" in delta
+    assert generator.generate_validation() is None
+    assert generator.generate_concurrent() is None
+
+
+def test_online_delta_builds_partitioned_audit_log_indexes_in_place():
+    """--audit-log-partitioned: app.tb_mutation_audit_log indexes are not CONCURRENTLY"""
+    foundation = AppSchemaGenerator(
+        audit_log=AuditLogConfig(partitioned=True)
+    ).generate_app_foundation()
+    generator = SchemaDeltaGenerator(
+        SchemaSnapshot(), SchemaSnapshot.from_sql(foundation), online=True
+    )
+    delta = generator.generate()
+
+    assert (
+        "CREATE INDEX idx_mutation_audit_tenant ON app.tb_mutation_audit_log(tenant_id);" in delta
+    )
+    assert "CONCURRENTLY" not in delta
+    assert generator.generate_concurrent() is None
@@ -0,0 +1,117 @@
+"""Tests for closure-table backed recursive validation patterns."""
+
+import pglast
+import pytest
+
+from core.ast_models import EntityDefinition
+from patterns.validation.closure_table import ClosureTableConfig, ClosureTableGenerator
+from patterns.validation.recursive_dependency_validator import RecursiveDependencyValidator
+from patterns.validation.template_inheritance import TemplateInheritancePattern
+
+
+def _dependency_closure() -> str:
+    return ClosureTableGenerator(
+        ClosureTableConfig(
+            schema="catalog",
+            edge_table="tb_feature_dependency",
+            source_column="feature_id",
+            target_column="requires_feature_id",
+            filter_column="dependency_type",
+            filter_value="REQUIRES",
+        )
+    ).generate()
+
+
+class TestClosureTableGenerator:
+    """Closure table DDL, maintenance trigger and rebuild."""
+
+    def test_closure_table_keyed_for_lookups(self):
+        sql = _dependency_closure()
+
+        assert "CREATE TABLE IF NOT EXISTS catalog.tb_feature_dependency_closure" in sql
+        assert "PRIMARY KEY (source_id, target_id, depth)" in sql
+        assert "ON catalog.tb_feature_dependency_closure (target_id, source_id);" in sql
+
+    def test_trigger_maintains_closure_incrementally(self):
+        sql = _dependency_closure()
+
+        assert "AFTER INSERT OR DELETE OR UPDATE OF feature_id, requires_feature_id, " in sql
+        assert "catalog.apply_tb_feature_dependency_closure_edge(OLD.feature_id" in sql
+        assert "OLD.dependency_type = 'REQUIRES'" in sql
+        assert "DO UPDATE SET path_count = c.path_count + EXCLUDED.path_count" in sql
+        assert "AND path_count <= 0;" in sql
+
+    def test_cycle_check_is_single_lookup(self):
+        sql = _dependency_closure()
+
+        assert (
+            "IF catalog.reaches_tb_feature_dependency_closure("
+            "NEW.requires_feature_id, NEW.feature_id) THEN"
+        ) in sql
+        assert "WITH RECURSIVE" not in sql
+
+    def test_maintenance_serialized_by_lock(self):
+        sql = _dependency_closure()
+        lock = "LOCK TABLE catalog.tb_feature_dependency_closure IN SHARE ROW EXCLUSIVE MODE;"
+
+        # Trigger, edge application and rebuild each lock before reading the closure
+        assert sql.count(lock) == 3
+        sync = sql[sql.index("FUNCTION catalog.sync_tb_feature_dependency_closure()") :]
+        assert sync.index(lock) < sync.index("reaches_tb_feature_dependency_closure(")
+
+    def test_rebuild_function(self):
+        sql = _dependency_closure()
+
+        assert "CREATE OR REPLACE FUNCTION catalog.rebuild_tb_feature_dependency_closure()" in sql
+        assert "JOIN catalog.tb_feature_dependency e ON e.feature_id = f.target_id" in sql
+
+    def test_generated_sql_parses(self):
+        pglast.parse_sql(_dependency_closure())
+
+
+class TestRecursiveDependencyValidatorClosure:
+    """closure_table: true swaps the recursive CTEs for closure lookups."""
+
+    def _functions(self, **params) -> list[str]:
+        entity = EntityDefinition(name="ProductConfig", schema="catalog", fields={})
+        RecursiveDependencyValidator.apply(
+            entity, {"dependency_entity": "FeatureDependency", **params}
+        )
+        return entity.functions
+
+    def test_default_still_uses_recursive_ctes(self):
+        sql = "\n".join(self._functions())
+
+        assert "WITH RECURSIVE dependency_tree" in sql
+        assert "_closure" not in sql
+
+    def test_closure_replaces_recursive_ctes(self):
+        functions = self._functions(closure_table=True)
+        sql = "\n".join(functions)
+
+        assert "tb_featuredependency_closure" in functions[0]
+        assert "WITH RECURSIVE dependency_tree" not in sql
+        assert "WITH RECURSIVE dep_graph" not in sql
+        assert "FROM catalog.tb_featuredependency_closure c" in sql
+        assert "catalog.would_create_cycle_productconfig(" in sql
+
+    def test_closure_rejects_allow_cycles(self):
+        with pytest.raises(ValueError, match="closure_table"):
+            self._functions(closure_table=True, allow_cycles=True)
+
+
+class TestTemplateInheritanceClosure:
+    """closure_table: true resolves template chains from the closure table."""
+
+    def test_closure_replaces_template_chain_cte(self):
+        entity = EntityDefinition(name="Product", schema="catalog", fields={})
+        TemplateInheritancePattern.apply(
+            entity, {"template_entity": "ProductTemplate", "closure_table": True}
+        )
+        sql = "\n".join(entity.functions)
+
+        assert "CREATE TABLE IF NOT EXISTS catalog.tb_producttemplate_closure" in sql
+        assert "AFTER INSERT OR DELETE OR UPDATE OF id, parent_template_id" in sql
+        assert "WITH RECURSIVE template_chain" not in sql
+        assert "JOIN catalog.tb_producttemplate_closure c ON c.source_id = e.template_id" in sql
+        assert "ELSE 2 + COALESCE(MAX(c.depth), 0)" in sql
@@ -0,0 +1,97 @@
+"""Tests for process-parallel reverse engineering of files."""
+
+import os
+
+from reverse_engineering.parallel import FileLog, ReverseExecutor, worker_instance
+
+
+class Counter:
+    created = 0
+
+    def __init__(self):
+        Counter.created += 1
+
+
+def _read(path, log, suffix=""):
+    log.info(f"Read {path.name}")
+    if not path.read_text():
+        log.warning("Empty")
+    return path.read_text() + suffix, os.getpid()
+
+
+def _instance_id(path, log):
+    return id(worker_instance(Counter))
+
+
+class RecordingOutput:
+    def __init__(self):
+        self.lines = []
+
+    def info(self, message):
+        self.lines.append(f"info: {message}")
+
+    def warning(self, message):
+        self.lines.append(f"warning: {message}")
+
+
+def _write_files(tmp_path, count=8):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"file{i}.txt"
+        path.write_text("" if i == 3 else f"content {i}")
+        paths.append(path)
+    return paths
+
+
+class TestReverseExecutor:
+    """Test cases for parsing files on worker processes."""
+
+    def test_serial_parses_in_process(self, tmp_path):
+        paths = _write_files(tmp_path)
+
+        results = list(ReverseExecutor().map(_read, paths, suffix="!"))
+
+        assert [path for path, _, _ in results] == paths
+        assert [result for _, (result, _), _ in results][:2] == ["content 0!", "content 1!"]
+        assert {pid for _, (_, pid), _ in results} == {os.getpid()}
+
+    def test_workers_preserve_file_order(self, tmp_path):
+        paths = _write_files(tmp_path)
+
+        serial = [(p, r[0], log.messages) for p, r, log in ReverseExecutor(1).map(_read, paths)]
+        parallel = list(ReverseExecutor(2).map(_read, paths))
+
+        assert [(p, r[0], log.messages) for p, r, log in parallel] == serial
+        assert os.getpid() not in {pid for _, (_, pid), _ in parallel}
+
+    def test_worker_instance_is_shared_across_files(self, tmp_path):
+        paths = _write_files(tmp_path, count=3)
+        Counter.created = 0
+
+        ids = {result for _, result, _ in ReverseExecutor().map(_instance_id, paths)}
+
+        assert len(ids) == 1
+        assert Counter.created == 1
+
+    def test_worker_instances_are_released_after_serial_map(self, tmp_path):
+        paths = _write_files(tmp_path, count=2)
+        Counter.created = 0
+
+        list(ReverseExecutor().map(_instance_id, paths))
+        list(ReverseExecutor().map(_instance_id, paths))
+
+        assert Counter.created == 2
+
+
+class TestFileLog:
+    """Test cases for replaying per-file messages."""
+
+    def test_replay_in_order(self):
+        log = FileLog()
+        log.info("Parsing")
+        log.warning("Skipped")
+        output = RecordingOutput()
+
+        log.replay(output)
+
+        assert output.lines == ["info: Parsing", "warning: Skipped"]
@@ -0,0 +1,115 @@
+"""Tests for the persistent reverse engineering parse cache."""
+
+import os
+
+import pytest
+
+from reverse_engineering import parse_cache
+from reverse_engineering.parallel import ReverseExecutor
+from reverse_engineering.parse_cache import ParseCache
+
+parsed = []
+
+
+def _read(path, log, suffix=""):
+    parsed.append(path)
+    log.info(f"Read {path.name}")
+    return path.read_text() + suffix
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParseCache("text", cache_dir=tmp_path / "cache")
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "model.txt"
+    path.write_text("content")
+    return path
+
+
+class TestParseCache:
+    """Test cases for keying, storing and evicting parse products."""
+
+    def test_round_trip(self, cache, source):
+        key = cache.key(_read, source, {})
+
+        assert cache.get(key) is None
+        cache.put(key, ("content", [("info", "Read")]))
+
+        assert cache.get(key) == ("content", [("info", "Read")])
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_covers_content_options_and_language(self, cache, source, tmp_path):
+        key = cache.key(_read, source, {})
+
+        assert cache.key(_read, source, {"suffix": "!"}) != key
+        assert ParseCache("other", cache.cache_dir).key(_read, source, {}) != key
+        source.write_text("changed")
+        assert cache.key(_read, source, {}) != key
+
+    def test_key_covers_parser_source(self, cache, source, tmp_path, monkeypatch):
+        """Editing the parse function's module invalidates its entries without a release"""
+        module = tmp_path / "cached_parser.py"
+        module.write_text("def parse(path, log):\n    return path.read_text()\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        from cached_parser import parse
+
+        key = cache.key(parse, source, {})
+        module.write_text("def parse(path, log):\n    return path.read_text().upper()\n")
+        parse_cache._module_digest.cache_clear()
+
+        assert cache.key(parse, source, {}) != key
+        assert cache.parser_version.count("/") == 2  # version/format/reverse_engineering digest
+
+    def test_unpicklable_products_are_not_stored(self, cache, source):
+        key = cache.key(_read, source, {})
+        cache.put(key, lambda: None)
+
+        assert cache.get(key) is None
+        assert list(cache.cache_dir.glob("*")) == []
+
+    def test_corrupt_entry_is_a_miss(self, cache, source):
+        key = cache.key(_read, source, {})
+        cache.put(key, "content")
+        next(cache.cache_dir.glob("*.pickle")).write_bytes(b"not a pickle")
+
+        assert cache.get(key) is None
+        assert list(cache.cache_dir.glob("*.pickle")) == []
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ParseCache("text", cache_dir=tmp_path / "cache", max_bytes=2500)
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.put(key, b"x" * 1000)
+            os.utime(cache.cache_dir / f"text-{key}.pickle", (i, i))
+        cache.get("a")  # Now the most recently used
+
+        assert cache.evict() == 1
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+
+class TestCachedExecutor:
+    """Test cases for reusing cached parses in ReverseExecutor."""
+
+    def test_parses_only_changed_files(self, cache, tmp_path):
+        paths = []
+        for i in range(3):
+            paths.append(tmp_path / f"file{i}.txt")
+            paths[-1].write_text(f"content {i}")
+        first = [
+            (p, r, log.messages) for p, r, log in ReverseExecutor(cache=cache).map(_read, paths)
+        ]
+        paths[1].write_text("changed")
+        parsed.clear()
+
+        second = [
+            (p, r, log.messages) for p, r, log in ReverseExecutor(cache=cache).map(_read, paths)
+        ]
+
+        assert parsed == [paths[1]]
+        assert second[0] == first[0]
+        assert second[1] == (paths[1], "changed", [("info", "Read file1.txt")])
+        assert second[2] == first[2]
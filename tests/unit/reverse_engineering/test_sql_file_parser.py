@@ -0,0 +1,108 @@
+"""Tests for parsing whole SQL files for reverse engineering."""
+
+import pytest
+
+from reverse_engineering import sql_file_parser
+from reverse_engineering.sql_file_parser import REVERSED_KINDS, SQLFileParser
+from reverse_engineering.sql_splitter import split_statements
+
+SCHEMA = """
+CREATE TABLE crm.tb_contact (
+    pk_contact INTEGER PRIMARY KEY,
+    email TEXT NOT NULL,
+    fk_company INTEGER
+);
+
+COMMENT ON TABLE crm.tb_contact IS 'Customer contacts';
+COMMENT ON COLUMN crm.tb_contact.email IS E'Contact\\'s e-mail';
+
+CREATE OR REPLACE FUNCTION crm.qualify_lead(p_contact_id INTEGER) RETURNS BOOLEAN AS $_$
+BEGIN
+    UPDATE crm.tb_contact SET email = 'x;y' WHERE pk_contact = p_contact_id;
+    RETURN true;
+END;
+$_$ LANGUAGE plpgsql;
+
+ALTER TABLE ONLY crm.tb_contact
+    ADD CONSTRAINT fk_contact_company FOREIGN KEY (fk_company) REFERENCES crm.tb_company(pk_company);
+"""
+
+
+@pytest.fixture
+def parser():
+    return SQLFileParser()
+
+
+class TestSQLFileParser:
+    """Test cases for single-parse SQL file reverse engineering."""
+
+    def test_dispatches_statements(self, parser):
+        result = parser.parse(SCHEMA)
+
+        assert [t.table_name for t in result.tables] == ["tb_contact"]
+        assert result.functions[0].parsed.function_name == "qualify_lead"
+        fk = result.foreign_keys["tb_contact"][0]
+        assert (fk.column, fk.references_table, fk.entity_name) == (
+            "fk_company",
+            "tb_company",
+            "Company",
+        )
+        assert result.skipped == 0
+
+    def test_attaches_comments(self, parser):
+        table = parser.parse(SCHEMA).tables[0]
+
+        assert table.table_comment == "Customer contacts"
+        assert table.column_comments == {"email": "Contact's e-mail"}
+
+    def test_parses_small_file_once(self, parser, monkeypatch):
+        calls = []
+        parse_sql = parser.pglast.parse_sql
+        monkeypatch.setattr(
+            parser.pglast, "parse_sql", lambda sql: calls.append(sql) or parse_sql(sql)
+        )
+
+        parser.parse(SCHEMA)
+
+        assert len(calls) == 1
+
+    def test_parses_statements_in_batches_as_they_are_split(self, parser, monkeypatch):
+        expected = parser.parse(SCHEMA)
+        consumed, parsed_after = [], []
+        parse_sql = parser.pglast.parse_sql
+        monkeypatch.setattr(sql_file_parser, "PARSE_BATCH_SIZE", 2)
+        monkeypatch.setattr(
+            parser.pglast,
+            "parse_sql",
+            lambda sql: parsed_after.append(len(consumed)) or parse_sql(sql),
+        )
+
+        def statements():
+            for statement in split_statements(SCHEMA, REVERSED_KINDS):
+                consumed.append(statement)
+                yield statement
+
+        assert parser.parse_statements(statements()) == expected
+        assert parsed_after == [2, 4, 5]
+
+    def test_rejected_statements_fall_back(self, parser):
+        result = parser.parse(
+            SCHEMA
+            + """
+            CREATE TABLE crm.tb_broken (id INTEGER,,);
+            ALTER TABLE crm.tb_task ADD CONSTRAINT fk_task_contact
+                FOREIGN KEY (fk_contact) REFERENCES crm.tb_contact(pk_contact) NOT VALID!;
+            """
+        )
+
+        assert [t.table_name for t in result.tables] == ["tb_contact"]
+        assert result.skipped == 1
+        assert "Failed to parse table" in result.warnings[0]
+        assert result.foreign_keys["tb_task"][0].column == "fk_contact"
+        assert result.tables[0].table_comment == "Customer contacts"
+
+    def test_parse_file(self, parser, tmp_path):
+        path = tmp_path / "schema.sql"
+        path.write_text(SCHEMA)
+
+        assert parser.parse_file(path) == parser.parse(SCHEMA)
@@ -0,0 +1,150 @@
+"""Tests for the streaming SQL statement splitter."""
+
+from reverse_engineering.sql_splitter import (
+    COMMENT,
+    CREATE_FUNCTION,
+    CREATE_TABLE,
+    FOREIGN_KEY,
+    OTHER,
+    split_file,
+    split_statements,
+)
+
+DUMP = """--
+-- Name: tb_contact; Type: TABLE; Schema: crm
+--
+
+CREATE TABLE crm.tb_contact (
+    pk_contact integer NOT NULL,
+    label text DEFAULT 'a;b''c',
+    "odd;name" text
+);
+
+/* nested /* ; */ comment ; */
+CREATE OR REPLACE FUNCTION crm.qualify_lead(p_id integer) RETURNS boolean
+    LANGUAGE plpgsql
+    AS $_$
+BEGIN
+    UPDATE crm.tb_contact SET label = 'qualified;' WHERE pk_contact = $1;
+    RETURN true;
+END;
+$_$;
+
+COMMENT ON TABLE crm.tb_contact IS E'Contact\\'s; details';
+
+ALTER TABLE ONLY crm.tb_contact
+    ADD CONSTRAINT fk_contact_company FOREIGN KEY (fk_company) REFERENCES crm.tb_company(pk_company);
+
+ALTER TABLE crm.tb_contact OWNER TO app;
+SELECT pg_catalog.set_config('search_path', '', false)
+"""
+
+
+class TestSplitStatements:
+    """Test cases for splitting and classifying statements."""
+
+    def test_splits_and_classifies_dump(self):
+        statements = list(split_statements(DUMP))
+
+        assert [s.kind for s in statements] == [
+            CREATE_TABLE,
+            CREATE_FUNCTION,
+            COMMENT,
+            FOREIGN_KEY,
+            OTHER,
+            OTHER,
+        ]
+        assert statements[0].sql.startswith("CREATE TABLE crm.tb_contact (")
+        assert statements[0].sql.endswith(");")
+
+    def test_semicolons_in_strings_bodies_and_comments_do_not_split(self):
+        function = list(split_statements(DUMP, {CREATE_FUNCTION}))[0]
+
+        assert "SET label = 'qualified;'" in function.sql
+        assert function.sql.endswith("$_$;")
+
+    def test_escape_string_literal(self):
+        comment = list(split_statements(DUMP, {COMMENT}))[0]
+
+        assert comment.sql == "COMMENT ON TABLE crm.tb_contact IS E'Contact\\'s; details';"
+
+    def test_kinds_filter(self):
+        statements = list(split_statements(DUMP, {FOREIGN_KEY}))
+
+        assert len(statements) == 1
+        assert "FOREIGN KEY (fk_company)" in statements[0].sql
+
+    def test_alter_table_without_foreign_key_is_other(self):
+        statements = list(split_statements(DUMP, {OTHER}))
+
+        assert statements[0].sql == "ALTER TABLE crm.tb_contact OWNER TO app;"
+
+    def test_unterminated_last_statement(self):
+        statements = list(split_statements("CREATE SCHEMA crm;\nCREATE SCHEMA app\n-- end\n"))
+
+        assert [s.sql for s in statements] == ["CREATE SCHEMA crm;", "CREATE SCHEMA app\n-- end"]
+
+    def test_dollar_in_identifier_is_not_a_quote(self):
+        statements = list(split_statements("SELECT a$b$ FROM t; SELECT 1;"))
+
+        assert len(statements) == 2
+
+    def test_create_table_statements(self):
+        sql = """
+        CREATE TABLE crm.tb_contact (pk_contact SERIAL PRIMARY KEY);
+
+        CREATE TABLE IF NOT EXISTS crm.tb_task (
+            pk_task SERIAL PRIMARY KEY
+        );
+        """
+
+        tables = list(split_statements(sql, {CREATE_TABLE}))
+
+        assert len(tables) == 2
+        assert tables[0].sql.startswith("CREATE TABLE crm.tb_contact")
+        assert "crm.tb_task" in tables[1].sql
+
+    def test_foreign_key_spanning_lines(self):
+        sql = """
+        ALTER TABLE crm.tb_contact ADD CONSTRAINT fk_contact_company
+            FOREIGN KEY (fk_company) REFERENCES management.tb_organization(pk_organization);
+        """
+
+        (statement,) = split_statements(sql)
+
+        assert statement.kind == FOREIGN_KEY
+        assert "REFERENCES management.tb_organization" in statement.sql
+
+    def test_begin_atomic_body_is_one_statement(self):
+        sql = (
+            "CREATE FUNCTION crm.two() RETURNS integer LANGUAGE sql\n"
+            "BEGIN ATOMIC\n"
+            "    SELECT 1;\n"
+            "    SELECT CASE WHEN true THEN 'end;' END;\n"
+            "END;\n"
+            "CREATE PROCEDURE crm.touch() LANGUAGE sql begin atomic SELECT 1; end;\n"
+            "SELECT 2;"
+        )
+
+        statements = list(split_statements(sql))
+
+        assert [s.kind for s in statements] == [CREATE_FUNCTION, OTHER, OTHER]
+        assert statements[0].sql.endswith("END;\nEND;")
+        assert statements[1].sql.endswith("end;")
+        assert statements[2].sql == "SELECT 2;"
+
+
+class TestSplitFile:
+    """Test cases for splitting memory-mapped files."""
+
+    def test_split_file_matches_split_statements(self, tmp_path):
+        path = tmp_path / "dump.sql"
+        path.write_text(DUMP)
+
+        assert list(split_file(path)) == list(split_statements(DUMP))
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.sql"
+        path.write_text("")
+
+        assert list(split_file(path)) == []
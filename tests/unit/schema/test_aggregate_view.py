@@ -0,0 +1,174 @@
+"""Tests for aggregate view pattern refresh modes."""
+
+import pytest
+
+from core.ast_models import Entity, FieldDefinition, FieldTier, Pattern
+from generators.schema.patterns.schema.aggregate_view import AggregateViewPattern
+from generators.schema.transformers.aggregate_view_transformer import AggregateViewTransformer
+
+
+def _order_entity() -> Entity:
+    return Entity(
+        name="Order",
+        schema="sales",
+        fields={
+            "customer": FieldDefinition(
+                name="customer",
+                type_name="ref",
+                reference_entity="Customer",
+                tier=FieldTier.REFERENCE,
+            ),
+            "total_amount": FieldDefinition(name="total_amount", type_name="decimal"),
+            "order_date": FieldDefinition(name="order_date", type_name="date"),
+        },
+    )
+
+
+def _params(refresh_mode: str) -> dict:
+    return {
+        "group_by": ["customer"],
+        "aggregates": [
+            {"field": "total_amount", "function": "sum", "alias": "total_spent"},
+            {"field": "total_amount", "function": "avg", "alias": "avg_spent"},
+            {"function": "count", "alias": "order_count"},
+            {"field": "order_date", "function": "min", "alias": "first_order"},
+            {"field": "order_date", "function": "max", "alias": "last_order"},
+        ],
+        "refresh_mode": refresh_mode,
+    }
+
+
+def _apply(refresh_mode: str) -> tuple[dict, list[str]]:
+    entity, _ = AggregateViewPattern.apply(_order_entity(), _params(refresh_mode))
+    return entity.aggregate_views[0], getattr(entity, "aggregate_view_indexes", [])
+
+
+class TestAutoRefreshMode:
+    """Auto mode refreshes concurrently once per statement."""
+
+    def test_refresh_is_concurrent_and_statement_level(self):
+        view, _ = _apply("auto")
+
+        assert "REFRESH MATERIALIZED VIEW CONCURRENTLY sales.mv_order_agg" in view["trigger_ddl"]
+        assert "FOR EACH STATEMENT" in view["trigger_ddl"]
+
+    def test_unique_group_index_generated(self):
+        _, indexes = _apply("auto")
+
+        assert "CREATE UNIQUE INDEX idx_mv_order_agg_group ON sales.mv_order_agg (customer);" in (
+            indexes
+        )
+
+    def test_manual_mode_has_no_triggers(self):
+        view, indexes = _apply("manual")
+
+        assert "CREATE MATERIALIZED VIEW sales.mv_order_agg" in view["ddl"]
+        assert "CREATE TRIGGER" not in view["trigger_ddl"]
+        assert "REFRESH MATERIALIZED VIEW sales.mv_order_agg;" in view["trigger_ddl"]
+        assert indexes == []
+
+
+class TestIncrementalRefreshMode:
+    """Incremental mode maintains a summary table from per-statement deltas."""
+
+    def test_summary_table_replaces_materialized_view(self):
+        view, _ = _apply("incremental")
+
+        assert "CREATE TABLE sales.mv_order_agg" in view["ddl"]
+        assert "MATERIALIZED VIEW" not in view["ddl"]
+        assert "customer INTEGER" in view["ddl"]
+        assert "UNIQUE NULLS NOT DISTINCT (customer)" in view["ddl"]
+
+    def test_sum_and_avg_exposed_as_generated_columns(self):
+        view, _ = _apply("incremental")
+
+        assert "_sum_total_spent NUMERIC NOT NULL DEFAULT 0" in view["ddl"]
+        assert "_cnt_avg_spent BIGINT NOT NULL DEFAULT 0" in view["ddl"]
+        assert "_sum_avg_spent / _cnt_avg_spent" in view["ddl"]
+        assert "order_count BIGINT NOT NULL DEFAULT 0" in view["ddl"]
+
+    def test_deltas_applied_from_transition_tables(self):
+        view, _ = _apply("incremental")
+        triggers = view["trigger_ddl"]
+
+        assert "REFERENCING NEW TABLE AS new_rows" in triggers
+        assert "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows" in triggers
+        assert "REFERENCING OLD TABLE AS old_rows" in triggers
+        assert "FROM new_rows" in triggers
+        assert "-COUNT(*)" in triggers
+        assert "ON CONFLICT (customer) DO UPDATE SET" in triggers
+        assert "REFRESH MATERIALIZED VIEW" not in triggers
+
+    def test_min_max_recomputed_only_when_extreme_removed(self):
+        view, _ = _apply("incremental")
+        triggers = view["trigger_ddl"]
+
+        assert "first_order = LEAST(s.first_order, EXCLUDED.first_order)" in triggers
+        assert "last_order = GREATEST(s.last_order, EXCLUDED.last_order)" in triggers
+        assert "SELECT MIN(b.order_date) FROM sales.tb_order b" in triggers
+        assert "AND o.order_date = s.first_order" in triggers
+
+    def test_empty_groups_removed_and_rebuild_function(self):
+        view, _ = _apply("incremental")
+        triggers = view["trigger_ddl"]
+
+        assert "AND s._row_count = 0;" in triggers
+        assert "CREATE OR REPLACE FUNCTION sales.refresh_mv_order_agg()" in triggers
+
+    def test_unsupported_function_rejected(self):
+        params = _params("incremental")
+        params["aggregates"] = [{"field": "order_date", "function": "array_agg"}]
+
+        with pytest.raises(ValueError, match="not supported in incremental mode"):
+            AggregateViewPattern.apply(_order_entity(), params)
+
+    def test_transformer_emits_same_summary_table(self):
+        pattern = Pattern(type="aggregate_view", params=_params("incremental"))
+
+        ddl = AggregateViewTransformer().transform_ddl(_order_entity(), "", pattern)
+
+        assert "CREATE TABLE sales.mv_order_agg" in ddl
+        assert "sales.apply_mv_order_agg_delta()" in ddl
+
+    def test_incremental_truncate_forces_rebuild(self):
+        view, _ = _apply("incremental")
+        triggers = view["trigger_ddl"]
+
+        assert "AFTER TRUNCATE ON sales.tb_order\nFOR EACH STATEMENT" in triggers
+        assert "IF TG_OP = 'TRUNCATE' THEN\n        -- No transition tables" in triggers
+        assert "PERFORM sales.refresh_mv_order_agg();" in triggers
+
+
+class TestAggregateViewTransformer:
+    """The orchestrator's transformer emits the pattern's DDL for every mode."""
+
+    @pytest.mark.parametrize("refresh_mode", ["manual", "auto", "incremental"])
+    def test_transformer_matches_pattern(self, refresh_mode):
+        pattern = Pattern(type="aggregate_view", params=_params(refresh_mode))
+
+        ddl = AggregateViewTransformer().transform_ddl(_order_entity(), "", pattern)
+
+        assert ddl.strip() == AggregateViewPattern.generate_sql(
+            _order_entity(), _params(refresh_mode)
+        )
+
+    def test_auto_mode_refreshes_concurrently(self):
+        pattern = Pattern(type="aggregate_view", params=_params("auto"))
+
+        ddl = AggregateViewTransformer().transform_ddl(_order_entity(), "", pattern)
+
+        assert "REFRESH MATERIALIZED VIEW CONCURRENTLY sales.mv_order_agg" in ddl
+        assert "CREATE UNIQUE INDEX idx_mv_order_agg_group" in ddl
+        assert "mv_refresh_queue" not in ddl
+
+    def test_column_aggregates_and_ref_group_by(self):
+        params = _params("manual")
+        params["aggregates"] = [{"function": "SUM", "column": "total_amount", "alias": "total"}]
+        pattern = Pattern(type="aggregate_view", params=params)
+
+        ddl = AggregateViewTransformer().transform_ddl(_order_entity(), "", pattern)
+
+        assert "fk_customer AS customer" in ddl
+        assert "SUM(total_amount) AS total" in ddl
+        assert "GROUP BY fk_customer" in ddl
+        assert "CREATE OR REPLACE FUNCTION sales.refresh_mv_order_agg()\nRETURNS void" in ddl
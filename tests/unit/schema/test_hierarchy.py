@@ -5,6 +5,9 @@ Tests INTEGER-based LTREE path calculation and management
 
 from jinja2 import Template
 
+from core.ast_models import EntityDefinition, FieldDefinition, FieldTier
+from generators.schema.schema_generator import SchemaGenerator
+
 
 class TestHierarchyTemplates:
     """Test hierarchy template rendering and structure."""
@@ -23,6 +26,16 @@ class TestHierarchyTemplates:
         assert "path::text || '.' || p_pk_location::text" in result
         assert "@specql:hierarchy" in result
 
+    def test_calculate_path_is_stable(self):
+        """calculate_path reads the table, so it must not be declared IMMUTABLE."""
+        with open("templates/sql/hierarchy/calculate_path.sql.jinja2") as f:
+            template = Template(f.read())
+
+        result = template.render(schema="tenant", entity_lower="location")
+
+        assert "LANGUAGE plpgsql STABLE" in result
+        assert "IMMUTABLE" not in result
+
     def test_recalculate_descendants_template_renders(self):
         """Test that recalculate_descendants template renders correctly."""
         with open("templates/sql/hierarchy/recalculate_descendants.sql.jinja2") as f:
@@ -32,11 +45,59 @@ class TestHierarchyTemplates:
 
         assert "CREATE OR REPLACE FUNCTION tenant.recalculate_location_descendant_paths" in result
         assert "RETURNS INTEGER" in result
-        assert "RECURSIVE subtree" in result
         assert "calculate_location_path" in result
         assert "path_updated_at = now()" in result
         assert "path_updated_by" in result
-        assert "IS DISTINCT FROM" in result  # Idempotent check
+        assert "IS NOT DISTINCT FROM v_new_path" in result  # Idempotent check
+
+    def test_recalculate_descendants_rewrites_prefix_in_one_update(self):
+        """Subtree moves rewrite the path prefix instead of recomputing each row."""
+        with open("templates/sql/hierarchy/recalculate_descendants.sql.jinja2") as f:
+            template = Template(f.read())
+
+        result = template.render(schema="tenant", entity_lower="location")
+
+        assert "path = v_new_path || subpath(l.path, nlevel(v_old_path))" in result
+        assert "WHERE l.path <@ v_old_path" in result
+        assert "RECURSIVE" not in result
+        # calculate_path runs once, for the moved node only
+        assert result.count("tenant.calculate_location_path(") == 1
+
+    def test_recalculate_descendants_reads_old_prefix_from_child(self):
+        """Callers that already updated the node's path can still omit p_old_path."""
+        with open("templates/sql/hierarchy/recalculate_descendants.sql.jinja2") as f:
+            template = Template(f.read())
+
+        result = template.render(schema="tenant", entity_lower="location")
+
+        assert "IF p_old_path IS NULL AND v_old_path IS NOT DISTINCT FROM v_new_path THEN" in result
+        assert "SELECT subpath(c.path, 0, nlevel(c.path) - 1)" in result
+        assert "WHERE c.fk_parent_location = p_pk_location" in result
+        # The fallback runs before the idempotency check, so it cannot short-circuit it
+        assert result.index("v_child_prefix;") < result.index("-- Idempotent")
+
+    def test_recalculate_descendants_drops_one_argument_overload(self):
+        """Upgrades must not keep (INTEGER) next to (INTEGER, ltree DEFAULT NULL)."""
+        with open("templates/sql/hierarchy/recalculate_descendants.sql.jinja2") as f:
+            template = Template(f.read())
+
+        result = template.render(schema="tenant", entity_lower="location")
+
+        drop = "DROP FUNCTION IF EXISTS tenant.recalculate_location_descendant_paths(INTEGER);"
+        assert drop in result
+        assert result.index(drop) < result.index("CREATE OR REPLACE FUNCTION")
+
+    def test_recalculate_descendants_creates_gist_index(self):
+        """The <@ subtree lookup is backed by a GiST index on path."""
+        with open("templates/sql/hierarchy/recalculate_descendants.sql.jinja2") as f:
+            template = Template(f.read())
+
+        result = template.render(schema="tenant", entity_lower="location")
+
+        assert (
+            "CREATE INDEX IF NOT EXISTS idx_tb_location_path\n"
+            "    ON tenant.tb_location USING GIST (path);"
+        ) in result
 
 
 class TestHierarchyTemplateIntegration:
@@ -68,3 +129,35 @@ class TestHierarchyTemplateIntegration:
         recalc_result = recalc_template.render(**entity_config)
 
         assert "tenant.calculate_department_path" in recalc_result
+
+
+class TestHierarchySchemaGeneration:
+    """Test that SchemaGenerator emits the path functions for hierarchical entities."""
+
+    @staticmethod
+    def _location(with_path: bool) -> EntityDefinition:
+        entity = EntityDefinition(name="Location", schema="tenant")
+        entity.fields["parent"] = FieldDefinition(
+            name="parent",
+            type_name="ref",
+            tier=FieldTier.REFERENCE,
+            reference_entity="Location",
+            reference_schema="tenant",
+        )
+        if with_path:
+            entity.fields["path"] = FieldDefinition(name="path", type_name="ltree")
+        return entity
+
+    def test_hierarchical_entity_with_path_gets_path_functions(self):
+        ddl = SchemaGenerator().generate_table(self._location(with_path=True))
+
+        assert "CREATE OR REPLACE FUNCTION tenant.calculate_location_path" in ddl
+        assert "CREATE OR REPLACE FUNCTION tenant.recalculate_location_descendant_paths" in ddl
+        # The parent column follows the reference field name
+        assert "SELECT fk_parent\n" in ddl
+        assert "WHERE c.fk_parent = p_pk_location" in ddl
+
+    def test_hierarchical_entity_without_path_has_no_path_functions(self):
+        ddl = SchemaGenerator().generate_table(self._location(with_path=False))
+
+        assert "calculate_location_path" not in ddl
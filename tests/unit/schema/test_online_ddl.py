@@ -0,0 +1,234 @@
+"""Tests for online-safe (lock-light) DDL emission."""
+
+import pglast
+
+from core.ast_models import (
+    Entity,
+    EntityDefinition,
+    FieldDefinition,
+    FieldTier,
+    PartitioningConfig,
+    PartitionStrategy,
+)
+from generators.schema.foreign_key_generator import ForeignKeyGenerator
+from generators.schema.online_ddl import (
+    add_constraint,
+    concurrently,
+    set_not_null,
+    split_concurrent,
+    split_validation,
+)
+from generators.schema.schema_generator import SchemaGenerator
+from generators.schema.tenant_indexes import generate_tenant_indexes
+from generators.schema_orchestrator import SchemaOrchestrator
+from generators.table_generator import TableGenerator
+
+
+def _contact(partitioning: PartitioningConfig | None = None) -> Entity:
+    return Entity(
+        name="Contact",
+        schema="crm",
+        fields={
+            "email": FieldDefinition(name="email", type_name="email"),
+            "company": FieldDefinition(name="company", type_name="ref", reference_entity="Company"),
+            "created_on": FieldDefinition(name="created_on", type_name="date"),
+        },
+        partitioning=partitioning,
+    )
+
+
+class TestOnlineDDLHelpers:
+    """Statement-level rewrites."""
+
+    def test_concurrently_rewrites_index_builds_once(self):
+        sql = "CREATE INDEX a ON t (x);\nCREATE UNIQUE INDEX CONCURRENTLY b ON t (y);"
+
+        assert concurrently(sql) == (
+            "CREATE INDEX CONCURRENTLY a ON t (x);\nCREATE UNIQUE INDEX CONCURRENTLY b ON t (y);"
+        )
+
+    def test_split_concurrent_separates_non_transactional_statements(self):
+        sql = "CREATE TABLE t (x int);\nCREATE INDEX CONCURRENTLY a\n    ON t (x);\nSELECT 1;\n"
+
+        transactional, concurrent = split_concurrent(sql)
+
+        assert transactional == "CREATE TABLE t (x int);\nSELECT 1;\n"
+        assert concurrent == "CREATE INDEX CONCURRENTLY a\n    ON t (x);"
+
+    def test_split_validation_separates_post_migration_statements(self):
+        sql = "\n".join(
+            [
+                "CREATE TABLE crm.tb_a (b int, email text);",
+                add_constraint(
+                    "crm.tb_a", "fk_b", "FOREIGN KEY (b) REFERENCES crm.tb_b(pk)", True, True
+                ),
+                set_not_null("crm.tb_a", "email", True),
+            ]
+        )
+
+        migration, validation = split_validation(sql)
+
+        assert migration.splitlines() == [
+            "CREATE TABLE crm.tb_a (b int, email text);",
+            "ALTER TABLE ONLY crm.tb_a",
+            "    ADD CONSTRAINT fk_b",
+            "    FOREIGN KEY (b) REFERENCES crm.tb_b(pk) NOT VALID;",
+            "ALTER TABLE crm.tb_a ADD CONSTRAINT tb_a_email_not_null "
+            "CHECK (email IS NOT NULL) NOT VALID;",
+        ]
+        assert validation.splitlines() == [
+            "ALTER TABLE ONLY crm.tb_a VALIDATE CONSTRAINT fk_b;",
+            "ALTER TABLE crm.tb_a VALIDATE CONSTRAINT tb_a_email_not_null;",
+            "ALTER TABLE crm.tb_a ALTER COLUMN email SET NOT NULL;",
+            "ALTER TABLE crm.tb_a DROP CONSTRAINT tb_a_email_not_null;",
+        ]
+
+    def test_add_constraint_not_valid_then_validate(self):
+        sql = add_constraint("crm.tb_a", "fk_b", "FOREIGN KEY (b) REFERENCES crm.tb_b(pk)", True)
+
+        assert sql.endswith(
+            "FOREIGN KEY (b) REFERENCES crm.tb_b(pk) NOT VALID;\n"
+            "ALTER TABLE crm.tb_a VALIDATE CONSTRAINT fk_b;"
+        )
+        pglast.parse_sql(sql)
+
+    def test_add_constraint_leaves_unique_alone(self):
+        sql = add_constraint("crm.tb_a", "uq_a", "UNIQUE (a)", online=True)
+
+        assert "NOT VALID" not in sql
+
+    def test_set_not_null_is_proven_by_validated_check(self):
+        statements = set_not_null("crm.tb_a", "email", online=True).splitlines()
+
+        assert statements == [
+            "ALTER TABLE crm.tb_a ADD CONSTRAINT tb_a_email_not_null "
+            "CHECK (email IS NOT NULL) NOT VALID;",
+            "ALTER TABLE crm.tb_a VALIDATE CONSTRAINT tb_a_email_not_null;",
+            "ALTER TABLE crm.tb_a ALTER COLUMN email SET NOT NULL;",
+            "ALTER TABLE crm.tb_a DROP CONSTRAINT tb_a_email_not_null;",
+        ]
+
+
+class TestTableGeneratorOnline:
+    """TableGenerator(online=True)."""
+
+    def test_foreign_keys_not_valid(self, schema_registry):
+        generator = TableGenerator(schema_registry, online=True)
+
+        for ddl, constraint in (
+            (generator.generate_table_ddl(_contact()), "tb_contact_fk_company_fkey"),
+            (generator.generate_foreign_keys_ddl(_contact()), "tb_contact_company_fkey"),
+        ):
+            assert "REFERENCES crm.tb_company(pk_company) NOT VALID;" in ddl
+            assert f"ALTER TABLE ONLY crm.tb_contact VALIDATE CONSTRAINT {constraint};" in ddl
+
+    def test_indexes_concurrently(self, schema_registry):
+        ddl = TableGenerator(schema_registry, online=True).generate_indexes_ddl(_contact())
+
+        assert ddl.count("CREATE INDEX CONCURRENTLY") == len(ddl.splitlines())
+
+    def test_default_output_unchanged(self, table_generator):
+        ddl = table_generator.generate_foreign_keys_ddl(_contact())
+
+        assert ddl == (
+            "ALTER TABLE ONLY crm.tb_contact\n"
+            "    ADD CONSTRAINT tb_contact_company_fkey\n"
+            "    FOREIGN KEY (fk_company) REFERENCES crm.tb_company(pk_company);"
+        )
+
+    def test_partitioned_tables_keep_plain_ddl(self, schema_registry):
+        """Neither CONCURRENTLY nor NOT VALID foreign keys work on partitioned tables"""
+        entity = _contact(PartitioningConfig(strategy=PartitionStrategy.RANGE, key="created_on"))
+        generator = TableGenerator(schema_registry, online=True)
+
+        assert "NOT VALID" not in generator.generate_foreign_keys_ddl(entity)
+        assert "CONCURRENTLY" not in generator.generate_indexes_ddl(entity)
+
+
+class TestSchemaGeneratorOnline:
+    """SchemaGenerator / ForeignKeyGenerator / tenant indexes with online=True."""
+
+    def _location(self) -> EntityDefinition:
+        return EntityDefinition(
+            name="location",
+            schema="tenant",
+            fields={
+                "name": FieldDefinition(name="name", type_name="text"),
+                "site": FieldDefinition(
+                    name="site",
+                    type_name="ref",
+                    tier=FieldTier.REFERENCE,
+                    reference_entity="Site",
+                    reference_schema="tenant",
+                ),
+            },
+        )
+
+    def test_references_move_out_of_create_table(self):
+        ddl = SchemaGenerator(online=True).generate_table(self._location())
+
+        assert "fk_site INTEGER," in ddl
+        assert (
+            "    FOREIGN KEY (fk_site) REFERENCES tenant.tb_site(pk_site) "
+            "ON DELETE RESTRICT ON UPDATE CASCADE NOT VALID;\n"
+            "ALTER TABLE tenant.tb_location VALIDATE CONSTRAINT tb_location_fk_site_fkey;"
+        ) in ddl
+        assert "CREATE INDEX idx" not in ddl
+        assert "CREATE INDEX CONCURRENTLY idx_location_site" in ddl
+
+    def test_foreign_key_generator_default_is_inline(self):
+        generator = ForeignKeyGenerator()
+        fk_ddl = generator.map_field(self._location().fields["site"])
+
+        assert "REFERENCES tenant.tb_site(pk_site)" in generator.generate_field_ddl(fk_ddl)
+
+    def test_tenant_indexes_concurrently(self):
+        indexes = generate_tenant_indexes(self._location(), "tenant", online=True)
+
+        assert indexes[0].startswith("CREATE INDEX CONCURRENTLY idx_location_tenant")
+        assert indexes[1].startswith("CREATE UNIQUE INDEX CONCURRENTLY idx_location_tenant_id")
+
+
+def test_split_schema_moves_concurrent_indexes_to_their_own_file():
+    """SchemaOrchestrator(online=True) splits CONCURRENTLY builds out of table_sql"""
+    orchestrator = SchemaOrchestrator(registry_optional=True, online=True)
+    entity = Entity(
+        name="Book",
+        schema="crm",
+        fields={"title": FieldDefinition(name="title", type_name="text")},
+    )
+
+    output = orchestrator.generate_split_schema(entity)
+
+    assert output.table_sql.startswith("SET lock_timeout = '5s';")
+    assert "CONCURRENTLY" not in output.table_sql
+    assert output.concurrent_indexes_sql == (
+        "CREATE INDEX CONCURRENTLY idx_tb_book_tenant ON crm.tb_book(tenant_id);"
+    )
+
+
+def test_split_schema_validates_foreign_keys_after_the_migration():
+    """Online table_sql adds foreign keys NOT VALID; validation gets its own file"""
+    orchestrator = SchemaOrchestrator(registry_optional=True, online=True)
+
+    output = orchestrator.generate_split_schema(_contact())
+
+    assert "NOT VALID;" in output.table_sql
+    assert "VALIDATE" not in output.table_sql
+    assert output.validation_sql == (
+        "ALTER TABLE ONLY crm.tb_contact VALIDATE CONSTRAINT tb_contact_fk_company_fkey;"
+    )
+
+
+def test_complete_schema_runs_online_steps_last():
+    """generate_complete_schema applies the same split, ending the script with them"""
+    sql = SchemaOrchestrator(registry_optional=True, online=True).generate_complete_schema(
+        _contact()
+    )
+
+    assert sql.startswith("SET lock_timeout = '5s';")
+    validation = sql.index("-- Constraint validation (after the DDL above has committed)")
+    concurrent = sql.index("-- Concurrent index builds (outside a transaction block)")
+    assert validation < sql.index("VALIDATE CONSTRAINT") < concurrent
+    assert concurrent < sql.index("CREATE INDEX CONCURRENTLY")
+    assert sql.count("INDEX CONCURRENTLY") == sql[concurrent:].count("INDEX CONCURRENTLY")
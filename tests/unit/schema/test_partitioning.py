@@ -0,0 +1,160 @@
+"""Tests for declarative table partitioning DDL."""
+
+import pytest
+
+from core.ast_models import Entity, FieldDefinition, PartitioningConfig, PartitionStrategy
+from core.exceptions import SpecQLValidationError
+from generators.schema.partition_generator import (
+    PartitionGenerator,
+    validate_partition_references,
+)
+
+
+def _event_entity(partitioning: PartitioningConfig | None) -> Entity:
+    return Entity(
+        name="Event",
+        schema="crm",
+        fields={
+            "occurred_at": FieldDefinition(name="occurred_at", type_name="timestamp"),
+            "region": FieldDefinition(name="region", type_name="text"),
+            "customer": FieldDefinition(
+                name="customer", type_name="ref", reference_entity="Customer"
+            ),
+        },
+        partitioning=partitioning,
+    )
+
+
+RANGE = PartitioningConfig(
+    strategy=PartitionStrategy.RANGE, key="occurred_at", interval="month", retention="12 months"
+)
+
+
+class TestPartitionedTableDDL:
+    """PARTITION BY tables with partition-key-aware constraints."""
+
+    def test_range_partitioned_table(self, table_generator):
+        ddl = table_generator.generate_table_ddl(_event_entity(RANGE))
+
+        assert "PARTITION BY RANGE (occurred_at);" in ddl
+        assert "pk_event INTEGER GENERATED BY DEFAULT AS IDENTITY," in ddl
+        assert "CONSTRAINT tb_event_pkey PRIMARY KEY (pk_event, occurred_at)" in ddl
+        assert "CONSTRAINT tb_event_id_key UNIQUE (id, occurred_at)" in ddl
+
+    def test_foreign_keys_valid_for_partitioned_parent(self, table_generator):
+        entity = _event_entity(RANGE)
+
+        ddl = table_generator.generate_table_ddl(entity)
+        fk_ddl = table_generator.generate_foreign_keys_ddl(entity)
+
+        assert "ALTER TABLE ONLY" not in ddl
+        assert "ALTER TABLE crm.tb_event\n    ADD CONSTRAINT tb_event_fk_customer_fkey" in ddl
+        assert fk_ddl.startswith("ALTER TABLE crm.tb_event")
+
+    def test_partition_ddl_ends_its_line(self, table_generator):
+        ddl = table_generator.generate_table_ddl(_event_entity(RANGE))
+
+        assert "SELECT crm.create_tb_event_partitions();\n" in ddl
+
+    def test_unpartitioned_table_unchanged(self, table_generator):
+        ddl = table_generator.generate_table_ddl(_event_entity(None))
+
+        assert "pk_event INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY" in ddl
+        assert "PARTITION BY" not in ddl
+        assert "ALTER TABLE ONLY crm.tb_event" in ddl
+
+    def test_list_partitions(self):
+        config = PartitioningConfig(
+            strategy=PartitionStrategy.LIST, key="region", values={"eu": ["FR", "DE"]}
+        )
+
+        sql = PartitionGenerator(_event_entity(config)).generate()
+
+        assert "crm.tb_event_eu\n    PARTITION OF crm.tb_event FOR VALUES IN ('FR', 'DE');" in sql
+        assert "PARTITION OF crm.tb_event DEFAULT;" in sql
+
+    def test_hash_partitions_on_ref_field(self):
+        config = PartitioningConfig(strategy=PartitionStrategy.HASH, key="customer", partitions=4)
+        generator = PartitionGenerator(_event_entity(config))
+
+        sql = generator.generate()
+
+        assert generator.partition_clause() == "HASH (fk_customer)"
+        assert sql.count("PARTITION OF crm.tb_event FOR VALUES WITH (MODULUS 4") == 4
+        assert "DEFAULT" not in sql
+
+
+class TestRangePartitionMaintenance:
+    """Rolling partition creation and retention for range partitioning."""
+
+    def test_create_partitions_function(self):
+        sql = PartitionGenerator(_event_entity(RANGE)).generate()
+
+        assert "CREATE OR REPLACE FUNCTION crm.create_tb_event_partitions(" in sql
+        assert "v_start TIMESTAMPTZ := date_trunc('month', p_from);" in sql
+        assert "to_char(v_start, 'YYYYMM')" in sql
+        assert "SELECT crm.create_tb_event_partitions();" in sql
+
+    def test_retention_drops_whole_partitions(self):
+        sql = PartitionGenerator(_event_entity(RANGE)).generate()
+
+        assert "p_retention INTERVAL DEFAULT INTERVAL '12 months'" in sql
+        assert "EXECUTE format('DROP TABLE %s', v_partition.partition_name);" in sql
+        assert "CREATE OR REPLACE FUNCTION crm.maintain_tb_event_partitions()" in sql
+
+    def test_retention_disabled_by_default(self):
+        config = PartitioningConfig(strategy=PartitionStrategy.RANGE, key="created_at")
+
+        sql = PartitionGenerator(_event_entity(config)).generate()
+
+        assert "p_retention INTERVAL DEFAULT NULL" in sql
+
+
+class TestPartitionPruning:
+    """Helpers and mutations filter on the partition key."""
+
+    def test_helpers_have_partition_key_overloads(self, trinity_helper_generator):
+        helpers = trinity_helper_generator.generate_all_helpers(_event_entity(RANGE))
+
+        assert "p_occurred_at TIMESTAMPTZ)" in helpers
+        assert "AND occurred_at = p_occurred_at" in helpers
+        assert "crm.event_id(p_pk INTEGER, p_occurred_at TIMESTAMPTZ)" in helpers
+
+    def test_mutations_filter_on_partition_key(self, core_logic_generator):
+        entity = _event_entity(RANGE)
+
+        update_sql = core_logic_generator.generate_core_update_function(entity)
+        delete_sql = core_logic_generator.generate_core_delete_function(entity)
+
+        assert "AND t.occurred_at = v_current.occurred_at" in update_sql
+        assert "v_partition_key TIMESTAMPTZ;" in delete_sql
+        assert "SELECT id, pk_event, occurred_at" in delete_sql
+        assert "AND occurred_at = v_partition_key;" in delete_sql
+
+    def test_tenant_key_needs_no_extra_filter(self, core_logic_generator):
+        config = PartitioningConfig(strategy=PartitionStrategy.HASH, key="tenant_id")
+
+        update_sql = core_logic_generator.generate_core_update_function(_event_entity(config))
+
+        assert "AND t.tenant_id = v_current.tenant_id" not in update_sql
+
+
+class TestPartitionReferenceValidation:
+    """Foreign keys cannot target a partitioned entity."""
+
+    def test_reference_to_partitioned_entity_rejected(self):
+        note = Entity(
+            name="Note",
+            schema="crm",
+            fields={
+                "event": FieldDefinition(name="event", type_name="ref", reference_entity="Event")
+            },
+        )
+
+        with pytest.raises(SpecQLValidationError, match="references partitioned entity 'Event'"):
+            validate_partition_references([_event_entity(RANGE), note])
+
+    def test_references_from_partitioned_entity_allowed(self):
+        customer = Entity(name="Customer", schema="crm", fields={})
+
+        validate_partition_references([_event_entity(RANGE), customer])
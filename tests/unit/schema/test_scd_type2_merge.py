@@ -0,0 +1,99 @@
+"""Tests for the SCD Type 2 bulk merge and current-version index."""
+
+import re
+
+import pglast
+
+from core.ast_models import Entity, FieldDefinition
+from generators.schema.patterns.schema.scd_type2_helper import SCDType2HelperPattern
+
+
+def _customer_entity() -> Entity:
+    return Entity(
+        name="Customer",
+        schema="crm",
+        fields={
+            name: FieldDefinition(name=name, type_name="text")
+            for name in ["customer_id", "name", "email", "notes"]
+        },
+    )
+
+
+def _apply(**params) -> Entity:
+    entity, _ = SCDType2HelperPattern.apply(
+        _customer_entity(),
+        {"natural_key": ["customer_id"], "tracked_fields": ["name", "email"], **params},
+    )
+    return entity
+
+
+class TestBulkMerge:
+    """merge_versions_{entity} only versions rows whose tracked fields changed."""
+
+    def test_merge_compares_tracked_field_hashes(self):
+        sql = "\n".join(_apply().functions)
+
+        assert "CREATE OR REPLACE FUNCTION crm.merge_versions_customer(" in sql
+        assert "FROM jsonb_array_elements(p_rows) WITH ORDINALITY AS r(value, ord)" in sql
+        assert "AND md5(ROW(t.name, t.email)::text) <> md5(ROW(s.name, s.email)::text);" in sql
+        assert re.search(r"\bt\.notes", sql) is None
+
+    def test_merge_is_two_set_based_statements(self):
+        merge, staging = _apply().functions[0].split("_from_staging(")
+
+        for sql in (merge, staging):
+            assert sql.count("UPDATE crm.tb_customer t") == 1
+            assert sql.count("INSERT INTO crm.tb_customer (") == 1
+            assert "WHERE NOT EXISTS (" in sql
+            assert "LOOP" not in sql
+
+    def test_merge_from_staging_table(self):
+        sql = _apply().functions[0]
+
+        assert "CREATE OR REPLACE FUNCTION crm.merge_versions_customer_from_staging(" in sql
+        assert "p_staging regclass" in sql
+        assert "FROM %s st" in sql
+        assert "ORDER BY st.customer_id, st.ctid DESC" in sql
+        assert sql.count("$merge$, p_staging);") == 2
+        assert "jsonb_agg" not in sql
+
+    def test_staging_statements_parse(self):
+        sql = _apply(version_field="version").functions[0]
+        staging = sql[sql.index("_from_staging(") :]
+
+        for statement in staging.split("$merge$")[1::2]:
+            pglast.parse_sql(statement.replace("%s", "crm.stg_customer"))
+
+    def test_version_field_increments(self):
+        sql = _apply(version_field="version").functions[0]
+
+        assert "SELECT COALESCE(MAX(v.version), 0) + 1" in sql
+
+    def test_single_row_helper_delegates_to_merge(self):
+        helper = _apply().functions[1]
+
+        assert "CREATE OR REPLACE FUNCTION crm.create_new_version_customer(" in helper
+        assert "PERFORM crm.merge_versions_customer(" in helper
+        assert "jsonb_build_array(new_data || natural_key_values)" in helper
+
+    def test_generated_sql_parses(self):
+        pglast.parse_sql("\n".join(_apply(version_field="version").functions))
+
+
+class TestCurrentVersionIndex:
+    """A partial unique index enforces one current version per natural key."""
+
+    def test_partial_unique_index_on_natural_key(self):
+        index = next(i for i in _apply().indexes if i.name == "uq_tb_customer_current_version")
+
+        assert index.columns == ["customer_id"]
+        assert index.unique is True
+        assert index.where == "is_current = true"
+
+    def test_partial_unique_index_ddl(self, table_generator):
+        ddl = table_generator.generate_indexes_ddl(_apply())
+
+        assert (
+            "CREATE UNIQUE INDEX uq_tb_customer_current_version ON crm.tb_customer "
+            "(customer_id) WHERE is_current = true;"
+        ) in ddl
@@ -7,9 +7,11 @@ from core.ast_models import (
     IncludeRelation,
     TableViewConfig,
     TableViewMode,
+    TranslationConfig,
 )
 from generators.schema.table_view_dependency import TableViewDependencyResolver
 from generators.schema.table_view_generator import TableViewGenerator
+from generators.schema.table_view_refresh_queue import TableViewRefreshQueueGenerator
 
 
 class TestTableViewGeneration:
@@ -231,6 +233,57 @@ class TestTableViewGeneration:
         assert "DELETE FROM library.tv_review" in sql
         assert "INSERT INTO library.tv_review" in sql
 
+    def test_refresh_function_upserts_only_changed_rows(self):
+        """Test refresh upserts with a change guard instead of delete + re-insert."""
+        entity = EntityDefinition(
+            name="Review",
+            schema="library",
+            fields={"author": FieldDefinition(name="author", type_name="ref(User)")},
+        )
+
+        generator = TableViewGenerator(entity, {})
+        sql = generator.generate_schema()
+
+        assert "ON CONFLICT (pk_review) DO UPDATE SET" in sql
+        assert "data = EXCLUDED.data" in sql
+        assert "IS DISTINCT FROM (EXCLUDED.id, EXCLUDED.tenant_id" in sql
+        # Only vanished rows are deleted
+        assert "NOT EXISTS (SELECT 1 FROM src WHERE src.pk_review = tv.pk_review)" in sql
+
+    def test_refresh_function_accepts_pk_array(self):
+        """Test batch refresh takes INTEGER[] and the single-pk function delegates to it."""
+        entity = EntityDefinition(
+            name="Review",
+            schema="library",
+            fields={"author": FieldDefinition(name="author", type_name="ref(User)")},
+        )
+
+        generator = TableViewGenerator(entity, {})
+        sql = generator.generate_schema()
+
+        assert "CREATE OR REPLACE FUNCTION library.refresh_tv_review_batch(" in sql
+        assert "p_pks_review INTEGER[]" in sql
+        assert "base.pk_review = ANY(p_pks_review)" in sql
+        assert "tv.pk_review = ANY(p_pks_review)" in sql
+        assert "PERFORM library.refresh_tv_review_batch(" in sql
+
+    def test_chunked_rebuild_procedure(self):
+        """Test chunked full-rebuild procedure for initial loads."""
+        entity = EntityDefinition(
+            name="Review",
+            schema="library",
+            fields={"author": FieldDefinition(name="author", type_name="ref(User)")},
+        )
+
+        generator = TableViewGenerator(entity, {})
+        sql = generator.generate_schema()
+
+        assert "CREATE OR REPLACE PROCEDURE library.rebuild_tv_review(" in sql
+        assert "p_chunk_size INTEGER DEFAULT 10000" in sql
+        assert "LIMIT p_chunk_size" in sql
+        assert "PERFORM library.refresh_tv_review_batch(v_pks);" in sql
+        assert "COMMIT;" in sql
+
     def test_refresh_function_joins_tv_tables(self):
         """Test refresh function JOINs to tv_ tables (not tb_!)."""
         entity = EntityDefinition(
@@ -266,6 +319,30 @@ class TestTableViewGeneration:
         # Should include related data from tv_ table
         assert "'author', tv_user.data" in sql
 
+    def test_refresh_function_joins_localized_translations(self):
+        """Test translated fields come from one join to the localized SRF."""
+        entity = EntityDefinition(
+            name="Manufacturer",
+            schema="catalog",
+            fields={
+                "name": FieldDefinition(name="name", type_name="text"),
+                "code": FieldDefinition(name="code", type_name="text"),
+            },
+            translations=TranslationConfig(enabled=True, fields=["name"]),
+            table_views=TableViewConfig(mode=TableViewMode.FORCE),
+        )
+
+        generator = TableViewGenerator(entity, {})
+        sql = generator.generate_schema()
+
+        assert (
+            "LEFT JOIN catalog.get_manufacturer_localized() tl "
+            "ON tl.fk_manufacturer = base.pk_manufacturer"
+        ) in sql
+        assert "'name', COALESCE(tl.name, base.name)" in sql
+        assert "'code', base.code" in sql
+        assert "get_manufacturer_name(" not in sql
+
     def test_explicit_field_selection(self):
         """Test explicit field selection from relations."""
         entity = EntityDefinition(
@@ -436,3 +513,131 @@ class TestTableViewDependencyResolution:
         # Should not detect circular dependency for self-reference
         order = resolver.get_generation_order()
         assert order == ["Category"]
+
+
+class TestTableViewRefreshQueue:
+    """Test deferred refresh queue generation for the batch scope."""
+
+    def _entities(self):
+        return [
+            EntityDefinition(
+                name="Comment",
+                schema="blog",
+                fields={"post": FieldDefinition(name="post", type_name="ref(Post)")},
+            ),
+            EntityDefinition(
+                name="Post",
+                schema="blog",
+                fields={"author": FieldDefinition(name="author", type_name="ref(User)")},
+            ),
+            EntityDefinition(
+                name="User",
+                schema="crm",
+                fields={},
+                table_views=TableViewConfig(mode=TableViewMode.FORCE),
+            ),
+        ]
+
+    def test_queue_created_on_first_use_with_dedup(self):
+        """Test enqueue function creates the queue keyed on (entity, pk)."""
+        sql = TableViewRefreshQueueGenerator(self._entities()).generate()
+
+        assert "CREATE OR REPLACE FUNCTION app.enqueue_tv_refresh(" in sql
+        assert "to_regclass('pg_temp.tv_refresh_queue') IS NULL" in sql
+        assert "PRIMARY KEY (entity, pk)" in sql
+        assert "ON CONFLICT DO NOTHING" in sql
+
+    def test_drained_by_deferred_constraint_trigger(self):
+        """Test the queue is drained once per transaction by a deferred trigger."""
+        sql = TableViewRefreshQueueGenerator(self._entities()).generate()
+
+        assert "CREATE CONSTRAINT TRIGGER trg_drain_tv_refresh_queue" in sql
+        assert "DEFERRABLE INITIALLY DEFERRED" in sql
+        assert "PERFORM app.drain_tv_refresh_queue();" in sql
+
+    def test_drain_in_dependency_order_with_array_refresh(self):
+        """Test drain refreshes parents before dependents via batch functions."""
+        sql = TableViewRefreshQueueGenerator(self._entities()).generate()
+
+        user_idx = sql.index("PERFORM crm.refresh_tv_user_batch(v_pks);")
+        post_idx = sql.index("PERFORM blog.refresh_tv_post_batch(v_pks);")
+        comment_idx = sql.index("PERFORM blog.refresh_tv_comment_batch(v_pks);")
+
+        assert user_idx < post_idx < comment_idx
+
+    def test_entities_without_table_views_skipped(self):
+        """Test entities that do not generate tv_ are not drained."""
+        entities = [
+            EntityDefinition(name="User", schema="crm", fields={}),
+            EntityDefinition(
+                name="Post",
+                schema="blog",
+                fields={"author": FieldDefinition(name="author", type_name="ref(User)")},
+            ),
+        ]
+
+        sql = TableViewRefreshQueueGenerator(entities).generate()
+
+        assert "refresh_tv_post_batch" in sql
+        assert "refresh_tv_user_batch" not in sql
+
+    def test_no_queue_without_table_views(self):
+        """Test nothing is generated when no entity has a tv_ table."""
+        entities = [EntityDefinition(name="User", schema="crm", fields={})]
+
+        assert TableViewRefreshQueueGenerator(entities).generate() == ""
+
+    def test_drain_enqueues_dependents_of_refreshed_parents(self):
+        """Test refreshing a parent queues the dependent rows composing it."""
+        sql = TableViewRefreshQueueGenerator(self._entities()).generate()
+
+        user_refresh = sql.index("PERFORM crm.refresh_tv_user_batch(v_pks);")
+        enqueue_posts = sql.index("SELECT 'Post', pk_post\n")
+        post_drain = sql.index("WHERE entity = 'Post'")
+
+        assert user_refresh < enqueue_posts < post_drain
+        assert "FROM blog.tv_post\n        WHERE fk_user = ANY(v_pks)" in sql
+        assert "SELECT 'Comment', pk_comment" in sql
+
+    def test_self_referencing_entity_drains_until_subtree_done(self):
+        """Test children of refreshed hierarchy rows are drained in a loop."""
+        entities = [
+            EntityDefinition(
+                name="Category",
+                schema="blog",
+                fields={"parent": FieldDefinition(name="parent", type_name="ref(Category)")},
+                table_views=TableViewConfig(mode=TableViewMode.FORCE),
+            )
+        ]
+
+        sql = TableViewRefreshQueueGenerator(entities).generate()
+
+        assert "EXIT WHEN v_pks IS NULL;" in sql
+        assert "SELECT 'Category', pk_category" in sql
+        assert sql.index("EXIT WHEN v_pks IS NULL;") < sql.index("END LOOP;")
+
+    def test_parsed_refs_queue_dependents_and_children(self):
+        """Test parser-produced ref fields (type_name "ref" + reference_entity) are followed."""
+        from core.specql_parser import SpecQLParser
+
+        parser = SpecQLParser()
+        company = parser.parse(
+            "entity: Company\nschema: crm\ntable_views:\n  mode: force\n"
+            "fields:\n  name: text\n  parent: ref(Company)\n"
+        )
+        contact = parser.parse(
+            "entity: Contact\nschema: crm\ntable_views:\n  mode: force\n"
+            "fields:\n  email: text\n  company: ref(Company)\n"
+        )
+        assert contact.fields["company"].type_name == "ref"
+
+        sql = TableViewRefreshQueueGenerator([company, contact]).generate()
+
+        assert "SELECT 'Contact', pk_contact\n" in sql
+        assert "FROM crm.tv_contact\n        WHERE fk_company = ANY(v_pks)" in sql
+        assert "SELECT 'Company', pk_company\n" in sql
+        assert "EXIT WHEN v_pks IS NULL;" in sql
+        assert (
+            "fk_company INTEGER"
+            in TableViewGenerator(contact, {"Company": company}).generate_schema()
+        )
@@ -1,3 +1,5 @@
+import pglast
+
 from core.ast_models import EntityDefinition, FieldDefinition, TranslationConfig
 from generators.schema.translation_helper_generator import TranslationHelperGenerator
 
@@ -20,6 +22,35 @@ def test_generate_translation_helpers():
     # Should generate 2 helper functions
     assert "CREATE OR REPLACE FUNCTION catalog.get_manufacturer_name" in helpers
     assert "CREATE OR REPLACE FUNCTION catalog.get_manufacturer_description" in helpers
-    assert "p_manufacturer_pk UUID" in helpers
+    assert "p_manufacturer_pk INTEGER" in helpers
     assert "p_locale_pk UUID DEFAULT NULL" in helpers
     assert "COALESCE(p_locale_pk, catalog.get_default_locale())" in helpers
+
+
+def test_generate_localized_set_returning_function():
+    """Generate one inlinable SRF joining the translation table with locale fallback"""
+    entity = EntityDefinition(
+        name="Manufacturer",
+        schema="catalog",
+        fields={
+            "name": FieldDefinition(name="name", type_name="text", nullable=False),
+            "description": FieldDefinition(name="description", type_name="text"),
+        },
+        translations=TranslationConfig(
+            enabled=True, table_name="tl_manufacturer_i18n", fields=["name", "description"]
+        ),
+    )
+
+    helpers = TranslationHelperGenerator().generate(entity)
+
+    assert "CREATE OR REPLACE FUNCTION catalog.get_manufacturer_localized(" in helpers
+    assert "RETURNS TABLE (" in helpers
+    assert "description TEXT" in helpers
+    # Joined on base.pk_<entity>: typed like the translation table's INTEGER fk
+    assert "    fk_manufacturer INTEGER,\n    fk_locale UUID," in helpers
+    assert "LANGUAGE sql\nSTABLE" in helpers
+    assert "SELECT DISTINCT ON (tl.fk_manufacturer)" in helpers
+    assert "FROM catalog.tl_manufacturer_i18n tl" in helpers
+    assert "WHERE tl.fk_locale IN (p_locale_pk, catalog.get_default_locale())" in helpers
+    assert "ORDER BY tl.fk_manufacturer, (tl.fk_locale = p_locale_pk) DESC NULLS LAST" in helpers
+    pglast.parse_sql(helpers)
@@ -26,7 +26,10 @@ def test_generate_translation_table_basic():
     # Should NOT have identifier field
     assert "identifier TEXT" not in ddl
     # Foreign keys
-    assert "fk_manufacturer UUID" in ddl
+    assert (
+        "fk_manufacturer INTEGER NOT NULL\n        REFERENCES catalog.tb_manufacturer(pk_manufacturer)"
+        in ddl
+    )
     assert "fk_locale UUID" in ddl
     # Translatable fields
     assert "name TEXT NOT NULL" in ddl
@@ -141,3 +141,77 @@ def test_generate_timestamptz():
 
     value = gen.generate(mapping)
     assert hasattr(value, "year") and hasattr(value, "hour")
+
+
+def test_seeded_generators_are_independent_of_global_state():
+    """Each generator owns its RNG streams; the global random module is untouched"""
+    import random
+
+    from testing.seed.field_generators import derive_seed
+
+    mappings = [
+        {"field_type": "text", "generator_type": "random"},
+        {"field_type": "integer", "generator_type": "random"},
+    ]
+    state = random.getstate()
+
+    first = FieldValueGenerator(seed=7)
+    other = FieldValueGenerator(seed=8)
+    values = [first.generate(m) for m in mappings]
+    other.generate(mappings[0])
+    first.reseed(7)
+
+    assert [first.generate(m) for m in mappings] == values
+    assert random.getstate() == state
+    assert derive_seed(42, "Contact", 0, 1) == derive_seed(42, "Contact", 0, 1)
+    assert derive_seed(42, "Contact", 0, 1) != derive_seed(42, "Contact", 0, 2)
+
+
+def test_generate_column_batches_non_dependent_fields():
+    """Columns are drawn at once and are reproducible per stream seed"""
+    from datetime import date
+
+    gen = FieldValueGenerator(seed=42)
+    enum = {"field_type": "enum(lead, qualified, customer)", "generator_type": "random"}
+    integer = {
+        "field_type": "integer",
+        "generator_type": "random",
+        "seed_distribution": {"min": 10, "max": 20},
+    }
+    sequence = {"generator_type": "sequence", "generator_params": {"start": 100, "step": 5}}
+    fixed = {"generator_type": "fixed", "generator_params": {"fixed_value": "x"}}
+
+    assert gen.generate_column(enum, 50, seed=1) == gen.generate_column(enum, 50, seed=1)
+    assert set(gen.generate_column(enum, 50, seed=1)) <= {"lead", "qualified", "customer"}
+    assert all(10 <= v <= 20 for v in gen.generate_column(integer, 50, seed=2))
+    assert gen.generate_column(sequence, 3, start_instance=4) == [115, 120, 125]
+    assert gen.generate_column(fixed, 2) == ["x", "x"]
+    dates = gen.generate_column({"field_type": "date", "generator_type": "random"}, 20, seed=3)
+    assert all(isinstance(d, date) and d <= date.today() for d in dates)
+    emails = gen.generate_column({"field_type": "email", "generator_type": "random"}, 3)
+    assert all("@" in e for e in emails)
+
+
+def test_generate_column_with_numpy():
+    """NumPy draws plain Python values for unseeded columns"""
+    import pytest
+
+    pytest.importorskip("numpy")
+    gen = FieldValueGenerator()
+    money = gen.generate_column({"field_type": "money", "generator_type": "random"}, 10)
+
+    assert all(type(v) is float and 10 <= v <= 10000 for v in money)
+
+
+def test_seeded_column_does_not_depend_on_numpy(monkeypatch):
+    """A seed gives the same column whether or not NumPy is installed"""
+    from core.dependencies import NUMPY
+    from testing.seed import field_generators
+
+    money = {"field_type": "money", "generator_type": "random"}
+    without_numpy = FieldValueGenerator().generate_column(money, 10, seed=1)
+
+    monkeypatch.setattr(NUMPY, "_available", True)
+    monkeypatch.setattr(field_generators, "_draw_numpy", None)  # Must not be called
+
+    assert FieldValueGenerator().generate_column(money, 10, seed=1) == without_numpy
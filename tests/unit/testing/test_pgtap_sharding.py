@@ -0,0 +1,63 @@
+"""Tests for runtime-balanced pgTAP sharding"""
+
+import pglast
+import pytest
+
+from testing.pgtap import PgTAPBlock, PgTAPGenerator, balance_shards
+from testing.pgtap.sharding import estimate_cost, shard_manifest
+
+CONFIG = {"entity_name": "Contact", "schema_name": "crm", "table_name": "tb_contact"}
+
+
+def test_cost_counts_assertions_and_function_calls():
+    generator = PgTAPGenerator()
+    structure = estimate_cost(generator.generate_structure_tests(CONFIG))
+    crud = estimate_cost(generator.generate_crud_tests(CONFIG, []))
+
+    assert structure == 2.0 + 9 * 0.5
+    assert crud > structure  # Three create calls, one prepared
+
+
+def test_entities_are_packed_longest_first_into_cheapest_shard():
+    blocks = [
+        PgTAPBlock("A", "structure", "", cost_ms=10),
+        PgTAPBlock("A", "crud", "", cost_ms=20),
+        PgTAPBlock("B", "structure", "", cost_ms=25),
+        PgTAPBlock("C", "structure", "", cost_ms=5),
+        PgTAPBlock("D", "structure", "", cost_ms=4),
+    ]
+
+    shards = balance_shards(blocks, 2)
+
+    assert [[(b.entity, b.kind) for b in s.blocks] for s in shards] == [
+        [("A", "structure"), ("A", "crud"), ("D", "structure")],
+        [("B", "structure"), ("C", "structure")],
+    ]
+    assert [s.cost_ms for s in shards] == [34, 30]
+    assert [s["file"] for s in shard_manifest(shards)["shards"]] == [
+        "test_shard_001.sql",
+        "test_shard_002.sql",
+    ]
+
+
+def test_shard_runs_blocks_in_savepoints_of_one_transaction():
+    generator = PgTAPGenerator()
+    blocks = [
+        PgTAPBlock("Contact", "structure", generator.generate_structure_tests(CONFIG)),
+        PgTAPBlock("Contact", "crud", generator.generate_crud_tests(CONFIG, [])),
+    ]
+
+    (shard,) = balance_shards(blocks, 4)
+    sql = shard.render()
+
+    assert sql.count("BEGIN;") == 1
+    assert sql.count("ROLLBACK;") == 1
+    assert "SELECT plan(" not in sql
+    assert sql.count("DEALLOCATE ALL;") == 2
+    assert sql.index("SAVEPOINT block_2;") > sql.index("ROLLBACK TO SAVEPOINT block_1;")
+    pglast.parse_sql(sql)
+
+
+def test_shard_count_must_be_positive():
+    with pytest.raises(ValueError, match="at least 1"):
+        balance_shards([], 0)
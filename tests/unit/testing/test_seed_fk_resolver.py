@@ -1,10 +1,17 @@
 """Tests for FK Resolver and Group Leader components"""
 
+import random
+import re
 from unittest.mock import Mock
 
 import pytest
 
-from testing.seed.fk_resolver import ForeignKeyResolver, GroupLeaderExecutor
+from testing.seed.fk_resolver import (
+    ForeignKeyResolver,
+    GroupLeaderExecutor,
+    OfflineForeignKeyResolver,
+    ParentRecordIndex,
+)
 
 
 class TestForeignKeyResolver:
@@ -172,3 +179,199 @@ class TestGroupLeaderExecutor:
 
         with pytest.raises(ValueError, match="Group leader query returned no results"):
             executor.execute(leader_mapping, context)
+
+
+def _mock_db(rows):
+    """Mock connection whose every query returns rows"""
+    mock_db = Mock()
+    mock_db.execute.return_value.fetchall.return_value = rows
+    return mock_db
+
+
+class TestPrefetchedPools:
+    """Test candidate pools fetched once and sampled in-process"""
+
+    MAPPING = {
+        "fk_target_schema": "crm",
+        "fk_target_table": "tb_company",
+        "fk_target_pk_field": "pk_company",
+    }
+
+    def test_pool_is_fetched_once_per_target_and_tenant(self):
+        """One query per (target, tenant, filter) instead of one per value"""
+        mock_db = _mock_db([(3,), (1,), (2,)])
+        resolver = ForeignKeyResolver(mock_db, prefetch=True, rng=random.Random(7))
+
+        values = [resolver.resolve(self.MAPPING, {"tenant_id": "t1"}) for _ in range(50)]
+        resolver.resolve(self.MAPPING, {"tenant_id": "t2"})
+
+        assert set(values) == {1, 2, 3}
+        assert [c.args[0] for c in mock_db.execute.call_args_list] == [
+            "SELECT pk_company FROM crm.tb_company WHERE deleted_at IS NULL AND tenant_id = 't1'",
+            "SELECT pk_company FROM crm.tb_company WHERE deleted_at IS NULL AND tenant_id = 't2'",
+        ]
+
+    def test_seeded_rng_is_reproducible_regardless_of_row_order(self):
+        """Pools are sorted before sampling, so scan order does not matter"""
+        first = ForeignKeyResolver(
+            _mock_db([(1,), (2,), (3,)]), prefetch=True, rng=random.Random(1)
+        )
+        second = ForeignKeyResolver(
+            _mock_db([(3,), (2,), (1,)]), prefetch=True, rng=random.Random(1)
+        )
+
+        assert [first.resolve(self.MAPPING, {}) for _ in range(20)] == [
+            second.resolve(self.MAPPING, {}) for _ in range(20)
+        ]
+
+    def test_tablesample_with_fallback_and_pool_size(self):
+        """TABLESAMPLE first; a sample with no rows falls back to a full (capped) read"""
+        mock_db = Mock()
+        mock_db.execute.return_value.fetchall.side_effect = [[], [(5,)]]
+        resolver = ForeignKeyResolver(mock_db, prefetch=True, pool_size=1000, sample_percent=1)
+
+        assert resolver.resolve(self.MAPPING, {}) == 5
+        assert [c.args[0] for c in mock_db.execute.call_args_list] == [
+            "SELECT pk_company FROM crm.tb_company TABLESAMPLE SYSTEM (1) "
+            "WHERE deleted_at IS NULL LIMIT 1000",
+            "SELECT pk_company FROM crm.tb_company WHERE deleted_at IS NULL "
+            "ORDER BY RANDOM() LIMIT 1000",
+        ]
+
+    def test_seeded_pool_queries_are_repeatable(self):
+        """With a seed, pools select the same rows on every run (no RANDOM())"""
+        mock_db = Mock()
+        mock_db.execute.return_value.fetchall.side_effect = [[], [(5,)]]
+        resolver = ForeignKeyResolver(
+            mock_db, prefetch=True, pool_size=1000, sample_percent=1, seed=42
+        )
+
+        resolver.resolve(self.MAPPING, {})
+        sampled, full = [c.args[0] for c in mock_db.execute.call_args_list]
+
+        assert re.search(r"TABLESAMPLE SYSTEM \(1\) REPEATABLE \(\d+\) ", sampled)
+        assert sampled.endswith("ORDER BY pk_company LIMIT 1000")
+        assert re.search(r"ORDER BY md5\(pk_company::text \|\| '\d+'\) LIMIT 1000$", full)
+        assert "RANDOM()" not in sampled + full
+
+        again = Mock()
+        again.execute.return_value.fetchall.side_effect = [[], [(5,)]]
+        ForeignKeyResolver(again, prefetch=True, pool_size=1000, sample_percent=1, seed=42).resolve(
+            self.MAPPING, {}
+        )
+        assert [c.args[0] for c in again.execute.call_args_list] == [sampled, full]
+
+    def test_empty_pool_resolves_to_none(self):
+        resolver = ForeignKeyResolver(_mock_db([]), prefetch=True)
+
+        assert resolver.resolve(self.MAPPING, {}) is None
+
+    def test_group_leader_pool_drops_random_pick(self):
+        """Leader queries ending in ORDER BY RANDOM() LIMIT 1 are fetched as a pool"""
+        mock_db = _mock_db([("FR", "75001"), ("DE", "10115")])
+        executor = GroupLeaderExecutor(mock_db, prefetch=True, rng=random.Random(3))
+        mapping = {
+            "generator_params": {
+                "leader_query": "SELECT country_code, postal_code FROM crm.tb_city "
+                "ORDER BY RANDOM() LIMIT 1"
+            },
+            "group_dependency_fields": ["country_code", "postal_code"],
+        }
+
+        results = [executor.execute(mapping, {}) for _ in range(30)]
+
+        assert {r["country_code"] for r in results} == {"FR", "DE"}
+        mock_db.execute.assert_called_once_with("SELECT country_code, postal_code FROM crm.tb_city")
+
+    def test_seeded_group_leader_pool_orders_by_row_hash(self):
+        mock_db = _mock_db([("FR", "75001")])
+        executor = GroupLeaderExecutor(mock_db, prefetch=True, pool_size=100, seed=42)
+        mapping = {
+            "generator_params": {
+                "leader_query": "SELECT country_code, postal_code FROM crm.tb_city "
+                "ORDER BY RANDOM() LIMIT 1"
+            },
+            "group_dependency_fields": ["country_code", "postal_code"],
+        }
+
+        executor.execute(mapping, {})
+
+        assert re.fullmatch(
+            r"SELECT \* FROM \(SELECT country_code, postal_code FROM crm\.tb_city\) AS leader "
+            r"ORDER BY md5\(leader::text \|\| '\d+'\) LIMIT 100",
+            mock_db.execute.call_args.args[0],
+        )
+
+    def test_group_leader_deterministic_query_keeps_first_row(self):
+        mock_db = _mock_db([("FR", "75001")])
+        executor = GroupLeaderExecutor(mock_db, prefetch=True)
+        mapping = {
+            "generator_params": {"leader_query": "SELECT c, p FROM crm.tb_city WHERE id = 1;"},
+            "group_dependency_fields": ["country_code", "postal_code"],
+        }
+
+        assert executor.execute(mapping, {}) == {"country_code": "FR", "postal_code": "75001"}
+        mock_db.execute.assert_called_once_with(
+            "SELECT * FROM (SELECT c, p FROM crm.tb_city WHERE id = 1) AS leader LIMIT 1"
+        )
+
+
+COMPANY = {"entity_name": "Company", "schema_name": "crm", "table_name": "tb_company"}
+
+
+class TestOfflineResolution:
+    """FK resolution from parents generated earlier in the run"""
+
+    def _index(self) -> ParentRecordIndex:
+        index = ParentRecordIndex()
+        for i, tenant in enumerate(["t1", "t1", "t2"], start=1):
+            index.add(COMPANY, {"id": f"company-{i}", "pk_company": i, "tenant_id": tenant})
+        return index
+
+    def test_resolves_parents_of_the_same_tenant(self):
+        resolver = OfflineForeignKeyResolver(self._index(), random.Random(1))
+        mapping = {"field_name": "company", "fk_target_entity": "Company"}
+
+        values = {resolver.resolve(mapping, {"tenant_id": "t1"}) for _ in range(50)}
+
+        assert values == {"company-1", "company-2"}
+        assert resolver.resolve(mapping, {"tenant_id": "t3"}) is None
+
+    def test_metadata_mappings_resolve_by_table_and_field(self):
+        resolver = OfflineForeignKeyResolver(self._index(), random.Random(1))
+        mapping = {
+            "field_name": "fk_company",
+            "fk_target_schema": "crm",
+            "fk_target_table": "tb_company",
+            "fk_target_field": "pk_company",
+        }
+
+        assert resolver.resolve(mapping, {"tenant_id": "t2"}) == 3
+
+    def test_reproducible_with_seed(self):
+        mapping = {"field_name": "company", "fk_target_entity": "Company"}
+
+        def picks(seed):
+            resolver = OfflineForeignKeyResolver(self._index(), random.Random(seed))
+            return [resolver.resolve(mapping, {"tenant_id": "t1"}) for _ in range(20)]
+
+        assert picks(7) == picks(7)
+
+    def test_sql_only_mappings_need_database(self):
+        resolver = OfflineForeignKeyResolver(self._index())
+        mapping = {
+            "field_name": "company",
+            "fk_target_entity": "Company",
+            "fk_filter_conditions": "status = 'active'",
+        }
+
+        with pytest.raises(ValueError, match="requires database connection"):
+            resolver.resolve(mapping, {})
+
+    def test_index_keeps_only_referenced_entities_and_fields(self):
+        index = ParentRecordIndex(fields=("id",), entities={"Company"})
+
+        index.add(COMPANY, {"id": "company-1", "name": "Acme"})
+        index.add({**COMPANY, "entity_name": "Contact"}, {"id": "contact-1"})
+
+        assert index.records == {("Company", None): [{"id": "company-1"}]}
@@ -2,6 +2,9 @@
 
 from unittest.mock import Mock
 
+import pytest
+
+from testing.seed.fk_resolver import ParentRecordIndex
 from testing.seed.seed_generator import EntitySeedGenerator
 from testing.seed.uuid_generator import SpecQLUUID
 
@@ -321,3 +324,148 @@ class TestEntitySeedGenerator:
         assert "city_code" not in result
         # Only the group leader field should be in result (but we mocked it to return dict)
         mock_field_gen.generate.assert_not_called()
+
+
+def test_generate_resolves_fks_from_parent_index_without_database():
+    """Children reference the ids of parents generated earlier in the run"""
+    index = ParentRecordIndex()
+    company_config = {
+        "entity_name": "Company",
+        "schema_name": "crm",
+        "table_name": "tb_company",
+        "base_uuid_prefix": "012320",
+        "is_tenant_scoped": False,
+    }
+    contact_config = {**company_config, "entity_name": "Contact", "table_name": "tb_contact"}
+    contact_config["base_uuid_prefix"] = "012321"
+    fk_mapping = {
+        "field_name": "company",
+        "generator_type": "fk_resolve",
+        "fk_target_entity": "Company",
+        "priority_order": 1,
+    }
+
+    companies = EntitySeedGenerator(company_config, [], parent_index=index).generate_batch(3)
+
+    def contacts():
+        generator = EntitySeedGenerator(contact_config, [fk_mapping], seed=42, parent_index=index)
+        return [record["company"] for record in generator.generate_batch(10)]
+
+    references = contacts()
+    assert set(references) <= {company["id"] for company in companies}
+    assert references == contacts()
+
+
+def test_instance_blocks_generate_the_same_rows_in_any_order():
+    """RNG streams are per (entity, scenario, instance block), not per generator"""
+    from testing.seed.seed_generator import SEED_BLOCK_SIZE
+
+    config = {
+        "entity_name": "Contact",
+        "schema_name": "crm",
+        "table_name": "tb_contact",
+        "base_uuid_prefix": "012321",
+        "is_tenant_scoped": False,
+    }
+    mappings = [
+        {"field_name": "email", "field_type": "email", "generator_type": "random"},
+        {"field_name": "score", "field_type": "integer", "generator_type": "random"},
+    ]
+    for i, mapping in enumerate(mappings):
+        mapping["priority_order"] = i
+
+    serial = EntitySeedGenerator(config, mappings, seed=42).generate_batch(SEED_BLOCK_SIZE + 5)
+    second_block = EntitySeedGenerator(config, mappings, seed=42)
+    tail = [second_block.generate(instance=SEED_BLOCK_SIZE + i) for i in range(1, 6)]
+
+    assert tail == serial[SEED_BLOCK_SIZE:]
+
+
+def test_columnar_blocks_match_any_partitioning():
+    """Column streams are per (entity, scenario, block, field); FKs stay row-wise"""
+    from testing.seed.seed_generator import SEED_BLOCK_SIZE
+
+    index = ParentRecordIndex()
+    index.add({"entity_name": "Company"}, {"id": "company-1"})
+    config = {
+        "entity_name": "Contact",
+        "schema_name": "crm",
+        "table_name": "tb_contact",
+        "base_uuid_prefix": "012321",
+        "is_tenant_scoped": False,
+    }
+    mappings = [
+        {"field_name": "score", "field_type": "integer", "generator_type": "random"},
+        {"field_name": "status", "field_type": "enum(a, b)", "generator_type": "random"},
+        {"field_name": "company", "generator_type": "fk_resolve", "fk_target_entity": "Company"},
+    ]
+    for i, mapping in enumerate(mappings):
+        mapping["priority_order"] = i
+
+    def generator():
+        return EntitySeedGenerator(config, mappings, seed=42, parent_index=index, columnar=True)
+
+    serial = generator().generate_batch(SEED_BLOCK_SIZE + 5)
+    tail = generator().generate_block(0, SEED_BLOCK_SIZE + 1, SEED_BLOCK_SIZE + 6)
+
+    assert tail == serial[SEED_BLOCK_SIZE:]
+    assert list(serial[0]) == ["id", "score", "status", "company"]
+    assert {record["company"] for record in serial} == {"company-1"}
+
+
+def test_columnar_block_continued_in_several_calls_matches_one_call():
+    """Column streams are advanced to the start of a range continuing its block"""
+    from datetime import timedelta
+
+    from testing.seed.field_generators import SEED_EPOCH
+
+    config = {
+        "entity_name": "Contact",
+        "schema_name": "crm",
+        "table_name": "tb_contact",
+        "base_uuid_prefix": "012321",
+        "is_tenant_scoped": False,
+    }
+    mappings = [
+        {"field_name": "email", "field_type": "email", "generator_type": "random"},
+        {"field_name": "score", "field_type": "integer", "generator_type": "random"},
+        {"field_name": "seen_at", "field_type": "timestamptz", "generator_type": "random"},
+    ]
+    for i, mapping in enumerate(mappings):
+        mapping["priority_order"] = i
+
+    whole = EntitySeedGenerator(config, mappings, seed=42, columnar=True).generate_block(0, 1, 21)
+    split = EntitySeedGenerator(config, mappings, seed=42, columnar=True)
+    parts = split.generate_block(0, 1, 8) + split.generate_block(0, 8, 21)
+
+    assert parts == whole
+    # Seeded timestamps are anchored to a fixed epoch, not to the current time
+    assert all(
+        SEED_EPOCH - timedelta(days=365) <= record["seen_at"] <= SEED_EPOCH for record in whole
+    )
+
+
+def test_seeded_ranges_must_not_skip_into_a_block():
+    from testing.seed.seed_generator import SEED_BLOCK_SIZE
+
+    config = {
+        "entity_name": "Contact",
+        "schema_name": "crm",
+        "table_name": "tb_contact",
+        "base_uuid_prefix": "012321",
+        "is_tenant_scoped": False,
+    }
+    mappings = [
+        {
+            "field_name": "score",
+            "field_type": "integer",
+            "generator_type": "random",
+            "priority_order": 0,
+        }
+    ]
+    generator = EntitySeedGenerator(config, mappings, seed=42, columnar=True)
+
+    with pytest.raises(ValueError, match="mid-block"):
+        generator.generate_block(0, 5, 10)
+    with pytest.raises(ValueError, match="span several seed blocks"):
+        generator.generate_block(0, 1, SEED_BLOCK_SIZE + 2)
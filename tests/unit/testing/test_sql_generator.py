@@ -1,6 +1,7 @@
 """Tests for SQL File Generator component"""
 
 from datetime import datetime
+from unittest.mock import MagicMock
 
 from testing.seed.sql_generator import SeedSQLGenerator
 from testing.seed.uuid_generator import SpecQLUUID
@@ -277,3 +278,74 @@ class TestSeedSQLGenerator:
 
         result = generator._format_value([1, 2, 3])  # List as unknown type
         assert result == "'[1, 2, 3]'"
+
+
+CONTACT = {"entity_name": "Contact", "schema_name": "crm", "table_name": "tb_contact"}
+
+
+def _rows(count: int):
+    for i in range(1, count + 1):
+        yield {"pk": i, "note": None if i % 2 else f"tab\there\\{i}", "active": i == 1}
+
+
+class TestStreamingOutput:
+    """Streaming seed output (multi-row VALUES, COPY text/CSV, cursor.copy)"""
+
+    def test_multi_row_inserts_are_chunked(self):
+        statements = list(SeedSQLGenerator(CONTACT).iter_inserts(_rows(3), rows_per_insert=2))
+
+        assert statements == [
+            "INSERT INTO crm.tb_contact (pk, note, active) VALUES\n"
+            "    (1, NULL, TRUE),\n"
+            "    (2, 'tab\there\\2', FALSE);",
+            "INSERT INTO crm.tb_contact (pk, note, active) VALUES\n    (3, NULL, FALSE);",
+        ]
+
+    def test_copy_text_escapes_and_nulls(self):
+        lines = "".join(SeedSQLGenerator(CONTACT).iter_copy(_rows(2))).splitlines()
+
+        assert lines == [
+            "COPY crm.tb_contact (pk, note, active) FROM STDIN;",
+            "1\t\\N\tt",
+            "2\ttab\\there\\\\2\tf",
+            "\\.",
+        ]
+
+    def test_copy_csv_quotes_values_and_leaves_null_empty(self):
+        lines = "".join(SeedSQLGenerator(CONTACT).iter_copy(_rows(2), csv=True)).splitlines()
+
+        assert lines[0] == "COPY crm.tb_contact (pk, note, active) FROM STDIN WITH (FORMAT csv);"
+        assert lines[1:] == ['"1",,"t"', '"2","tab\there\\2","f"', "\\."]
+
+    def test_new_column_set_starts_new_block(self):
+        rows = [{"a": 1}, {"a": 2, "b": 3}]
+
+        output = "".join(SeedSQLGenerator(CONTACT).iter_copy(rows))
+
+        assert output.count("FROM STDIN") == 2
+        assert "COPY crm.tb_contact (a, b) FROM STDIN;\n2\t3\n" in output
+
+    def test_stream_file_consumes_rows_lazily(self):
+        consumed = []
+
+        def rows():
+            for row in _rows(3):
+                consumed.append(row)
+                yield row
+
+        chunks = SeedSQLGenerator(CONTACT).stream_file(rows(), mode="copy")
+
+        assert next(chunks).startswith("-- Seed data for Contact")
+        assert consumed == []
+        assert "".join(chunks).endswith("\\.\n\n-- Record count: 3\n")
+
+    def test_copy_to_streams_into_cursor_copy(self):
+        connection = MagicMock()
+        copy = connection.cursor.return_value.__enter__.return_value.copy
+        writer = copy.return_value.__enter__.return_value
+
+        loaded = SeedSQLGenerator(CONTACT).copy_to(connection, _rows(3))
+
+        assert loaded == 3
+        copy.assert_called_once_with("COPY crm.tb_contact (pk, note, active) FROM STDIN")
+        assert writer.write.call_args_list[0].args == ("1\t\\N\tt\n",)